@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for concurrent AI augment.
+
+Runs `run_ai_augment` over the enriched OpenAI fixture jobs twice against a fresh cache each
+time, using LatencyStubProvider to stand in for a remote model: once with one worker and once
+with `--workers`. Prints a JSON summary (seconds per mode, speedup) plus the sha256 of each
+output so any divergence between serial and concurrent runs is visible next to the timing.
+
+Usage:
+  python scripts/bench_ai_concurrency.py [--fixture PATH] [--latency-ms MS] [--jitter-ms MS] [--workers N]
+"""
+
+from __future__ import annotations
+
+try:
+    import _bootstrap  # type: ignore
+except ModuleNotFoundError:
+    from scripts import _bootstrap  # noqa: F401
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from ji_engine.ai.cache import FileSystemAICache
+from ji_engine.ai.provider import LatencyStubProvider
+from ji_engine.utils.verification import compute_sha256_bytes
+
+try:
+    from scripts import run_ai_augment  # type: ignore
+except ModuleNotFoundError:
+    import run_ai_augment  # type: ignore
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_FIXTURE = REPO_ROOT / "tests" / "fixtures" / "openai_enriched_jobs.sample.json"
+
+
+def _timed_run(fixture: Path, workdir: Path, workers: int, latency_ms: float, jitter_ms: float) -> tuple[float, str]:
+    out_path = workdir / f"augmented.{workers}.json"
+    provider = LatencyStubProvider(latency_ms=latency_ms, jitter_ms=jitter_ms)
+    cache = FileSystemAICache(root=workdir / f"ai_cache.{workers}")
+    start = time.perf_counter()
+    run_ai_augment.main(
+        ["--in_path", str(fixture), "--out_path", str(out_path), "--max_workers", str(workers)],
+        provider=provider,
+        cache=cache,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, compute_sha256_bytes(out_path.read_bytes())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark serial vs concurrent AI augment with a latency stub.")
+    ap.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE, help="Enriched jobs JSON array")
+    ap.add_argument("--latency-ms", type=float, default=200.0, help="Base stub latency per call (default: 200)")
+    ap.add_argument("--jitter-ms", type=float, default=100.0, help="Extra per-job latency in [0, N) (default: 100)")
+    ap.add_argument("--workers", type=int, default=8, help="Concurrent workers for the parallel pass (default: 8)")
+    args = ap.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.WARNING)
+    jobs = json.loads(args.fixture.read_text(encoding="utf-8"))
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        serial_s, serial_sha = _timed_run(args.fixture, workdir, 1, args.latency_ms, args.jitter_ms)
+        parallel_s, parallel_sha = _timed_run(args.fixture, workdir, args.workers, args.latency_ms, args.jitter_ms)
+
+    print(
+        json.dumps(
+            {
+                "fixture": str(args.fixture),
+                "jobs": len(jobs),
+                "latency_ms": args.latency_ms,
+                "jitter_ms": args.jitter_ms,
+                "workers": args.workers,
+                "serial_seconds": round(serial_s, 4),
+                "parallel_seconds": round(parallel_s, 4),
+                "speedup": round(serial_s / parallel_s, 2) if parallel_s else None,
+                "serial_output_sha256": serial_sha,
+                "parallel_output_sha256": parallel_sha,
+                "outputs_match": serial_sha == parallel_sha,
+            },
+            sort_keys=True,
+        )
+    )
+    return 0 if serial_sha == parallel_sha else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for pre-scoring dedupe.
+
+Builds a deterministic synthetic input (default 50k jobs, 30% of them duplicates of
+earlier postings with varied descriptions/URLs, including exact ties), times
+`_dedupe_jobs_for_scoring` over fresh copies of it and prints a JSON summary plus a
+sha256 of the deduped output so selection drift is visible alongside the timing.
+
+Usage:
+  python scripts/bench_dedupe.py [--jobs N] [--dup-ratio R] [--iterations N] [--seed S]
+"""
+
+from __future__ import annotations
+
+try:
+    import _bootstrap  # type: ignore
+except ModuleNotFoundError:
+    from scripts import _bootstrap  # noqa: F401
+
+import argparse
+import copy
+import hashlib
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    from score_jobs import _dedupe_jobs_for_scoring  # type: ignore
+except ModuleNotFoundError:
+    from scripts.score_jobs import _dedupe_jobs_for_scoring
+
+
+def synthetic_jobs(count: int, dup_ratio: float, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    unique = max(1, int(count * (1.0 - dup_ratio)))
+    base: List[Dict[str, Any]] = []
+    for idx in range(unique):
+        desc = " ".join(rng.choice(("customer", "success", "deploy", "python", "api", "remote")) for _ in range(400))
+        job: Dict[str, Any] = {
+            "provider": rng.choice(("openai", "anthropic", "cohere")),
+            "title": f"Role {idx % 997}",
+            "location": rng.choice(("Remote - US", "San Francisco, CA", "New York, NY")),
+            "team": rng.choice(("Sales", "Support", "Engineering")),
+            "jd_text": desc,
+        }
+        if idx % 3:
+            job["job_id"] = f"job-{idx}"
+        if idx % 5:
+            job["apply_url"] = f"https://jobs.example.com/{idx}/apply"
+        else:
+            job["detail_url"] = f"https://jobs.example.com/{idx}"
+        base.append(job)
+
+    jobs = list(base)
+    while len(jobs) < count:
+        dup = dict(rng.choice(base))
+        variant = rng.random()
+        if variant < 0.4:
+            dup["jd_text"] = dup["jd_text"][: rng.randint(0, len(dup["jd_text"]))]
+        elif variant < 0.6:
+            dup["enrich_status"] = rng.choice(("enriched", "unavailable"))
+        elif variant < 0.8:
+            dup["scraped_at"] = f"2026-01-{rng.randint(1, 28):02d}T00:00:00Z"
+        jobs.append(dup)
+    rng.shuffle(jobs)
+    return jobs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark _dedupe_jobs_for_scoring on synthetic input.")
+    ap.add_argument("--jobs", type=int, default=50_000, help="Total input jobs (default: 50000)")
+    ap.add_argument("--dup-ratio", type=float, default=0.3, help="Fraction of duplicate postings (default: 0.3)")
+    ap.add_argument("--iterations", type=int, default=3, help="Timed passes (default: 3)")
+    ap.add_argument("--seed", type=int, default=1234)
+    args = ap.parse_args(argv)
+
+    jobs = synthetic_jobs(max(1, args.jobs), min(max(args.dup_ratio, 0.0), 0.99), args.seed)
+    iterations = max(1, args.iterations)
+
+    out = _dedupe_jobs_for_scoring(copy.deepcopy(jobs))
+    digest = hashlib.sha256(json.dumps(out, sort_keys=True).encode("utf-8")).hexdigest()
+
+    elapsed = 0.0
+    for _ in range(iterations):
+        # Dedupe stamps job_id/source_job_id/duplicates, so every pass gets a fresh copy.
+        batch = copy.deepcopy(jobs)
+        start = time.perf_counter()
+        _dedupe_jobs_for_scoring(batch)
+        elapsed += time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "jobs": len(jobs),
+                "deduped": len(out),
+                "dup_ratio": args.dup_ratio,
+                "iterations": iterations,
+                "seconds_per_pass": round(elapsed / iterations, 4),
+                "us_per_job": round(elapsed / (iterations * len(jobs)) * 1e6, 2),
+                "output_sha256": digest,
+            },
+            sort_keys=True,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the per provider/profile diff renderers.
+
+Builds deterministic synthetic prior/current ranked lists (default 10k jobs each, with
+added/removed/changed postings), then renders the shortlist changes section, diff report,
+delta summary and alerts from one shared `JobDiff`. Prints per-renderer timings plus a
+sha256 of the rendered outputs so drift is visible alongside the timing.
+
+Usage:
+  python scripts/bench_diff.py [--jobs N] [--iterations N] [--seed S]
+"""
+
+from __future__ import annotations
+
+try:
+    import _bootstrap  # type: ignore
+except ModuleNotFoundError:
+    from scripts import _bootstrap  # noqa: F401
+
+import argparse
+import hashlib
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ji_engine.utils.content_fingerprint import content_fingerprint
+from ji_engine.utils.diff_engine import JobDiff
+from ji_engine.utils.diff_report import build_diff_report
+from ji_engine.utils.job_identity import clear_identity_memo
+from jobintel.alerts import build_last_seen, compute_alerts
+from jobintel.delta import render_delta
+
+try:
+    import run_daily  # type: ignore
+except ModuleNotFoundError:
+    from scripts import run_daily
+
+
+def synthetic_runs(count: int, seed: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    rng = random.Random(seed)
+
+    def _job(idx: int) -> Dict[str, Any]:
+        job = {
+            "provider": "openai",
+            "job_id": f"job-{idx}",
+            "title": f"Role {idx % 503}",
+            "location": rng.choice(("Remote - US", "San Francisco, CA", "New York, NY")),
+            "team": rng.choice(("Sales", "Support", "Engineering")),
+            "apply_url": f"https://jobs.example.com/{idx}/apply",
+            "score": rng.randint(0, 100),
+            "jd_text": " ".join(rng.choice(("customer", "deploy", "python", "api")) for _ in range(200)),
+        }
+        job["content_fingerprint"] = content_fingerprint(job)
+        return job
+
+    prev = [_job(idx) for idx in range(count)]
+    curr: List[Dict[str, Any]] = []
+    for job in prev[count // 10 :]:
+        updated = dict(job)
+        if rng.random() < 0.15:
+            updated["title"] = f"{job['title']} (Updated)"
+            updated["score"] = min(100, job["score"] + 15)
+            updated["content_fingerprint"] = content_fingerprint(updated)
+        curr.append(updated)
+    curr.extend(_job(idx) for idx in range(count, count + count // 10))
+    rng.shuffle(curr)
+    return prev, curr
+
+
+def _render(prev: List[Dict[str, Any]], curr: List[Dict[str, Any]], timings: Dict[str, float]) -> List[Any]:
+    """Render every diff output from one shared `JobDiff`, accumulating per-renderer seconds."""
+    outputs: List[Any] = []
+    diff = JobDiff(prev, curr)
+    prev_index = build_last_seen(prev)
+    steps = (
+        ("changes", lambda: run_daily._diff(diff)),
+        (
+            "diff_report",
+            lambda: build_diff_report(prev, curr, provider="openai", profile="cs", baseline_exists=True, diff=diff),
+        ),
+        ("delta", lambda: render_delta(diff, provider="openai", profile="cs", labeled_total=len(curr))),
+        ("alerts", lambda: compute_alerts(curr, prev_index, diff=diff)),
+    )
+    for name, step in steps:
+        start = time.perf_counter()
+        outputs.append(step())
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+    return outputs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark diff renderers over one shared JobDiff.")
+    ap.add_argument("--jobs", type=int, default=10_000, help="Jobs in the prior run (default: 10000)")
+    ap.add_argument("--iterations", type=int, default=5, help="Timed passes (default: 5)")
+    ap.add_argument("--seed", type=int, default=1234)
+    args = ap.parse_args(argv)
+
+    prev, curr = synthetic_runs(max(1, args.jobs), args.seed)
+    iterations = max(1, args.iterations)
+
+    outputs = _render(prev, curr, {})
+    digest = hashlib.sha256(json.dumps(outputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    timings: Dict[str, float] = {}
+    for _ in range(iterations):
+        clear_identity_memo()
+        _render(prev, curr, timings)
+
+    print(
+        json.dumps(
+            {
+                "prev_jobs": len(prev),
+                "curr_jobs": len(curr),
+                "iterations": iterations,
+                "seconds": {name: round(total / iterations, 4) for name, total in timings.items()},
+                "total_seconds": round(sum(timings.values()) / iterations, 4),
+                "output_sha256": digest,
+            },
+            sort_keys=True,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for deterministic AI field extraction.
+
+Times `extract_ai_fields` over the enriched OpenAI fixture jobs and prints a JSON
+summary (jobs, iterations, total seconds, microseconds per job) plus a sha256 of the
+extracted payloads so output drift is visible alongside the timing.
+
+Usage:
+  python scripts/bench_extract_rules.py [--fixture PATH] [--iterations N]
+"""
+
+from __future__ import annotations
+
+try:
+    import _bootstrap  # type: ignore
+except ModuleNotFoundError:
+    from scripts import _bootstrap  # noqa: F401
+
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from ji_engine.ai.extract_rules import RULES_VERSION, extract_ai_fields
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_FIXTURE = REPO_ROOT / "tests" / "fixtures" / "openai_enriched_jobs.sample.json"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark extract_ai_fields over enriched fixture jobs.")
+    ap.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE, help="Enriched jobs JSON array")
+    ap.add_argument("--iterations", type=int, default=50, help="Passes over the fixture (default: 50)")
+    args = ap.parse_args(argv)
+
+    jobs = json.loads(args.fixture.read_text(encoding="utf-8"))
+    iterations = max(1, args.iterations)
+
+    outputs = [extract_ai_fields(job) for job in jobs]
+    digest = hashlib.sha256(json.dumps(outputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for job in jobs:
+            extract_ai_fields(job)
+    elapsed = time.perf_counter() - start
+
+    calls = len(jobs) * iterations
+    print(
+        json.dumps(
+            {
+                "fixture": str(args.fixture),
+                "rules_version": RULES_VERSION,
+                "jobs": len(jobs),
+                "iterations": iterations,
+                "seconds": round(elapsed, 4),
+                "us_per_job": round(elapsed / calls * 1e6, 1) if calls else 0.0,
+                "output_sha256": digest,
+            },
+            sort_keys=True,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
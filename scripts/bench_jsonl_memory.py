@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Peak-memory benchmark for job artifact IO: whole-array JSON vs streamed records.
+
+Builds a deterministic synthetic board (default 100k jobs with ~1.5k chars of JD text each),
+writes it once as a JSON array and once as JSON Lines, then runs one stage-shaped pass
+(read every record, add a derived field, write the result) in a fresh subprocess per mode so
+each peak RSS is measured on its own:
+
+  array        json.loads(read_text()) -> list -> json.dumps(list) (how the stages used to work)
+  stream_json  iter_json_records -> generator -> write_json_records to a JSON array
+  jsonl        iter_json_records -> generator -> write_json_records to JSON Lines
+
+Prints a JSON summary with peak RSS (and its growth over the post-import baseline), wall time
+and the output sha256; `array` and `stream_json` must produce identical bytes.
+
+Usage:
+  python scripts/bench_jsonl_memory.py [--jobs N] [--jd-chars N] [--modes array,stream_json,jsonl] [--seed S]
+"""
+
+from __future__ import annotations
+
+try:
+    import _bootstrap  # type: ignore
+except ModuleNotFoundError:
+    from scripts import _bootstrap  # noqa: F401
+
+import argparse
+import hashlib
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ji_engine.utils.atomic_write import atomic_write_text
+from ji_engine.utils.jsonl import iter_json_records, write_json_records
+
+MODES = ("array", "stream_json", "jsonl")
+_DUMP_SETTINGS: Dict[str, Any] = {"ensure_ascii": False, "sort_keys": True, "separators": (",", ":")}
+_WORDS = ("customer", "success", "deploy", "python", "api", "remote", "kubernetes", "solutions", "enterprise")
+
+
+def synthetic_board(count: int, jd_chars: int, seed: int) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed)
+    for idx in range(count):
+        words: List[str] = []
+        size = 0
+        while size < jd_chars:
+            word = rng.choice(_WORDS)
+            words.append(word)
+            size += len(word) + 1
+        yield {
+            "job_id": f"job-{idx}",
+            "title": f"Role {idx % 997}",
+            "apply_url": f"https://jobs.example.com/{idx}/apply",
+            "location": rng.choice(("Remote - US", "San Francisco, CA", "New York, NY", "London, UK")),
+            "team": rng.choice(("Sales", "Support", "Engineering")),
+            "relevance": rng.choice(("RELEVANT", "MAYBE", "IRRELEVANT")),
+            "jd_text": " ".join(words),
+        }
+
+
+def _stage(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {**job, "jd_chars": len(job.get("jd_text") or ""), "stage": "bench"}
+
+
+def _peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _child(mode: str, in_path: Path, out_path: Path) -> Dict[str, Any]:
+    baseline = _peak_rss_kb()
+    start = time.perf_counter()
+    if mode == "array":
+        jobs = json.loads(in_path.read_text(encoding="utf-8"))
+        out = [_stage(job) for job in jobs]
+        atomic_write_text(out_path, json.dumps(out, **_DUMP_SETTINGS) + "\n")
+        count = len(out)
+    else:
+        count = write_json_records(out_path, (_stage(job) for job in iter_json_records(in_path)))
+    elapsed = time.perf_counter() - start
+    peak = _peak_rss_kb()
+    return {
+        "mode": mode,
+        "records": count,
+        "seconds": round(elapsed, 3),
+        "peak_rss_mb": round(peak / 1024, 1),
+        "peak_rss_growth_mb": round((peak - baseline) / 1024, 1),
+        "output_bytes": out_path.stat().st_size,
+        "output_sha256": hashlib.sha256(out_path.read_bytes()).hexdigest(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Peak RSS of whole-array vs streamed job artifact IO.")
+    ap.add_argument("--jobs", type=int, default=100_000)
+    ap.add_argument("--jd-chars", type=int, default=1500)
+    ap.add_argument("--modes", default=",".join(MODES))
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    ap.add_argument("--in-path", type=Path, help=argparse.SUPPRESS)
+    ap.add_argument("--out-path", type=Path, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_child(args.child, args.in_path, args.out_path), sort_keys=True))
+        return 0
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = sorted(set(modes) - set(MODES))
+    if unknown:
+        ap.error(f"unknown modes: {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        board_json = workdir / "board.json"
+        board_jsonl = workdir / "board.jsonl"
+        for path in (board_json, board_jsonl):
+            write_json_records(path, synthetic_board(args.jobs, args.jd_chars, args.seed))
+        results = []
+        for mode in modes:
+            in_path = board_jsonl if mode == "jsonl" else board_json
+            out_path = workdir / f"out.{mode}{in_path.suffix}"
+            proc = subprocess.run(
+                [sys.executable, __file__, "--child", mode, "--in-path", str(in_path), "--out-path", str(out_path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+            out_path.unlink()
+        input_bytes = {"json": board_json.stat().st_size, "jsonl": board_jsonl.stat().st_size}
+
+    by_mode = {result["mode"]: result for result in results}
+    identical = None
+    if "array" in by_mode and "stream_json" in by_mode:
+        identical = by_mode["array"]["output_sha256"] == by_mode["stream_json"]["output_sha256"]
+    print(
+        json.dumps(
+            {
+                "jobs": args.jobs,
+                "jd_chars": args.jd_chars,
+                "input_bytes": input_bytes,
+                "results": results,
+                "array_stream_identical": identical,
+            },
+            sort_keys=True,
+        )
+    )
+    return 0 if identical in (None, True) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -18,14 +18,14 @@ except ModuleNotFoundError:
     from scripts import _bootstrap  # noqa: F401
 
 import argparse
-import json
 import logging
 import os
 import sys
-from collections import Counter
+from collections import Counter, deque
 from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
@@ -34,16 +34,11 @@ from ji_engine.config import ASHBY_CACHE_DIR, ENRICHED_JOBS_JSON, LABELED_JOBS_J
 from ji_engine.integrations.ashby_graphql import fetch_job_posting
 from ji_engine.integrations.html_to_text import html_to_text
 from ji_engine.providers.retry import ProviderFetchError, classify_failure_type
-from ji_engine.utils.atomic_write import atomic_write_text
 from ji_engine.utils.job_id import extract_job_id_from_url
+from ji_engine.utils.jsonl import iter_json_records, write_json_records
 from ji_engine.utils.time import utc_now_naive
 
 logger = logging.getLogger(__name__)
-_CANONICAL_JSON_KWARGS = {"ensure_ascii": False, "sort_keys": True, "separators": (",", ":")}
-
-
-def _canonical_json(obj: Any) -> str:
-    return json.dumps(obj, **_CANONICAL_JSON_KWARGS) + "\n"
 
 
 DEBUG = os.getenv("JI_DEBUG") == "1"
@@ -361,8 +356,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=int(default_limit_env) if default_limit_env else None,
         help="Limit number of jobs to enrich (for tests/dev).",
     )
-    ap.add_argument("--in_path", help="Input labeled jobs JSON (default: config LABELED_JOBS_JSON)")
-    ap.add_argument("--out_path", help="Output enriched jobs JSON (default: config ENRICHED_JOBS_JSON)")
+    ap.add_argument("--in_path", help="Input labeled jobs JSON or .jsonl (default: config LABELED_JOBS_JSON)")
+    ap.add_argument(
+        "--out_path",
+        help="Output enriched jobs JSON, or JSON Lines for a .jsonl path (default: config ENRICHED_JOBS_JSON)",
+    )
     args = ap.parse_args(argv)
 
     in_path = Path(args.in_path) if args.in_path else LABELED_JOBS_JSON
@@ -370,16 +368,18 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.error(f"Error: Input file not found: {in_path}")
         return 1
 
-    jobs = json.loads(in_path.read_text(encoding="utf-8"))
-    enriched: List[Dict[str, Any]] = []
+    # Stream the labeled records and keep only the ones to enrich; IRRELEVANT jobs are never held.
+    loaded = 0
+    filtered_jobs: List[Dict[str, Any]] = []
+    limit = max(0, args.limit) if args.limit is not None else None
+    for job in iter_json_records(in_path):
+        loaded += 1
+        if job.get("relevance") in ("RELEVANT", "MAYBE") and (limit is None or len(filtered_jobs) < limit):
+            filtered_jobs.append(job)
     stats = {"enriched": 0, "unavailable": 0, "failed": 0}
     unavailable_reasons: Counter[str] = Counter()
 
-    filtered_jobs = [j for j in jobs if j.get("relevance") in ("RELEVANT", "MAYBE")]
-    if args.limit is not None:
-        filtered_jobs = filtered_jobs[: max(0, args.limit)]
-
-    logger.info(f"Loaded {len(jobs)} labeled jobs")
+    logger.info(f"Loaded {loaded} labeled jobs")
     logger.info(f"Filtering for RELEVANT/MAYBE: {len(filtered_jobs)} jobs to enrich\n")
 
     if ORG == "openai" and filtered_jobs and not _openai_job_snapshots_present():
@@ -387,27 +387,27 @@ def main(argv: Optional[List[str]] = None) -> int:
             "OpenAI job detail snapshots not found; skipping offline enrichment. "
             "Run update_snapshots.py with network access to enable."
         )
-        for job in filtered_jobs:
-            job_id = job.get("job_id") or _extract_job_id_from_url(job.get("apply_url", ""))
-            updated_job = {
-                **job,
-                "job_id": job_id,
-                "jd_text": None,
-                "fetched_at": None,
-                "enrich_status": "unavailable",
-                "enrich_reason": "missing_job_snapshots",
-            }
-            enriched.append(updated_job)
-            stats["unavailable"] += 1
-            unavailable_reasons["missing_job_snapshots"] += 1
+
+        def _unavailable_jobs() -> Iterator[Dict[str, Any]]:
+            for job in filtered_jobs:
+                job_id = job.get("job_id") or _extract_job_id_from_url(job.get("apply_url", ""))
+                stats["unavailable"] += 1
+                unavailable_reasons["missing_job_snapshots"] += 1
+                yield {
+                    **job,
+                    "job_id": job_id,
+                    "jd_text": None,
+                    "fetched_at": None,
+                    "enrich_status": "unavailable",
+                    "enrich_reason": "missing_job_snapshots",
+                }
 
         out_path = Path(args.out_path) if args.out_path else ENRICHED_JOBS_JSON
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, _canonical_json(enriched))
+        total = write_json_records(out_path, _unavailable_jobs())
 
         logger.info("\n" + "=" * 60)
         logger.info("Enrichment Summary:")
-        logger.info(f" Total processed: {len(enriched)}")
+        logger.info(f" Total processed: {total}")
         logger.info(f" Enriched: {stats['enriched']}")
         logger.info(f" Unavailable: {stats['unavailable']}")
         logger.info(f" Failed: {stats['failed']}")
@@ -416,38 +416,39 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.info("=" * 60)
         return 0
 
-    with ThreadPoolExecutor(max_workers=max(1, args.max_workers)) as pool:
-        futures = []
-        for i, job in enumerate(filtered_jobs, 1):
-            futures.append((i, pool.submit(_enrich_single, job, i, len(filtered_jobs), fetch_job_posting)))
-
-        # preserve deterministic ordering by index
-        results: List[Tuple[int, Dict[str, Any], Optional[str], str]] = []
-        for i, fut in futures:
-            updated_job, unavailable_reason, status_key = fut.result()
-            results.append((i, updated_job, unavailable_reason, status_key))
-
-    results.sort(key=lambda x: x[0])
-    for _, updated_job, unavailable_reason, status_key in results:
-        if status_key == "enriched":
-            stats["enriched"] += 1
-        elif status_key == "unavailable":
-            stats["unavailable"] += 1
-        else:
-            stats["failed"] += 1
-
-        if unavailable_reason:
-            unavailable_reasons[unavailable_reason] += 1
-
-        enriched.append(updated_job)
+    def _enriched_jobs() -> Iterator[Dict[str, Any]]:
+        workers = max(1, args.max_workers)
+        queued = enumerate(filtered_jobs, 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Results are written in input order, so output stays deterministic. At most 2 * workers
+            # fetches are in flight or finished-but-unwritten: the next job is submitted only as the
+            # oldest result is written, so a slow head-of-line fetch holds back a bounded window.
+            futures = deque(
+                pool.submit(_enrich_single, job, i, len(filtered_jobs), fetch_job_posting)
+                for i, job in islice(queued, 2 * workers)
+            )
+            while futures:
+                updated_job, unavailable_reason, status_key = futures.popleft().result()
+                for i, job in islice(queued, 1):
+                    futures.append(pool.submit(_enrich_single, job, i, len(filtered_jobs), fetch_job_posting))
+                if status_key == "enriched":
+                    stats["enriched"] += 1
+                elif status_key == "unavailable":
+                    stats["unavailable"] += 1
+                else:
+                    stats["failed"] += 1
+
+                if unavailable_reason:
+                    unavailable_reasons[unavailable_reason] += 1
+
+                yield updated_job
 
     out_path = Path(args.out_path) if args.out_path else ENRICHED_JOBS_JSON
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    atomic_write_text(out_path, _canonical_json(enriched))
+    total = write_json_records(out_path, _enriched_jobs())
 
     logger.info("\n" + "=" * 60)
     logger.info("Enrichment Summary:")
-    logger.info(f" Total processed: {len(enriched)}")
+    logger.info(f" Total processed: {total}")
     logger.info(f" Enriched: {stats['enriched']}")
     logger.info(f" Unavailable: {stats['unavailable']}")
     logger.info(f" Failed: {stats['failed']}")
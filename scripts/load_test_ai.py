@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Offline load test for the AI stages against the local LLM stand-in.
+
+Starts ji_engine.ai.standin_server on a free port with the requested latency, tail, rate-limit
+and error-injection settings, then drives AI augment, job briefs and weekly insights through
+its chat endpoint with `--workers` concurrent calls. Everything runs in a throwaway state/data
+directory, so real caches and run dirs are untouched. Prints a JSON report per stage:
+throughput, client-side tail latency, retries/429s/5xx, and cost-accounting accuracy (the
+tokens each stage books from its local estimate against the tokens the server reported).
+
+Usage:
+  python scripts/load_test_ai.py [--jobs N] [--stages augment,briefs,insights] [--workers N]
+      [--latency-ms MS] [--jitter-ms MS] [--latency-dist fixed|uniform|lognormal]
+      [--tail-ms MS] [--tail-rate R] [--error-rate R] [--rate-limit-rps RPS] [--rate-limit-burst N]
+"""
+
+from __future__ import annotations
+
+try:
+    import _bootstrap  # type: ignore
+except ModuleNotFoundError:
+    from scripts import _bootstrap  # noqa: F401
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from ji_engine.ai.chat_client import ChatCompletionsClient
+from ji_engine.ai.standin_server import LATENCY_DISTRIBUTIONS, StandInConfig, StandInServer
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_FIXTURE = REPO_ROOT / "tests" / "fixtures" / "openai_enriched_jobs.sample.json"
+STAGES = ("augment", "briefs", "insights")
+INSIGHT_PROFILES = ("cs", "tam", "se")
+
+
+def _synthetic_jobs(fixture: Path, count: int) -> List[Dict[str, Any]]:
+    """`count` distinct jobs cycled from the fixture, so every job is a distinct model request."""
+    base = json.loads(fixture.read_text(encoding="utf-8"))
+    jobs = []
+    for idx in range(count):
+        job = dict(base[idx % len(base)])
+        job["title"] = f"{job.get('title') or 'Role'} #{idx}"
+        job["apply_url"] = f"{job.get('apply_url') or 'https://example.invalid/job'}#{idx}"
+        job["job_id"] = f"load-{idx}"
+        job["score"] = 100 - idx % 60
+        jobs.append(job)
+    return jobs
+
+
+def _accuracy(booked: int, served: int) -> Dict[str, Any]:
+    return {
+        "booked_tokens": booked,
+        "served_tokens": served,
+        "ratio": round(booked / served, 4) if served else None,
+    }
+
+
+def _run_augment(jobs: List[Dict[str, Any]], workdir: Path, client: ChatCompletionsClient, workers: int) -> int:
+    from ji_engine.ai.cache import FileSystemAICache  # noqa: PLC0415 - after the sandbox env is set
+    from ji_engine.ai.provider import HTTPChatProvider  # noqa: PLC0415
+
+    try:
+        from scripts import run_ai_augment  # type: ignore  # noqa: PLC0415
+    except ModuleNotFoundError:
+        import run_ai_augment  # type: ignore  # noqa: PLC0415
+
+    in_path = workdir / "augment_in.json"
+    in_path.write_text(json.dumps(jobs), encoding="utf-8")
+    argv = ["--in_path", str(in_path), "--out_path", str(workdir / "augment_out.json"), "--max_workers", str(workers)]
+    run_ai_augment.main(
+        argv, provider=HTTPChatProvider(client), cache=FileSystemAICache(root=workdir / "augment_cache")
+    )
+    stats = client.stats()
+    # Augment books nothing itself; the local estimate is what the other stages would book for it.
+    return stats["estimated_prompt_tokens"] + stats["estimated_completion_tokens"]
+
+
+def _run_briefs(jobs: List[Dict[str, Any]], workdir: Path, client: ChatCompletionsClient, workers: int) -> int:
+    from jobintel.ai_job_briefs import generate_job_briefs  # noqa: PLC0415
+
+    ranked_path = workdir / "openai_ranked_jobs.cs.json"
+    ranked_path.write_text(json.dumps(jobs), encoding="utf-8")
+    _, _, payload = generate_job_briefs(
+        provider="openai",
+        profile="cs",
+        ranked_path=ranked_path,
+        run_id="2026-01-01T00:00:00Z",
+        max_jobs=len(jobs),
+        max_tokens_per_job=4000,
+        total_budget=10**9,
+        ai_enabled=True,
+        ai_reason="",
+        model_name=client.model,
+        max_workers=workers,
+        chat_client=client,
+    )
+    return int(payload["metadata"]["ai_accounting"]["tokens_total"])
+
+
+def _run_insights(jobs: List[Dict[str, Any]], workdir: Path, client: ChatCompletionsClient, workers: int) -> int:
+    from ji_engine.ai.executor import AIExecutor  # noqa: PLC0415
+    from jobintel.ai_insights import generate_insights  # noqa: PLC0415
+
+    def _one(profile: str) -> Dict[str, Any]:
+        ranked_path = workdir / f"openai_ranked_jobs.{profile}.json"
+        ranked_path.write_text(json.dumps(jobs), encoding="utf-8")
+        _, _, payload = generate_insights(
+            provider="openai",
+            profile=profile,
+            ranked_path=ranked_path,
+            prev_path=None,
+            run_id="2026-01-01T00:00:00Z",
+            ai_enabled=True,
+            ai_reason="",
+            model_name=client.model,
+            chat_client=client,
+        )
+        return payload
+
+    with AIExecutor(workers) as executor:
+        futures = [executor.submit(profile, _one, profile) for profile in INSIGHT_PROFILES]
+        payloads = [future.result() for future in futures]
+    return sum(int(payload["metadata"]["ai_accounting"]["tokens_total"]) for payload in payloads)
+
+
+_RUNNERS: Dict[str, Callable[[List[Dict[str, Any]], Path, ChatCompletionsClient, int], int]] = {
+    "augment": _run_augment,
+    "briefs": _run_briefs,
+    "insights": _run_insights,
+}
+
+
+@contextlib.contextmanager
+def _sandbox_env(workdir: Path) -> Iterator[None]:
+    """Point state, data and the AI cache at `workdir`; stage modules read these when first imported."""
+    overrides = {
+        "JOBINTEL_STATE_DIR": str(workdir / "state"),
+        "JOBINTEL_DATA_DIR": str(workdir / "data"),
+        "JOBINTEL_AI_CACHE_DB": str(workdir / "state" / "ai_cache.sqlite3"),
+    }
+    saved = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _stage_report(
+    stage: str, jobs: List[Dict[str, Any]], workdir: Path, server: StandInServer, workers: int
+) -> Dict[str, Any]:
+    runner = _RUNNERS[stage]
+    client = ChatCompletionsClient(server.base_url, model="standin", backoff_s=0.05)
+    before = server.stats()
+    start = time.perf_counter()
+    booked = runner(jobs, workdir / stage, client, workers)
+    elapsed = time.perf_counter() - start
+    after = server.stats()
+    served = {name: after[name] - before[name] for name in after}
+    client_stats = client.stats()
+    items = len(INSIGHT_PROFILES) if stage == "insights" else len(jobs)
+    return {
+        "stage": stage,
+        "items": items,
+        "seconds": round(elapsed, 4),
+        "throughput_per_s": round(items / elapsed, 2) if elapsed else None,
+        "client": client_stats,
+        "server": served,
+        "accounting": _accuracy(booked, served["prompt_tokens"] + served["completion_tokens"]),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Load-test the AI stages against a local deterministic LLM stand-in.")
+    ap.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE, help="Enriched jobs JSON array to cycle")
+    ap.add_argument("--jobs", type=int, default=60, help="Jobs per stage (default: 60)")
+    ap.add_argument("--stages", default=",".join(STAGES), help=f"Comma-separated subset of {','.join(STAGES)}")
+    ap.add_argument("--workers", type=int, default=8, help="Concurrent model calls per stage (default: 8)")
+    ap.add_argument("--latency-ms", type=float, default=150.0, help="Base server latency (default: 150)")
+    ap.add_argument("--jitter-ms", type=float, default=100.0, help="Jitter scale (default: 100)")
+    ap.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    ap.add_argument("--tail-ms", type=float, default=800.0, help="Extra latency for tail requests (default: 800)")
+    ap.add_argument("--tail-rate", type=float, default=0.02, help="Fraction of tail requests (default: 0.02)")
+    ap.add_argument("--error-rate", type=float, default=0.02, help="Fraction of attempts answering 5xx (default: 0.02)")
+    ap.add_argument("--rate-limit-rps", type=float, default=0.0, help="Server token-bucket rate; 0 disables")
+    ap.add_argument("--rate-limit-burst", type=int, default=10, help="Token-bucket burst (default: 10)")
+    ap.add_argument("--seed", default="standin", help="Seed for latency/error draws")
+    args = ap.parse_args(argv)
+
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        ap.error(f"unknown stages: {', '.join(unknown)}")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    config = StandInConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        latency_dist=args.latency_dist,
+        tail_ms=args.tail_ms,
+        tail_rate=args.tail_rate,
+        error_rate=args.error_rate,
+        rate_limit_rps=args.rate_limit_rps,
+        rate_limit_burst=args.rate_limit_burst,
+        seed=args.seed,
+    )
+    jobs = _synthetic_jobs(args.fixture, max(1, args.jobs))
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for stage in stages:
+            (workdir / stage).mkdir(parents=True, exist_ok=True)
+        with _sandbox_env(workdir), StandInServer(config) as server:
+            reports = [_stage_report(stage, jobs, workdir, server, args.workers) for stage in stages]
+
+    failed = sum(report["client"]["failed"] for report in reports)
+    print(
+        json.dumps(
+            {
+                "jobs": len(jobs),
+                "workers": args.workers,
+                "standin": {
+                    "latency_ms": args.latency_ms,
+                    "jitter_ms": args.jitter_ms,
+                    "latency_dist": args.latency_dist,
+                    "tail_ms": args.tail_ms,
+                    "tail_rate": args.tail_rate,
+                    "error_rate": args.error_rate,
+                    "rate_limit_rps": args.rate_limit_rps,
+                    "rate_limit_burst": args.rate_limit_burst,
+                    "seed": args.seed,
+                },
+                "stages": reports,
+                "failed_calls": failed,
+            },
+            sort_keys=True,
+        )
+    )
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,16 +2,22 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
-from ji_engine.config import DATA_DIR, DEFAULT_CANDIDATE_ID, RUN_METADATA_DIR, sanitize_candidate_id
+from ji_engine.config import DATA_DIR, DEFAULT_CANDIDATE_ID, HASH_CACHE_JSON, RUN_METADATA_DIR, sanitize_candidate_id
+from ji_engine.utils.fingerprint_cache import configure_fingerprint_cache, flush_fingerprint_cache
+from ji_engine.utils.verification import compute_sha256_file
 from jobintel.aws_runs import build_state_payload, write_last_success_state, write_provider_last_success_state
 
 try:
@@ -34,6 +40,12 @@ LATEST_OUTPUT_ALLOWLIST = {
     "shortlist_md",
     "top_md",
 }
+DEFAULT_PUBLISH_WORKERS = 8
+MULTIPART_THRESHOLD_BYTES = 64 * 1024 * 1024
+MULTIPART_CHUNKSIZE_BYTES = 16 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 4
+# User metadata carrying the artifact sha256 (x-amz-meta-sha256); used to skip unchanged objects.
+SHA256_METADATA_KEY = "sha256"
 
 
 class UploadItem:
@@ -290,26 +302,254 @@ def _build_plan_entries(
     return entries
 
 
-def _upload_plan(client, bucket: str, plan: List[UploadItem], dry_run: bool) -> int:
-    uploaded = 0
-    for item in plan:
-        if dry_run:
-            logger.info("dry-run: %s -> s3://%s/%s", item.source, bucket, item.key)
-            continue
+def _publish_workers(workers: Optional[int] = None) -> int:
+    if workers is None:
+        raw = os.getenv("JOBINTEL_S3_PUBLISH_WORKERS", "").strip()
         try:
-            extra_args: Dict[str, str] = {}
+            workers = int(raw) if raw else DEFAULT_PUBLISH_WORKERS
+        except ValueError:
+            logger.warning("Invalid JOBINTEL_S3_PUBLISH_WORKERS=%r; using %d", raw, DEFAULT_PUBLISH_WORKERS)
+            workers = DEFAULT_PUBLISH_WORKERS
+    return max(1, workers)
+
+
+def _transfer_config() -> TransferConfig:
+    return TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD_BYTES,
+        multipart_chunksize=MULTIPART_CHUNKSIZE_BYTES,
+        max_concurrency=MULTIPART_MAX_CONCURRENCY,
+    )
+
+
+def _file_md5(path: Path) -> Optional[str]:
+    digest = hashlib.md5(usedforsecurity=False)
+    try:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _remote_matches(client, bucket: str, key: str, sha256: Optional[str], source: Path) -> bool:
+    """True when s3://bucket/key already holds these bytes (sha256 metadata, else a single-part ETag)."""
+    if not sha256:
+        return False
+    try:
+        head = client.head_object(Bucket=bucket, Key=key)
+    except ClientError as exc:
+        code = str((exc.response or {}).get("Error", {}).get("Code", ""))
+        if code not in {"404", "NoSuchKey", "NotFound"}:
+            logger.warning("head_object failed for s3://%s/%s (%s); uploading", bucket, key, code or "unknown")
+        return False
+    if (head.get("Metadata") or {}).get(SHA256_METADATA_KEY) == sha256:
+        return True
+    etag = str(head.get("ETag") or "").strip('"')
+    # Multipart ETags ("<md5>-<parts>") are not content hashes; only plain ones can be compared.
+    return bool(etag) and "-" not in etag and etag == _file_md5(source)
+
+
+def _publish_item(
+    client,
+    bucket: str,
+    item: UploadItem,
+    *,
+    sha256: Optional[str],
+    copy_source_key: Optional[str],
+    transfer_config: TransferConfig,
+) -> Dict[str, Any]:
+    started = time.monotonic()
+    try:
+        size: Optional[int] = item.source.stat().st_size
+    except OSError:
+        size = None
+    try:
+        if _remote_matches(client, bucket, item.key, sha256, item.source):
+            action = "skipped"
+            logger.info("unchanged, skipped s3://%s/%s", bucket, item.key)
+        elif copy_source_key:
+            # Server-side copy keeps the runs/ object's content type and sha256 metadata.
+            client.copy_object(Bucket=bucket, Key=item.key, CopySource={"Bucket": bucket, "Key": copy_source_key})
+            action = "copied"
+            logger.info("copied s3://%s/%s -> s3://%s/%s", bucket, copy_source_key, bucket, item.key)
+        else:
+            extra_args: Dict[str, Any] = {}
             if item.content_type:
                 extra_args["ContentType"] = item.content_type
-            if extra_args:
-                client.upload_file(str(item.source), bucket, item.key, ExtraArgs=extra_args)
-            else:
-                client.upload_file(str(item.source), bucket, item.key)
+            if sha256:
+                extra_args["Metadata"] = {SHA256_METADATA_KEY: sha256}
+            client.upload_file(str(item.source), bucket, item.key, ExtraArgs=extra_args or None, Config=transfer_config)
+            action = "uploaded"
             logger.info("uploaded %s -> s3://%s/%s", item.source, bucket, item.key)
-            uploaded += 1
-        except ClientError as exc:
-            logger.error("upload failed: %s", _format_s3_client_error(exc, bucket))
-            raise
-    return uploaded
+    except ClientError as exc:
+        logger.error("upload failed: %s", _format_s3_client_error(exc, bucket))
+        raise
+    return {
+        "s3_key": item.key,
+        "kind": item.scope,
+        "action": action,
+        "bytes": size,
+        "seconds": round(time.monotonic() - started, 6),
+    }
+
+
+def _upload_plan(
+    client,
+    bucket: str,
+    plan: List[UploadItem],
+    dry_run: bool,
+    *,
+    verifiable: Optional[Dict[str, Dict[str, str]]] = None,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Publish `plan` and return one transfer record per object.
+
+    runs/ objects are uploaded on a bounded worker pool (multipart above MULTIPART_THRESHOLD_BYTES);
+    latest/ objects are then server-side copies of their runs/ key. Objects whose remote sha256
+    metadata or plain ETag already matches are skipped.
+    """
+    runs_key_by_logical = {item.logical_key: item.key for item in plan if item.scope == "runs"}
+    if dry_run:
+        for item in plan:
+            suffix = " (server-side copy)" if item.scope == "latest" else ""
+            logger.info("dry-run: %s -> s3://%s/%s%s", item.source, bucket, item.key, suffix)
+        return []
+
+    verifiable = verifiable or {}
+    transfer_config = _transfer_config()
+
+    def _publish(item: UploadItem) -> Dict[str, Any]:
+        meta = verifiable.get(item.logical_key)
+        sha256 = meta.get("sha256") if isinstance(meta, dict) else None
+        return _publish_item(
+            client,
+            bucket,
+            item,
+            sha256=sha256 if isinstance(sha256, str) else None,
+            copy_source_key=runs_key_by_logical.get(item.logical_key) if item.scope == "latest" else None,
+            transfer_config=transfer_config,
+        )
+
+    transfers: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=_publish_workers(workers), thread_name_prefix="s3-publish") as pool:
+        # latest/ copies read the runs/ objects, so they start once every runs/ upload has finished.
+        for scope in ("runs", "latest"):
+            transfers.extend(pool.map(_publish, [item for item in plan if item.scope == scope]))
+    return transfers
+
+
+def _transfer_summary(transfers: List[Dict[str, Any]], *, workers: int, seconds: float) -> Dict[str, Any]:
+    counts = dict.fromkeys(("uploaded", "copied", "skipped"), 0)
+    for record in transfers:
+        counts[record["action"]] += 1
+    return {
+        **counts,
+        "bytes_uploaded": sum(record["bytes"] or 0 for record in transfers if record["action"] == "uploaded"),
+        "workers": workers,
+        "seconds": round(seconds, 6),
+        "files": transfers,
+    }
+
+
+class StreamingPublisher:
+    """
+    Background uploader for a run's `runs/` artifacts, fed as each provider/profile finishes.
+
+    Only the immutable per-run keys are written here (same keys, content type and sha256 metadata
+    as `_build_upload_plan`). `latest/` copies and `last_success` pointers are still written by
+    `publish_run` once the run completes, where these objects are skipped as unchanged. `rollback()`
+    deletes what was streamed when the run does not complete. Upload errors are recorded, not
+    raised: `publish_run` retries anything that is missing or differs.
+    """
+
+    def __init__(
+        self,
+        *,
+        run_id: str,
+        bucket: str,
+        prefix: str,
+        candidate_id: str = DEFAULT_CANDIDATE_ID,
+        workers: Optional[int] = None,
+        client_factory: Optional[Any] = None,
+    ) -> None:
+        self.run_id = run_id
+        self.bucket = bucket
+        self.runs_prefix = f"{_s3_candidate_prefix(prefix, candidate_id)}/runs/{run_id}".strip("/")
+        self.workers = _publish_workers(workers)
+        self._client_factory = client_factory or (lambda: boto3.client("s3"))
+        self._client: Any = None
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="s3-stream")
+        self._futures: List[Future] = []
+        self._submitted: set = set()
+        self._transfer_config = _transfer_config()
+        self._started = time.monotonic()
+        # True once drain() (or rollback()) has waited for every upload and stopped the pool.
+        self.settled = False
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    def submit(self, provider: str, profile: str, paths: Iterable[Path]) -> None:
+        """Queue the finished artifacts of one provider/profile; missing files are left to publish_run."""
+        for path in paths:
+            key = f"{self.runs_prefix}/{provider}/{profile}/{path.name}"
+            if key in self._submitted or not path.exists():
+                continue
+            self._submitted.add(key)
+            item = UploadItem(
+                source=path,
+                key=key,
+                content_type=_content_type_for(path),
+                logical_key=key,
+                scope="runs",
+            )
+            self._futures.append(self._pool.submit(self._upload, item))
+
+    def _upload(self, item: UploadItem) -> Dict[str, Any]:
+        return _publish_item(
+            self._get_client(),
+            self.bucket,
+            item,
+            sha256=compute_sha256_file(item.source),
+            copy_source_key=None,
+            transfer_config=self._transfer_config,
+        )
+
+    def drain(self) -> Dict[str, Any]:
+        """Wait for every queued upload; returns the transfer summary plus any errors."""
+        transfers: List[Dict[str, Any]] = []
+        errors: List[str] = []
+        for future in self._futures:
+            try:
+                transfers.append(future.result())
+            except Exception as exc:
+                errors.append(repr(exc))
+        self._pool.shutdown(wait=True)
+        self.settled = True
+        summary = _transfer_summary(transfers, workers=self.workers, seconds=time.monotonic() - self._started)
+        summary["errors"] = errors
+        return summary
+
+    def rollback(self) -> Dict[str, Any]:
+        """Drain, then delete every object this run streamed (objects that were already present are kept)."""
+        summary = self.drain()
+        deleted = 0
+        for record in summary["files"]:
+            if record["action"] != "uploaded":
+                continue
+            try:
+                self._get_client().delete_object(Bucket=self.bucket, Key=record["s3_key"])
+                deleted += 1
+            except ClientError as exc:
+                logger.error("rollback delete failed: %s", _format_s3_client_error(exc, self.bucket))
+                summary["errors"].append(repr(exc))
+        logger.info("rolled back %d streamed object(s) under s3://%s/%s", deleted, self.bucket, self.runs_prefix)
+        summary["rolled_back"] = deleted
+        return summary
 
 
 def _resolve_bucket_prefix(bucket: Optional[str], prefix: Optional[str]) -> Tuple[str, str]:
@@ -390,6 +630,7 @@ def publish_run(
     providers: Optional[List[str]] = None,
     profiles: Optional[List[str]] = None,
     write_last_success: bool = True,
+    workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     safe_candidate_id = sanitize_candidate_id(candidate_id)
     resolved_bucket, resolved_prefix = _resolve_bucket_prefix(bucket, prefix)
@@ -427,11 +668,22 @@ def publish_run(
         if require_s3 and not dry_run:
             raise SystemExit(2)
         return {"status": "error", "uploaded_files_count": 0}
+    transfers_summary: Optional[Dict[str, Any]] = None
     if dry_run:
-        uploaded = _upload_plan(None, resolved_bucket or "dry-run", plan, dry_run=True)
+        _upload_plan(None, resolved_bucket or "dry-run", plan, dry_run=True)
+        uploaded = 0
     else:
         client = boto3.client("s3")
-        uploaded = _upload_plan(client, resolved_bucket, plan, dry_run=False)
+        publish_workers = _publish_workers(workers)
+        transfer_started = time.monotonic()
+        transfers = _upload_plan(
+            client, resolved_bucket, plan, dry_run=False, verifiable=verifiable, workers=publish_workers
+        )
+        transfers_summary = _transfer_summary(
+            transfers, workers=publish_workers, seconds=time.monotonic() - transfer_started
+        )
+        # Skipped objects are already published with identical bytes, so they count as published.
+        uploaded = len(transfers)
     if uploaded == 0 and not dry_run:
         logger.error("no artifacts uploaded for run %s", run_id)
         if require_s3:
@@ -545,6 +797,7 @@ def publish_run(
         "bucket": resolved_bucket,
         "prefixes": build_s3_prefixes(resolved_prefix, run_id, latest_prefixes, candidate_id=safe_candidate_id),
         "uploaded_files_count": uploaded,
+        "transfers": transfers_summary,
         "dashboard_url": dashboard_url or None,
         "pointer_write": pointer_write,
     }
@@ -593,7 +846,19 @@ def main() -> int:
         default="",
         help="Comma-separated profiles to publish latest pointers for (default: all).",
     )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Parallel upload workers (default: JOBINTEL_S3_PUBLISH_WORKERS or {DEFAULT_PUBLISH_WORKERS}).",
+    )
+    ap.add_argument(
+        "--no-hash-cache",
+        action="store_true",
+        help="Re-hash every local file instead of trusting cached fingerprints.",
+    )
     args = ap.parse_args()
+    configure_fingerprint_cache(HASH_CACHE_JSON, enabled=not args.no_hash_cache)
     try:
         candidate_id = sanitize_candidate_id(args.candidate_id)
     except ValueError as exc:
@@ -685,7 +950,9 @@ def main() -> int:
         require_s3=args.require_s3,
         providers=providers,
         profiles=profiles,
+        workers=args.workers,
     )
+    flush_fingerprint_cache()
     if args.json:
         print(json.dumps({"ok": True, "preflight": preflight, "result": result}, sort_keys=True))
     return 0
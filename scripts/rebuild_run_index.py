@@ -3,18 +3,18 @@ from __future__ import annotations
 
 import argparse
 import json
-from typing import List
+from typing import List, Optional
 
 from ji_engine.config import DEFAULT_CANDIDATE_ID, sanitize_candidate_id
 from ji_engine.run_repository import FileSystemRunRepository, discover_candidates
 
 
-def _rebuild_for_candidates(candidate_ids: List[str]) -> List[dict]:
+def _rebuild_for_candidates(candidate_ids: List[str], since: Optional[str] = None) -> List[dict]:
     repo = FileSystemRunRepository()
     results: List[dict] = []
     for candidate_id in sorted(candidate_ids):
         safe_candidate = sanitize_candidate_id(candidate_id)
-        results.append(repo.rebuild_index(safe_candidate))
+        results.append(repo.rebuild_index(safe_candidate, since=since))
     return results
 
 
@@ -22,6 +22,11 @@ def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Rebuild deterministic SQLite run index from run artifacts.")
     parser.add_argument("--candidate-id", default=DEFAULT_CANDIDATE_ID)
     parser.add_argument("--all-candidates", action="store_true")
+    parser.add_argument(
+        "--since",
+        default=None,
+        help="Only re-index run dirs at or after this run id (full rebuild when the index is missing)",
+    )
     parser.add_argument("--json", action="store_true", help="Emit JSON output")
     args = parser.parse_args(argv)
 
@@ -30,7 +35,7 @@ def main(argv: List[str] | None = None) -> int:
     else:
         candidate_ids = [sanitize_candidate_id(args.candidate_id)]
 
-    results = _rebuild_for_candidates(candidate_ids)
+    results = _rebuild_for_candidates(candidate_ids, since=args.since)
     if args.json:
         print(json.dumps({"results": results}, sort_keys=True))
     else:
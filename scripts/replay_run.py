@@ -8,19 +8,42 @@ except ModuleNotFoundError:
 
 import argparse
 import json
+import os
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from ji_engine.config import DATA_DIR, RUN_METADATA_DIR, STATE_DIR
+from ji_engine.config import (
+    DATA_DIR,
+    DEFAULT_CANDIDATE_ID,
+    HASH_CACHE_JSON,
+    RUN_METADATA_DIR,
+    STATE_DIR,
+    candidate_run_metadata_dir,
+    sanitize_candidate_id,
+)
+from ji_engine.utils.atomic_write import atomic_write_text
+from ji_engine.utils.compression import artifact_digest, codec_for_suffix
+from ji_engine.utils.fingerprint_cache import configure_fingerprint_cache, flush_fingerprint_cache
 from ji_engine.utils.verification import compute_sha256_file, verify_verifiable_artifacts
 
+BULK_REPLAY_MATRIX_SCHEMA_VERSION = 1
+DEFAULT_BULK_REPLAY_WORKERS = 4
+
 
 def _sanitize_run_id(run_id: str) -> str:
     return run_id.replace(":", "").replace("-", "").replace(".", "")
 
 
+def _candidate_runs_dir(candidate_id: str) -> Path:
+    safe_candidate = sanitize_candidate_id(candidate_id)
+    if safe_candidate == DEFAULT_CANDIDATE_ID:
+        return RUN_METADATA_DIR
+    return candidate_run_metadata_dir(safe_candidate)
+
+
 def _load_run_report(path: Path) -> Dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
@@ -34,6 +57,13 @@ def _resolve_archived_path(path_str: Optional[str], state_dir: Path) -> Optional
     return str(state_dir / path)
 
 
+def _content_sha256(path: Path) -> str:
+    # Archived inputs may be stored compressed; their recorded sha256 is over the uncompressed bytes.
+    if codec_for_suffix(path):
+        return artifact_digest(path)[0]
+    return compute_sha256_file(path)
+
+
 def _resolve_provider(report: Dict[str, Any]) -> str:
     providers = report.get("providers") or []
     if isinstance(providers, list) and providers:
@@ -278,7 +308,7 @@ def _replay_report(
                 "missing": True,
             }
             continue
-        actual = compute_sha256_file(path)
+        actual = _content_sha256(path)
         ok = actual == expected_hash
         if logical_name in verifiable_mismatch_by_label:
             mismatch = verifiable_mismatch_by_label[logical_name]
@@ -578,6 +608,123 @@ def _recalc_report(
     )
 
 
+def _bulk_run_dirs(runs_dir: Path, since: Optional[str]) -> List[Path]:
+    """Run dirs under `runs_dir` that hold a run_report.json, oldest first; `since` keeps runs at or after it."""
+    floor = _sanitize_run_id(since) if since else None
+    run_dirs = sorted(report_path.parent for report_path in runs_dir.glob("*/run_report.json"))
+    return [run_dir for run_dir in run_dirs if floor is None or run_dir.name >= floor]
+
+
+def _artifact_status(meta: Dict[str, Optional[object]]) -> str:
+    if meta.get("missing"):
+        return "missing"
+    return "match" if meta.get("match") else "mismatch"
+
+
+def _warm_replay_worker(hash_cache_enabled: bool) -> None:
+    """Process-pool initializer: pay for the scoring engine import once per worker, not once per run."""
+    import scripts.score_jobs  # noqa: F401
+
+    configure_fingerprint_cache(HASH_CACHE_JSON, enabled=hash_cache_enabled)
+
+
+def _replay_run_dir(run_dir: Path, profile: str, recalc: bool) -> Dict[str, Any]:
+    """Strict replay (or recalc) of one run dir, reduced to one row of the bulk matrix."""
+    state_dir = run_dir.parent.parent if run_dir.parent.name == "runs" else STATE_DIR
+    try:
+        report = _load_run_report(run_dir / "run_report.json")
+    except Exception as exc:
+        return {
+            "run_id": run_dir.name,
+            "run_dir": str(run_dir),
+            "exit_code": 3,
+            "summary": f"ERROR: failed to load run report: {exc!r}",
+            "counts": {"checked": 0, "matched": 0, "mismatched": 0, "missing": 0},
+            "artifacts": {},
+        }
+    if recalc:
+        exit_code, lines, artifacts, counts, _, _ = _recalc_report(report, profile, True, run_dir, True, state_dir)
+    else:
+        exit_code, lines, artifacts, counts = _replay_report(report, profile, True, state_dir)
+    flush_fingerprint_cache()
+    return {
+        "run_id": report.get("run_id") or run_dir.name,
+        "run_dir": str(run_dir),
+        "exit_code": exit_code,
+        "summary": lines[0] if lines else None,
+        "counts": counts,
+        "artifacts": {key: _artifact_status(meta) for key, meta in sorted(artifacts.items())},
+    }
+
+
+def _bulk_replay(
+    run_dirs: List[Path], *, profile: str, recalc: bool, workers: int, hash_cache_enabled: bool
+) -> Dict[str, Any]:
+    """
+    Replay every run dir (strict) and return the run x artifact matrix. Runs fan out over a
+    process pool; recalc patches sys.argv and writes under each run's own _recalc/ dir, so
+    runs never share state across workers.
+    """
+    if workers <= 1 or len(run_dirs) <= 1:
+        rows = [_replay_run_dir(run_dir, profile, recalc) for run_dir in run_dirs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(run_dirs)),
+            initializer=_warm_replay_worker,
+            initargs=(hash_cache_enabled,),
+        ) as pool:
+            rows = list(pool.map(_replay_run_dir, run_dirs, [profile] * len(run_dirs), [recalc] * len(run_dirs)))
+    failed = [row["run_id"] for row in rows if row["exit_code"] != 0]
+    return {
+        "schema_version": BULK_REPLAY_MATRIX_SCHEMA_VERSION,
+        "profile": profile,
+        "recalc": recalc,
+        "runs": rows,
+        "summary": {
+            "runs": len(rows),
+            "passed": len(rows) - len(failed),
+            "failed": len(failed),
+            "failed_run_ids": failed,
+            "mismatched": sum(row["counts"].get("mismatched", 0) for row in rows),
+            "missing": sum(row["counts"].get("missing", 0) for row in rows),
+        },
+    }
+
+
+def _bulk_main(args: argparse.Namespace) -> int:
+    runs_dir = Path(args.runs_dir) if args.runs_dir else _candidate_runs_dir(args.candidate)
+    run_dirs = _bulk_run_dirs(runs_dir, args.since)
+    if not run_dirs:
+        if not args.quiet and not args.json:
+            print(f"ERROR: no run reports found under {runs_dir}", file=sys.stderr)
+        return 2
+    workers = args.workers if args.workers is not None else min(DEFAULT_BULK_REPLAY_WORKERS, os.cpu_count() or 1)
+    matrix = _bulk_replay(
+        run_dirs,
+        profile=args.profile,
+        recalc=bool(args.recalc),
+        workers=workers,
+        hash_cache_enabled=not args.no_hash_cache,
+    )
+    if args.matrix_out:
+        atomic_write_text(
+            Path(args.matrix_out), json.dumps(matrix, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+        )
+    if args.json:
+        print(json.dumps(matrix, ensure_ascii=False, sort_keys=True))
+    elif not args.quiet:
+        for row in matrix["runs"]:
+            counts = row["counts"]
+            print(
+                f"{row['run_id']}: {'PASS' if row['exit_code'] == 0 else 'FAIL'} checked={counts.get('checked', 0)} "
+                f"matched={counts.get('matched', 0)} mismatched={counts.get('mismatched', 0)} "
+                f"missing={counts.get('missing', 0)}"
+            )
+        summary = matrix["summary"]
+        print(f"SUMMARY: runs={summary['runs']} passed={summary['passed']} failed={summary['failed']}")
+    return max((row["exit_code"] for row in matrix["runs"]), default=0)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Replay deterministic scoring from a run report.")
     parser.add_argument("--run-report", type=str, help="Path to run report JSON.")
@@ -589,9 +736,39 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--recalc", action="store_true", help="Recompute scoring outputs from archived inputs.")
     parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON to stdout.")
     parser.add_argument("--quiet", action="store_true", help="Suppress non-JSON output.")
+    parser.add_argument(
+        "--no-hash-cache",
+        action="store_true",
+        help="Re-hash every artifact from disk instead of trusting cached fingerprints (audits).",
+    )
+    parser.add_argument("--all", action="store_true", help="Replay every run under the runs dir (always strict).")
+    parser.add_argument("--since", type=str, help="Replay every run at or after this run id (always strict).")
+    parser.add_argument(
+        "--candidate",
+        type=str,
+        default=DEFAULT_CANDIDATE_ID,
+        help="Candidate whose runs dir to use when --runs-dir is not given (default: local).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Bulk replay worker processes (default: min({DEFAULT_BULK_REPLAY_WORKERS}, CPU count)).",
+    )
+    parser.add_argument("--matrix-out", type=str, help="Bulk replay: write the run x artifact matrix JSON here.")
     args = parser.parse_args(argv)
+    configure_fingerprint_cache(HASH_CACHE_JSON, enabled=not args.no_hash_cache)
+
+    try:
+        candidate_runs_dir = _candidate_runs_dir(args.candidate)
+    except ValueError as exc:
+        if not args.quiet and not args.json:
+            print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    if args.all or args.since:
+        return _bulk_main(args)
 
-    runs_dir = Path(args.runs_dir) if args.runs_dir else RUN_METADATA_DIR
+    runs_dir = Path(args.runs_dir) if args.runs_dir else candidate_runs_dir
     try:
         report_path = _resolve_report_path(args.run_id, args.run_report, args.run_dir, runs_dir)
     except SystemExit as exc:
@@ -617,7 +794,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         run_dir = report_path.parent
     else:
         run_id = report.get("run_id")
-        run_dir = RUN_METADATA_DIR / _sanitize_run_id(run_id or report_path.stem)
+        run_dir = candidate_runs_dir / _sanitize_run_id(run_id or report_path.stem)
     state_dir = STATE_DIR
     if run_dir.parent.name == "runs":
         state_dir = run_dir.parent.parent
@@ -651,6 +828,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(json.dumps(payload, ensure_ascii=False, sort_keys=True))
     elif not args.quiet:
         _print_report(lines)
+    flush_fingerprint_cache()
     return exit_code
 
 
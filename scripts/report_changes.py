@@ -8,6 +8,8 @@ from typing import Dict, List
 
 import scripts.run_daily as run_daily
 from ji_engine.config import HISTORY_DIR, USER_STATE_DIR
+from ji_engine.utils.compression import read_artifact_text, resolve_artifact_path
+from ji_engine.utils.diff_engine import JobDiff
 from ji_engine.utils.job_identity import job_identity
 from ji_engine.utils.user_state import load_user_state
 
@@ -66,10 +68,10 @@ def _history_dir_for(run_id: str, profile: str) -> Path:
 
 
 def _load_ranked(run_id: str, profile: str) -> List[Dict[str, object]]:
-    path = _history_dir_for(run_id, profile) / run_daily.ranked_jobs_json(profile).name
+    path = resolve_artifact_path(_history_dir_for(run_id, profile) / run_daily.ranked_jobs_json(profile).name)
     if not path.exists():
         return []
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(read_artifact_text(path))
 
 
 def _load_user_state_map(profile: str) -> Dict[str, Dict[str, object]]:
@@ -146,7 +148,7 @@ def _report(
 
     curr_jobs = _load_ranked(run_id, profile)
     prev_jobs = _load_ranked(prev_id, profile) if prev_id else []
-    new_jobs, changed_jobs, removed_jobs, changed_fields = run_daily._diff(prev_jobs, curr_jobs)
+    new_jobs, changed_jobs, removed_jobs, changed_fields = run_daily._diff(JobDiff(prev_jobs, curr_jobs))
 
     counts = {"new": len(new_jobs), "changed": len(changed_jobs), "removed": len(removed_jobs)}
     print("Counts:", counts)
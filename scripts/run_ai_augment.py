@@ -6,17 +6,22 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import Future, as_completed
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from ji_engine.ai.augment import compute_content_hash, load_cached_ai, save_cached_ai
+from ji_engine.ai.augment import compute_content_hash, default_augment_cache
+from ji_engine.ai.cache import AICache
+from ji_engine.ai.chat_client import DEFAULT_CHAT_MODEL, ChatCompletionsClient, resolve_ai_api_key, resolve_ai_base_url
+from ji_engine.ai.executor import AIExecutor
 from ji_engine.ai.extract_rules import RULES_VERSION, extract_ai_fields
 from ji_engine.ai.match import compute_match
-from ji_engine.ai.provider import AIProvider, OpenAIProvider, StubProvider
+from ji_engine.ai.provider import AIProvider, HTTPChatProvider, LatencyStubProvider, OpenAIProvider, StubProvider
 from ji_engine.ai.schema import ensure_ai_payload
 from ji_engine.config import ENRICHED_JOBS_JSON
 from ji_engine.profile_loader import load_candidate_profile
-from ji_engine.utils.atomic_write import atomic_write_text
+from ji_engine.utils.jsonl import iter_json_records, write_json_records
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,11 +29,6 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 logger = logging.getLogger(__name__)
-_CANONICAL_JSON_KWARGS = {"ensure_ascii": False, "sort_keys": True, "separators": (",", ":")}
-
-
-def _canonical_json(obj: Any) -> str:
-    return json.dumps(obj, **_CANONICAL_JSON_KWARGS) + "\n"
 
 
 OUTPUT_PATH = Path("data/openai_enriched_jobs_ai.json")
@@ -38,21 +38,56 @@ PROFILE_PATH = Path("data/candidate_profile.json")
 def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     ap = argparse.ArgumentParser()
     ap.add_argument("--ai_live", action="store_true", help="Use live AI provider (requires OPENAI_API_KEY)")
-    ap.add_argument("--in_path", help="Input enriched jobs JSON (default: config ENRICHED_JOBS_JSON)")
-    ap.add_argument("--out_path", help="Output AI-enriched jobs JSON (default: data/openai_enriched_jobs_ai.json)")
+    ap.add_argument("--in_path", help="Input enriched jobs JSON or .jsonl (default: config ENRICHED_JOBS_JSON)")
+    ap.add_argument(
+        "--out_path",
+        help="Output AI-enriched jobs JSON, or JSON Lines for a .jsonl path (default: data/openai_enriched_jobs_ai.json)",
+    )
+    ap.add_argument(
+        "--max_workers", type=int, default=None, help="Concurrent provider calls (default: AI_MAX_CONCURRENCY or 4)"
+    )
+    ap.add_argument(
+        "--stub_latency_ms",
+        type=float,
+        default=None,
+        help="Without --ai_live, sleep this long per stub call (benchmarks concurrency offline)",
+    )
+    ap.add_argument(
+        "--ai_base_url",
+        default=None,
+        help="OpenAI-compatible API base URL, e.g. a local stand-in (default: JOBINTEL_AI_BASE_URL)",
+    )
     return ap.parse_args(argv)
 
 
 def _select_provider(args: argparse.Namespace) -> AIProvider:
+    base_url = resolve_ai_base_url(args.ai_base_url)
+    if args.ai_live and base_url:
+        logger.info("Using HTTPChatProvider at %s (ai_live enabled).", base_url)
+        client = ChatCompletionsClient(
+            base_url,
+            api_key=resolve_ai_api_key(base_url),
+            model=os.environ.get("AI_MODEL", "").strip() or DEFAULT_CHAT_MODEL,
+        )
+        return HTTPChatProvider(client)
+    if base_url:
+        logger.warning("AI base URL %s is ignored without --ai_live; using StubProvider.", base_url)
     if args.ai_live:
         api_key = os.environ.get("OPENAI_API_KEY", "").strip()
         if api_key:
             logger.info("Using OpenAIProvider (ai_live enabled).")
             return OpenAIProvider(api_key=api_key)
         logger.warning("ai_live requested but OPENAI_API_KEY not set; falling back to StubProvider.")
+    if args.stub_latency_ms:
+        return LatencyStubProvider(latency_ms=args.stub_latency_ms)
     return StubProvider()
 
 
+# Cache writes go out in batches of this size as results are produced, not once at the end.
+_CACHE_WRITE_BATCH = 32
+# Input records read, prefetched and written per step; bounds the records and results held at once.
+_STREAM_CHUNK = 256
+
 _RULE_FIELDS = (
     "skills_required",
     "skills_preferred",
@@ -87,9 +122,131 @@ def _ensure_rules(payload: Dict[str, Any], job: Dict[str, Any], provider: AIProv
     return payload, needs_upgrade
 
 
-def main(argv: Optional[List[str]] = None, provider: Optional[AIProvider] = None) -> int:
+def _extract(provider: AIProvider, job: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return provider.extract(job)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.error("AI provider extract failed: %s", exc, exc_info=True)
+        return {
+            "summary": f"AI extraction failed for {job.get('title', '(untitled)')}",
+            "confidence": 0.0,
+            "notes": f"provider_error:{exc}",
+        }
+
+
+def _merge_rules(payload: Dict[str, Any], rules: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(payload)
+    for k in ("skills_required", "skills_preferred", "role_family", "seniority", "red_flags"):
+        v = merged.get(k)
+        add = rules.get(k)
+        if isinstance(v, list):
+            seen = set(str(x) for x in v)
+            for x in add or []:
+                sx = str(x)
+                if sx not in seen:
+                    v.append(sx)
+                    seen.add(sx)
+        elif not v:
+            merged[k] = add
+    return merged
+
+
+def _augment_payload(
+    job: Dict[str, Any],
+    provider: AIProvider,
+    candidate_profile: Any,
+    cached: Optional[Dict[str, Any]],
+    raw: Optional[Dict[str, Any]],
+) -> tuple[Dict[str, Any], bool]:
+    """
+    The job's AI payload from a cache hit (`cached`) or a provider result (`raw`), with rule
+    backfill and match scoring applied; the flag says whether the cache entry should be rewritten.
+    """
+    if cached:
+        payload = ensure_ai_payload(cached)
+        payload, changed = _ensure_rules(payload, job, provider)
+    else:
+        raw = raw or {}
+        # Backfill/augment fields deterministically when using stub provider or when skills are missing/empty.
+        rules = extract_ai_fields(job) if isinstance(provider, StubProvider) else {}
+        if not (raw.get("skills_required") or raw.get("skills_preferred")):
+            rules = extract_ai_fields(job)
+        payload = ensure_ai_payload(_merge_rules(raw, rules))
+        changed = True
+
+    # If cached payload was produced before rules existed (or provider returned empty skills), backfill now.
+    if isinstance(provider, StubProvider) or not (payload.get("skills_required") or payload.get("skills_preferred")):
+        payload = ensure_ai_payload(_merge_rules(payload, extract_ai_fields(job)))
+        payload, _ = _ensure_rules(payload, job, provider)
+        changed = True
+
+    if candidate_profile:
+        match_score, match_notes = compute_match(payload, candidate_profile)
+        payload["match_score"] = match_score
+        # concatenate notes (payload may already contain notes)
+        notes_text = "; ".join(str(n) for n in match_notes) if isinstance(match_notes, list) else str(match_notes)
+        if payload.get("notes"):
+            payload["notes"] = f"{payload['notes']} | {notes_text}"
+        else:
+            payload["notes"] = notes_text
+        payload = ensure_ai_payload(payload)
+        # keep cache in sync with computed match score
+        changed = True
+    return payload, changed
+
+
+def _prefetch_extractions(
+    jobs: List[Dict[str, Any]],
+    provider: AIProvider,
+    cache: AICache,
+    executor: AIExecutor,
+    candidate_profile: Any,
+    seen: set[str],
+) -> tuple[Dict[str, Optional[Dict[str, Any]]], Dict[str, Dict[str, Any]]]:
+    """
+    First-occurrence cache lookups (one batch lookup per chunk of input) and, for every miss,
+    the provider result (fetched concurrently) turned into its final payload. Paid results are
+    written to the cache in batches of `_CACHE_WRITE_BATCH` as they complete, so an interrupted
+    run keeps what it already bought. Keys in `seen` (met in an earlier chunk) and repeats of a
+    key are left to the main loop, which reads what the first occurrence saved.
+    """
+    unique: Dict[str, tuple[str, str, Dict[str, Any]]] = {}
+    for job in jobs:
+        job_id = job.get("apply_url") or job.get("id") or job.get("applyId") or "unknown"
+        chash = compute_content_hash(job)
+        key = f"{job_id}|{chash}"
+        if key not in seen:
+            unique.setdefault(key, (job_id, chash, job))
+    found = cache.get_many((job_id, chash) for job_id, chash, _ in unique.values())
+
+    first_lookup: Dict[str, Optional[Dict[str, Any]]] = {}
+    fresh: Dict[str, Dict[str, Any]] = {}
+    futures: Dict[Future, tuple[str, str, str, Dict[str, Any]]] = {}
+    batch: List[tuple[str, str, Dict[str, Any]]] = []
+    for key, (job_id, chash, job) in unique.items():
+        cached = found.get((job_id, chash))
+        first_lookup[key] = ensure_ai_payload(cached) if cached else None
+        if not first_lookup[key]:
+            futures[executor.submit(key, _extract, provider, job)] = (key, job_id, chash, job)
+    for future in as_completed(futures):
+        key, job_id, chash, job = futures[future]
+        fresh[key], _ = _augment_payload(job, provider, candidate_profile, None, future.result())
+        batch.append((job_id, chash, fresh[key]))
+        if len(batch) >= _CACHE_WRITE_BATCH:
+            cache.put_many(batch)
+            batch = []
+    cache.put_many(batch)
+    return first_lookup, fresh
+
+
+def main(
+    argv: Optional[List[str]] = None,
+    provider: Optional[AIProvider] = None,
+    cache: Optional[AICache] = None,
+) -> int:
     args = _parse_args(argv or [])
     provider = provider or _select_provider(args)
+    cache = cache or default_augment_cache()
 
     in_path = Path(args.in_path) if args.in_path else ENRICHED_JOBS_JSON
     out_path = Path(args.out_path) if args.out_path else OUTPUT_PATH
@@ -105,92 +262,71 @@ def main(argv: Optional[List[str]] = None, provider: Optional[AIProvider] = None
         except Exception as exc:  # pragma: no cover - defensive
             logger.warning(f"Could not load candidate_profile.json; proceeding without match scoring: {exc}")
 
-    jobs: List[Dict[str, Any]] = json.loads(in_path.read_text(encoding="utf-8"))
-    augmented: List[Dict[str, Any]] = []
     cache_hits = 0
-
-    for job in jobs:
-        job_id = job.get("apply_url") or job.get("id") or job.get("applyId") or "unknown"
-        chash = compute_content_hash(job)
-        cached = load_cached_ai(job_id, chash)
-        if cached:
-            cache_hits += 1
-            payload = ensure_ai_payload(cached)
-            payload, upgraded = _ensure_rules(payload, job, provider)
-            if upgraded:
-                save_cached_ai(job_id, chash, payload)
-        else:
-            try:
-                raw = provider.extract(job)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.error("AI provider extract failed: %s", exc, exc_info=True)
-                raw = {
-                    "summary": f"AI extraction failed for {job.get('title', '(untitled)')}",
-                    "confidence": 0.0,
-                    "notes": f"provider_error:{exc}",
-                }
-            # Backfill/augment fields deterministically when using stub provider or when skills are missing/empty.
-            rules = extract_ai_fields(job) if isinstance(provider, StubProvider) else {}
-            if not (raw.get("skills_required") or raw.get("skills_preferred")):
-                rules = extract_ai_fields(job)
-            merged = dict(raw)
-            for k in ("skills_required", "skills_preferred", "role_family", "seniority", "red_flags"):
-                v = merged.get(k)
-                add = rules.get(k)
-                if isinstance(v, list):
-                    seen = set(str(x) for x in v)
-                    for x in add or []:
-                        sx = str(x)
-                        if sx not in seen:
-                            v.append(sx)
-                            seen.add(sx)
-                elif not v:
-                    merged[k] = add
-            payload = ensure_ai_payload(merged)
-            save_cached_ai(job_id, chash, payload)
-
-        # If cached payload was produced before rules existed (or provider returned empty skills), backfill now.
-        if isinstance(provider, StubProvider) or not (
-            payload.get("skills_required") or payload.get("skills_preferred")
-        ):
-            rules = extract_ai_fields(job)
-            merged = dict(payload)
-            for k in ("skills_required", "skills_preferred", "role_family", "seniority", "red_flags"):
-                v = merged.get(k)
-                add = rules.get(k)
-                if isinstance(v, list):
-                    seen = set(str(x) for x in v)
-                    for x in add or []:
-                        sx = str(x)
-                        if sx not in seen:
-                            v.append(sx)
-                            seen.add(sx)
-                elif not v:
-                    merged[k] = add
-            payload = ensure_ai_payload(merged)
-            payload, upgraded = _ensure_rules(payload, job, provider)
-            save_cached_ai(job_id, chash, payload)
-
-        if candidate_profile:
-            match_score, match_notes = compute_match(payload, candidate_profile)
-            payload["match_score"] = match_score
-            # concatenate notes (payload may already contain notes)
-            notes_text = "; ".join(str(n) for n in match_notes) if isinstance(match_notes, list) else str(match_notes)
-            if payload.get("notes"):
-                payload["notes"] = f"{payload['notes']} | {notes_text}"
-            else:
-                payload["notes"] = notes_text
-            payload = ensure_ai_payload(payload)
-            # keep cache in sync with computed match score
-            save_cached_ai(job_id, chash, payload)
-
-        job_out = dict(job)
-        job_out["ai"] = payload
-        job_out["ai_content_hash"] = chash
-        augmented.append(job_out)
-
-    atomic_write_text(out_path, _canonical_json(augmented))
-    logger.info(f"AI augment complete. cache_hits={cache_hits}, total={len(jobs)}")
+    total = 0
+
+    # The input is streamed in chunks of `_STREAM_CHUNK` records. Within a chunk, provider calls
+    # for cache misses run concurrently up front and are cached as they complete; everything else
+    # (merging, match scoring, output) stays in input order, so the output matches a serial run.
+    # Augmented records are streamed to the output as they are produced.
+    visited: set[str] = set()
+    # Rewrites of cached entries are buffered as JSON text and stored every `_CACHE_WRITE_BATCH`
+    # entries; a repeat of a key reads the buffered copy, exactly what it would read from the cache.
+    pending: Dict[str, tuple[str, str, str]] = {}
+
+    def _flush_pending() -> None:
+        cache.put_many((job_id, chash, json.loads(text)) for job_id, chash, text in pending.values())
+        pending.clear()
+
+    def _save(job_id: str, chash: str, key: str, payload: Dict[str, Any]) -> None:
+        pending[key] = (job_id, chash, json.dumps(ensure_ai_payload(payload), ensure_ascii=False))
+        if len(pending) >= _CACHE_WRITE_BATCH:
+            _flush_pending()
+
+    def _load(job_id: str, chash: str, key: str) -> Optional[Dict[str, Any]]:
+        if key in pending:
+            return ensure_ai_payload(json.loads(pending[key][2]))
+        cached = cache.get(job_id, chash)
+        return ensure_ai_payload(cached) if cached else None
+
+    def _augmented(executor: AIExecutor) -> Iterator[Dict[str, Any]]:
+        nonlocal cache_hits, total
+        records = iter_json_records(in_path)
+        for jobs in iter(lambda: list(islice(records, _STREAM_CHUNK)), []):
+            first_lookup, fresh = _prefetch_extractions(jobs, provider, cache, executor, candidate_profile, visited)
+            for job in jobs:
+                total += 1
+                job_id = job.get("apply_url") or job.get("id") or job.get("applyId") or "unknown"
+                chash = compute_content_hash(job)
+                key = f"{job_id}|{chash}"
+                first = key not in visited
+                visited.add(key)
+                if first and key in fresh:
+                    # Built and cached when its provider call completed.
+                    payload = fresh.pop(key)
+                else:
+                    cached = first_lookup[key] if first else _load(job_id, chash, key)
+                    if cached:
+                        cache_hits += 1
+                    raw = None if cached else _extract(provider, job)
+                    payload, changed = _augment_payload(job, provider, candidate_profile, cached, raw)
+                    if changed:
+                        _save(job_id, chash, key, payload)
+
+                job_out = dict(job)
+                job_out["ai"] = payload
+                job_out["ai_content_hash"] = chash
+                yield job_out
+
+    try:
+        with AIExecutor(args.max_workers) as executor:
+            write_json_records(out_path, _augmented(executor))
+    finally:
+        _flush_pending()
+        cache.flush()
+    if executor.stats()["calls"]:
+        logger.info("AI augment provider calls: %s", executor.stats())
+    logger.info(f"AI augment complete. cache_hits={cache_hits}, total={total}")
     logger.info(f"Output: {out_path}")
     return 0
 
@@ -9,6 +9,8 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from ji_engine.ai.chat_client import ChatCompletionsClient, resolve_ai_api_key, resolve_ai_base_url
+from ji_engine.ai.executor import AIExecutor
 from ji_engine.config import (
     DATA_DIR,
     DEFAULT_CANDIDATE_ID,
@@ -59,10 +61,19 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     ap = argparse.ArgumentParser()
     ap.add_argument("--provider", default="openai")
     ap.add_argument("--profile", default="cs")
+    ap.add_argument("--profiles", default="", help="Comma-separated profiles to run concurrently; overrides --profile")
     ap.add_argument("--ranked_path", help="Path to ranked_jobs.json")
     ap.add_argument("--prev_path", help="Path to previous ranked_jobs.json (optional)")
     ap.add_argument("--run_id", help="Run ID to write into state/runs/<run_id>")
     ap.add_argument("--prompt_path", help="Path to prompt template markdown")
+    ap.add_argument(
+        "--max_workers", type=int, default=None, help="Concurrent profiles (default: AI_MAX_CONCURRENCY or 4)"
+    )
+    ap.add_argument(
+        "--ai_base_url",
+        default=None,
+        help="OpenAI-compatible API base URL, e.g. a local stand-in (default: JOBINTEL_AI_BASE_URL)",
+    )
     return ap.parse_args(argv)
 
 
@@ -76,44 +87,61 @@ def main(argv: Optional[list[str]] = None) -> int:
     if not run_id:
         raise SystemExit("run_id is required (no last_run.json found).")
 
-    ranked_path = Path(args.ranked_path) if args.ranked_path else _default_ranked_path(args.provider, args.profile)
+    profiles = list(dict.fromkeys(p.strip() for p in args.profiles.split(",") if p.strip())) or [args.profile]
+    if len(profiles) > 1 and (args.ranked_path or args.prev_path):
+        raise SystemExit("--ranked_path/--prev_path apply to a single profile; drop them or --profiles.")
     prev_path = Path(args.prev_path) if args.prev_path else None
     prompt_path = Path(args.prompt_path) if args.prompt_path else PROMPT_PATH
 
     ai_enabled = os.environ.get("AI_ENABLED", "0").strip() == "1"
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
     model_name = os.environ.get("AI_MODEL", "stub")
-    if ai_enabled and not api_key:
+    base_url = resolve_ai_base_url(args.ai_base_url)
+    if ai_enabled and not api_key and not base_url:
         ai_enabled = False
         ai_reason = "ai_enabled_but_missing_openai_api_key"
     else:
         ai_reason = "ai_disabled" if not ai_enabled else ""
-
-    md_path, json_path, payload = generate_insights(
-        provider=args.provider,
-        profile=args.profile,
-        ranked_path=ranked_path,
-        prev_path=prev_path,
-        run_id=run_id,
-        prompt_path=prompt_path,
-        ai_enabled=ai_enabled,
-        ai_reason=ai_reason,
-        model_name=model_name,
-        candidate_id=candidate_id,
+    chat_client = (
+        ChatCompletionsClient(base_url, api_key=resolve_ai_api_key(base_url), model=model_name)
+        if ai_enabled and base_url
+        else None
     )
 
-    logger.info("AI insights written: %s", json_path)
-    logger.info("AI insights markdown: %s", md_path)
-
-    if ai_enabled:
-        webhook = resolve_webhook(args.profile)
-        if webhook:
-            summary = payload.get("recommended_actions") or payload.get("themes") or []
-            bullets = "\n".join([f"- {b}" for b in summary[:3]])
-            base_url = os.environ.get("JOBINTEL_DASHBOARD_URL", "").rstrip("/")
-            run_url = f"{base_url}/runs/{run_id}" if base_url else f"Run ID: {run_id}"
-            message = f"**Weekly AI insights — {args.provider}/{args.profile}**\n{bullets}\n{run_url}"
-            post_discord(webhook, message)
+    def _generate(profile: str):
+        ranked_path = Path(args.ranked_path) if args.ranked_path else _default_ranked_path(args.provider, profile)
+        return generate_insights(
+            provider=args.provider,
+            profile=profile,
+            ranked_path=ranked_path,
+            prev_path=prev_path,
+            run_id=run_id,
+            prompt_path=prompt_path,
+            ai_enabled=ai_enabled,
+            ai_reason=ai_reason,
+            model_name=model_name,
+            candidate_id=candidate_id,
+            chat_client=chat_client,
+        )
+
+    # Profiles generate concurrently; results (and Discord posts) are handled in --profiles order.
+    with AIExecutor(args.max_workers) as executor:
+        futures = [(profile, executor.submit(f"{args.provider}/{profile}", _generate, profile)) for profile in profiles]
+        results = [(profile, future.result()) for profile, future in futures]
+
+    for profile, (md_path, json_path, payload) in results:
+        logger.info("AI insights written: %s", json_path)
+        logger.info("AI insights markdown: %s", md_path)
+
+        if ai_enabled:
+            webhook = resolve_webhook(profile)
+            if webhook:
+                summary = payload.get("recommended_actions") or payload.get("themes") or []
+                bullets = "\n".join([f"- {b}" for b in summary[:3]])
+                base_url = os.environ.get("JOBINTEL_DASHBOARD_URL", "").rstrip("/")
+                run_url = f"{base_url}/runs/{run_id}" if base_url else f"Run ID: {run_id}"
+                message = f"**Weekly AI insights — {args.provider}/{profile}**\n{bullets}\n{run_url}"
+                post_discord(webhook, message)
     return 0
 
 
@@ -9,6 +9,7 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from ji_engine.ai.chat_client import ChatCompletionsClient, resolve_ai_api_key, resolve_ai_base_url
 from ji_engine.config import (
     DATA_DIR,
     DEFAULT_CANDIDATE_ID,
@@ -61,6 +62,17 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     ap.add_argument("--max_tokens_per_job", type=int, default=400)
     ap.add_argument("--total_budget", type=int, default=2000)
     ap.add_argument("--prompt_path", help="Path to prompt template markdown")
+    ap.add_argument(
+        "--max_workers", type=int, default=None, help="Concurrent brief generations (default: AI_MAX_CONCURRENCY or 4)"
+    )
+    ap.add_argument(
+        "--max_cost_usd", default=os.environ.get("AI_MAX_COST_USD"), help="Estimated cost ceiling for the run"
+    )
+    ap.add_argument(
+        "--ai_base_url",
+        default=None,
+        help="OpenAI-compatible API base URL, e.g. a local stand-in (default: JOBINTEL_AI_BASE_URL)",
+    )
     return ap.parse_args(argv)
 
 
@@ -82,11 +94,17 @@ def main(argv: Optional[list[str]] = None) -> int:
     )
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
     model_name = os.environ.get("AI_MODEL", "stub")
-    if ai_enabled and not api_key:
+    base_url = resolve_ai_base_url(args.ai_base_url)
+    if ai_enabled and not api_key and not base_url:
         ai_enabled = False
         ai_reason = "ai_enabled_but_missing_openai_api_key"
     else:
         ai_reason = "ai_disabled" if not ai_enabled else ""
+    chat_client = (
+        ChatCompletionsClient(base_url, api_key=resolve_ai_api_key(base_url), model=model_name)
+        if ai_enabled and base_url
+        else None
+    )
 
     md_path, json_path, payload = generate_job_briefs(
         provider=args.provider,
@@ -101,6 +119,9 @@ def main(argv: Optional[list[str]] = None) -> int:
         model_name=model_name,
         prompt_path=prompt_path,
         candidate_id=candidate_id,
+        max_workers=args.max_workers,
+        max_cost_usd=args.max_cost_usd,
+        chat_client=chat_client,
     )
 
     logger.info("AI job briefs written: %s", json_path)
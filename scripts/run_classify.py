@@ -14,13 +14,12 @@ except ModuleNotFoundError:
     from scripts import _bootstrap  # noqa: F401
 
 import argparse
-import json
 import logging
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 from ji_engine.config import EMBED_CACHE_JSON, LABELED_JOBS_JSON, RAW_JOBS_JSON
 from ji_engine.embeddings.provider import EmbeddingProvider, OpenAIEmbeddingProvider, StubEmbeddingProvider
@@ -35,13 +34,9 @@ from ji_engine.models import JobSource, RawJobPosting
 from ji_engine.pipeline.classifier import label_jobs
 from ji_engine.profile_loader import load_candidate_profile
 from ji_engine.utils.compat import zip_pairs
+from ji_engine.utils.jsonl import iter_json_records, write_json_records
 
 logger = logging.getLogger(__name__)
-_CANONICAL_JSON_KWARGS = {"ensure_ascii": False, "sort_keys": True, "separators": (",", ":")}
-
-
-def _canonical_json(obj: Any) -> str:
-    return json.dumps(obj, **_CANONICAL_JSON_KWARGS) + "\n"
 
 
 def _load_raw_jobs(path: Path) -> List[RawJobPosting]:
@@ -49,9 +44,8 @@ def _load_raw_jobs(path: Path) -> List[RawJobPosting]:
         raise FileNotFoundError(f"Jobs file not found: {path}")
 
     jobs: List[RawJobPosting] = []
-    data = json.loads(path.read_text(encoding="utf-8"))
-
-    for d in data:
+    # Records are streamed (JSON array or .jsonl) and converted one at a time.
+    for d in iter_json_records(path):
         # Normalize types for RawJobPosting(**d)
         try:
             d["source"] = JobSource(d["source"])
@@ -112,8 +106,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         )
 
     ap = argparse.ArgumentParser()
-    ap.add_argument("--in_path", help="Input raw jobs JSON (default: config RAW_JOBS_JSON)")
-    ap.add_argument("--out_path", help="Output labeled jobs JSON (default: config LABELED_JOBS_JSON)")
+    ap.add_argument("--in_path", help="Input raw jobs JSON or .jsonl (default: config RAW_JOBS_JSON)")
+    ap.add_argument(
+        "--out_path",
+        help="Output labeled jobs JSON, or JSON Lines for a .jsonl path (default: config LABELED_JOBS_JSON)",
+    )
     args = ap.parse_args(argv)
 
     profile = load_candidate_profile()
@@ -158,11 +155,10 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.info(f"\n{i}. {job['title']}")
         logger.info(f"   {job['apply_url']}")
 
-    # Write labeled jobs to JSON file
-    output_data = []
-    for job, labeled_result in zip_pairs(jobs, labeled):
-        output_data.append(
-            {
+    # Write labeled jobs to JSON (or JSON Lines for a .jsonl out_path), one record at a time.
+    def _output_records() -> Iterator[Dict[str, Any]]:
+        for job, labeled_result in zip_pairs(jobs, labeled):
+            yield {
                 "title": job.title,
                 "apply_url": job.apply_url,
                 "detail_url": job.detail_url,
@@ -174,14 +170,9 @@ def main(argv: Optional[List[str]] = None) -> int:
                 "is_us_or_remote_us_guess": labeled_result.get("is_us_or_remote_us_guess"),
                 "us_guess_reason": labeled_result.get("us_guess_reason"),
             }
-        )
 
     out_path = Path(args.out_path) if args.out_path else LABELED_JOBS_JSON
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        _canonical_json(output_data),
-        encoding="utf-8",
-    )
+    write_json_records(out_path, _output_records())
 
     logger.info(f"\nWrote labeled jobs to {out_path}")
     return 0
@@ -27,6 +27,7 @@ import os
 import platform
 import runpy
 import shutil
+import sqlite3
 import subprocess
 import sys
 import tempfile
@@ -37,10 +38,17 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ji_engine.ai.cache_store import (
+    AI_CACHE_COUNTERS,
+    ai_cache_counter_delta,
+    ai_cache_db_path,
+    read_ai_cache_counters,
+)
 from ji_engine.config import (
     DATA_DIR,
     DEFAULT_CANDIDATE_ID,
     ENRICHED_JOBS_JSON,
+    HASH_CACHE_JSON,
     HISTORY_DIR,
     LABELED_JOBS_JSON,
     LOCK_PATH,
@@ -50,10 +58,12 @@ from ji_engine.config import (
     SNAPSHOT_DIR,
     STATE_DIR,
     USER_STATE_DIR,
+    candidate_job_history_path,
     candidate_last_run_pointer_path,
     candidate_last_run_read_paths,
     candidate_last_success_pointer_path,
     candidate_last_success_read_paths,
+    candidate_latest_view_path,
     candidate_run_metadata_dir,
     candidate_state_paths,
     ensure_dirs,
@@ -67,7 +77,10 @@ from ji_engine.config import (
     shortlist_md as shortlist_md_path,
 )
 from ji_engine.history_retention import update_history_retention, write_history_run_artifacts
+from ji_engine.latest_view import build_latest_records, latest_record, read_latest_view, update_latest_view
 from ji_engine.providers.registry import load_providers_config, resolve_provider_ids
+from ji_engine.run_job_index import RunJobIndex
+from ji_engine.run_repository import FileSystemRunRepository
 from ji_engine.scoring import (
     ScoringConfig,
     ScoringConfigError,
@@ -77,9 +90,13 @@ from ji_engine.scoring import (
 from ji_engine.semantic.core import DEFAULT_SEMANTIC_MODEL_ID, EMBEDDING_BACKEND_VERSION
 from ji_engine.semantic.step import finalize_semantic_artifacts, semantic_score_artifact_path
 from ji_engine.utils.atomic_write import atomic_write_text
+from ji_engine.utils.canonical_json import canonical_text
+from ji_engine.utils.compression import artifact_compression, compress_file, compressed_path, read_artifact_text
 from ji_engine.utils.content_fingerprint import content_fingerprint
+from ji_engine.utils.diff_engine import JobDiff, KeyedDiff
 from ji_engine.utils.diff_report import build_diff_markdown, build_diff_report
 from ji_engine.utils.dotenv import load_dotenv
+from ji_engine.utils.fingerprint_cache import configure_fingerprint_cache, flush_fingerprint_cache
 from ji_engine.utils.job_identity import job_identity
 from ji_engine.utils.redaction import scan_json_for_secrets, scan_text_for_secrets
 from ji_engine.utils.time import utc_now_naive, utc_now_z
@@ -90,8 +107,8 @@ from ji_engine.utils.verification import (
     compute_sha256_file,
 )
 from jobintel.alerts import (
-    build_last_seen,
     compute_alerts,
+    current_last_seen,
     load_last_seen,
     resolve_score_delta,
     write_alerts,
@@ -387,7 +404,7 @@ def _run(cmd: List[str], *, stage: str) -> None:
 
 
 def _read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(read_artifact_text(path))
 
 
 def _write_json(path: Path, obj: Any) -> None:
@@ -399,8 +416,7 @@ def _write_json(path: Path, obj: Any) -> None:
 def _write_canonical_json(path: Path, obj: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     _redaction_guard_json(path, obj)
-    payload = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n"
-    path.write_text(payload, encoding="utf-8")
+    path.write_text(canonical_text(obj), encoding="utf-8")
 
 
 def _redaction_enforce_enabled() -> bool:
@@ -583,7 +599,7 @@ def _build_publish_section(
     pointer_write = s3_meta.get("pointer_write") if isinstance(s3_meta, dict) else None
     if not pointer_write:
         pointer_write = {"global": "disabled", "provider_profile": {}, "error": None}
-    return {
+    section = {
         "enabled": bool(enabled),
         "required": bool(required),
         "bucket": bucket,
@@ -591,6 +607,11 @@ def _build_publish_section(
         "pointer_write": pointer_write,
         "skip_reason": skip_reason,
     }
+    for key in ("transfers", "streamed"):
+        value = s3_meta.get(key) if isinstance(s3_meta, dict) else None
+        if value:
+            section[key] = value
+    return section
 
 
 def _publish_contract_failed(publish_section: Dict[str, Any]) -> bool:
@@ -613,6 +634,40 @@ def _resolve_publish_state(
     return True, require_s3, None
 
 
+def _start_stream_publisher(args: argparse.Namespace, run_id: str) -> Optional[publish_s3.StreamingPublisher]:
+    stream_requested = bool(args.publish_stream) or os.environ.get("PUBLISH_S3_STREAM", "0").strip() == "1"
+    publish_requested = (
+        os.environ.get("PUBLISH_S3", "0").strip() == "1" or bool(args.publish_s3) or bool(args.publish_dry_run)
+    )
+    dry_run = bool(args.publish_dry_run) or os.environ.get("PUBLISH_S3_DRY_RUN", "0").strip() == "1"
+    if not stream_requested or not publish_requested or dry_run:
+        return None
+    bucket, prefix = publish_s3._resolve_bucket_prefix(None, None)
+    if not bucket:
+        return None
+    logger.info("S3 streaming publish enabled: s3://%s/%s/runs/%s", bucket, prefix, run_id)
+    return publish_s3.StreamingPublisher(run_id=run_id, bucket=bucket, prefix=prefix, candidate_id=CANDIDATE_ID)
+
+
+def _stream_profile_outputs(
+    stream_publisher: Optional[publish_s3.StreamingPublisher], provider: str, profile: str
+) -> None:
+    """Hand a provider/profile's final ranked outputs to the streaming publisher, if one is running."""
+    if stream_publisher is None:
+        return
+    stream_publisher.submit(
+        provider,
+        profile,
+        [
+            _provider_ranked_jobs_json(provider, profile),
+            _provider_ranked_jobs_csv(provider, profile),
+            _provider_ranked_families_json(provider, profile),
+            _provider_shortlist_md(provider, profile),
+            _provider_top_md(provider, profile),
+        ],
+    )
+
+
 def _score_meta_path(ranked_json: Path) -> Path:
     return ranked_json.with_suffix(".score_meta.json")
 
@@ -1402,6 +1457,17 @@ def _local_last_success_pointer_paths(provider: str, profile: str) -> List[Path]
     ]
 
 
+def _resolve_latest_view_ranked(provider: str, profile: str, current_run_id: str) -> Optional[Path]:
+    record = latest_record(read_latest_view(candidate_latest_view_path(CANDIDATE_ID)), provider, profile)
+    if record is None or record.get("run_id") == current_run_id:
+        return None
+    ranked = record.get("ranked_json")
+    ranked_path = Path(ranked) if isinstance(ranked, str) and ranked else None
+    if ranked_path is not None and ranked_path.exists():
+        return ranked_path
+    return None
+
+
 def _resolve_local_last_success_ranked(provider: str, profile: str, current_run_id: str) -> Optional[Path]:
     for pointer_path in _local_last_success_pointer_paths(provider, profile):
         if not pointer_path.exists():
@@ -1444,6 +1510,29 @@ def _resolve_latest_run_ranked(provider: str, profile: str, current_run_id: str)
     return candidates[-1][2]
 
 
+def _resolve_prev_ranked(
+    provider: str, profile: str, run_id: str, state_path: Path
+) -> Tuple[List[Dict[str, Any]], Optional[Path]]:
+    """Prior ranked jobs for the changelog and the file they came from (None when there is no baseline)."""
+    ranked_path = _resolve_latest_view_ranked(provider, profile, run_id)
+    if ranked_path is None:
+        ranked_path = _resolve_local_last_success_ranked(provider, profile, run_id)
+    if ranked_path is None and state_path.exists():
+        ranked_path = state_path
+    if ranked_path is None:
+        ranked_path = _resolve_latest_run_ranked(provider, profile, run_id)
+    if ranked_path is None and s3_enabled():
+        bucket = os.environ.get("JOBINTEL_S3_BUCKET", "").strip()
+        prefix = os.environ.get("JOBINTEL_S3_PREFIX", "jobintel").strip("/")
+        if bucket:
+            s3_info = _resolve_s3_baseline(provider, profile, run_id, bucket=bucket, prefix=prefix)
+            if s3_info.ranked_path and s3_info.ranked_path.exists():
+                ranked_path = s3_info.ranked_path
+    if ranked_path is None:
+        return [], None
+    return _read_json(ranked_path), ranked_path
+
+
 def _history_run_dir(run_id: str, profile: str, provider: Optional[str] = None) -> Path:
     run_date = run_id.split("T")[0]
     sanitized = _sanitize_run_id(run_id)
@@ -1465,6 +1554,20 @@ def _copy_artifact(src: Path, dest: Path) -> None:
     shutil.copy2(src, dest)
 
 
+def _copy_archived_artifact(src: Path, dest: Path) -> Path:
+    """
+    Copy a large artifact into a per-run archive, compressed when JOBINTEL_ARTIFACT_COMPRESSION
+    selects a codec (`dest` then gains `.gz`/`.zst`). Returns the path actually written.
+    """
+    codec = artifact_compression()
+    if codec is None or not src.exists():
+        _copy_artifact(src, dest)
+        return dest
+    stored = compressed_path(dest, codec)
+    compress_file(src, stored, codec)
+    return stored
+
+
 def _atomic_copy(src: Path, dest: Path) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
     tmp = dest.with_name(dest.name + ".tmp")
@@ -1485,15 +1588,33 @@ def _archive_input(
     dest_rel: Path,
     *,
     state_dir: Path = STATE_DIR,
+    compress: bool = False,
 ) -> Dict[str, Any]:
+    """
+    Copy a run input into the run dir. With `compress` and a configured codec the copy is stored
+    compressed; `sha256`/`bytes` always describe the uncompressed input and the stored file's
+    digest is recorded separately as `compressed_sha256`/`compressed_bytes`.
+    """
     if not src.exists():
         logger.error("Archive source missing: %s", src)
         raise SystemExit(2)
     dest = run_dir / dest_rel
+    codec = artifact_compression() if compress else None
+    compression: Dict[str, Any] = {}
     try:
-        _atomic_copy(src, dest)
-        sha256 = compute_sha256_file(dest)
-        size = dest.stat().st_size
+        if codec is None:
+            _atomic_copy(src, dest)
+            sha256 = compute_sha256_file(dest)
+            size = dest.stat().st_size
+        else:
+            dest = compressed_path(dest, codec)
+            digests = compress_file(src, dest, codec)
+            sha256, size = digests["sha256"], digests["bytes"]
+            compression = {
+                "compression": codec,
+                "compressed_sha256": digests["compressed_sha256"],
+                "compressed_bytes": digests["compressed_bytes"],
+            }
     except SystemExit:
         raise
     except Exception as exc:
@@ -1505,6 +1626,7 @@ def _archive_input(
         "sha256": sha256,
         "bytes": size,
         "hash_algo": "sha256",
+        **compression,
     }
 
 
@@ -1527,7 +1649,9 @@ def _archive_run_inputs(
         logger.error("Scoring config missing for archival: %s", scoring_config_path)
         raise SystemExit(2)
     return {
-        "selected_scoring_input": _archive_input(run_dir, selected_input_path, base / "selected_scoring_input.json"),
+        "selected_scoring_input": _archive_input(
+            run_dir, selected_input_path, base / "selected_scoring_input.json", compress=True
+        ),
         "profile_config": _archive_input(run_dir, profiles_config_path, base / "profiles.json"),
         "scoring_config": _archive_input(run_dir, scoring_config_path, base / "scoring.v1.json"),
     }
@@ -1540,6 +1664,28 @@ def _run_registry_dir(run_id: str) -> Path:
     return candidate_run_metadata_dir(CANDIDATE_ID) / safe_run
 
 
+def _upsert_run_index(run_id: str, run_report_path: Optional[Path] = None) -> None:
+    """Keep the run index current for this run; a failure only costs a rescan on the next read."""
+    try:
+        FileSystemRunRepository(RUN_METADATA_DIR).upsert_run(
+            run_id, candidate_id=CANDIDATE_ID, run_report_path=run_report_path
+        )
+    except Exception as exc:
+        logger.warning("run_index upsert failed for %s: %r", run_id, exc)
+
+
+def _update_latest_view(run_report_path: Path, index_path: Path) -> None:
+    """Refresh the latest view for this run's provider/profiles; on failure lookups fall back to the pointers."""
+    try:
+        run_report = json.loads(run_report_path.read_text(encoding="utf-8"))
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        records = build_latest_records(run_report, index_path.parent, index)
+        if records:
+            update_latest_view(candidate_latest_view_path(CANDIDATE_ID), records)
+    except Exception as exc:
+        logger.warning("latest view update failed for %s: %r", index_path.parent.name, exc)
+
+
 def _write_run_registry(
     run_id: str,
     providers: List[str],
@@ -1569,8 +1715,8 @@ def _write_run_registry(
         for src in provider_inputs:
             if not src.exists():
                 continue
-            dest = provider_dir / src.name
-            _copy_artifact(src, dest)
+            # Keyed by the logical name; the path may point at a compressed copy.
+            dest = _copy_archived_artifact(src, provider_dir / src.name)
             rel = dest.relative_to(run_dir).as_posix()
             provider_payload["artifacts"][src.name] = rel
             artifacts.setdefault(src.name, rel)
@@ -1626,6 +1772,11 @@ def _write_run_registry(
 
     index_path = run_dir / "index.json"
     index_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    try:
+        RunJobIndex(run_dir).build(payload)
+    except (OSError, sqlite3.Error) as exc:
+        # The dashboard rebuilds a missing index on first query.
+        logger.warning("run job index build failed for %s: %r", run_id, exc)
     return index_path
 
 
@@ -1638,16 +1789,21 @@ def _archive_profile_artifacts(
 ) -> None:
     history_dir = _history_run_dir(run_id, profile, provider)
     latest_dir = _latest_profile_dir(profile, provider)
+    # (artifact, large): per-run history keeps the large ones compressed when configured;
+    # latest/ always holds plain copies.
     artifacts = [
-        _provider_ranked_jobs_json(provider or "openai", profile),
-        _provider_ranked_jobs_csv(provider or "openai", profile),
-        _provider_ranked_families_json(provider or "openai", profile),
-        _provider_shortlist_md(provider or "openai", profile),
+        (_provider_ranked_jobs_json(provider or "openai", profile), True),
+        (_provider_ranked_jobs_csv(provider or "openai", profile), True),
+        (_provider_ranked_families_json(provider or "openai", profile), False),
+        (_provider_shortlist_md(provider or "openai", profile), False),
     ]
-    for src in artifacts:
+    for src, large in artifacts:
         dest_history = history_dir / src.name
         dest_latest = latest_dir / src.name
-        _copy_artifact(src, dest_history)
+        if large:
+            _copy_archived_artifact(src, dest_history)
+        else:
+            _copy_artifact(src, dest_history)
         _copy_artifact(src, dest_latest)
     _copy_artifact(run_metadata_path, latest_dir / "run_metadata.json")
     summary_file = "run_summary.txt"
@@ -2021,7 +2177,13 @@ def _resolve_s3_baseline(
     return BaselineInfo(run_id=None, source="none", path=None, ranked_path=None)
 
 
-def _build_delta_summary(run_id: str, providers: List[str], profiles: List[str]) -> Dict[str, Any]:
+def _build_delta_summary(
+    run_id: str,
+    providers: List[str],
+    profiles: List[str],
+    job_diffs: Optional[Dict[Tuple[str, str], JobDiff]] = None,
+) -> Dict[str, Any]:
+    """Delta summary per provider/profile; `job_diffs` holds the per-profile `JobDiff`s of this run."""
     summary: Dict[str, Any] = {
         "baseline_run_id": None,
         "baseline_run_path": None,
@@ -2068,6 +2230,7 @@ def _build_delta_summary(run_id: str, providers: List[str], profiles: List[str])
                 baseline_ranked_path,
                 provider,
                 profile,
+                diff=(job_diffs or {}).get((provider, profile)),
             )
             delta["baseline_run_id"] = baseline_run_id
             delta["baseline_run_path"] = baseline_run_path
@@ -2844,36 +3007,26 @@ def _apply_user_state_to_alerts(
     return adjusted
 
 
+def _changes_view(diff: JobDiff) -> KeyedDiff:
+    return diff.keyed("changes", _job_key, _hash_job)
+
+
 def _diff(
-    prev: List[Dict[str, Any]],
-    curr: List[Dict[str, Any]],
+    diff: JobDiff,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, List[str]]]:
-    prev_map = {_job_key(j): (j, _hash_job(j)) for j in prev}
-    curr_map = {_job_key(j): (j, _hash_job(j)) for j in curr}
+    view = _changes_view(diff)
 
-    new_jobs: List[Dict[str, Any]] = []
+    new_jobs: List[Dict[str, Any]] = [view.curr[k] for k in view.added]
     changed_jobs: List[Dict[str, Any]] = []
-    removed_jobs: List[Dict[str, Any]] = []
+    removed_jobs: List[Dict[str, Any]] = [view.prev[k] for k in view.removed]
     changed_fields: Dict[str, List[str]] = {}
 
-    for k, (cj, ch) in curr_map.items():
-        if k not in prev_map:
-            new_jobs.append(cj)
-        else:
-            pj, ph = prev_map[k]
-            if ph != ch:
-                changes: List[str] = []
-
-                for key, label in _FIELD_DIFF_KEYS:
-                    if _job_field_value(pj, key) != _job_field_value(cj, key):
-                        changes.append(label)
-
-                changed_fields[k] = changes
-                changed_jobs.append(cj)
-
-    for k, (pj, _) in prev_map.items():
-        if k not in curr_map:
-            removed_jobs.append(pj)
+    for k in view.changed:
+        pj, cj = view.prev[k], view.curr[k]
+        changed_fields[k] = [
+            label for key, label in _FIELD_DIFF_KEYS if _job_field_value(pj, key) != _job_field_value(cj, key)
+        ]
+        changed_jobs.append(cj)
 
     new_jobs.sort(key=lambda x: x.get("score", 0), reverse=True)
     changed_jobs.sort(key=lambda x: x.get("score", 0), reverse=True)
@@ -2998,6 +3151,7 @@ def _append_shortlist_changes_section(
     changed_fields: Dict[str, List[str]],
     prev_jobs: Optional[List[Dict[str, Any]]] = None,
     min_alert_score: int = 0,
+    diff: Optional[JobDiff] = None,
 ) -> None:
     """Append 'Changes since last run' section to shortlist markdown."""
     if not shortlist_path.exists():
@@ -3005,7 +3159,9 @@ def _append_shortlist_changes_section(
 
     # Build prev_map for looking up before values
     prev_map: Dict[str, Dict[str, Any]] = {}
-    if prev_jobs:
+    if diff is not None:
+        prev_map = _changes_view(diff).prev
+    elif prev_jobs:
         prev_map = {_job_key(j): j for j in prev_jobs}
 
     section_md = format_changes_section(
@@ -3334,6 +3490,7 @@ def _collect_run_costs(
     profiles: List[str],
     semantic_summary: Dict[str, Any],
     embedding_token_estimate_per_item: int = 128,
+    ai_cache_baseline: Optional[Dict[str, Dict[str, int]]] = None,
 ) -> Dict[str, Any]:
     run_dir = RUN_METADATA_DIR / _sanitize_run_id(run_id)
     embeddings_count = int((semantic_summary.get("embedded_job_count") or 0) or 0)
@@ -3461,6 +3618,20 @@ def _collect_run_costs(
                 "estimated_cost_usd": f"{ai_estimated_cost_usd:.6f}",
             },
         },
+        "ai_cache": _ai_cache_run_stats(ai_cache_baseline or {}),
+    }
+
+
+def _ai_cache_run_stats(baseline: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+    """AI cache store counter growth since `baseline` (taken at run start), per namespace and in total."""
+    namespaces = ai_cache_counter_delta(baseline, read_ai_cache_counters(ai_cache_db_path(STATE_DIR)))
+    totals = {name: sum(counts[name] for counts in namespaces.values()) for name in AI_CACHE_COUNTERS}
+    served = totals["hits"] + totals["remote_hits"] + totals["legacy_hits"]
+    lookups = served + totals["misses"]
+    return {
+        "namespaces": namespaces,
+        "totals": totals,
+        "hit_rate": round(served / lookups, 4) if lookups else None,
     }
 
 
@@ -3749,6 +3920,14 @@ def main() -> int:
         action="store_true",
         help="Plan S3 publish without uploading (requires --publish-s3 or implies it).",
     )
+    ap.add_argument(
+        "--publish-stream",
+        action="store_true",
+        help=(
+            "When publishing, upload each provider/profile's runs/ artifacts as soon as they are final "
+            "(also enable via PUBLISH_S3_STREAM=1); latest/ and last_success still flip at run end."
+        ),
+    )
     ap.add_argument(
         "--history-enabled",
         action="store_true",
@@ -3766,8 +3945,14 @@ def main() -> int:
         default=None,
         help="Retention: keep this many recent daily pointers per profile (env fallback: HISTORY_KEEP_DAYS=90).",
     )
+    ap.add_argument(
+        "--no-hash-cache",
+        action="store_true",
+        help="Hash every artifact from disk instead of reusing cached fingerprints (also JOBINTEL_NO_HASH_CACHE=1).",
+    )
 
     args = ap.parse_args()
+    configure_fingerprint_cache(HASH_CACHE_JSON, enabled=not args.no_hash_cache)
     history_enabled, history_keep_runs, history_keep_days = _resolve_history_settings(args)
     if args.snapshot_only and not args.offline:
         args.offline = True
@@ -3782,6 +3967,7 @@ def main() -> int:
     openai_only = providers == ["openai"]
     run_id = _resolve_run_id()
     print(f"JOBINTEL_RUN_ID={run_id}", flush=True)
+    ai_cache_baseline = read_ai_cache_counters(ai_cache_db_path(STATE_DIR))
     global USE_SUBPROCESS
     USE_SUBPROCESS = not args.no_subprocess
     log_file_enabled = _resolve_log_file_enabled(args)
@@ -3841,6 +4027,7 @@ def main() -> int:
     scoring_input_selection_by_profile: Dict[str, Dict[str, Any]] = {}
     diff_counts_by_provider: Dict[str, Dict[str, Dict[str, Any]]] = {}
     diff_summary_by_provider_profile: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    job_diffs: Dict[Tuple[str, str], JobDiff] = {}
     diff_report_by_provider_profile: Dict[str, Dict[str, Dict[str, Any]]] = {}
     user_state_counts_by_provider_profile: Dict[str, Dict[str, Dict[str, int]]] = {}
     scoring_inputs_by_provider: Dict[str, Dict[str, Dict[str, Optional[str]]]] = {}
@@ -3868,7 +4055,9 @@ def main() -> int:
         "history_keep_days": history_keep_days,
     }
 
-    def _finalize(status: str, extra: Optional[Dict[str, Any]] = None) -> str:
+    stream_publisher = _start_stream_publisher(args, run_id)
+
+    def _finalize_run(status: str, extra: Optional[Dict[str, Any]] = None) -> str:
         final_status = status
         s3_meta: Dict[str, Any] = {"status": "disabled"}
         proof_receipt_path: Optional[str] = None
@@ -3934,7 +4123,7 @@ def main() -> int:
             "pruned_log_dirs": [],
             "reason": "pending",
         }
-        delta_summary = _build_delta_summary(run_id, providers, profiles_list)
+        delta_summary = _build_delta_summary(run_id, providers, profiles_list, job_diffs)
         for provider, profiles in diff_summary_by_provider_profile.items():
             for profile, entry in profiles.items():
                 delta = delta_summary.get("provider_profile", {}).get(provider, {}).get(profile, {})
@@ -3984,6 +4173,7 @@ def main() -> int:
             run_id=run_id,
             profiles=profiles_list,
             semantic_summary=semantic_summary,
+            ai_cache_baseline=ai_cache_baseline,
         )
         costs_path = _write_costs_artifact(run_id, costs_payload)
         ai_rollups = _write_ai_accounting_rollups(CANDIDATE_ID)
@@ -4113,7 +4303,7 @@ def main() -> int:
                         provider=provider,
                     )
 
-        _write_run_registry(
+        registry_index_path = _write_run_registry(
             run_id,
             providers,
             profiles_list,
@@ -4121,6 +4311,9 @@ def main() -> int:
             diff_counts_by_provider,
             telemetry,
         )
+        _upsert_run_index(run_id, run_report_path=run_metadata_path)
+        if telemetry.get("success", False):
+            _update_latest_view(run_metadata_path, registry_index_path)
 
         s3_failed = False
         s3_exit_code: Optional[int] = None
@@ -4138,6 +4331,10 @@ def main() -> int:
         publish_enabled, require_s3, skip_reason = _resolve_publish_state(
             publish_requested, resolved_bucket, publish_required
         )
+        stream_meta: Optional[Dict[str, Any]] = None
+        if stream_publisher is not None:
+            # runs/ objects streamed so far only stay if the run completed; latest/ and pointers flip below.
+            stream_meta = stream_publisher.drain() if status == "success" else stream_publisher.rollback()
         if status != "success":
             skip_reason = f"skipped_status_{status}"
             publish_enabled = False
@@ -4206,6 +4403,8 @@ def main() -> int:
             else:
                 logger.info("S3 publish disabled.")
 
+        if stream_meta is not None and isinstance(s3_meta, dict):
+            s3_meta["streamed"] = stream_meta
         telemetry["stages"]["publish"] = {"duration_sec": round(max(0.0, time.time() - publish_started), 3)}
 
         required_contract = require_s3 and not dry_run
@@ -4228,6 +4427,7 @@ def main() -> int:
             )
         else:
             _update_run_metadata_publish(run_metadata_path, publish_section)
+        _upsert_run_index(run_id, run_report_path=run_metadata_path)
         logger.info(
             "PUBLISH_CONTRACT enabled=%s required=%s bucket=%s prefix=%s pointer_global=%s pointer_profiles=%s error=%s",
             publish_section.get("enabled"),
@@ -4256,6 +4456,7 @@ def main() -> int:
                         profile=profile,
                         run_report_path=run_metadata_path,
                         written_at=str(telemetry.get("ended_at") or _utcnow_iso()),
+                        job_history_db=candidate_job_history_path(CANDIDATE_ID),
                     )
                 except Exception as exc:
                     logger.warning(
@@ -4275,6 +4476,7 @@ def main() -> int:
                     "identity_map_path": artifact_result.identity_map_path if artifact_result else None,
                     "provenance_path": artifact_result.provenance_path if artifact_result else None,
                     "identity_count": artifact_result.identity_count if artifact_result else 0,
+                    "job_history_rows": artifact_result.job_history_rows if artifact_result else 0,
                     "run_pointer_path": result.run_pointer_path,
                     "daily_pointer_path": result.daily_pointer_path,
                     "runs_kept": result.runs_kept,
@@ -4446,6 +4648,15 @@ def main() -> int:
             raise SystemExit(s3_exit_code or 2)
         return final_status
 
+    def _finalize(status: str, extra: Optional[Dict[str, Any]] = None) -> str:
+        try:
+            return _finalize_run(status, extra)
+        finally:
+            # Exits that never reached the publish step (an early return or an exception) still
+            # delete what was streamed for this run and stop the upload pool.
+            if stream_publisher is not None and not stream_publisher.settled:
+                stream_publisher.rollback()
+
     current_stage = "startup"
 
     def record_stage(name: str, fn) -> Any:
@@ -4961,18 +5172,29 @@ def main() -> int:
                 curr = _read_json(ranked_json)
                 state_map, user_state_counts, ignored_ids, suppress_new_ids = _user_state_sets(profile, curr)
                 user_state_counts_by_provider_profile.setdefault(provider, {})[profile] = user_state_counts
+                fallback_applied = selection.get("us_only_fallback", {}).get("fallback_applied") is True
+
+                # One JobDiff per provider/profile: alerts, the changes section, diff report and delta
+                # summary all render from it. The US-only fallback suppresses the changelog, so it
+                # skips the baseline lookup.
+                prev: List[Dict[str, Any]] = []
+                prev_path: Optional[Path] = None
+                if not fallback_applied:
+                    prev, prev_path = _resolve_prev_ranked(provider, profile, run_id, state_path)
+                baseline_exists = prev_path is not None
+                job_diff = JobDiff(prev, curr)
+
                 alerts_json, alerts_md = _alerts_paths(provider, profile)
                 last_seen_path = _last_seen_path(provider, profile)
                 prev_last_seen = load_last_seen(last_seen_path)
-                alerts = compute_alerts(curr, prev_last_seen, score_delta=resolve_score_delta())
+                alerts = compute_alerts(curr, prev_last_seen, score_delta=resolve_score_delta(), diff=job_diff)
                 alerts = _apply_user_state_to_alerts(
                     alerts,
                     suppress_new_ids=suppress_new_ids,
                     ignored_ids=ignored_ids,
                 )
                 write_alerts(alerts_json, alerts_md, alerts, provider, profile)
-                write_last_seen(last_seen_path, build_last_seen(curr))
-                fallback_applied = selection.get("us_only_fallback", {}).get("fallback_applied") is True
+                write_last_seen(last_seen_path, current_last_seen(job_diff))
                 if fallback_applied:
                     label = _profile_label(provider, profile)
                     diff_counts = {
@@ -4990,6 +5212,7 @@ def main() -> int:
                         diff_counts_by_profile[profile] = diff_counts
                     logger.info("Changelog (%s) suppressed due to US-only fallback.", label)
                     _write_json(state_path, curr)
+                    _stream_profile_outputs(stream_publisher, provider, profile)
                     extra_lines: List[str] = []
                     policy_line = provider_policy_lines.get(provider)
                     if policy_line:
@@ -5019,30 +5242,8 @@ def main() -> int:
                     )
                     continue
 
-                prev: List[Dict[str, Any]] = []
-                baseline_exists = False
-                local_ranked = _resolve_local_last_success_ranked(provider, profile, run_id)
-                if local_ranked:
-                    prev = _read_json(local_ranked)
-                    baseline_exists = True
-                elif state_exists:
-                    prev = _read_json(state_path)
-                    baseline_exists = True
-                else:
-                    latest_ranked = _resolve_latest_run_ranked(provider, profile, run_id)
-                    if latest_ranked:
-                        prev = _read_json(latest_ranked)
-                        baseline_exists = True
-
-                if not baseline_exists and s3_enabled():
-                    bucket = os.environ.get("JOBINTEL_S3_BUCKET", "").strip()
-                    prefix = os.environ.get("JOBINTEL_S3_PREFIX", "jobintel").strip("/")
-                    if bucket:
-                        s3_info = _resolve_s3_baseline(provider, profile, run_id, bucket=bucket, prefix=prefix)
-                        if s3_info.ranked_path and s3_info.ranked_path.exists():
-                            prev = _read_json(s3_info.ranked_path)
-                            baseline_exists = True
-                new_jobs, changed_jobs, removed_jobs, changed_fields = _diff(prev, curr)
+                job_diffs[(provider, profile)] = job_diff
+                new_jobs, changed_jobs, removed_jobs, changed_fields = _diff(job_diff)
                 visible_new_jobs = _filter_by_ids(new_jobs, ignored_ids)
                 visible_changed_jobs = _filter_by_ids(changed_jobs, ignored_ids)
                 visible_removed_jobs = _filter_by_ids(removed_jobs, ignored_ids)
@@ -5064,7 +5265,10 @@ def main() -> int:
                     changed_fields,
                     prev_jobs=prev,
                     min_alert_score=args.min_alert_score,
+                    diff=job_diff,
                 )
+                # Ranked outputs and the shortlist are final from here on.
+                _stream_profile_outputs(stream_publisher, provider, profile)
 
                 diff_json_path, diff_md_path = _provider_diff_paths(provider, profile)
                 diff_report = build_diff_report(
@@ -5074,6 +5278,7 @@ def main() -> int:
                     profile=profile,
                     baseline_exists=baseline_exists,
                     ignored_ids=ignored_ids,
+                    diff=job_diff,
                 )
                 _write_canonical_json(diff_json_path, diff_report)
                 diff_markdown = build_diff_markdown(diff_report)
@@ -5335,6 +5540,7 @@ def main() -> int:
         _finalize("error", {"error": repr(e), "failed_stage": current_stage})
         return 3
     finally:
+        flush_fingerprint_cache()
         logger.info(f"===== jobintel end {_utcnow_iso()} =====")
 
 
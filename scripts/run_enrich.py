@@ -16,9 +16,9 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any
 
 from ji_engine.config import ENRICHED_JOBS_JSON, LABELED_JOBS_JSON
+from ji_engine.utils.jsonl import read_json_records, write_json_records
 from jobintel.enrichment import enrich_jobs
 
 try:
@@ -27,14 +27,13 @@ except ImportError:  # pragma: no cover - script execution fallback
     from scripts.schema_validate import resolve_named_schema_path, validate_payload
 
 
-def _canonical_json(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n"
-
-
 def main() -> None:
     ap = argparse.ArgumentParser(description="Deterministic enrichment step.")
-    ap.add_argument("--in_path", help="Input labeled jobs JSON (default: config LABELED_JOBS_JSON)")
-    ap.add_argument("--out_path", help="Output enriched jobs JSON (default: config ENRICHED_JOBS_JSON)")
+    ap.add_argument("--in_path", help="Input labeled jobs JSON or .jsonl (default: config LABELED_JOBS_JSON)")
+    ap.add_argument(
+        "--out_path",
+        help="Output enriched jobs JSON, or JSON Lines for a .jsonl path (default: config ENRICHED_JOBS_JSON)",
+    )
     ap.add_argument("--cache_dir", help="Optional cache dir (default: JOBINTEL_CACHE_DIR or data/ashby_cache)")
     ap.add_argument("--providers", help="Optional providers list (unused; for compatibility)")
     args = ap.parse_args()
@@ -48,14 +47,14 @@ def main() -> None:
         print("Run scripts/run_classify.py first to generate labeled jobs.")
         sys.exit(1)
 
-    labeled_jobs = json.loads(labeled_path.read_text(encoding="utf-8"))
-    if not isinstance(labeled_jobs, list):
-        print(f"Error: Labeled jobs file is not a list: {labeled_path}")
+    try:
+        labeled_jobs = read_json_records(labeled_path)
+    except ValueError as exc:
+        print(f"Error: Invalid labeled jobs file: {exc}")
         sys.exit(1)
 
     enriched_jobs = enrich_jobs(labeled_jobs, cache_dir)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(_canonical_json(enriched_jobs), encoding="utf-8")
+    write_json_records(output_path, enriched_jobs)
 
     schema_path = resolve_named_schema_path("enriched_jobs", 1)
     schema = json.loads(schema_path.read_text(encoding="utf-8"))
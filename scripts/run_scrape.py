@@ -30,7 +30,7 @@ from ji_engine.providers.retry import (
     record_policy_block,
 )
 from ji_engine.providers.snapshot_json_provider import SnapshotJsonProvider
-from ji_engine.utils.job_identity import job_identity
+from ji_engine.utils.job_identity import identities_for
 from jobintel.snapshots.validate import validate_snapshot_file
 
 _STATUS_CODE_RE = re.compile(r"status (\d+)")
@@ -48,15 +48,12 @@ def _normalize_jobs(raw: List[Any]) -> List[Dict[str, Any]]:
     jobs: List[Dict[str, Any]] = []
     for item in raw:
         if hasattr(item, "to_dict"):
-            job = item.to_dict()
-            if not job.get("job_id"):
-                job["job_id"] = job_identity(job, mode="provider")
-            jobs.append(job)
+            jobs.append(item.to_dict())
         elif isinstance(item, dict):
-            job = dict(item)
-            if not job.get("job_id"):
-                job["job_id"] = job_identity(job, mode="provider")
-            jobs.append(job)
+            jobs.append(dict(item))
+    missing = [job for job in jobs if not job.get("job_id")]
+    for job, identity in zip(missing, identities_for(missing, mode="provider"), strict=True):
+        job["job_id"] = identity
     return sorted(jobs, key=_sort_key)
 
 
@@ -3,10 +3,11 @@
 Score enriched job postings for CS-fit / customer-facing technical roles.
 
 Input:
-  data/openai_enriched_jobs.json (produced by scripts.enrich_jobs)
+  data/openai_enriched_jobs.json (produced by scripts.enrich_jobs; a .jsonl input is also accepted)
 
 Outputs:
   data/openai_ranked_jobs.json
+  data/openai_ranked_jobs.jsonl (optional, --out_jsonl)
   data/openai_ranked_jobs.csv
   data/openai_ranked_families.json
   data/openai_shortlist.md
@@ -40,7 +41,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ji_engine.ai.augment import compute_content_hash
-from ji_engine.ai.cache import AICache, FileSystemAICache, S3AICache
+from ji_engine.ai.cache import AICache
+from ji_engine.ai.cache_store import open_ai_cache_store
 from ji_engine.ai.provider import AIProvider, OpenAIProvider, StubProvider
 from ji_engine.ai.schema import ensure_ai_payload
 from ji_engine.config import (
@@ -57,13 +59,14 @@ from ji_engine.scoring import ScoringConfig, ScoringConfigError, load_scoring_co
 from ji_engine.semantic.boost import SemanticPolicy, apply_bounded_semantic_boost
 from ji_engine.semantic.core import DEFAULT_SEMANTIC_MODEL_ID, EMBEDDING_BACKEND_VERSION
 from ji_engine.utils.atomic_write import atomic_write_text, atomic_write_with
+from ji_engine.utils.canonical_json import canonical_dumps, canonical_text
 from ji_engine.utils.content_fingerprint import content_fingerprint
-from ji_engine.utils.job_identity import job_identity
-from ji_engine.utils.location_normalize import normalize_location_guess
+from ji_engine.utils.job_identity import JOB_IDENTITY_FIELD, job_identity
+from ji_engine.utils.jsonl import read_json_records, write_json_records
+from ji_engine.utils.location_normalize import shared_location_normalizer
 from ji_engine.utils.user_state import load_user_state_checked, normalize_user_status
 
 logger = logging.getLogger(__name__)
-JSON_DUMP_SETTINGS = {"ensure_ascii": False, "separators": (",", ":"), "sort_keys": True}
 _DEPRIORITIZED_USER_STATUSES = {"applied", "interviewing"}
 CSV_FIELDNAMES = [
     "job_id",
@@ -89,7 +92,7 @@ CSV_FIELDNAMES = [
 
 
 def _serialize_json(obj: Any) -> str:
-    return json.dumps(obj, **JSON_DUMP_SETTINGS) + "\n"
+    return canonical_text(obj)
 
 
 def _score_meta_path(out_json: Path) -> Path:
@@ -421,14 +424,8 @@ def _select_ai_provider(ai_live: bool) -> AIProvider:
 
 
 def _select_ai_cache() -> AICache:
-    bucket = os.getenv("JOBINTEL_S3_BUCKET", "").strip()
-    prefix = os.getenv("JOBINTEL_S3_PREFIX", "").strip()
-    if bucket:
-        try:
-            return S3AICache(bucket=bucket, prefix=prefix)
-        except Exception as exc:
-            logger.warning("S3AICache unavailable (%s); falling back to filesystem cache.", exc)
-    return FileSystemAICache()
+    # The shared store adds its S3 tier itself when JOBINTEL_S3_BUCKET is set.
+    return open_ai_cache_store().namespace("application_kit")
 
 
 # ------------------------------------------------------------
@@ -967,7 +964,11 @@ def _dedupe_jobs_for_scoring(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     2) Prefer records with non-unavailable enrichment status (if present).
     3) Prefer records with more non-empty core fields (title/location/team/apply_url/detail_url).
     4) Prefer having an apply_url over only a detail_url.
-    5) Final tiebreaker: stable JSON representation (sort_keys=True).
+    5) Final tiebreaker: stable JSON representation (sort_keys=True), only serialized
+       for records that tie on 1-4.
+
+    Single pass: each group keeps its running canonical record, so cost is linear in the
+    input and provider identities are only hashed for records without job_id or URL.
 
     Provenance:
     - Canonical record gets `duplicates`: a sorted list of the other source records' identifiers
@@ -1004,43 +1005,56 @@ def _dedupe_jobs_for_scoring(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]
         return 2 if _norm(job.get("apply_url")) else (1 if _norm(job.get("detail_url")) else 0)
 
     def _stable_repr(job: Dict[str, Any]) -> str:
-        return json.dumps(job, ensure_ascii=False, sort_keys=True, default=str)
+        # Compact canonical text orders exactly like the ", "/": " layout used before: a separator
+        # is followed by its space in both compared strings, so the first difference is unchanged.
+        return canonical_dumps(job, default=str)
+
+    def _cheap_key(job: Dict[str, Any]) -> Tuple[int, int, int, int]:
+        return (_desc_len(job), _enrich_rank(job), _core_field_count(job), _url_rank(job))
+
+    # Full-record JSON is only needed when two members tie on every cheap key; cache it per record.
+    stable_reprs: Dict[int, str] = {}
 
-    groups: Dict[str, List[Dict[str, Any]]] = {}
+    def _tiebreak_repr(job: Dict[str, Any]) -> str:
+        cached = stable_reprs.get(id(job))
+        if cached is None:
+            cached = stable_reprs[id(job)] = _stable_repr(job)
+        return cached
+
+    # group_id -> [canonical, canonical cheap key (computed once a duplicate shows up), members]
+    groups: Dict[str, List[Any]] = {}
     order: List[str] = []
     for job in jobs:
         source_job_id = _norm(job.get("job_id") or job.get("id"))
         if source_job_id:
             job.setdefault("source_job_id", source_job_id)
-        stable_provider_job_id = job_identity(job, mode="provider")
-
-        group_id = source_job_id or _norm(job.get("apply_url") or job.get("detail_url")) or stable_provider_job_id
-        if not source_job_id:
+            group_id = source_job_id
+        else:
+            url_id = _norm(job.get("apply_url") or job.get("detail_url"))
+            group_id = url_id or job_identity(job, mode="provider")
             # Ensure downstream artifacts always have a job_id for stable diffs/alerts.
-            job["job_id"] = _norm(job.get("apply_url") or job.get("detail_url")) or stable_provider_job_id
+            job["job_id"] = group_id
 
-        if group_id not in groups:
-            groups[group_id] = []
+        state = groups.get(group_id)
+        if state is None:
+            groups[group_id] = [job, None, [job]]
             order.append(group_id)
-        groups[group_id].append(job)
+            continue
+        state[2].append(job)
+        if state[1] is None:
+            state[1] = _cheap_key(state[0])
+        key = _cheap_key(job)
+        # Same winner as max() over (cheap key..., stable repr): strictly greater replaces, ties keep the first.
+        if key > state[1] or (key == state[1] and _tiebreak_repr(job) > _tiebreak_repr(state[0])):
+            state[0], state[1] = job, key
 
     out: List[Dict[str, Any]] = []
     for jid in order:
-        members = groups[jid]
+        canonical, _, members = groups[jid]
         if len(members) == 1:
-            out.append(members[0])
+            out.append(canonical)
             continue
 
-        def _canonical_key(job: Dict[str, Any]):
-            return (
-                _desc_len(job),
-                _enrich_rank(job),
-                _core_field_count(job),
-                _url_rank(job),
-                _stable_repr(job),
-            )
-
-        canonical = max(members, key=_canonical_key)
         dup_sources: List[Dict[str, Any]] = []
         for m in members:
             if m is canonical:
@@ -1324,11 +1338,15 @@ def write_application_kit_md(
     cache: AICache,
 ) -> None:
     lines: List[str] = ["# Application Kit", ""]
+    keys = []
     for job in shortlist:
         title = _norm(job.get("title")) or "Untitled"
         job_id = job.get("apply_url") or job.get("id") or job.get("applyId") or title
-        chash = compute_content_hash(job)
-        cached = cache.get(job_id, chash)
+        keys.append((str(job_id), compute_content_hash(job)))
+    found = cache.get_many(keys)
+    for job, (job_id, chash) in zip(shortlist, keys, strict=True):
+        title = _norm(job.get("title")) or "Untitled"
+        cached = found.get((job_id, chash))
         payload = None
         if cached and isinstance(cached, dict) and cached.get("application_kit"):
             payload = cached.get("application_kit")
@@ -1345,6 +1363,7 @@ def write_application_kit_md(
                     "gap_plan": [],
                 }
             cache.put(job_id, chash, {"application_kit": payload, "content_hash": chash})
+            found[(job_id, chash)] = {"application_kit": payload, "content_hash": chash}
 
         ai_payload = ensure_ai_payload(job.get("ai") or {})
         match_score = ai_payload.get("match_score", 0)
@@ -1458,6 +1477,7 @@ def write_application_kit_md(
             lines.append(f"- Day {day_idx}: {text}")
         lines.append("")
 
+    cache.flush()
     out_path.write_text("\n".join(lines), encoding="utf-8")
 
 
@@ -1466,10 +1486,7 @@ def is_us_or_remote_us(job: Dict[str, Any]) -> bool:
     if isinstance(guess, bool):
         return guess
 
-    normalized = normalize_location_guess(
-        job.get("title"),
-        job.get("location") or job.get("locationName"),
-    )
+    normalized = shared_location_normalizer().normalize_job(job)
     if normalized["us_guess_reason"] != "none":
         return normalized["is_us_or_remote_us_guess"]
 
@@ -1525,7 +1542,7 @@ def main() -> int:
     ap.add_argument("--provider_id", default="openai")
     ap.add_argument("--profiles", default="config/profiles.json")
     ap.add_argument("--scoring_config", default=str(REPO_ROOT / "config" / "scoring.v1.json"))
-    ap.add_argument("--in_path", default=str(ENRICHED_JOBS_JSON))
+    ap.add_argument("--in_path", default=str(ENRICHED_JOBS_JSON), help="Jobs to score: JSON array or .jsonl")
     ap.add_argument(
         "--prefer_ai",
         action="store_true",
@@ -1533,6 +1550,11 @@ def main() -> int:
     )
 
     ap.add_argument("--out_json", default=str(ranked_jobs_json("cs")))
+    ap.add_argument(
+        "--out_jsonl",
+        default="",
+        help="Optional ranked JSON Lines output (same records and order as --out_json, which is always written).",
+    )
     ap.add_argument("--out_csv", default=str(ranked_jobs_csv("cs")))
     ap.add_argument("--out_families", default=str(ranked_families_json("cs")))
     ap.add_argument("--out_md", default=str(shortlist_md("cs")))
@@ -1649,9 +1671,10 @@ def main() -> int:
     if not in_path.exists():
         raise SystemExit(f"Input not found: {in_path}")
 
-    jobs = json.loads(in_path.read_text(encoding="utf-8"))
-    if not isinstance(jobs, list):
-        raise SystemExit("Input JSON must be a list of jobs")
+    try:
+        jobs = read_json_records(in_path)
+    except ValueError as exc:
+        raise SystemExit(f"Input JSON must be a list of jobs: {exc}") from exc
 
     us_only_fallback: Optional[Dict[str, Any]] = None
     if args.us_only:
@@ -1661,10 +1684,7 @@ def main() -> int:
                 return True
             if isinstance(job.get("is_us_or_remote_us_guess"), bool):
                 return True
-            normalized = normalize_location_guess(
-                job.get("title"),
-                job.get("location") or job.get("locationName"),
-            )
+            normalized = shared_location_normalizer().normalize_job(job)
             return normalized["us_guess_reason"] != "none"
 
         if not any(_has_location_signal(j) for j in jobs):
@@ -1704,6 +1724,7 @@ def main() -> int:
     for j in scored:
         j["explanation"] = _build_explanation(j, candidate_skills)
         j["content_fingerprint"] = content_fingerprint(j)
+        j[JOB_IDENTITY_FIELD] = job_identity(j, mode="provider")
     semantic_policy = _resolve_semantic_policy_from_env()
     if semantic_policy.enabled:
         try:
@@ -1798,9 +1819,13 @@ def main() -> int:
     sanitized_scored = [_strip_ephemeral_fields(j) for j in scored]
     ranked_scored = sorted(sanitized_scored, key=_ranked_sort_key)
 
-    atomic_write_text(out_json, _serialize_json(ranked_scored))
-    if us_only_fallback:
-        meta_payload = {"us_only_fallback": us_only_fallback}
+    write_json_records(out_json, ranked_scored, jsonl=False)
+    if args.out_jsonl:
+        write_json_records(Path(args.out_jsonl), ranked_scored, jsonl=True)
+    if us_only_fallback or args.us_only:
+        meta_payload: Dict[str, Any] = {"location_cache": shared_location_normalizer().stats()}
+        if us_only_fallback:
+            meta_payload["us_only_fallback"] = us_only_fallback
         atomic_write_text(_score_meta_path(out_json), _serialize_json(meta_payload))
     if args.semantic_scores_out:
         semantic_out = Path(args.semantic_scores_out)
@@ -15,7 +15,8 @@ from typing import Any, Dict, List, Tuple
 import boto3
 from botocore.exceptions import ClientError
 
-from ji_engine.config import DATA_DIR, RUN_METADATA_DIR
+from ji_engine.config import DATA_DIR, HASH_CACHE_JSON, RUN_METADATA_DIR
+from ji_engine.utils.fingerprint_cache import configure_fingerprint_cache, flush_fingerprint_cache
 from ji_engine.utils.verification import compute_sha256_file
 
 try:
@@ -197,7 +198,13 @@ def main(argv: List[str] | None = None) -> int:
     parser.add_argument("--offline", action="store_true")
     parser.add_argument("--plan-json")
     parser.add_argument("--json", action="store_true")
+    parser.add_argument(
+        "--no-hash-cache",
+        action="store_true",
+        help="With --offline, re-hash every local file instead of trusting cached fingerprints.",
+    )
     args = parser.parse_args(argv)
+    configure_fingerprint_cache(HASH_CACHE_JSON, enabled=not args.no_hash_cache)
 
     start = time.time()
     try:
@@ -216,6 +223,7 @@ def main(argv: List[str] | None = None) -> int:
             mismatched.extend(_latest_semantics_mismatches(entries))
         if args.offline:
             ok, missing, offline_mismatched = _verify_offline(entries)
+            flush_fingerprint_cache()
             mismatched.extend(offline_mismatched)
             ok = ok and len(mismatched) == 0
         else:
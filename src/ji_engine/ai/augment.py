@@ -10,7 +10,8 @@ from __future__ import annotations
 import hashlib
 from typing import Any, Dict
 
-from ji_engine.ai.cache import FileSystemAICache
+from ji_engine.ai.cache import AICache
+from ji_engine.ai.cache_store import open_ai_cache_store
 from ji_engine.ai.schema import ensure_ai_payload
 
 
@@ -26,14 +27,17 @@ def compute_content_hash(job: Dict[str, Any]) -> str:
     return _hash_bytes(payload)
 
 
-def load_cached_ai(job_id: str, content_hash: str, cache: FileSystemAICache | None = None) -> Dict[str, Any] | None:
-    cache = cache or FileSystemAICache()
+def default_augment_cache() -> AICache:
+    """The "augment" namespace of the shared AI cache store."""
+    return open_ai_cache_store().namespace("augment")
+
+
+def load_cached_ai(job_id: str, content_hash: str, cache: AICache | None = None) -> Dict[str, Any] | None:
+    cache = cache or default_augment_cache()
     cached = cache.get(job_id, content_hash)
     return ensure_ai_payload(cached) if cached else None
 
 
-def save_cached_ai(
-    job_id: str, content_hash: str, payload: Dict[str, Any], cache: FileSystemAICache | None = None
-) -> None:
-    cache = cache or FileSystemAICache()
+def save_cached_ai(job_id: str, content_hash: str, payload: Dict[str, Any], cache: AICache | None = None) -> None:
+    cache = cache or default_augment_cache()
     cache.put(job_id, content_hash, ensure_ai_payload(payload))
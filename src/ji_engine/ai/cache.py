@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from ji_engine.config import DATA_DIR
 from ji_engine.utils.atomic_write import atomic_write_text
@@ -23,6 +23,22 @@ class AICache:
     def put(self, job_id: str, content_hash: str, payload: Dict[str, Any]) -> None:
         raise NotImplementedError
 
+    def get_many(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """(job_id, content_hash) -> payload for the keys that hit. Backends override to batch."""
+        found: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for job_id, content_hash in keys:
+            payload = self.get(job_id, content_hash)
+            if payload:
+                found[(job_id, content_hash)] = payload
+        return found
+
+    def put_many(self, entries: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        for job_id, content_hash, payload in entries:
+            self.put(job_id, content_hash, payload)
+
+    def flush(self) -> None:
+        """Make buffered writes durable; a no-op for write-through backends."""
+
 
 class FileSystemAICache(AICache):
     def __init__(self, root: Path = DATA_DIR / "ai_cache"):
@@ -68,6 +84,9 @@ def _sanitize(name: str) -> str:
 class S3AICache(AICache):
     """
     S3-backed AI cache. Defaults to filesystem unless explicitly selected.
+
+    One request per get/put; the pipeline uses ji_engine.ai.cache_store.AICacheStore, which puts
+    a local SQLite tier in front of S3 and batches remote traffic.
     """
 
     def __init__(self, bucket: str, prefix: str = "", client: Any = None):
@@ -0,0 +1,556 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ji_engine.ai.cache import AICache, _get_boto3_client, _s3_key, _sanitize
+from ji_engine.config import DATA_DIR, STATE_DIR
+
+logger = logging.getLogger(__name__)
+
+AI_CACHE_SCHEMA_VERSION = 1
+AI_CACHE_DB_NAME = "ai_cache.sqlite3"
+AI_CACHE_NAMESPACES = ("augment", "application_kit", "briefs", "insights")
+DEFAULT_AI_CACHE_MAX_ENTRIES = 50000
+DEFAULT_AI_CACHE_TTL_DAYS = 30
+DEFAULT_REMOTE_WORKERS = 8
+AI_CACHE_COUNTERS = (
+    "hits",
+    "misses",
+    "remote_hits",
+    "legacy_hits",
+    "puts",
+    "remote_puts",
+    "remote_errors",
+    "expired",
+    "evicted",
+)
+
+# SQLite caps bound parameters per statement (999 on older builds); batches stay well under it.
+_SQL_BATCH = 500
+_KEY_SEP = "\x1f"
+
+CacheKey = Tuple[str, str]
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return max(0, int(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+def ai_cache_db_path(state_dir: Optional[Path] = None) -> Path:
+    """JOBINTEL_AI_CACHE_DB, else <state_dir>/ai_cache.sqlite3 (state_dir defaults to STATE_DIR)."""
+    override = os.environ.get("JOBINTEL_AI_CACHE_DB", "").strip()
+    if override:
+        return Path(override)
+    return (state_dir or STATE_DIR) / AI_CACHE_DB_NAME
+
+
+def _entry_key(job_id: str, content_hash: str) -> str:
+    return f"{job_id}{_KEY_SEP}{content_hash}"
+
+
+class S3CacheTier:
+    """Remote tier: one object per entry under {prefix}/ai_cache/{namespace}/."""
+
+    def __init__(self, bucket: str, prefix: str = "", client: Any = None) -> None:
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = client or _get_boto3_client()
+
+    def key(self, namespace: str, job_id: str, content_hash: str) -> str:
+        return _s3_key(self.prefix, f"ai_cache/{namespace}", f"{_sanitize(job_id)}.{content_hash}.json")
+
+    def get(self, namespace: str, job_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        try:
+            obj = self.client.get_object(Bucket=self.bucket, Key=self.key(namespace, job_id, content_hash))
+            payload = json.loads(obj["Body"].read().decode("utf-8"))
+        except Exception:
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def put(self, namespace: str, job_id: str, content_hash: str, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        self.client.put_object(Bucket=self.bucket, Key=self.key(namespace, job_id, content_hash), Body=data)
+
+
+class LegacyAICacheTier:
+    """
+    Read-only view of the per-file caches the store replaced, so entries written before the
+    switch keep hitting; `AICacheStore.get_many` copies hits into SQLite. Layouts:
+
+    - augment, application_kit: <data_dir>/ai_cache/<job_id>.<hash>.json (FileSystemAICache)
+    - application_kit: S3 {prefix}/ai_cache/<job>.<hash>.json (S3AICache, used by score_jobs only)
+    - briefs: <state_dir>/ai_job_briefs_cache/<profile>/<key>.json, stored as "<profile>.<key>"
+
+    Augment and application kits shared the flat file layout, so each namespace only takes the
+    payload shape it wrote.
+    """
+
+    def __init__(
+        self,
+        *,
+        file_root: Optional[Path] = None,
+        briefs_root: Optional[Path] = None,
+        s3: Optional[S3CacheTier] = None,
+    ) -> None:
+        self.file_root = file_root
+        self.briefs_root = briefs_root
+        self.s3 = s3
+
+    @staticmethod
+    def _read_file(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return payload if isinstance(payload, dict) and payload else None
+
+    def _read_s3(self, job_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        if self.s3 is None:
+            return None
+        key = _s3_key(self.s3.prefix, "ai_cache", f"{_sanitize(job_id)}.{content_hash}.json")
+        try:
+            obj = self.s3.client.get_object(Bucket=self.s3.bucket, Key=key)
+            payload = json.loads(obj["Body"].read().decode("utf-8"))
+        except Exception:
+            return None
+        return payload if isinstance(payload, dict) and payload else None
+
+    def get(self, namespace: str, job_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        if namespace == "briefs":
+            profile, _, key = content_hash.rpartition(".")
+            if self.briefs_root is None or not profile or not key:
+                return None
+            return self._read_file(self.briefs_root / profile / f"{key}.json")
+        if namespace not in {"augment", "application_kit"}:
+            return None
+        payload = self._read_file(self.file_root / f"{job_id}.{content_hash}.json") if self.file_root else None
+        if payload is None and namespace == "application_kit":
+            payload = self._read_s3(job_id, content_hash)
+        if payload is None or ("application_kit" in payload) != (namespace == "application_kit"):
+            return None
+        return payload
+
+
+class AICacheStore:
+    """
+    Namespaced AI output cache: a local SQLite tier, optionally in front of an S3 tier.
+
+    Entries are keyed by (namespace, job_id, content_hash). Reads check SQLite first and fetch
+    local misses from S3 in parallel, copying remote hits down. Writes land in SQLite at once and
+    reach S3 write-behind on a small pool; `flush` waits for them. Remaining misses fall back to
+    the pre-store layouts (`legacy`) and hits are backfilled. Entries not read for longer than the
+    TTL read as misses, and `evict` drops expired rows plus the least recently used ones above
+    `max_entries`. Hit/miss/put counters accumulate per namespace and are persisted on `flush`,
+    so a run can diff them (see `read_ai_cache_counters`). Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        remote: Optional[S3CacheTier] = None,
+        legacy: Optional[LegacyAICacheTier] = None,
+        max_entries: int = DEFAULT_AI_CACHE_MAX_ENTRIES,
+        ttl_days: int = DEFAULT_AI_CACHE_TTL_DAYS,
+        remote_workers: int = DEFAULT_REMOTE_WORKERS,
+    ) -> None:
+        self.db_path = db_path
+        self.remote = remote
+        self.legacy = legacy
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0, int(ttl_days)) * 86400
+        self._remote_workers = max(1, int(remote_workers))
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Tuple[str, Future]] = []
+        self._unsaved: Dict[str, Dict[str, int]] = {}
+        self._session: Dict[str, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------------
+    # Plumbing
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS cache_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS ai_cache (
+                    namespace TEXT NOT NULL,
+                    entry_key TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, entry_key)
+                );
+                CREATE INDEX IF NOT EXISTS idx_ai_cache_accessed ON ai_cache(accessed_at);
+                CREATE TABLE IF NOT EXISTS ai_cache_counters (
+                    namespace TEXT NOT NULL,
+                    counter TEXT NOT NULL,
+                    value INTEGER NOT NULL,
+                    PRIMARY KEY (namespace, counter)
+                );
+                """
+            )
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_meta(key, value) VALUES ('schema_version', ?)",
+                    (str(AI_CACHE_SCHEMA_VERSION),),
+                )
+            self._conn = conn
+        return self._conn
+
+    def _count(self, namespace: str, counter: str, amount: int = 1) -> None:
+        if amount <= 0:
+            return
+        for bucket in (self._unsaved, self._session):
+            counts = bucket.setdefault(namespace, {})
+            counts[counter] = counts.get(counter, 0) + amount
+
+    def _remote_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._remote_workers, thread_name_prefix="ai-cache")
+        return self._pool
+
+    def _expired(self, accessed_at: float, now: float) -> bool:
+        # Measured from the last read, so entries every run still uses are never re-bought.
+        return bool(self.ttl_seconds) and now - accessed_at > self.ttl_seconds
+
+    # ------------------------------------------------------------------
+    # Reads / writes
+    # ------------------------------------------------------------------
+
+    def get_many(self, namespace: str, keys: Iterable[CacheKey]) -> Dict[CacheKey, Dict[str, Any]]:
+        """Batch lookup; the result holds only the keys that hit."""
+        wanted = list(dict.fromkeys((str(job_id), str(chash)) for job_id, chash in keys))
+        if not wanted:
+            return {}
+        now = time.time()
+        found: Dict[CacheKey, Dict[str, Any]] = {}
+        with self._lock:
+            conn = self._connect()
+            by_entry = {_entry_key(*key): key for key in wanted}
+            entry_keys = list(by_entry)
+            hit_keys: List[str] = []
+            for start in range(0, len(entry_keys), _SQL_BATCH):
+                chunk = entry_keys[start : start + _SQL_BATCH]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT entry_key, payload, accessed_at FROM ai_cache "
+                    f"WHERE namespace = ? AND entry_key IN ({marks})",
+                    (namespace, *chunk),
+                ).fetchall()
+                for entry_key, payload, accessed_at in rows:
+                    if self._expired(accessed_at, now):
+                        self._count(namespace, "expired")
+                        continue
+                    try:
+                        found[by_entry[entry_key]] = json.loads(payload)
+                    except ValueError:
+                        continue
+                    hit_keys.append(entry_key)
+            if hit_keys:
+                with conn:
+                    conn.executemany(
+                        "UPDATE ai_cache SET accessed_at = ? WHERE namespace = ? AND entry_key = ?",
+                        [(now, namespace, entry_key) for entry_key in hit_keys],
+                    )
+            self._count(namespace, "hits", len(found))
+
+        misses = [key for key in wanted if key not in found]
+        if misses and self.remote is not None:
+            remote = self.remote
+            pool = self._remote_pool()
+            futures = [pool.submit(remote.get, namespace, job_id, chash) for job_id, chash in misses]
+            fetched = [(key, future.result()) for key, future in zip(misses, futures, strict=True)]
+            pulled = [(key, payload) for key, payload in fetched if payload is not None]
+            if pulled:
+                self._put_local(namespace, [(job_id, chash, payload) for (job_id, chash), payload in pulled])
+                found.update(pulled)
+                with self._lock:
+                    self._count(namespace, "remote_hits", len(pulled))
+            misses = [key for key in misses if key not in found]
+        if misses and self.legacy is not None:
+            legacy = self.legacy
+            if legacy.s3 is not None:
+                pool = self._remote_pool()
+                futures = [pool.submit(legacy.get, namespace, job_id, chash) for job_id, chash in misses]
+                fetched = [(key, future.result()) for key, future in zip(misses, futures, strict=True)]
+            else:
+                # Local files only: not worth a thread pool.
+                fetched = [((job_id, chash), legacy.get(namespace, job_id, chash)) for job_id, chash in misses]
+            pulled = [(key, payload) for key, payload in fetched if payload is not None]
+            if pulled:
+                # Backfill SQLite only: the remote tier stays keyed by the new layout via later puts.
+                self._put_local(namespace, [(job_id, chash, payload) for (job_id, chash), payload in pulled])
+                found.update(pulled)
+                with self._lock:
+                    self._count(namespace, "legacy_hits", len(pulled))
+            misses = [key for key in misses if key not in found]
+        with self._lock:
+            self._count(namespace, "misses", len(misses))
+        return found
+
+    def get(self, namespace: str, job_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        return self.get_many(namespace, [(job_id, content_hash)]).get((str(job_id), str(content_hash)))
+
+    def _put_local(self, namespace: str, entries: Sequence[Tuple[str, str, Dict[str, Any]]]) -> None:
+        now = time.time()
+        rows = [
+            (namespace, _entry_key(job_id, chash), job_id, json.dumps(payload, ensure_ascii=False), now, now)
+            for job_id, chash, payload in entries
+        ]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ai_cache(namespace, entry_key, job_id, payload, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    def put_many(self, namespace: str, entries: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        batch = [(str(job_id), str(chash), payload) for job_id, chash, payload in entries]
+        if not batch:
+            return
+        self._put_local(namespace, batch)
+        with self._lock:
+            self._count(namespace, "puts", len(batch))
+            if self.remote is None:
+                return
+            pool = self._remote_pool()
+            for job_id, chash, payload in batch:
+                self._pending.append((namespace, pool.submit(self.remote.put, namespace, job_id, chash, payload)))
+
+    def put(self, namespace: str, job_id: str, content_hash: str, payload: Dict[str, Any]) -> None:
+        self.put_many(namespace, [(job_id, content_hash, payload)])
+
+    def namespace(self, namespace: str) -> "NamespacedAICache":
+        return NamespacedAICache(self, namespace)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def evict(self, *, now: Optional[float] = None) -> int:
+        """
+        Drop entries unread for longer than the TTL, then the least recently used ones above
+        max_entries; returns rows removed.
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if self.ttl_seconds:
+                    cutoff = now - self.ttl_seconds
+                    for namespace, count in conn.execute(
+                        "SELECT namespace, COUNT(*) FROM ai_cache WHERE accessed_at < ? GROUP BY namespace", (cutoff,)
+                    ).fetchall():
+                        self._count(namespace, "evicted", count)
+                        removed += count
+                    conn.execute("DELETE FROM ai_cache WHERE accessed_at < ?", (cutoff,))
+                if self.max_entries:
+                    (total,) = conn.execute("SELECT COUNT(*) FROM ai_cache").fetchone()
+                    excess = total - self.max_entries
+                    if excess > 0:
+                        victims = conn.execute(
+                            "SELECT namespace, entry_key FROM ai_cache ORDER BY accessed_at, namespace, entry_key "
+                            "LIMIT ?",
+                            (excess,),
+                        ).fetchall()
+                        conn.executemany("DELETE FROM ai_cache WHERE namespace = ? AND entry_key = ?", victims)
+                        for namespace, _ in victims:
+                            self._count(namespace, "evicted")
+                        removed += len(victims)
+        return removed
+
+    def entry_counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._connect().execute("SELECT namespace, COUNT(*) FROM ai_cache GROUP BY namespace").fetchall()
+        return {namespace: int(count) for namespace, count in sorted(rows)}
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Counters accumulated by this store object since it was opened, per namespace."""
+        with self._lock:
+            return {
+                ns: {name: counts.get(name, 0) for name in AI_CACHE_COUNTERS} for ns, counts in self._session.items()
+            }
+
+    def flush(self) -> None:
+        """Wait for write-behind uploads, apply eviction and persist counters."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for namespace, future in pending:
+            try:
+                future.result()
+            except Exception as exc:
+                logger.warning("AI cache remote write failed (%s): %r", namespace, exc)
+                with self._lock:
+                    self._count(namespace, "remote_errors")
+            else:
+                with self._lock:
+                    self._count(namespace, "remote_puts")
+        self.evict()
+        with self._lock:
+            unsaved, self._unsaved = self._unsaved, {}
+            rows = [(ns, name, value) for ns, counts in unsaved.items() for name, value in counts.items() if value]
+            if not rows:
+                return
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO ai_cache_counters(namespace, counter, value) VALUES (?, ?, ?) "
+                    "ON CONFLICT(namespace, counter) DO UPDATE SET value = value + excluded.value",
+                    rows,
+                )
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class NamespacedAICache(AICache):
+    """`AICache` view of one AICacheStore namespace, for callers written against get/put."""
+
+    def __init__(self, store: AICacheStore, namespace: str) -> None:
+        self.store = store
+        self.namespace = namespace
+
+    def get(self, job_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(self.namespace, job_id, content_hash)
+
+    def put(self, job_id: str, content_hash: str, payload: Dict[str, Any]) -> None:
+        self.store.put(self.namespace, job_id, content_hash, payload)
+
+    def get_many(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, Dict[str, Any]]:
+        return self.store.get_many(self.namespace, keys)
+
+    def put_many(self, entries: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        self.store.put_many(self.namespace, entries)
+
+    def flush(self) -> None:
+        self.store.flush()
+
+
+def _remote_tier_from_env() -> Optional[S3CacheTier]:
+    bucket = os.getenv("JOBINTEL_S3_BUCKET", "").strip()
+    if not bucket or os.getenv("JOBINTEL_AI_CACHE_S3", "1").strip().lower() in {"0", "false", "no", "off"}:
+        return None
+    try:
+        return S3CacheTier(bucket=bucket, prefix=os.getenv("JOBINTEL_S3_PREFIX", "").strip())
+    except Exception as exc:
+        logger.warning("AI cache S3 tier unavailable (%s); using the local tier only.", exc)
+        return None
+
+
+_STORES: Dict[Path, AICacheStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def open_ai_cache_store(db_path: Optional[Path] = None, *, state_dir: Optional[Path] = None) -> AICacheStore:
+    """
+    Process-wide store for `db_path` (default `ai_cache_db_path()`), configured from the environment:
+    JOBINTEL_AI_CACHE_MAX_ENTRIES / JOBINTEL_AI_CACHE_TTL_DAYS (0 disables either limit), and an S3
+    tier when JOBINTEL_S3_BUCKET is set unless JOBINTEL_AI_CACHE_S3=0. Misses read through to the
+    pre-store caches under DATA_DIR/ai_cache and `state_dir` (default STATE_DIR)/ai_job_briefs_cache.
+    Stores are flushed at exit.
+    """
+    path = (db_path or ai_cache_db_path()).resolve()
+    with _STORES_LOCK:
+        store = _STORES.get(path)
+        if store is None:
+            remote = _remote_tier_from_env()
+            store = _STORES[path] = AICacheStore(
+                path,
+                remote=remote,
+                legacy=LegacyAICacheTier(
+                    file_root=DATA_DIR / "ai_cache",
+                    briefs_root=(state_dir or STATE_DIR) / "ai_job_briefs_cache",
+                    s3=remote,
+                ),
+                max_entries=_env_int("JOBINTEL_AI_CACHE_MAX_ENTRIES", DEFAULT_AI_CACHE_MAX_ENTRIES),
+                ttl_days=_env_int("JOBINTEL_AI_CACHE_TTL_DAYS", DEFAULT_AI_CACHE_TTL_DAYS),
+            )
+        return store
+
+
+def close_ai_cache_stores() -> None:
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+        _STORES.clear()
+    for store in stores:
+        try:
+            store.close()
+        except Exception as exc:  # pragma: no cover - best effort at interpreter exit
+            logger.warning("AI cache close failed for %s: %r", store.db_path, exc)
+
+
+atexit.register(close_ai_cache_stores)
+
+
+def read_ai_cache_counters(db_path: Path) -> Dict[str, Dict[str, int]]:
+    """Persisted cumulative counters per namespace; empty when the store does not exist yet."""
+    if not db_path.exists():
+        return {}
+    try:
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            rows = conn.execute("SELECT namespace, counter, value FROM ai_cache_counters").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+    counters: Dict[str, Dict[str, int]] = {}
+    for namespace, counter, value in rows:
+        counters.setdefault(namespace, {})[counter] = int(value)
+    return counters
+
+
+def ai_cache_counter_delta(
+    before: Dict[str, Dict[str, int]], after: Dict[str, Dict[str, int]]
+) -> Dict[str, Dict[str, int]]:
+    """Per-namespace counter growth between two `read_ai_cache_counters` snapshots (all counters listed)."""
+    delta: Dict[str, Dict[str, int]] = {}
+    for namespace in sorted(after):
+        counts = {
+            name: max(0, after[namespace].get(name, 0) - before.get(namespace, {}).get(name, 0))
+            for name in AI_CACHE_COUNTERS
+        }
+        if any(counts.values()):
+            delta[namespace] = counts
+    return delta
@@ -0,0 +1,164 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+from ji_engine.ai.accounting import estimate_tokens
+
+DEFAULT_CHAT_MODEL = "gpt-4o-mini"
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+OPENAI_API_HOST = "api.openai.com"
+
+
+def resolve_ai_base_url(value: Optional[str] = None) -> Optional[str]:
+    """Explicit value, else JOBINTEL_AI_BASE_URL; None means no HTTP model endpoint is configured."""
+    raw = (value if value is not None else os.environ.get("JOBINTEL_AI_BASE_URL", "")).strip()
+    return raw.rstrip("/") or None
+
+
+def resolve_ai_api_key(base_url: str) -> str:
+    """
+    Bearer token for `base_url`: OPENAI_API_KEY only when the endpoint is OpenAI's own, else
+    JOBINTEL_AI_API_KEY (empty by default), so a configured stand-in or proxy never receives the OpenAI key.
+    """
+    parts = urllib.parse.urlsplit(base_url)
+    if parts.scheme == "https" and parts.hostname == OPENAI_API_HOST:
+        return os.environ.get("OPENAI_API_KEY", "").strip()
+    return os.environ.get("JOBINTEL_AI_API_KEY", "").strip()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    idx = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return round(sorted_values[idx], 3)
+
+
+class ChatCompletionsClient:
+    """
+    Minimal OpenAI-compatible client for `{base_url}/chat/completions`, safe to share across
+    AIExecutor workers. Retries 429/5xx with backoff (honoring Retry-After), and keeps usage
+    counters: the tokens the server reported next to the local `estimate_tokens` figures the
+    stages book, so accounting drift is measurable.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        api_key: str = "",
+        model: str = DEFAULT_CHAT_MODEL,
+        timeout: float = 30.0,
+        max_retries: int = 4,
+        backoff_s: float = 0.25,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.model = model
+        self.timeout = timeout
+        self.max_retries = max(1, int(max_retries))
+        self.backoff_s = max(0.0, float(backoff_s))
+        self._lock = threading.Lock()
+        self._latencies_ms: List[float] = []
+        self._counts: Dict[str, int] = {
+            "calls": 0,
+            "requests": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "server_errors": 0,
+            "failed": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "estimated_prompt_tokens": 0,
+            "estimated_completion_tokens": 0,
+        }
+
+    def _bump(self, **amounts: int) -> None:
+        with self._lock:
+            for name, amount in amounts.items():
+                self._counts[name] += amount
+
+    def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        for attempt in range(self.max_retries):
+            if attempt:
+                self._bump(retries=1)
+            req = urllib.request.Request(f"{self.base_url}/chat/completions", data=body, headers=headers, method="POST")
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                    data = json.loads(resp.read().decode("utf-8"))
+                with self._lock:
+                    self._counts["requests"] += 1
+                    self._latencies_ms.append((time.perf_counter() - start) * 1000.0)
+                return data
+            except urllib.error.HTTPError as exc:
+                self._bump(requests=1, rate_limited=int(exc.code == 429), server_errors=int(exc.code >= 500))
+                if exc.code not in RETRYABLE_STATUSES or attempt + 1 >= self.max_retries:
+                    raise
+                retry_after = exc.headers.get("Retry-After") if exc.headers else None
+                try:
+                    delay = float(retry_after) if retry_after else self.backoff_s * (2**attempt)
+                except ValueError:
+                    delay = self.backoff_s * (2**attempt)
+                time.sleep(delay)
+        raise RuntimeError("Unreachable")
+
+    def complete_json(self, system: str, user: str, *, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """One JSON-mode chat call; returns the parsed message content ({} when it is not a JSON object)."""
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "messages": [{"role": "system", "content": system}, {"role": "user", "content": user}],
+            "response_format": {"type": "json_object"},
+            "temperature": 0,
+        }
+        if max_tokens:
+            payload["max_tokens"] = int(max_tokens)
+        self._bump(calls=1)
+        try:
+            data = self._post(payload)
+        except Exception:
+            self._bump(failed=1)
+            raise
+        content = ((data.get("choices") or [{}])[0].get("message") or {}).get("content") or ""
+        usage = data.get("usage") or {}
+        self._bump(
+            prompt_tokens=int(usage.get("prompt_tokens", 0) or 0),
+            completion_tokens=int(usage.get("completion_tokens", 0) or 0),
+            estimated_prompt_tokens=estimate_tokens(system) + estimate_tokens(user),
+            estimated_completion_tokens=estimate_tokens(content),
+        )
+        try:
+            parsed = json.loads(content)
+        except ValueError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+            latencies = sorted(self._latencies_ms)
+        counts["latency_ms"] = {
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "max": round(latencies[-1], 3) if latencies else None,
+        }
+        return counts
@@ -0,0 +1,142 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+
+from ji_engine.ai.accounting import estimate_cost_usd
+
+DEFAULT_AI_MAX_CONCURRENCY = 4
+
+
+def resolve_ai_concurrency(value: Optional[int] = None) -> int:
+    """Explicit value, else AI_MAX_CONCURRENCY, else DEFAULT_AI_MAX_CONCURRENCY; always >= 1."""
+    if value is None:
+        raw = os.environ.get("AI_MAX_CONCURRENCY", "").strip()
+        try:
+            value = int(raw) if raw else DEFAULT_AI_MAX_CONCURRENCY
+        except ValueError:
+            value = DEFAULT_AI_MAX_CONCURRENCY
+    return max(1, int(value))
+
+
+class AIBudget:
+    """
+    Token/cost ceiling shared by every worker of a stage. `try_reserve` checks and books
+    under one lock, so concurrent callers can never overshoot the ceiling together.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: Optional[int] = None,
+        max_cost_usd: Optional[str] = None,
+        input_per_1k: str = "0",
+        output_per_1k: str = "0",
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.max_cost_usd = Decimal(max_cost_usd) if max_cost_usd not in (None, "") else None
+        self.input_per_1k = input_per_1k
+        self.output_per_1k = output_per_1k
+        self._lock = threading.Lock()
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.rejected = 0
+
+    def _cost(self, tokens_in: int, tokens_out: int) -> Decimal:
+        return Decimal(
+            estimate_cost_usd(tokens_in, tokens_out, input_per_1k=self.input_per_1k, output_per_1k=self.output_per_1k)
+        )
+
+    def _fits_locked(self, tokens_in: int, tokens_out: int) -> bool:
+        if self.max_tokens is not None and self.tokens_in + self.tokens_out + tokens_in + tokens_out > self.max_tokens:
+            return False
+        if self.max_cost_usd is not None:
+            return self._cost(self.tokens_in + tokens_in, self.tokens_out + tokens_out) <= self.max_cost_usd
+        return True
+
+    def fits(self, tokens_in: int, tokens_out: int = 0) -> bool:
+        with self._lock:
+            return self._fits_locked(tokens_in, tokens_out)
+
+    def try_reserve(self, tokens_in: int, tokens_out: int = 0) -> bool:
+        with self._lock:
+            if not self._fits_locked(tokens_in, tokens_out):
+                self.rejected += 1
+                return False
+            self.tokens_in += tokens_in
+            self.tokens_out += tokens_out
+            return True
+
+    def release(self, tokens_in: int, tokens_out: int = 0) -> None:
+        """Give back a reservation whose call never happened (e.g. it raised before reaching the model)."""
+        with self._lock:
+            self.tokens_in = max(0, self.tokens_in - tokens_in)
+            self.tokens_out = max(0, self.tokens_out - tokens_out)
+
+    @property
+    def tokens_used(self) -> int:
+        with self._lock:
+            return self.tokens_in + self.tokens_out
+
+
+class AIExecutor:
+    """
+    Bounded worker pool for model calls. `submit` is single-flight per key: a second submit
+    of a key that is still in flight gets the first call's future instead of a new call.
+    Finished futures are dropped, so the executor holds no results; callers that must also
+    reuse finished calls keep their own key -> future map. Callers keep their own list of
+    futures in input order and collect results from it, so output order never depends on
+    completion order.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = resolve_ai_concurrency(max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ai")
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __enter__(self) -> "AIExecutor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future
+            future = self._futures[key] = self._pool.submit(fn, *args)
+            self.calls += 1
+        # Registered outside the lock: a future that is already done runs the callback right here.
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future
+
+    def _forget(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def inflight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._futures
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"max_workers": self.max_workers, "calls": self.calls, "coalesced": self.coalesced}
@@ -61,11 +61,51 @@ def _job_text(job: Dict[str, Any]) -> str:
     return _norm_text("\n".join(parts))
 
 
-def _contains(text: str, patterns: List[str]) -> bool:
-    for p in patterns:
-        if re.search(p, text, flags=re.IGNORECASE):
-            return True
-    return False
+def _compile_any(patterns: List[str]) -> re.Pattern[str]:
+    """Fold a rule's alternatives into one case-insensitive regex (search-equivalent to trying each)."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags=re.IGNORECASE)
+
+
+def _contains(text: str, pattern: re.Pattern[str]) -> bool:
+    return pattern.search(text) is not None
+
+
+# Uppercase ASCII plus the non-ASCII characters that IGNORECASE folds onto ASCII letters.
+# When any is present the literal prefilter is skipped so results match the regex exactly.
+_FOLD_HAZARD_RE = re.compile("[A-Z\u0130\u0131\u017f\u212a]")
+
+_Rule = Tuple[Tuple[str, ...], re.Pattern[str]]
+
+
+def _required_literal(pattern: str) -> str:
+    """Leading literal (after a word boundary) that every match of `pattern` must contain."""
+    if "|" in pattern:
+        return ""
+    body = pattern[2:] if pattern.startswith(r"\b") else pattern
+    literal = ""
+    for ch in body:
+        if ch.isalnum() or ch == " ":
+            literal += ch
+            continue
+        if ch in "?*{":
+            literal = literal[:-1]
+        break
+    return literal
+
+
+def _compile_rule(patterns: List[str]) -> _Rule:
+    """Compile a rule plus the literals used to skip the regex when none can match."""
+    literals = tuple(_required_literal(p) for p in patterns)
+    if not all(literals):
+        literals = ()
+    return literals, _compile_any(patterns)
+
+
+def _rule_matches(rule: _Rule, text: str, prefilter: bool) -> bool:
+    literals, pattern = rule
+    if prefilter and literals and not any(lit in text for lit in literals):
+        return False
+    return pattern.search(text) is not None
 
 
 # Keep this small and high-signal; order is the deterministic output order.
@@ -199,11 +239,72 @@ _SECURITY_REQUIRED_TRIGGERS: List[Tuple[str, str]] = [
 ]
 
 
+# Rule tables compiled once at import. Each skill/trigger list folds into a single
+# alternation so a section is scanned once per rule instead of once per raw pattern.
+_SKILL_RULES: List[Tuple[str, _Rule]] = [(skill, _compile_rule(pats)) for skill, pats in _SKILL_PATTERNS]
+_HW_TRIGGER_RULE = _compile_rule(_HW_TRIGGER_PATTERNS)
+_CS_TRIGGER_RULE = _compile_rule(_CS_TRIGGER_PATTERNS)
+_SECURITY_MENTION_RE = _compile_any(_SECURITY_MENTION_PATTERNS)
+_SECURITY_REQUIRED_RULES: List[Tuple[str, re.Pattern[str]]] = [
+    (reason, re.compile(pat, flags=re.IGNORECASE)) for reason, pat in _SECURITY_REQUIRED_TRIGGERS
+]
+_SECURITY_REQUIRED_RE = _compile_any([pat for _reason, pat in _SECURITY_REQUIRED_TRIGGERS])
+
+_TITLE_FORWARD_DEPLOYED_RE = re.compile(r"\bforward deployed\b", flags=re.IGNORECASE)
+_TITLE_VALUE_REALIZATION_RE = re.compile(r"\bvalue realization\b", flags=re.IGNORECASE)
+_TITLE_DEPLOYMENT_MANAGER_RE = _compile_any([r"\b(ai\s+)?deployment manager\b", r"\bmanager,\s*ai deployment\b"])
+_TITLE_SOLUTIONS_ARCHITECT_RE = _compile_any([r"\b(partner\s+)?solutions architect\b", r"\bsolution architect\b"])
+_TITLE_SOLUTIONS_ENGINEER_RE = re.compile(r"\bsolutions engineer\b", flags=re.IGNORECASE)
+_TITLE_CUSTOMER_SUCCESS_RE = re.compile(r"\bcustomer success\b|\bcs\b", flags=re.IGNORECASE)
+_TEXT_CUSTOMER_SUCCESS_RE = _compile_any(
+    [r"\bcustomer success\b", r"\bai deployment\b", r"\bdeployment and adoption\b", r"\bdeployment & adoption\b"]
+)
+# Explicit precedence list. Keep "Forward Deployed" explicit-only.
+_ROLE_FAMILY_RULES: List[Tuple[str, re.Pattern[str]]] = [
+    (
+        "Solutions Architect",
+        _compile_any([r"\bsolutions architect\b", r"\bsolution architect\b", r"\bpresales\b", r"\bsales engineer\b"]),
+    ),
+    ("Forward Deployed", _compile_any([r"\bforward deployed\b", r"\bforward-deployed\b"])),
+    (
+        "Robotics",
+        _compile_any(
+            [
+                r"\brobotics?\b",
+                r"\bmechatronics?\b",
+                r"\bembedded\b",
+                r"\bfirmware\b",
+                r"\bplc\b",
+                r"\bmotion control\b",
+            ]
+        ),
+    ),
+    ("Product", _compile_any([r"\bproduct manager\b", r"\bproduct lead\b", r"\bproduct\b"])),
+    ("Engineering", _compile_any([r"\bsoftware engineer\b", r"\bengineer\b", r"\bdeveloper\b"])),
+    ("G&A", _compile_any([r"\bfinance\b", r"\blegal\b", r"\bpeople\b", r"\bhr\b", r"\brecruit\b"])),
+]
+_TITLE_FIELD_RE = re.compile(r"\bfield\s+(engineer|service|technician)\b", flags=re.IGNORECASE)
+_TITLE_TEST_ENGINEER_RE = re.compile(r"\btest\s+engineer\b", flags=re.IGNORECASE)
+
+_SENIORITY_MANAGER_RE = re.compile(r"\b(manager|director|vp|head of)\b")
+_SENIORITY_STAFF_RE = re.compile(r"\b(principal|staff)\b")
+_SENIORITY_SENIOR_RE = re.compile(r"\b(senior|sr\.?)\b")
+_SENIORITY_LEAD_RE = re.compile(r"\blead\b")
+
+_FLAG_CLEARANCE_RE = _compile_any([r"\bclearance\b", r"\bts/sci\b", r"\btop secret\b"])
+_FLAG_RELOCATION_RE = _compile_any([r"\brelocation\b", r"\bmust relocate\b"])
+_FLAG_TRAVEL_PCT_RE = re.compile(r"travel\s+(up to\s+)?(\d{1,2})\s*%")
+_FLAG_TRAVEL_RE = _compile_any([r"\btravel\b"])
+_FLAG_ON_CALL_RE = _compile_any([r"\bon[- ]?call\b"])
+_FLAG_SHIFT_RE = _compile_any([r"\bshift\b", r"\bnight\b", r"\bweekend\b"])
+
+# Section headings used by _section_slices.
+_REQUIRED_MARKERS = ["requirements", "required qualifications", "must have", "you will", "what you’ll do"]
+_PREFERRED_MARKERS = ["preferred qualifications", "nice to have", "bonus", "preferred"]
+
+
 def _security_required(text: str) -> bool:
-    for _reason, pat in _SECURITY_REQUIRED_TRIGGERS:
-        if re.search(pat, text, flags=re.IGNORECASE):
-            return True
-    return False
+    return _contains(text, _SECURITY_REQUIRED_RE)
 
 
 def _security_required_reason_match_context(text: str) -> Tuple[str, str, str]:
@@ -211,8 +312,8 @@ def _security_required_reason_match_context(text: str) -> Tuple[str, str, str]:
     Deterministically return (reason_label, matched_text, context_snippet) for the first strong trigger.
     Returns ("","","") if no strong trigger matches.
     """
-    for reason, pat in _SECURITY_REQUIRED_TRIGGERS:
-        m = re.search(pat, text, flags=re.IGNORECASE)
+    for reason, pat in _SECURITY_REQUIRED_RULES:
+        m = pat.search(text)
         if m:
             match_text = m.group(0) or ""
             if len(match_text) > 80:
@@ -237,15 +338,7 @@ def _security_required_reason_match_context(text: str) -> Tuple[str, str, str]:
 
 
 def _security_mentioned(text: str) -> bool:
-    return _contains(text, _SECURITY_MENTION_PATTERNS)
-
-
-def _hw_trigger_count(text: str) -> int:
-    found = 0
-    for p in _HW_TRIGGER_PATTERNS:
-        if re.search(p, text, flags=re.IGNORECASE):
-            found += 1
-    return found
+    return _contains(text, _SECURITY_MENTION_RE)
 
 
 def _section_slices(text: str) -> Tuple[str, str, str]:
@@ -254,18 +347,13 @@ def _section_slices(text: str) -> Tuple[str, str, str]:
     Deterministic and intentionally simple.
     """
     t = text
-    # common markers
-    markers = [
-        ("required", ["requirements", "required qualifications", "must have", "you will", "what you’ll do"]),
-        ("preferred", ["preferred qualifications", "nice to have", "bonus", "preferred"]),
-    ]
 
     def _find_any(needles: List[str]) -> int:
-        idxs = [t.find(n) for n in needles if t.find(n) != -1]
+        idxs = [i for i in (t.find(n) for n in needles) if i != -1]
         return min(idxs) if idxs else -1
 
-    req_idx = _find_any(markers[0][1])
-    pref_idx = _find_any(markers[1][1])
+    req_idx = _find_any(_REQUIRED_MARKERS)
+    pref_idx = _find_any(_PREFERRED_MARKERS)
 
     if req_idx == -1 and pref_idx == -1:
         return "", "", t
@@ -283,20 +371,40 @@ def _section_slices(text: str) -> Tuple[str, str, str]:
     return req, pref, other
 
 
-def _skills_from_text(text: str) -> List[str]:
-    out: List[str] = []
-    hw_triggers = _hw_trigger_count(text)
-    cs_triggered = _contains(text, _CS_TRIGGER_PATTERNS)
-    for skill, pats in _SKILL_PATTERNS:
-        if skill in _GATED_HW_SKILLS and hw_triggers < 1:
-            continue
-        if skill in _GATED_CS_SKILLS and not cs_triggered:
+def _skills_by_section(sections: Dict[str, str]) -> Dict[str, List[str]]:
+    """
+    Single pass over the compiled skill table, reporting matched skills per named section.
+
+    Gating triggers are evaluated once per section; empty sections are skipped.
+    """
+    out: Dict[str, List[str]] = {name: [] for name in sections}
+    active: List[Tuple[str, str, bool, bool, bool]] = []
+    for name, text in sections.items():
+        if not text:
             continue
-        if _contains(text, pats):
-            out.append(skill)
+        prefilter = _FOLD_HAZARD_RE.search(text) is None
+        hw_triggered = _rule_matches(_HW_TRIGGER_RULE, text, prefilter)
+        cs_triggered = _rule_matches(_CS_TRIGGER_RULE, text, prefilter)
+        active.append((name, text, prefilter, hw_triggered, cs_triggered))
+    if not active:
+        return out
+    for skill, rule in _SKILL_RULES:
+        gated_hw = skill in _GATED_HW_SKILLS
+        gated_cs = skill in _GATED_CS_SKILLS
+        for name, text, prefilter, hw_triggered, cs_triggered in active:
+            if gated_hw and not hw_triggered:
+                continue
+            if gated_cs and not cs_triggered:
+                continue
+            if _rule_matches(rule, text, prefilter):
+                out[name].append(skill)
     return out
 
 
+def _skills_from_text(text: str) -> List[str]:
+    return _skills_by_section({"text": text})["text"]
+
+
 def _role_family(title_text: str, job_text: str) -> str:
     """
     Deterministic precedence list. Some families are TITLE-only to avoid JD-text false positives.
@@ -305,67 +413,38 @@ def _role_family(title_text: str, job_text: str) -> str:
 
     # TITLE-only explicit mappings first (highest precedence).
     # Keep Forward Deployed explicit-only.
-    if re.search(r"\bforward deployed\b", title, flags=re.IGNORECASE):
+    if _TITLE_FORWARD_DEPLOYED_RE.search(title):
         return "Forward Deployed"
 
     # Value Realization is a Customer Success/business role.
-    if re.search(r"\bvalue realization\b", title, flags=re.IGNORECASE):
+    if _TITLE_VALUE_REALIZATION_RE.search(title):
         return "Customer Success"
 
     # AI Deployment Manager / Manager, AI Deployment should map to Customer Success.
-    if re.search(r"\b(ai\s+)?deployment manager\b", title, flags=re.IGNORECASE) or re.search(
-        r"\bmanager,\s*ai deployment\b", title, flags=re.IGNORECASE
-    ):
+    if _TITLE_DEPLOYMENT_MANAGER_RE.search(title):
         return "Customer Success"
 
     # Solutions Architect should win by title even if CS/deployment triggers exist in jd_text.
-    if re.search(r"\b(partner\s+)?solutions architect\b", title, flags=re.IGNORECASE) or re.search(
-        r"\bsolution architect\b", title, flags=re.IGNORECASE
-    ):
+    if _TITLE_SOLUTIONS_ARCHITECT_RE.search(title):
         return "Solutions Architect"
     # Solutions Engineer maps to Solutions Architect (title-only).
-    if re.search(r"\bsolutions engineer\b", title, flags=re.IGNORECASE):
+    if _TITLE_SOLUTIONS_ENGINEER_RE.search(title):
         return "Solutions Architect"
 
-    if re.search(r"\bcustomer success\b|\bcs\b", title, flags=re.IGNORECASE):
+    if _TITLE_CUSTOMER_SUCCESS_RE.search(title):
         return "Customer Success"
     # If team/dept/JD explicitly says Customer Success, treat as Customer Success before generic "product" matches.
-    if _contains(
-        job_text,
-        [r"\bcustomer success\b", r"\bai deployment\b", r"\bdeployment and adoption\b", r"\bdeployment & adoption\b"],
-    ):
+    if _contains(job_text, _TEXT_CUSTOMER_SUCCESS_RE):
         return "Customer Success"
 
-    rules = [
-        # Explicit precedence list. Keep "Forward Deployed" explicit-only.
-        (
-            "Solutions Architect",
-            [r"\bsolutions architect\b", r"\bsolution architect\b", r"\bpresales\b", r"\bsales engineer\b"],
-        ),
-        ("Forward Deployed", [r"\bforward deployed\b", r"\bforward-deployed\b"]),
-        (
-            "Robotics",
-            [
-                r"\brobotics?\b",
-                r"\bmechatronics?\b",
-                r"\bembedded\b",
-                r"\bfirmware\b",
-                r"\bplc\b",
-                r"\bmotion control\b",
-            ],
-        ),
-        ("Product", [r"\bproduct manager\b", r"\bproduct lead\b", r"\bproduct\b"]),
-        ("Engineering", [r"\bsoftware engineer\b", r"\bengineer\b", r"\bdeveloper\b"]),
-        ("G&A", [r"\bfinance\b", r"\blegal\b", r"\bpeople\b", r"\bhr\b", r"\brecruit\b"]),
-    ]
-    for name, pats in rules:
-        if _contains(job_text, pats):
+    for name, pat in _ROLE_FAMILY_RULES:
+        if _contains(job_text, pat):
             return name
 
     # Field is TITLE-only (do not trigger on JD text like "field feedback/signal").
-    if re.search(r"\bfield\s+(engineer|service|technician)\b", title, flags=re.IGNORECASE):
+    if _TITLE_FIELD_RE.search(title):
         return "Field"
-    if re.search(r"\btest\s+engineer\b", title, flags=re.IGNORECASE):
+    if _TITLE_TEST_ENGINEER_RE.search(title):
         return "Field"
 
     return ""
@@ -377,33 +456,33 @@ def _seniority_from_title(title: str) -> str:
     (e.g., "operations staff").
     """
     t = (title or "").lower()
-    if re.search(r"\b(manager|director|vp|head of)\b", t):
+    if _SENIORITY_MANAGER_RE.search(t):
         return "Manager"
-    if re.search(r"\b(principal|staff)\b", t):
+    if _SENIORITY_STAFF_RE.search(t):
         return "Staff"
-    if re.search(r"\b(senior|sr\.?)\b", t):
+    if _SENIORITY_SENIOR_RE.search(t):
         return "Senior"
-    if re.search(r"\blead\b", t):
+    if _SENIORITY_LEAD_RE.search(t):
         return "Senior"
     return "IC"
 
 
 def _red_flags(job_text: str) -> List[str]:
     flags: List[str] = []
-    if _contains(job_text, [r"\bclearance\b", r"\bts/sci\b", r"\btop secret\b"]):
+    if _contains(job_text, _FLAG_CLEARANCE_RE):
         flags.append("Security clearance required")
-    if _contains(job_text, [r"\brelocation\b", r"\bmust relocate\b"]):
+    if _contains(job_text, _FLAG_RELOCATION_RE):
         flags.append("Relocation required")
     # travel %
-    m = re.search(r"travel\s+(up to\s+)?(\d{1,2})\s*%", job_text)
+    m = _FLAG_TRAVEL_PCT_RE.search(job_text)
     if m:
         flags.append(f"Travel up to {m.group(2)}%")
-    elif _contains(job_text, [r"\btravel\b"]):
+    elif _contains(job_text, _FLAG_TRAVEL_RE):
         # keep generic if % not specified
         flags.append("Travel required")
-    if _contains(job_text, [r"\bon[- ]?call\b"]):
+    if _contains(job_text, _FLAG_ON_CALL_RE):
         flags.append("On-call rotation")
-    if _contains(job_text, [r"\bshift\b", r"\bnight\b", r"\bweekend\b"]):
+    if _contains(job_text, _FLAG_SHIFT_RE):
         flags.append("Shift/weekend coverage")
     return flags
 
@@ -417,8 +496,11 @@ def extract_ai_fields(job: Dict[str, Any]) -> Dict[str, Any]:
     title_only = _norm_text(str(job.get("title") or ""))
     req_section, pref_section, other_section = _section_slices(text)
 
-    req_skills = _skills_from_text(req_section) or _skills_from_text(text)
-    pref_skills = _skills_from_text(pref_section)
+    # One pass over the skill table; required skills fall back to the full text when the
+    # required section yields nothing.
+    skills = _skills_by_section({"required": req_section, "preferred": pref_section, "full": text})
+    req_skills = skills["required"] or skills["full"]
+    pref_skills = skills["preferred"]
 
     # Security handling:
     # - If strong requirement triggers exist anywhere, add to required (and do not add to preferred).
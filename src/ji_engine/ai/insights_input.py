@@ -215,51 +215,6 @@ def _repository_from_runs_dir(run_metadata_dir: Path) -> RunRepository:
     return FileSystemRunRepository(run_metadata_dir)
 
 
-def _rolling_diff_counts_7(
-    provider: str,
-    profile: str,
-    *,
-    run_limit: int = 7,
-    run_repository: Optional[RunRepository] = None,
-    candidate_id: str = DEFAULT_CANDIDATE_ID,
-    run_metadata_dir: Path = RUN_METADATA_DIR,
-) -> Dict[str, Any]:
-    repo = run_repository or _repository_from_runs_dir(run_metadata_dir)
-    run_reports = sorted(repo.list_run_metadata_paths(candidate_id=candidate_id), key=lambda p: p.name, reverse=True)
-    series: List[Dict[str, Any]] = []
-    totals = {"new": 0, "changed": 0, "removed": 0}
-    for path in run_reports:
-        try:
-            report = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        if not isinstance(report, dict):
-            continue
-        provider_map = ((report.get("delta_summary") or {}).get("provider_profile") or {}).get(provider) or {}
-        profile_entry = provider_map.get(profile) or {}
-        try:
-            new_count = int(profile_entry.get("new_job_count", 0) or 0)
-            changed_count = int(profile_entry.get("changed_job_count", 0) or 0)
-            removed_count = int(profile_entry.get("removed_job_count", 0) or 0)
-        except Exception:
-            continue
-        series.append(
-            {
-                "run_id": str(report.get("run_id") or path.stem),
-                "new": new_count,
-                "changed": changed_count,
-                "removed": removed_count,
-            }
-        )
-        totals["new"] += new_count
-        totals["changed"] += changed_count
-        totals["removed"] += removed_count
-        if len(series) >= run_limit:
-            break
-    series.reverse()
-    return {"window_size": run_limit, "runs_considered": len(series), "totals": totals, "series": series}
-
-
 def build_weekly_insights_input(
     *,
     provider: str,
@@ -295,14 +250,7 @@ def build_weekly_insights_input(
         "top_families": _top_families(family_jobs if family_jobs else curr_jobs),
         "score_distribution": _score_distribution(curr_jobs),
         "skill_keywords": _skill_keywords(curr_jobs),
-        "rolling_diff_counts_7": _rolling_diff_counts_7(
-            provider,
-            profile,
-            run_limit=7,
-            run_repository=repo,
-            candidate_id=candidate_id,
-            run_metadata_dir=run_metadata_dir,
-        ),
+        "rolling_diff_counts_7": repo.delta_counts_window(provider, profile, window=7, candidate_id=candidate_id),
         "top_recurring_skill_tokens": _top_recurring_skill_tokens(curr_jobs, limit=3),
         "median_score_trend_delta": {
             "current_median": current_median,
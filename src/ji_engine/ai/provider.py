@@ -7,8 +7,12 @@ See LICENSE for permitted use.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import time
 from typing import Any, Dict
 
+from ji_engine.ai.chat_client import ChatCompletionsClient
 from ji_engine.ai.schema import ensure_ai_payload
 
 
@@ -94,6 +98,72 @@ class StubProvider(AIProvider):
         }
 
 
+class LatencyStubProvider(StubProvider):
+    """
+    StubProvider that sleeps like a remote model would, for benchmarking concurrency offline.
+    Latency per call is `latency_ms` plus a jitter in [0, jitter_ms) derived from the job title,
+    so repeated runs see the same latency profile and return the same payloads as StubProvider.
+    """
+
+    def __init__(self, latency_ms: float = 250.0, jitter_ms: float = 0.0):
+        self.latency_ms = max(0.0, float(latency_ms))
+        self.jitter_ms = max(0.0, float(jitter_ms))
+
+    def _sleep(self, job: Dict[str, Any]) -> None:
+        jitter = 0.0
+        if self.jitter_ms:
+            seed = hashlib.sha256(str(job.get("title", "")).encode("utf-8")).digest()
+            jitter = int.from_bytes(seed[:4], "big") / 2**32 * self.jitter_ms
+        time.sleep((self.latency_ms + jitter) / 1000.0)
+
+    def extract(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        self._sleep(job)
+        return super().extract(job)
+
+    def application_kit(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        self._sleep(job)
+        return super().application_kit(job)
+
+
+class HTTPChatProvider(StubProvider):
+    """
+    Extraction through an OpenAI-compatible chat endpoint (a real one, or the local stand-in
+    from ji_engine.ai.standin_server). Fields the response does not supply fall back to
+    StubProvider's; a failed call raises like a live provider would.
+    """
+
+    EXTRACT_SYSTEM = (
+        "Extract structured fields from a job posting. Reply with a JSON object with keys summary, "
+        "confidence, skills_required, skills_preferred, role_family, seniority, red_flags, summary_bullets."
+    )
+    APPLICATION_KIT_SYSTEM = (
+        "Draft an application kit for a job posting. Reply with a JSON object with keys resume_bullets, "
+        "cover_letter_points, interview_prompts, star_prompts, gap_plan."
+    )
+
+    def __init__(self, client: ChatCompletionsClient):
+        self.client = client
+
+    @staticmethod
+    def _job_prompt(job: Dict[str, Any]) -> str:
+        fields = {key: job.get(key) or "" for key in ("title", "location", "team", "jd_text")}
+        return json.dumps(fields, sort_keys=True, ensure_ascii=False)
+
+    def extract(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        content = self.client.complete_json(self.EXTRACT_SYSTEM, self._job_prompt(job))
+        base = super().extract(job)
+        return ensure_ai_payload({**base, **{key: value for key, value in content.items() if key in base}})
+
+    def application_kit(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        content = self.client.complete_json(self.APPLICATION_KIT_SYSTEM, self._job_prompt(job))
+        base = super().application_kit(job)
+        for key in base:
+            value = content.get(key)
+            if isinstance(value, list) and value and all(isinstance(item, str) for item in value):
+                base[key] = value
+        return base
+
+
 class OpenAIProvider(AIProvider):
     """Placeholder for live OpenAI calls (only used when ai_live flag is set)."""
 
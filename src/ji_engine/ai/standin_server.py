@@ -0,0 +1,272 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from ji_engine.embeddings.simple import hash_embed
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+def count_tokens(text: str) -> int:
+    """The stand-in's 'true' tokenizer: words and punctuation marks, unlike the len/4 estimate."""
+    return len(_TOKEN_RE.findall(text or ""))
+
+
+def _unit(*parts: str) -> float:
+    """Deterministic value in [0, 1) from the given parts."""
+    digest = hashlib.sha256("|".join(parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    """
+    Behaviour of the stand-in server. Latency is `latency_ms` plus a jitter drawn from
+    `latency_dist` (scaled by `jitter_ms`); `tail_rate` of requests add `tail_ms` on top, which
+    is what moves p99. `error_rate` of attempts answer `error_status`, and `rate_limit_rps` > 0
+    enforces a token bucket of `rate_limit_burst` that answers 429 with Retry-After. Every draw is
+    a hash of (seed, request hash, attempt number), so a given request sequence always sees the
+    same latencies and errors, and a retried request can succeed.
+    """
+
+    latency_ms: float = 50.0
+    jitter_ms: float = 0.0
+    latency_dist: str = "uniform"
+    tail_ms: float = 0.0
+    tail_rate: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 10
+    embedding_dim: int = 256
+    seed: str = "standin"
+
+    def __post_init__(self) -> None:
+        if self.latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"latency_dist must be one of {LATENCY_DISTRIBUTIONS}, got {self.latency_dist!r}")
+
+    def latency_s(self, request_hash: str, attempt: int) -> float:
+        draw = _unit(self.seed, "latency", request_hash, str(attempt))
+        if self.latency_dist == "fixed":
+            jitter = 0.0
+        elif self.latency_dist == "uniform":
+            jitter = draw * self.jitter_ms
+        else:
+            # Lognormal via the inverse-CDF approximation of a standard normal; median jitter_ms/2.
+            z = math.sqrt(2.0) * _erfinv(2.0 * min(max(draw, 1e-9), 1 - 1e-9) - 1.0)
+            jitter = min(self.jitter_ms * 10, self.jitter_ms / 2 * math.exp(0.75 * z))
+        tail = self.tail_ms if _unit(self.seed, "tail", request_hash, str(attempt)) < self.tail_rate else 0.0
+        return max(0.0, self.latency_ms + jitter + tail) / 1000.0
+
+    def fails(self, request_hash: str, attempt: int) -> bool:
+        return _unit(self.seed, "error", request_hash, str(attempt)) < self.error_rate
+
+
+def _erfinv(y: float) -> float:
+    # Winitzki's approximation; plenty for shaping a latency tail.
+    a = 0.147
+    ln = math.log(1.0 - y * y)
+    first = 2.0 / (math.pi * a) + ln / 2.0
+    return math.copysign(math.sqrt(math.sqrt(first * first - ln / a) - first), y)
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> Optional[float]:
+        """None when a token was taken, else seconds until one is available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return None
+            return (1.0 - self.tokens) / self.rate
+
+
+def _request_hash(body: Dict[str, Any]) -> str:
+    canonical = {key: value for key, value in body.items() if key not in ("stream", "user")}
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def _chat_response(body: Dict[str, Any], request_hash: str) -> Dict[str, Any]:
+    messages = body.get("messages") or []
+    prompt = "\n".join(str(m.get("content") or "") for m in messages if isinstance(m, dict))
+    content = json.dumps(
+        {
+            "summary": f"Stand-in response {request_hash[:12]}",
+            "confidence": round(_unit("confidence", request_hash), 2),
+            "request_sha256": request_hash,
+        },
+        sort_keys=True,
+    )
+    prompt_tokens = count_tokens(prompt)
+    completion_tokens = count_tokens(content)
+    return {
+        "id": f"chatcmpl-standin-{request_hash[:24]}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": body.get("model") or "standin",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def _embeddings_response(body: Dict[str, Any], dim: int) -> Dict[str, Any]:
+    raw = body.get("input")
+    inputs: List[str] = [raw] if isinstance(raw, str) else [str(item) for item in (raw or [])]
+    prompt_tokens = sum(count_tokens(text) for text in inputs)
+    return {
+        "object": "list",
+        "model": body.get("model") or "standin",
+        "data": [
+            {"object": "embedding", "index": idx, "embedding": hash_embed(text, dim=dim)}
+            for idx, text in enumerate(inputs)
+        ],
+        "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+    }
+
+
+class StandInServer:
+    """
+    Local stand-in for an OpenAI-compatible API: POST /v1/chat/completions and /v1/embeddings,
+    plus GET /v1/standin/stats. Responses are a pure function of the request body (chat content
+    embeds the request hash; embeddings come from hash_embed). Runs on a background thread:
+
+        with StandInServer(StandInConfig(latency_ms=200, error_rate=0.05)) as server:
+            client = ChatCompletionsClient(server.base_url)
+    """
+
+    def __init__(self, config: Optional[StandInConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or StandInConfig()
+        self._bucket = _TokenBucket(self.config.rate_limit_rps, self.config.rate_limit_burst)
+        self._lock = threading.Lock()
+        self._attempts: Dict[str, int] = {}
+        self._stats: Dict[str, int] = {"requests": 0, "ok": 0, "rate_limited": 0, "errors": 0}
+        self._served: Dict[str, int] = {"prompt_tokens": 0, "completion_tokens": 0}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="ai-standin", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, **self._served}
+
+    def _admit(self, request_hash: str) -> Tuple[int, float, Dict[str, str]]:
+        """(status, latency seconds, extra headers) for one attempt of a request."""
+        with self._lock:
+            attempt = self._attempts.get(request_hash, 0)
+            self._attempts[request_hash] = attempt + 1
+            self._stats["requests"] += 1
+        if self.config.rate_limit_rps > 0:
+            wait = self._bucket.take()
+            if wait is not None:
+                with self._lock:
+                    self._stats["rate_limited"] += 1
+                return 429, 0.0, {"Retry-After": f"{wait:.3f}"}
+        latency = self.config.latency_s(request_hash, attempt)
+        if self.config.fails(request_hash, attempt):
+            with self._lock:
+                self._stats["errors"] += 1
+            return self.config.error_status, latency, {}
+        return 200, latency, {}
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+                return
+
+            def _reply(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+                data = json.dumps(payload, sort_keys=True).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:  # noqa: N802 - stdlib hook
+                if self.path.rstrip("/") == "/v1/standin/stats":
+                    self._reply(200, server.stats())
+                else:
+                    self._reply(404, {"error": {"message": f"unknown path {self.path}"}})
+
+            def do_POST(self) -> None:  # noqa: N802 - stdlib hook
+                route = self.path.rstrip("/")
+                if route not in ("/v1/chat/completions", "/v1/embeddings"):
+                    self._reply(404, {"error": {"message": f"unknown path {self.path}"}})
+                    return
+                try:
+                    body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                except ValueError:
+                    self._reply(400, {"error": {"message": "invalid JSON body"}})
+                    return
+                request_hash = _request_hash(body if isinstance(body, dict) else {})
+                status, latency, headers = server._admit(request_hash)
+                if latency:
+                    time.sleep(latency)
+                if status != 200:
+                    self._reply(status, {"error": {"message": f"stand-in injected {status}"}}, headers)
+                    return
+                if route == "/v1/chat/completions":
+                    payload = _chat_response(body, request_hash)
+                else:
+                    payload = _embeddings_response(body, server.config.embedding_dim)
+                with server._lock:
+                    server._stats["ok"] += 1
+                    for name in server._served:
+                        server._served[name] += int(payload["usage"].get(name, 0) or 0)
+                self._reply(200, payload)
+
+        return _Handler
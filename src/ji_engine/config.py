@@ -37,6 +37,7 @@ LABELED_JOBS_JSON = DATA_DIR / "openai_labeled_jobs.json"
 ENRICHED_JOBS_JSON = DATA_DIR / "openai_enriched_jobs.json"
 ASHBY_CACHE_DIR = DATA_DIR / "ashby_cache"
 EMBED_CACHE_JSON = STATE_DIR / "embed_cache.json"
+HASH_CACHE_JSON = STATE_DIR / "hash_cache.json"
 
 RANKED_FAMILIES_JSON = DATA_DIR / "openai_ranked_families.json"
 
@@ -96,6 +97,8 @@ class CandidateStatePaths:
     last_run_pointer_path: Path
     last_success_pointer_path: Path
     run_index_path: Path
+    job_history_path: Path
+    latest_view_path: Path
     proofs_dir: Path
 
 
@@ -117,6 +120,8 @@ def candidate_state_paths(candidate_id: str) -> CandidateStatePaths:
         last_run_pointer_path=system_state / "last_run.json",
         last_success_pointer_path=system_state / "last_success.json",
         run_index_path=system_state / "run_index.sqlite",
+        job_history_path=system_state / "job_history.sqlite",
+        latest_view_path=system_state / "latest_view.json",
         proofs_dir=root / "proofs",
     )
 
@@ -137,6 +142,14 @@ def candidate_run_index_path(candidate_id: str) -> Path:
     return candidate_state_paths(candidate_id).run_index_path
 
 
+def candidate_job_history_path(candidate_id: str) -> Path:
+    return candidate_state_paths(candidate_id).job_history_path
+
+
+def candidate_latest_view_path(candidate_id: str) -> Path:
+    return candidate_state_paths(candidate_id).latest_view_path
+
+
 def candidate_last_run_read_paths(candidate_id: str) -> List[Path]:
     """
     Deterministic read order for last_run pointers with backward compatibility.
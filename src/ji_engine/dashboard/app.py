@@ -7,19 +7,21 @@ See LICENSE for permitted use.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import re
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type
-
-import boto3
-from botocore.exceptions import ClientError
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 try:
-    from fastapi import FastAPI, HTTPException
-    from fastapi.responses import Response
+    from fastapi import FastAPI, HTTPException, Request
+    from fastapi.responses import FileResponse, Response, StreamingResponse
     from pydantic import BaseModel, ConfigDict, Field, ValidationError
 except ModuleNotFoundError as exc:  # pragma: no cover - exercised in environments without dashboard extras
     raise RuntimeError("Dashboard dependencies are not installed. Install with: pip install -e '.[dashboard]'") from exc
@@ -32,7 +34,11 @@ from ji_engine.config import (
     candidate_state_paths,
     sanitize_candidate_id,
 )
+from ji_engine.dashboard.s3_reads import CACHEABLE_S3_STATUSES, DEFAULT_S3_CACHE_TTL_SECONDS, DashboardS3Reader
+from ji_engine.latest_view import latest_record, read_latest_view
+from ji_engine.run_job_index import RunJobIndex
 from ji_engine.run_repository import FileSystemRunRepository, RunRepository
+from ji_engine.utils.compression import artifact_digest, codec_for_suffix, logical_path, open_artifact
 from jobintel import aws_runs
 
 app = FastAPI(title="SignalCraft Dashboard API")
@@ -42,6 +48,19 @@ RUN_REPOSITORY: RunRepository = FileSystemRunRepository(RUN_METADATA_DIR)
 
 _RUN_ID_RE = re.compile(r"^[A-Za-z0-9_.:+-]{1,128}$")
 _DEFAULT_MAX_JSON_BYTES = 2 * 1024 * 1024
+_FILE_CACHE_MAX_ENTRIES = 512
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_REVALIDATE_CACHE_CONTROL = "no-cache"
+_ARTIFACT_CHUNK_BYTES = 64 * 1024
+_GZIP_MIN_BYTES = 1024
+# Pre-compressed sibling suffix per content coding, in server preference order.
+_PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+# Parsed (and schema-validated) JSON objects and file digests, keyed by (kind, path, mtime_ns, size):
+# a rewritten file gets a new key, stale entries age out of the LRU. Cached payloads are shared
+# between requests, so callers copy before mutating.
+_file_cache: "OrderedDict[Tuple[str, str, int, int], Any]" = OrderedDict()
+_file_cache_lock = threading.Lock()
 
 
 class _RunIndexSchema(BaseModel):
@@ -72,6 +91,18 @@ class _DashboardJsonError(RuntimeError):
         self.code = code
 
 
+def _s3_cache_ttl_seconds() -> float:
+    raw = os.environ.get("JOBINTEL_DASHBOARD_S3_CACHE_TTL_S", str(DEFAULT_S3_CACHE_TTL_SECONDS)).strip()
+    try:
+        parsed = float(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid JOBINTEL_DASHBOARD_S3_CACHE_TTL_S=%r; using default=%s", raw, DEFAULT_S3_CACHE_TTL_SECONDS
+        )
+        return DEFAULT_S3_CACHE_TTL_SECONDS
+    return max(0.0, parsed)
+
+
 def _max_json_bytes() -> int:
     raw = os.environ.get("JOBINTEL_DASHBOARD_MAX_JSON_BYTES", str(_DEFAULT_MAX_JSON_BYTES)).strip()
     try:
@@ -93,6 +124,9 @@ def _max_json_bytes() -> int:
     return parsed
 
 
+S3_READER = DashboardS3Reader(ttl_seconds=_s3_cache_ttl_seconds())
+
+
 def _validate_schema(payload: Dict[str, Any], schema: Optional[Type[BaseModel]]) -> None:
     if schema is None:
         return
@@ -102,16 +136,61 @@ def _validate_schema(payload: Dict[str, Any], schema: Optional[Type[BaseModel]])
         raise _DashboardJsonError("invalid_schema") from exc
 
 
+def _file_cache_get(key: Tuple[str, str, int, int]) -> Any:
+    with _file_cache_lock:
+        value = _file_cache.get(key)
+        if value is not None:
+            _file_cache.move_to_end(key)
+        return value
+
+
+def _file_cache_put(key: Tuple[str, str, int, int], value: Any) -> None:
+    with _file_cache_lock:
+        _file_cache[key] = value
+        _file_cache.move_to_end(key)
+        while len(_file_cache) > _FILE_CACHE_MAX_ENTRIES:
+            _file_cache.popitem(last=False)
+
+
+def _file_sha256(path: Path) -> str:
+    stat = path.stat()
+    key = ("sha256", str(path), stat.st_mtime_ns, stat.st_size)
+    digest = _file_cache_get(key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        _file_cache_put(key, digest)
+    return digest
+
+
+def _content_sha256(path: Path) -> str:
+    """Digest of a compressed artifact's uncompressed bytes, cached like `_file_sha256`."""
+    stat = path.stat()
+    key = ("content-sha256", str(path), stat.st_mtime_ns, stat.st_size)
+    digest = _file_cache_get(key)
+    if digest is None:
+        digest = artifact_digest(path)[0]
+        _file_cache_put(key, digest)
+    return digest
+
+
 def _read_local_json_object(path: Path, *, schema: Optional[Type[BaseModel]] = None) -> Dict[str, Any]:
     if not path.exists():
         raise _DashboardJsonError("not_found")
     max_bytes = _max_json_bytes()
     try:
-        size_bytes = path.stat().st_size
+        stat = path.stat()
     except OSError as exc:
         raise _DashboardJsonError("io_error") from exc
-    if size_bytes > max_bytes:
+    if stat.st_size > max_bytes:
         raise _DashboardJsonError("too_large")
+    key = (f"json:{schema.__name__ if schema else ''}", str(path), stat.st_mtime_ns, stat.st_size)
+    cached = _file_cache_get(key)
+    if cached is not None:
+        return cached
     try:
         payload = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
@@ -121,6 +200,7 @@ def _read_local_json_object(path: Path, *, schema: Optional[Type[BaseModel]] = N
     if not isinstance(payload, dict):
         raise _DashboardJsonError("invalid_shape")
     _validate_schema(payload, schema)
+    _file_cache_put(key, payload)
     return payload
 
 
@@ -188,21 +268,31 @@ def _load_first_ai_prompt_version(run_dir: Path) -> Optional[str]:
     return None
 
 
-def _list_runs(candidate_id: str) -> List[Dict[str, Any]]:
-    runs: List[Dict[str, Any]] = []
+def _list_runs(
+    candidate_id: str,
+    *,
+    filters: Optional[Dict[str, Optional[str]]] = None,
+    limit: int = 1000,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     safe_candidate = _sanitize_candidate_id(candidate_id)
-    for path in RUN_REPOSITORY.list_run_dirs(candidate_id=safe_candidate):
-        index_path = path / "index.json"
-        if not index_path.exists():
-            continue
+    try:
+        page = RUN_REPOSITORY.query_runs(
+            safe_candidate, **(filters or {}), limit=limit, cursor=cursor, include_payload=True
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    runs: List[Dict[str, Any]] = []
+    for item in page["runs"]:
+        data = item.pop("payload")
         try:
-            data = _read_local_json_object(index_path, schema=_RunIndexSchema)
+            _validate_schema(data, _RunIndexSchema)
         except _DashboardJsonError as exc:
-            logger.warning("Skipping run index at %s (%s)", index_path, exc.code)
+            logger.warning("Skipping run index for run_id=%s (%s)", item["run_id"], exc.code)
             continue
+        data["summary"] = item
         runs.append(data)
-    runs.sort(key=lambda r: r.get("timestamp") or "", reverse=True)
-    return runs
+    return runs, page["next_cursor"]
 
 
 def _resolve_artifact_path(run_id: str, candidate_id: str, index: Dict[str, Any], name: str) -> Path:
@@ -244,6 +334,118 @@ def _content_type(path: Path) -> str:
     return "text/plain"
 
 
+def _run_finished(run_report: Dict[str, Any]) -> bool:
+    timestamps = run_report.get("timestamps")
+    ended_at = timestamps.get("ended_at") if isinstance(timestamps, dict) else None
+    return isinstance(ended_at, str) and bool(ended_at.strip())
+
+
+def _artifact_sha256(run_report: Dict[str, Any], path: Path, run_dir: Path) -> str:
+    """
+    Digest recorded in the run report for the artifact at this run-dir path, else the (cached)
+    digest of the file; for an artifact stored compressed, the digest of its uncompressed bytes.
+    A `provider:profile:*` entry is archived at `<provider>/<profile>/<name>`, so a recorded digest
+    is only used for exactly that path (same basenames recur across providers and profiles).
+    """
+    if codec_for_suffix(path):
+        return _content_sha256(path)
+    verifiable = run_report.get("verifiable_artifacts")
+    try:
+        rel = path.resolve().relative_to(run_dir.resolve()).as_posix()
+    except ValueError:
+        return _file_sha256(path)
+    if isinstance(verifiable, dict):
+        size = path.stat().st_size
+        for logical_key, meta in verifiable.items():
+            parts = str(logical_key).split(":")
+            if len(parts) < 3 or not isinstance(meta, dict) or not isinstance(meta.get("path"), str):
+                continue
+            sha = meta.get("sha256")
+            archived = f"{parts[0]}/{parts[1]}/{Path(meta['path']).name}"
+            if archived == rel and meta.get("bytes") == size and isinstance(sha, str) and sha:
+                return sha
+    return _file_sha256(path)
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def _accepted_encodings(request: Request) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for item in (request.headers.get("accept-encoding") or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def _negotiate_artifact_encoding(request: Request, path: Path) -> Tuple[Optional[str], Optional[Path]]:
+    """
+    Pick the content coding for an artifact: a pre-compressed `<name>.br`/`<name>.gz` sibling that
+    is at least as new as the artifact, else on-the-fly gzip for non-range requests. Returns
+    (coding, sibling path or None); (None, None) serves the file as is. An artifact archived
+    compressed (`.gz`/`.zst`) is sent as stored when the client accepts its coding, else decoded.
+    """
+    accepted = _accepted_encodings(request)
+    wildcard = accepted.get("*", 0.0)
+    stored = codec_for_suffix(path)
+    if stored is not None:
+        return (stored, path) if accepted.get(stored, wildcard) > 0 else (None, None)
+    if not accepted:
+        return None, None
+    mtime_ns = path.stat().st_mtime_ns
+    for coding, suffix in _PRECOMPRESSED_SUFFIXES:
+        if accepted.get(coding, wildcard) <= 0:
+            continue
+        sibling = path.with_name(path.name + suffix)
+        try:
+            if sibling.is_file() and sibling.stat().st_mtime_ns >= mtime_ns:
+                return coding, sibling
+        except OSError:
+            continue
+    # Ranges address the stored bytes, so only whole-file responses are compressed on the fly.
+    if (
+        accepted.get("gzip", wildcard) > 0
+        and request.headers.get("range") is None
+        and path.stat().st_size >= _GZIP_MIN_BYTES
+    ):
+        return "gzip", None
+    return None, None
+
+
+def _gzip_chunks(path: Path) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_ARTIFACT_CHUNK_BYTES), b""):
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+    yield compressor.flush()
+
+
+def _decoded_chunks(path: Path) -> Iterator[bytes]:
+    with open_artifact(path, "rb") as handle:
+        yield from iter(lambda: handle.read(_ARTIFACT_CHUNK_BYTES), b"")
+
+
+def _cache_headers(etag: str, finished: bool) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": _IMMUTABLE_CACHE_CONTROL if finished else _REVALIDATE_CACHE_CONTROL}
+
+
 def _s3_bucket() -> str:
     return os.environ.get("JOBINTEL_S3_BUCKET", "").strip()
 
@@ -279,37 +481,7 @@ def _read_local_json(path: Path) -> Dict[str, Any]:
 
 
 def _read_s3_json(bucket: str, key: str) -> Tuple[Optional[Dict[str, Any]], str]:
-    s3 = boto3.client("s3")
-    try:
-        resp = s3.get_object(Bucket=bucket, Key=key)
-    except ClientError as exc:
-        code = exc.response.get("Error", {}).get("Code", "")
-        if code in {"NoSuchKey", "404"}:
-            return None, "not_found"
-        if code in {"AccessDenied", "403"}:
-            return None, "access_denied"
-        return None, f"error:{code or exc.__class__.__name__}"
-    body = resp.get("Body")
-    if body is None:
-        return None, "empty_body"
-    max_bytes = _max_json_bytes()
-    content_length = resp.get("ContentLength")
-    if isinstance(content_length, int) and content_length > max_bytes:
-        logger.warning(
-            "S3 JSON payload too large: s3://%s/%s bytes=%d limit=%d", bucket, key, content_length, max_bytes
-        )
-        return None, "too_large"
-    try:
-        raw = body.read(max_bytes + 1)
-        if len(raw) > max_bytes:
-            logger.warning("S3 JSON payload exceeded read limit: s3://%s/%s limit=%d", bucket, key, max_bytes)
-            return None, "too_large"
-        payload = json.loads(raw.decode("utf-8"))
-    except Exception:
-        return None, "invalid_json"
-    if not isinstance(payload, dict):
-        return None, "invalid_shape"
-    return payload, "ok"
+    return S3_READER.get_json(bucket, key, max_bytes=_max_json_bytes())
 
 
 def _local_proof_path(run_id: str, candidate_id: str) -> Path:
@@ -343,22 +515,7 @@ def _s3_legacy_latest_prefix(prefix: str, provider: str, profile: str) -> str:
 
 
 def _s3_list_keys(bucket: str, prefix: str) -> List[str]:
-    s3 = boto3.client("s3")
-    keys: List[str] = []
-    token = None
-    while True:
-        kwargs: Dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
-        if token:
-            kwargs["ContinuationToken"] = token
-        resp = s3.list_objects_v2(**kwargs)
-        for obj in resp.get("Contents") or []:
-            key = obj.get("Key")
-            if key:
-                keys.append(key)
-        if not resp.get("IsTruncated"):
-            break
-        token = resp.get("NextContinuationToken")
-    return keys
+    return S3_READER.list_keys(bucket, prefix)
 
 
 @app.get("/healthz")
@@ -367,12 +524,38 @@ def healthz() -> Dict[str, str]:
 
 
 @app.get("/runs")
-def runs(candidate_id: str = DEFAULT_CANDIDATE_ID) -> List[Dict[str, Any]]:
-    return _list_runs(candidate_id)
+def runs(
+    response: Response,
+    candidate_id: str = DEFAULT_CANDIDATE_ID,
+    status: Optional[str] = None,
+    provider: Optional[str] = None,
+    profile: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    git_sha: Optional[str] = None,
+    limit: int = 1000,
+    cursor: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    if limit < 1 or limit > 1000:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 1000")
+    filters = {
+        "status": status,
+        "provider": provider,
+        "profile": profile,
+        "since": since,
+        "until": until,
+        "git_sha": git_sha,
+    }
+    items, next_cursor = _list_runs(candidate_id, filters=filters, limit=limit, cursor=cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
 
 
-@app.get("/runs/{run_id}")
-def run_detail(run_id: str, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Dict[str, Any]:
+@app.get("/runs/{run_id}", response_model=None)
+def run_detail(
+    run_id: str, request: Request, response: Response, candidate_id: str = DEFAULT_CANDIDATE_ID
+) -> Union[Dict[str, Any], Response]:
     _sanitize_run_id(run_id)
     index = _load_index(run_id, candidate_id)
     run_dir = _run_dir(run_id, candidate_id)
@@ -386,15 +569,78 @@ def run_detail(run_id: str, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Dict[st
     enriched["semantic_mode"] = run_report.get("semantic_mode")
     enriched["ai_prompt_version"] = prompt_version
     enriched["cost_summary"] = costs
+    digest = hashlib.sha256(json.dumps(enriched, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    # Never immutable: diff counts, costs and the AI prompt version can change after the run ends.
+    headers = {"ETag": f'"{digest}"', "Cache-Control": _REVALIDATE_CACHE_CONTROL}
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return enriched
 
 
 @app.get("/runs/{run_id}/artifact/{name}")
-def run_artifact(run_id: str, name: str, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Response:
+def run_artifact(run_id: str, name: str, request: Request, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Response:
     _sanitize_run_id(run_id)
     index = _load_index(run_id, candidate_id)
     path = _resolve_artifact_path(run_id, candidate_id, index, name)
-    return Response(path.read_bytes(), media_type=_content_type(path))
+    run_dir = _run_dir(run_id, candidate_id)
+    run_report = (
+        _load_optional_json_object(run_dir / "run_report.json", context="run report", schema=_RunReportSchema) or {}
+    )
+    coding, encoded_path = _negotiate_artifact_encoding(request, path)
+    digest = _artifact_sha256(run_report, path, run_dir)
+    headers = _cache_headers(f'"{digest}-{coding}"' if coding else f'"{digest}"', _run_finished(run_report))
+    headers["Vary"] = "Accept-Encoding"
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    media_type = _content_type(logical_path(path))
+    if coding is None:
+        if codec_for_suffix(path):
+            return StreamingResponse(_decoded_chunks(path), media_type=media_type, headers=headers)
+        return FileResponse(path, media_type=media_type, headers=headers)
+    headers["Content-Encoding"] = coding
+    if encoded_path is not None:
+        return FileResponse(encoded_path, media_type=media_type, headers=headers)
+    return StreamingResponse(_gzip_chunks(path), media_type=media_type, headers=headers)
+
+
+@app.get("/runs/{run_id}/jobs")
+def run_jobs(
+    run_id: str,
+    response: Response,
+    candidate_id: str = DEFAULT_CANDIDATE_ID,
+    provider: Optional[str] = None,
+    profile: Optional[str] = None,
+    min_score: Optional[float] = None,
+    role_band: Optional[str] = None,
+    q: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    _sanitize_run_id(run_id)
+    if limit < 1 or limit > 500:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 500")
+    _load_index(run_id, candidate_id)
+    job_index = RunJobIndex(_run_dir(run_id, candidate_id))
+    try:
+        job_index.ensure_current()
+        page = job_index.query_jobs(
+            provider=provider,
+            profile=profile,
+            min_score=min_score,
+            role_band=role_band,
+            q=q,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Run job index unavailable for run_id=%s (%r)", run_id, exc)
+        raise HTTPException(status_code=500, detail="Run job index unavailable") from exc
+    if page["next_cursor"]:
+        response.headers["X-Next-Cursor"] = page["next_cursor"]
+    return {"run_id": run_id, **page}
 
 
 @app.get("/runs/{run_id}/semantic_summary/{profile}")
@@ -437,7 +683,13 @@ def latest(candidate_id: str = DEFAULT_CANDIDATE_ID) -> Dict[str, Any]:
     if _s3_enabled():
         bucket = _s3_bucket()
         prefix = _s3_prefix()
-        payload, status, key = aws_runs.read_last_success_state(bucket, prefix, candidate_id=safe_candidate)
+        payload, status, key = S3_READER.cached(
+            ("last_success", bucket, prefix, safe_candidate),
+            lambda: aws_runs.read_last_success_state(
+                bucket, prefix, candidate_id=safe_candidate, client=S3_READER.client()
+            ),
+            cache_if=lambda result: result[1] in CACHEABLE_S3_STATUSES,
+        )
         if status != "ok" or not payload:
             raise HTTPException(status_code=404, detail=f"s3 last_success not found ({status})")
         return {
@@ -478,6 +730,17 @@ def run_receipt(run_id: str, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Dict[s
     return {"source": "local", "path": str(local_path), "payload": payload}
 
 
+@app.get("/v1/trends/{provider}/{profile}")
+def delta_trends(
+    provider: str, profile: str, window: int = 7, candidate_id: str = DEFAULT_CANDIDATE_ID
+) -> Dict[str, Any]:
+    safe_candidate = _sanitize_candidate_id(candidate_id)
+    if window < 1 or window > 1000:
+        raise HTTPException(status_code=400, detail="window must be between 1 and 1000")
+    trend = RUN_REPOSITORY.delta_counts_window(provider, profile, window=window, candidate_id=safe_candidate)
+    return {"provider": provider, "profile": profile, **trend}
+
+
 @app.get("/v1/artifacts/latest/{provider}/{profile}")
 def latest_artifacts(provider: str, profile: str, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Dict[str, Any]:
     safe_candidate = _sanitize_candidate_id(candidate_id)
@@ -491,6 +754,16 @@ def latest_artifacts(provider: str, profile: str, candidate_id: str = DEFAULT_CA
             keys = _s3_list_keys(bucket, latest_prefix)
         return {"source": "s3", "bucket": bucket, "prefix": latest_prefix, "keys": keys}
 
+    record = latest_record(read_latest_view(candidate_state_paths(safe_candidate).latest_view_path), provider, profile)
+    if record is not None:
+        outputs = record.get("outputs") if isinstance(record.get("outputs"), dict) else {}
+        return {
+            "source": "local",
+            "run_id": record["run_id"],
+            "paths": [item.get("path") for item in outputs.values() if isinstance(item, dict) and item.get("path")],
+        }
+
+    # Runs finalized before the latest view existed: last_success pointer + run report.
     pointer = _read_local_json(_state_last_success_path(safe_candidate))
     run_id = pointer.get("run_id")
     if not run_id:
@@ -0,0 +1,162 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+import boto3
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_S3_CACHE_TTL_SECONDS = 10.0
+DEFAULT_S3_CACHE_MAX_ENTRIES = 1024
+
+# Outcomes worth remembering for a TTL; throttling/5xx/etc. are retried on the next request.
+CACHEABLE_S3_STATUSES = frozenset({"ok", "not_found"})
+
+
+def fetch_s3_json(client: Any, bucket: str, key: str, max_bytes: int) -> Tuple[Optional[Dict[str, Any]], str]:
+    """GET one JSON object (bounded by `max_bytes`) -> (payload, status)."""
+    try:
+        resp = client.get_object(Bucket=bucket, Key=key)
+    except ClientError as exc:
+        code = exc.response.get("Error", {}).get("Code", "")
+        if code in {"NoSuchKey", "404"}:
+            return None, "not_found"
+        if code in {"AccessDenied", "403"}:
+            return None, "access_denied"
+        return None, f"error:{code or exc.__class__.__name__}"
+    body = resp.get("Body")
+    if body is None:
+        return None, "empty_body"
+    content_length = resp.get("ContentLength")
+    if isinstance(content_length, int) and content_length > max_bytes:
+        logger.warning(
+            "S3 JSON payload too large: s3://%s/%s bytes=%d limit=%d", bucket, key, content_length, max_bytes
+        )
+        return None, "too_large"
+    try:
+        raw = body.read(max_bytes + 1)
+        if len(raw) > max_bytes:
+            logger.warning("S3 JSON payload exceeded read limit: s3://%s/%s limit=%d", bucket, key, max_bytes)
+            return None, "too_large"
+        payload = json.loads(raw.decode("utf-8"))
+    except Exception:
+        return None, "invalid_json"
+    if not isinstance(payload, dict):
+        return None, "invalid_shape"
+    return payload, "ok"
+
+
+def list_s3_keys(client: Any, bucket: str, prefix: str) -> List[str]:
+    keys: List[str] = []
+    token = None
+    while True:
+        kwargs: Dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
+        if token:
+            kwargs["ContinuationToken"] = token
+        resp = client.list_objects_v2(**kwargs)
+        for obj in resp.get("Contents") or []:
+            key = obj.get("Key")
+            if key:
+                keys.append(key)
+        if not resp.get("IsTruncated"):
+            break
+        token = resp.get("NextContinuationToken")
+    return keys
+
+
+class DashboardS3Reader:
+    """
+    Shared S3 read path for the dashboard.
+
+    One boto3 client per process (clients are thread-safe), a short-TTL LRU for pointer objects
+    and prefix listings, and single-flight loading: concurrent requests for the same key wait on
+    the first caller's S3 call instead of issuing their own. Route handlers are sync, so FastAPI
+    already runs these calls on its worker thread pool rather than on the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_S3_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_S3_CACHE_MAX_ENTRIES,
+        client_factory: Optional[Callable[[], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._client_factory = client_factory or (lambda: boto3.client("s3"))
+        self._clock = clock
+        self._client: Any = None
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def client(self) -> Any:
+        with self._lock:
+            if self._client is None:
+                self._client = self._client_factory()
+            return self._client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def cached(self, key: Hashable, loader: Callable[[], T], *, cache_if: Callable[[T], bool] = lambda _: True) -> T:
+        """Value for `key` from the TTL cache, else from `loader()` (run once for concurrent callers)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+        if not leader:
+            return future.result()
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+            if self.ttl_seconds > 0 and cache_if(value):
+                self._entries[key] = (self._clock() + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def get_json(self, bucket: str, key: str, *, max_bytes: int) -> Tuple[Optional[Dict[str, Any]], str]:
+        return self.cached(
+            ("get_json", bucket, key, max_bytes),
+            lambda: fetch_s3_json(self.client(), bucket, key, max_bytes),
+            cache_if=lambda result: result[1] in CACHEABLE_S3_STATUSES,
+        )
+
+    def list_keys(self, bucket: str, prefix: str) -> List[str]:
+        return self.cached(("list_keys", bucket, prefix), lambda: list_s3_keys(self.client(), bucket, prefix))
@@ -33,7 +33,8 @@ class StubEmbeddingProvider(EmbeddingProvider):
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """
-    Calls OpenAI embeddings endpoint with simple backoff.
+    Calls OpenAI embeddings endpoint with simple backoff. `base_url` points it at any
+    OpenAI-compatible API, e.g. the local stand-in in ji_engine.ai.standin_server.
     """
 
     def __init__(
@@ -43,12 +44,14 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         timeout: int = 30,
         max_retries: int = 3,
         min_interval: float = 0.2,
+        base_url: str = "https://api.openai.com/v1",
     ):
         self.api_key = api_key
         self.model = model
         self.timeout = timeout
         self.max_retries = max_retries
         self.min_interval = min_interval
+        self.base_url = base_url.rstrip("/")
         self._last_call_ts = 0.0
 
     def _throttle(self) -> None:
@@ -62,7 +65,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-        url = "https://api.openai.com/v1/embeddings"
+        url = f"{self.base_url}/embeddings"
 
         for attempt in range(self.max_retries):
             self._throttle()
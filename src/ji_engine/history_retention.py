@@ -14,7 +14,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from ji_engine.utils.job_identity import job_identity, normalize_job_url
+from ji_engine.job_history import JobHistoryStore, history_job_id
+from ji_engine.utils.job_identity import normalize_job_url
 
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
@@ -38,6 +39,7 @@ class HistoryRunArtifactsResult:
     identity_map_path: str
     provenance_path: str
     identity_count: int
+    job_history_rows: int = 0
 
 
 def _run_key(run_id: str) -> str:
@@ -146,17 +148,21 @@ def write_history_run_artifacts(
     profile: str,
     run_report_path: Path,
     written_at: str,
+    job_history_db: Path | None = None,
 ) -> HistoryRunArtifactsResult:
+    """
+    Write identity_map.json/provenance.json for one profile of a run. When `job_history_db`
+    is given, the run's ranked jobs are also recorded in that `JobHistoryStore`.
+    """
     run_report = _read_json(run_report_path)
     providers = [p for p in (run_report.get("providers") or []) if isinstance(p, str) and p.strip()]
 
     identities: dict[str, dict[str, Any]] = {}
+    jobs_by_provider: dict[str, list[dict[str, Any]]] = {}
     for provider in sorted(set(providers)):
-        for job in _iter_ranked_jobs(run_report, provider, profile):
-            job_id_raw = job.get("job_id")
-            job_id = str(job_id_raw).strip() if isinstance(job_id_raw, str) and job_id_raw.strip() else ""
-            if not job_id:
-                job_id = job_identity(job, mode="provider")
+        ranked_jobs = jobs_by_provider[provider] = _iter_ranked_jobs(run_report, provider, profile)
+        for job in ranked_jobs:
+            job_id = history_job_id(job)
             normalized_url = normalize_job_url(
                 str(job.get("apply_url") or job.get("detail_url") or job.get("url") or "")
             )
@@ -234,12 +240,22 @@ def write_history_run_artifacts(
         },
     )
 
+    job_history_rows = 0
+    if job_history_db is not None:
+        job_history_rows = JobHistoryStore(job_history_db).record_run(
+            profile=profile,
+            run_id=run_id,
+            run_timestamp=written_at,
+            jobs_by_provider=jobs_by_provider,
+        )
+
     return HistoryRunArtifactsResult(
         profile=profile,
         run_id=run_id,
         identity_map_path=identity_path.as_posix(),
         provenance_path=provenance_path.as_posix(),
         identity_count=len(identities_sorted),
+        job_history_rows=job_history_rows,
     )
 
 
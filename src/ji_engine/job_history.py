@@ -0,0 +1,355 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from ji_engine.utils.job_identity import stored_job_identity
+
+JOB_HISTORY_SCHEMA_VERSION = 1
+
+# Lifecycle status of a job in a run, relative to earlier runs of the same profile/provider.
+STATUS_NEW = "new"
+STATUS_REOPENED = "reopened"
+STATUS_CHANGED = "changed"
+STATUS_UNCHANGED = "unchanged"
+JOB_STATUSES = (STATUS_NEW, STATUS_REOPENED, STATUS_CHANGED, STATUS_UNCHANGED)
+
+
+@dataclass(frozen=True)
+class JobHistoryRebuildResult:
+    db_path: str
+    runs_indexed: int
+    rows_indexed: int
+
+
+def history_job_id(job: Mapping[str, Any]) -> str:
+    """Same job_id resolution as the identity_map history artifacts."""
+    job_id_raw = job.get("job_id")
+    if isinstance(job_id_raw, str) and job_id_raw.strip():
+        return job_id_raw.strip()
+    return stored_job_identity(dict(job))
+
+
+def _score(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+def _text(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) and value else None
+
+
+def _parse_ts(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+
+class JobHistoryStore:
+    """
+    Per-candidate SQLite store with one row per (profile, job_id, provider, run_id).
+
+    Rows carry score, content_fingerprint, role_band and a lifecycle status computed against
+    the profile's earlier runs. Runs are expected to be recorded in run_id order (as
+    run_daily does); `rebuild_from_run_dirs` replays archived ranked outputs to restore the
+    store after repair or out-of-order writes.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+
+    def _connect(self, path: Optional[Path] = None, *, ensure_schema: bool = True) -> sqlite3.Connection:
+        target = path or self.db_path
+        if ensure_schema:
+            target.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(target)
+        conn.row_factory = sqlite3.Row
+        if ensure_schema:
+            self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS history_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS history_runs (
+                profile TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                run_timestamp TEXT NOT NULL,
+                job_count INTEGER NOT NULL,
+                PRIMARY KEY (profile, run_id)
+            );
+            CREATE TABLE IF NOT EXISTS job_history (
+                profile TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                run_timestamp TEXT NOT NULL,
+                title TEXT,
+                score NUMERIC,
+                content_fingerprint TEXT,
+                role_band TEXT,
+                status TEXT NOT NULL,
+                PRIMARY KEY (profile, job_id, provider, run_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_job_history_run
+                ON job_history(profile, run_id, provider);
+            """
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO history_meta(key, value) VALUES ('schema_version', ?)",
+            (str(JOB_HISTORY_SCHEMA_VERSION),),
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record_run(
+        self,
+        *,
+        profile: str,
+        run_id: str,
+        run_timestamp: str,
+        jobs_by_provider: Mapping[str, Iterable[Mapping[str, Any]]],
+    ) -> int:
+        """Replace the rows for (profile, run_id) with the given ranked jobs; returns rows written."""
+        conn = self._connect()
+        try:
+            with conn:
+                written = self._record_run(conn, profile, run_id, run_timestamp, jobs_by_provider)
+        finally:
+            conn.close()
+        return written
+
+    def _record_run(
+        self,
+        conn: sqlite3.Connection,
+        profile: str,
+        run_id: str,
+        run_timestamp: str,
+        jobs_by_provider: Mapping[str, Iterable[Mapping[str, Any]]],
+    ) -> int:
+        conn.execute("DELETE FROM job_history WHERE profile = ? AND run_id = ?", (profile, run_id))
+        prev_row = conn.execute(
+            "SELECT run_id FROM history_runs WHERE profile = ? AND run_id < ? ORDER BY run_id DESC LIMIT 1",
+            (profile, run_id),
+        ).fetchone()
+        prev_run_id = prev_row["run_id"] if prev_row else None
+
+        rows: Dict[tuple, tuple] = {}
+        for provider in sorted(jobs_by_provider):
+            prev_fingerprints: Dict[str, Optional[str]] = {}
+            if prev_run_id is not None:
+                prev_fingerprints = {
+                    row["job_id"]: row["content_fingerprint"]
+                    for row in conn.execute(
+                        "SELECT job_id, content_fingerprint FROM job_history "
+                        "WHERE profile = ? AND run_id = ? AND provider = ?",
+                        (profile, prev_run_id, provider),
+                    )
+                }
+            for job in jobs_by_provider[provider]:
+                job_id = history_job_id(job)
+                fingerprint = _text(job.get("content_fingerprint"))
+                if job_id in prev_fingerprints:
+                    status = STATUS_CHANGED if prev_fingerprints[job_id] != fingerprint else STATUS_UNCHANGED
+                elif conn.execute(
+                    "SELECT 1 FROM job_history "
+                    "WHERE profile = ? AND job_id = ? AND provider = ? AND run_id < ? LIMIT 1",
+                    (profile, job_id, provider, run_id),
+                ).fetchone():
+                    status = STATUS_REOPENED
+                else:
+                    status = STATUS_NEW
+                rows[(job_id, provider)] = (
+                    profile,
+                    job_id,
+                    provider,
+                    run_id,
+                    run_timestamp,
+                    _text(job.get("title")),
+                    _score(job.get("score")),
+                    fingerprint,
+                    _text(job.get("role_band")),
+                    status,
+                )
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO job_history(
+                profile, job_id, provider, run_id, run_timestamp,
+                title, score, content_fingerprint, role_band, status
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [rows[key] for key in sorted(rows)],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO history_runs(profile, run_id, run_timestamp, job_count) VALUES (?, ?, ?, ?)",
+            (profile, run_id, run_timestamp, len(rows)),
+        )
+        return len(rows)
+
+    def rebuild_from_run_dirs(self, run_dirs: Iterable[Path]) -> JobHistoryRebuildResult:
+        """
+        Rebuild the whole store from archived run directories (`<run_dir>/index.json` and the
+        ranked JSON copies it lists), replaying runs in run_id order into a temp DB that
+        atomically replaces the current one.
+        """
+        runs: List[tuple[str, str, str, Dict[str, List[Dict[str, Any]]]]] = []
+        for run_dir in run_dirs:
+            runs.extend(_archived_runs(run_dir))
+        runs.sort(key=lambda item: (item[0], item[1]))
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.db_path.with_suffix(".tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        rows_indexed = 0
+        conn = self._connect(tmp_path)
+        try:
+            with conn:
+                for run_id, profile, run_timestamp, jobs_by_provider in runs:
+                    rows_indexed += self._record_run(conn, profile, run_id, run_timestamp, jobs_by_provider)
+        finally:
+            conn.close()
+        os.replace(tmp_path, self.db_path)
+        return JobHistoryRebuildResult(
+            db_path=str(self.db_path),
+            runs_indexed=len(runs),
+            rows_indexed=rows_indexed,
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple) -> List[sqlite3.Row]:
+        if not self.db_path.exists():
+            return []
+        conn = self._connect(ensure_schema=False)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def job_timeline(self, job_id: str, *, profile: str, provider: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Every recorded run of one job, oldest first."""
+        sql = (
+            "SELECT run_id, run_timestamp, provider, title, score, content_fingerprint, role_band, status "
+            "FROM job_history WHERE profile = ? AND job_id = ?"
+        )
+        params: tuple = (profile, job_id)
+        if provider is not None:
+            sql += " AND provider = ?"
+            params += (provider,)
+        sql += " ORDER BY run_id, provider"
+        return [dict(row) for row in self._query(sql, params)]
+
+    def open_duration(self, job_id: str, *, profile: str, provider: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """First/last sighting of a job, how many runs it appeared in and whether it is still open."""
+        sql = (
+            "SELECT MIN(run_id) AS first_seen_run_id, MIN(run_timestamp) AS first_seen_at, "
+            "MAX(run_id) AS last_seen_run_id, MAX(run_timestamp) AS last_seen_at, "
+            "COUNT(DISTINCT run_id) AS runs_seen "
+            "FROM job_history WHERE profile = ? AND job_id = ?"
+        )
+        params: tuple = (profile, job_id)
+        if provider is not None:
+            sql += " AND provider = ?"
+            params += (provider,)
+        rows = self._query(sql, params)
+        if not rows or not rows[0]["runs_seen"]:
+            return None
+        result = dict(rows[0])
+        latest = self._query("SELECT MAX(run_id) AS run_id FROM history_runs WHERE profile = ?", (profile,))
+        result["open"] = bool(latest) and latest[0]["run_id"] == result["last_seen_run_id"]
+        first_at = _parse_ts(result["first_seen_at"])
+        last_at = _parse_ts(result["last_seen_at"])
+        result["open_days"] = (
+            round((last_at - first_at).total_seconds() / 86400, 3)
+            if first_at is not None and last_at is not None
+            else None
+        )
+        return result
+
+    def churn_by_provider(self, *, profile: str, run_id: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Per-provider status counts for one run (default: latest) plus jobs removed since the previous run."""
+        runs = [
+            row["run_id"]
+            for row in self._query(
+                "SELECT run_id FROM history_runs WHERE profile = ? AND (? IS NULL OR run_id <= ?) "
+                "ORDER BY run_id DESC LIMIT 2",
+                (profile, run_id, run_id),
+            )
+        ]
+        if not runs or (run_id is not None and runs[0] != run_id):
+            return {}
+        current = runs[0]
+        churn: Dict[str, Dict[str, int]] = {}
+        for row in self._query(
+            "SELECT provider, status, COUNT(*) AS n FROM job_history WHERE profile = ? AND run_id = ? "
+            "GROUP BY provider, status",
+            (profile, current),
+        ):
+            counts = churn.setdefault(row["provider"], {**dict.fromkeys(JOB_STATUSES, 0), "removed": 0})
+            counts[row["status"]] = row["n"]
+        if len(runs) > 1:
+            for row in self._query(
+                "SELECT prev.provider AS provider, COUNT(*) AS n FROM job_history AS prev "
+                "LEFT JOIN job_history AS cur ON cur.profile = prev.profile AND cur.job_id = prev.job_id "
+                "AND cur.provider = prev.provider AND cur.run_id = ? "
+                "WHERE prev.profile = ? AND prev.run_id = ? AND cur.job_id IS NULL GROUP BY prev.provider",
+                (current, profile, runs[1]),
+            ):
+                counts = churn.setdefault(row["provider"], {**dict.fromkeys(JOB_STATUSES, 0), "removed": 0})
+                counts["removed"] = row["n"]
+        return {provider: churn[provider] for provider in sorted(churn)}
+
+
+def _archived_runs(run_dir: Path) -> List[tuple[str, str, str, Dict[str, List[Dict[str, Any]]]]]:
+    """(run_id, profile, run_timestamp, ranked jobs by provider) for each profile archived in a run dir."""
+    try:
+        index = json.loads((run_dir / "index.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return []
+    if not isinstance(index, dict):
+        return []
+    run_id = index.get("run_id")
+    if not isinstance(run_id, str) or not run_id.strip():
+        return []
+    timestamp = index.get("timestamp")
+    run_timestamp = timestamp if isinstance(timestamp, str) and timestamp.strip() else run_id
+    by_profile: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    providers = index.get("providers")
+    for provider, provider_payload in sorted((providers or {}).items() if isinstance(providers, dict) else []):
+        profiles = provider_payload.get("profiles") if isinstance(provider_payload, dict) else None
+        for profile, profile_payload in sorted((profiles or {}).items() if isinstance(profiles, dict) else []):
+            artifacts = profile_payload.get("artifacts") if isinstance(profile_payload, dict) else None
+            rel = (artifacts or {}).get(f"{provider}_ranked_jobs.{profile}.json")
+            if not isinstance(rel, str):
+                continue
+            try:
+                payload = json.loads((run_dir / rel).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            if isinstance(payload, list):
+                by_profile.setdefault(profile, {})[provider] = [item for item in payload if isinstance(item, dict)]
+    return [(run_id, profile, run_timestamp, by_profile[profile]) for profile in sorted(by_profile)]
@@ -0,0 +1,91 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ji_engine.utils.atomic_write import atomic_write_text
+
+LATEST_VIEW_SCHEMA_VERSION = 1
+
+
+def _view_key(provider: str, profile: str) -> str:
+    return f"{provider}/{profile}"
+
+
+def read_latest_view(path: Path) -> Dict[str, Any]:
+    """The materialized view at `path`, or an empty view when it is missing, unreadable or another schema."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema_version") != LATEST_VIEW_SCHEMA_VERSION:
+        return {}
+    return payload
+
+
+def latest_record(view: Dict[str, Any], provider: str, profile: str) -> Optional[Dict[str, Any]]:
+    records = view.get("records")
+    record = records.get(_view_key(provider, profile)) if isinstance(records, dict) else None
+    return record if isinstance(record, dict) and record.get("run_id") else None
+
+
+def build_latest_records(run_report: Dict[str, Any], run_dir: Path, index: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    One record per provider/profile of a finished run: the run's published outputs (path + sha256
+    from the run report), its run-dir artifact copies (from index.json) and its diff counts.
+    Pairs without a ranked JSON copy in the run dir get no record.
+    """
+    timestamps = run_report.get("timestamps")
+    completed_at = timestamps.get("ended_at") if isinstance(timestamps, dict) else None
+    outputs_by_provider = run_report.get("outputs_by_provider")
+    providers = index.get("providers")
+    records: Dict[str, Dict[str, Any]] = {}
+    for provider, profiles in sorted(outputs_by_provider.items() if isinstance(outputs_by_provider, dict) else []):
+        if not isinstance(profiles, dict):
+            continue
+        provider_index = providers.get(provider) if isinstance(providers, dict) else None
+        profile_index = provider_index.get("profiles") if isinstance(provider_index, dict) else None
+        for profile, outputs in sorted(profiles.items()):
+            if not isinstance(outputs, dict):
+                continue
+            entry = profile_index.get(profile) if isinstance(profile_index, dict) else None
+            entry = entry if isinstance(entry, dict) else {}
+            artifacts = entry.get("artifacts") if isinstance(entry.get("artifacts"), dict) else {}
+            ranked_rel = artifacts.get(f"{provider}_ranked_jobs.{profile}.json")
+            if not isinstance(ranked_rel, str):
+                # Nothing ranked for this pair in this run; keep the previous record.
+                continue
+            records[_view_key(provider, profile)] = {
+                "run_id": run_report.get("run_id"),
+                "completed_at_utc": completed_at,
+                "provider": provider,
+                "profile": profile,
+                "run_dir": str(run_dir),
+                "ranked_json": str(run_dir / ranked_rel),
+                "outputs": {
+                    key: {"path": pointer.get("path"), "sha256": pointer.get("sha256")}
+                    for key, pointer in sorted(outputs.items())
+                    if isinstance(pointer, dict) and pointer.get("path")
+                },
+                "artifacts": dict(sorted(artifacts.items())),
+                "counts": entry.get("diff_counts") if isinstance(entry.get("diff_counts"), dict) else {},
+            }
+    return records
+
+
+def update_latest_view(path: Path, records: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge `records` over the current view and atomically replace the file; returns the new view."""
+    current = read_latest_view(path).get("records")
+    merged = dict(current) if isinstance(current, dict) else {}
+    merged.update(records)
+    view = {"schema_version": LATEST_VIEW_SCHEMA_VERSION, "records": dict(sorted(merged.items()))}
+    atomic_write_text(path, json.dumps(view, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n")
+    return view
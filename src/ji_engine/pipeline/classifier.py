@@ -6,14 +6,139 @@ See LICENSE for permitted use.
 
 Improved relevance scoring for job titles based on candidate profile.
 Uses weighted scoring, location gating, and negative filters to reduce false positives.
+
+Keyword tiers are compiled once at import into a single alternation regex per tier;
+``re.search`` over an alternation of escaped literals is equivalent to the
+``any(term in text for term in terms)`` substring checks it replaces.
 """
 
-from typing import Any, Dict, List
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
 
 from ji_engine.models import RawJobPosting
 from ji_engine.profile_loader import CandidateProfile
 from ji_engine.utils.job_id import extract_job_id_from_url
-from ji_engine.utils.location_normalize import normalize_location_guess
+from ji_engine.utils.location_normalize import shared_location_normalizer
+
+# Hard reject clearly non-US (location validity check)
+_VALID_US_FOREIGN_MARKERS = (
+    "tokyo",
+    "japan",
+    "india",
+    "sydney",
+    "australia",
+    "dublin",
+    "london",
+    "uk",
+    "singapore",
+    "paris",
+    "berlin",
+    "amsterdam",
+    "zurich",
+    "hong kong",
+)
+# Very rough US markers (location validity check)
+_VALID_US_MARKERS = ("united states", "us", "u.s.", "usa", "new york", "san francisco", "austin", "seattle", "remote")
+
+FOREIGN_MARKERS = (
+    "tokyo",
+    "japan",
+    "india",
+    "delhi",
+    "sydney",
+    "australia",
+    "dublin",
+    "london",
+    "uk",
+    "united kingdom",
+    "singapore",
+    "paris",
+    "berlin",
+    "amsterdam",
+    "zurich",
+    "hong kong",
+)
+KILL_WORDS = (
+    "audiovisual",
+    "a/v",
+    "events engineer",
+    "it support",
+    "helpdesk",
+    "desktop support",
+    "technician",
+    "datacenter technician",
+    "payroll",
+    "legal",
+    "counsel",
+    "security guard",
+    "intern",
+    "university",
+    "residency",
+    "hr",
+    "talent",
+    "recruiter",
+    "account executive",
+    "sales development",
+    "seller",
+)
+# Tier A: CS / deployment / adoption / value / TAM / CSM
+CS_TERMS = (
+    "customer success",
+    "ai deployment",
+    "ai adoption",
+    "deployment manager",
+    "adoption manager",
+    "value realization",
+    "value realisation",
+    "csm",
+    "customer success manager",
+    "technical account manager",
+    "tam",
+    "customer engineer",
+    "customer engineering",
+)
+# Tier B: solutions / forward deployed / partner engineer
+SA_TERMS = (
+    "solutions architect",
+    "solution architect",
+    "solutions engineer",
+    "solution engineer",
+    "forward deployed",
+    "forward-deployed",
+    "partner engineer",
+    "field engineer",
+)
+# Tier C: adjacent leadership / TPM / GTM-ish
+TPM_TERMS = ("program manager", "technical program manager", "tpm", "product operations", "g tm", "go-to-market")
+SENIORITY_TERMS = ("senior", "sr.", "lead", "principal", "manager", "director")
+SWE_TERMS = ("software engineer", "backend engineer", "full stack engineer")
+DS_TERMS = ("data scientist", "data science", "research scientist")
+# Rough US markers (doesn't hard-gate, just nudge)
+US_NUDGE_MARKERS = ("united states", "us ", " u.s.", " usa", "san francisco", "austin", "seattle", "chicago")
+
+_NEVER_MATCHES = re.compile(r"(?!)")
+
+
+def _compile_terms(terms: Iterable[str]) -> Pattern[str]:
+    """Compile literal substrings into one alternation regex (longest first, deduped)."""
+    unique = sorted(set(terms), key=lambda term: (-len(term), term))
+    if not unique:
+        return _NEVER_MATCHES
+    return re.compile("|".join(re.escape(term) for term in unique))
+
+
+_VALID_US_FOREIGN_RE = _compile_terms(_VALID_US_FOREIGN_MARKERS)
+_VALID_US_RE = _compile_terms(_VALID_US_MARKERS)
+_FOREIGN_RE = _compile_terms(FOREIGN_MARKERS)
+_KILL_RE = _compile_terms(KILL_WORDS)
+_CS_RE = _compile_terms(CS_TERMS)
+_SA_RE = _compile_terms(SA_TERMS)
+_TPM_RE = _compile_terms(TPM_TERMS)
+_SENIORITY_RE = _compile_terms(SENIORITY_TERMS)
+_SWE_RE = _compile_terms(SWE_TERMS)
+_DS_RE = _compile_terms(DS_TERMS)
+_US_NUDGE_RE = _compile_terms(US_NUDGE_MARKERS)
 
 
 def _location_is_valid_us(job: RawJobPosting, profile: CandidateProfile) -> bool:
@@ -21,35 +146,106 @@ def _location_is_valid_us(job: RawJobPosting, profile: CandidateProfile) -> bool
     if not loc:
         return True  # unknown → don't auto-reject
 
-    # Hard reject clearly non-US
-    foreign_markers = [
-        "tokyo",
-        "japan",
-        "india",
-        "sydney",
-        "australia",
-        "dublin",
-        "london",
-        "uk",
-        "singapore",
-        "paris",
-        "berlin",
-        "amsterdam",
-        "zurich",
-        "hong kong",
-    ]
-    if any(f in loc for f in foreign_markers):
+    if _VALID_US_FOREIGN_RE.search(loc):
         return False
 
-    # Very rough US markers
-    us_markers = ["united states", "us", "u.s.", "usa", "new york", "san francisco", "austin", "seattle", "remote"]
-    if any(m in loc for m in us_markers):
+    if _VALID_US_RE.search(loc):
         return True
 
     # If it's not obviously foreign, treat as maybe-US
     return True
 
 
+def _anti_pattern_words(anti_patterns: Iterable[str]) -> Tuple[str, ...]:
+    words: List[str] = []
+    for ap in anti_patterns:
+        words.extend(w for w in ap.lower().split() if len(w) > 3)
+    return tuple(words)
+
+
+class TitleRelevanceClassifier:
+    """Title relevance rules compiled once; reuse one instance across a batch of jobs."""
+
+    def __init__(self, anti_patterns: Iterable[str] = ()) -> None:
+        self._anti_pattern_re = _compile_terms(_anti_pattern_words(anti_patterns))
+
+    @classmethod
+    def for_profile(cls, profile: CandidateProfile) -> "TitleRelevanceClassifier":
+        return _classifier_for_anti_patterns(tuple(profile.preferences.anti_patterns))
+
+    def score(self, title: Optional[str], location: Optional[str]) -> str:
+        """Classify a single title/location pair. See ``score_title_relevance``."""
+        title_text = (title or "").lower()
+        # Some locations are baked into the title text, so combine them
+        location_text = f"{title or ''} {location or ''}".lower()
+
+        # ---- 1. HARD LOCATION FILTER ----
+        if _FOREIGN_RE.search(location_text):
+            return "IRRELEVANT"
+
+        # ---- 2. HARD KILL WORDS ----
+        if _KILL_RE.search(title_text):
+            return "IRRELEVANT"
+
+        # Profile-defined anti-patterns
+        if self._anti_pattern_re.search(title_text):
+            return "IRRELEVANT"
+
+        score = 0
+
+        # ---- 3. ROLE / TYPE SCORING ----
+        has_cs = _CS_RE.search(title_text) is not None
+        if has_cs:
+            score += 15
+
+        has_sa = _SA_RE.search(title_text) is not None
+        if has_sa:
+            score += 10
+
+        if _TPM_RE.search(title_text):
+            score += 5
+
+        # ---- 4. SENIORITY & CONTEXT MODIFIERS ----
+        if _SENIORITY_RE.search(title_text):
+            score += 3
+
+        # Penalize pure SWE / DS without customer angle
+        if _SWE_RE.search(title_text) and not has_sa and not has_cs:
+            score -= 6
+
+        if _DS_RE.search(title_text):
+            score -= 6
+
+        # ---- 5. LOCATION PREFERENCE BONUSES ----
+        # Strong preference for remote & NYC, but open to general US.
+        if "remote" in location_text:
+            score += 6
+        if "new york" in location_text:
+            score += 5
+
+        if _US_NUDGE_RE.search(location_text):
+            score += 2
+
+        # ---- 6. SA OVERRIDE FOR US-BASED ROLES ----
+        # If it's a Solutions/Forward-Deployed style role and looks US-based, treat as relevant
+        # even if score is a bit lower.
+        if has_sa and score >= 12:
+            return "RELEVANT"
+
+        # ---- 7. FINAL DECISION ----
+        if score >= 18:
+            return "RELEVANT"
+        elif score >= 10:
+            return "MAYBE"
+        else:
+            return "IRRELEVANT"
+
+
+@lru_cache(maxsize=32)
+def _classifier_for_anti_patterns(anti_patterns: Tuple[str, ...]) -> TitleRelevanceClassifier:
+    return TitleRelevanceClassifier(anti_patterns)
+
+
 def score_title_relevance(job: RawJobPosting, profile: CandidateProfile) -> str:
     """
     Returns: 'RELEVANT', 'MAYBE', 'IRRELEVANT'
@@ -59,159 +255,30 @@ def score_title_relevance(job: RawJobPosting, profile: CandidateProfile) -> str:
       2) Solutions Architect / Solutions Engineer / Forward Deployed / Partner Engineer (US / Remote / NYC)
       3) Adjacent TPM / GTM as MAYBE
     """
-    title = (job.title or "").lower()
-    # Some locations are baked into the title text, so combine them
-    location_text = f"{job.title or ''} {job.location or ''}".lower()
-
-    # ---- 1. HARD LOCATION FILTER ----
-    foreign_markers = [
-        "tokyo",
-        "japan",
-        "india",
-        "delhi",
-        "sydney",
-        "australia",
-        "dublin",
-        "london",
-        "uk",
-        "united kingdom",
-        "singapore",
-        "paris",
-        "berlin",
-        "amsterdam",
-        "zurich",
-        "hong kong",
-    ]
-    if any(f in location_text for f in foreign_markers):
-        return "IRRELEVANT"
-
-    # ---- 2. HARD KILL WORDS ----
-    kill_words = [
-        "audiovisual",
-        "a/v",
-        "events engineer",
-        "it support",
-        "helpdesk",
-        "desktop support",
-        "technician",
-        "datacenter technician",
-        "payroll",
-        "legal",
-        "counsel",
-        "security guard",
-        "intern",
-        "university",
-        "residency",
-        "hr",
-        "talent",
-        "recruiter",
-        "account executive",
-        "sales development",
-        "seller",
-    ]
-    if any(kw in title for kw in kill_words):
-        return "IRRELEVANT"
-
-    # Profile-defined anti-patterns
-    for ap in profile.preferences.anti_patterns:
-        words = [w for w in ap.lower().split() if len(w) > 3]
-        if any(w in title for w in words):
-            return "IRRELEVANT"
+    return TitleRelevanceClassifier.for_profile(profile).score(job.title, job.location)
 
-    score = 0
-
-    # ---- 3. ROLE / TYPE SCORING ----
-    # Tier A: CS / deployment / adoption / value / TAM / CSM
-    cs_terms = [
-        "customer success",
-        "ai deployment",
-        "ai adoption",
-        "deployment manager",
-        "adoption manager",
-        "value realization",
-        "value realisation",
-        "csm",
-        "customer success manager",
-        "technical account manager",
-        "tam",
-        "customer engineer",
-        "customer engineering",
-    ]
-    if any(t in title for t in cs_terms):
-        score += 15
-
-    # Tier B: solutions / forward deployed / partner engineer
-    sa_terms = [
-        "solutions architect",
-        "solution architect",
-        "solutions engineer",
-        "solution engineer",
-        "forward deployed",
-        "forward-deployed",
-        "partner engineer",
-        "field engineer",
-    ]
-    has_sa = any(t in title for t in sa_terms)
-    if has_sa:
-        score += 10
-
-    # Tier C: adjacent leadership / TPM / GTM-ish
-    tpm_terms = ["program manager", "technical program manager", "tpm", "product operations", "g tm", "go-to-market"]
-    if any(t in title for t in tpm_terms):
-        score += 5
-
-    # ---- 4. SENIORITY & CONTEXT MODIFIERS ----
-    seniority_terms = ["senior", "sr.", "lead", "principal", "manager", "director"]
-    if any(s in title for s in seniority_terms):
-        score += 3
-
-    # Penalize pure SWE / DS without customer angle
-    if "software engineer" in title or "backend engineer" in title or "full stack engineer" in title:
-        if not has_sa and not any(t in title for t in cs_terms):
-            score -= 6
 
-    if "data scientist" in title or "data science" in title or "research scientist" in title:
-        score -= 6
-
-    # ---- 5. LOCATION PREFERENCE BONUSES ----
-    # Strong preference for remote & NYC, but open to general US.
-    if "remote" in location_text:
-        score += 6
-    if "new york" in location_text:
-        score += 5
-
-    # Rough US markers (doesn't hard-gate, just nudge)
-    us_markers = ["united states", "us ", " u.s.", " usa", "san francisco", "austin", "seattle", "chicago"]
-    if any(m in location_text for m in us_markers):
-        score += 2
-
-    # ---- 6. SA OVERRIDE FOR US-BASED ROLES ----
-    # If it's a Solutions/Forward-Deployed style role and looks US-based, treat as relevant
-    # even if score is a bit lower.
-    if has_sa and score >= 12:
-        return "RELEVANT"
-
-    # ---- 7. FINAL DECISION ----
-    if score >= 18:
-        return "RELEVANT"
-    elif score >= 10:
-        return "MAYBE"
-    else:
-        return "IRRELEVANT"
-
-
-def label_jobs(jobs: List[RawJobPosting], profile: CandidateProfile) -> List[Dict[str, Any]]:
-    """Return labeled jobs with relevance tags."""
+def label_jobs(
+    jobs: Iterable[RawJobPosting],
+    profile: CandidateProfile,
+    classifier: Optional[TitleRelevanceClassifier] = None,
+) -> List[Dict[str, Any]]:
+    """Return labeled jobs with relevance tags.
+
+    All jobs are classified with one compiled ``TitleRelevanceClassifier``.
+    """
+    rules = classifier or TitleRelevanceClassifier.for_profile(profile)
+    locations = shared_location_normalizer()
     labeled: List[Dict[str, Any]] = []
     for job in jobs:
-        location_meta = normalize_location_guess(job.title, job.location)
+        location_meta = locations.normalize(job.title, job.location)
         job_id = extract_job_id_from_url(job.apply_url)
         labeled.append(
             {
                 "title": job.title,
                 "apply_url": job.apply_url,
                 "location": job.location,
-                "relevance": score_title_relevance(job, profile),
+                "relevance": rules.score(job.title, job.location),
                 "job_id": job_id,
                 **location_meta,
             }
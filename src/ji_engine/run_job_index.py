@@ -0,0 +1,294 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+RUN_JOB_INDEX_SCHEMA_VERSION = 1
+RUN_JOB_INDEX_FILENAME = "jobs_index.sqlite"
+
+# Fields returned per job; the full record stays in the ranked JSON artifact.
+JOB_FIELDS = ("provider", "profile", "rank", "job_id", "title", "team", "location", "score", "role_band", "apply_url")
+
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _text(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) and value else None
+
+
+def _score(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+def _encode_cursor(provider: str, profile: str, rank: int) -> str:
+    raw = json.dumps([provider, profile, rank], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        provider, profile, rank = json.loads(raw.decode("utf-8"))
+    except (ValueError, TypeError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid jobs cursor") from exc
+    if (
+        not isinstance(provider, str)
+        or not isinstance(profile, str)
+        or isinstance(rank, bool)
+        or not isinstance(rank, int)
+    ):
+        raise ValueError("Invalid jobs cursor")
+    return provider, profile, rank
+
+
+def _fts_query(text: str) -> Optional[str]:
+    """Free text -> FTS5 query: every word must match as a prefix; FTS syntax in the input is inert."""
+    tokens = _FTS_TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    return " AND ".join(f'"{token}"*' for token in tokens)
+
+
+def ranked_job_sources(run_dir: Path, index: Dict[str, Any]) -> Dict[Tuple[str, str], Path]:
+    """(provider, profile) -> ranked JSON copy listed in a run dir's index.json."""
+    sources: Dict[Tuple[str, str], Path] = {}
+    providers = index.get("providers")
+    for provider, provider_payload in sorted(providers.items() if isinstance(providers, dict) else []):
+        profiles = provider_payload.get("profiles") if isinstance(provider_payload, dict) else None
+        for profile, profile_payload in sorted(profiles.items() if isinstance(profiles, dict) else []):
+            artifacts = profile_payload.get("artifacts") if isinstance(profile_payload, dict) else None
+            rel = (artifacts or {}).get(f"{provider}_ranked_jobs.{profile}.json")
+            if not isinstance(rel, str) or not rel.strip():
+                continue
+            rel_path = Path(rel)
+            if rel_path.is_absolute() or ".." in rel_path.parts:
+                continue
+            sources[(provider, profile)] = run_dir / rel_path
+    return sources
+
+
+def _source_signature(sources: Dict[Tuple[str, str], Path]) -> str:
+    signature: List[List[Any]] = []
+    for (provider, profile), path in sorted(sources.items()):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append([provider, profile, path.name, stat.st_mtime_ns, stat.st_size])
+    return json.dumps(signature, separators=(",", ":"))
+
+
+class RunJobIndex:
+    """
+    Per-run SQLite index (`<run_dir>/jobs_index.sqlite`) over the ranked JSON artifacts of one run.
+
+    One row per ranked job with the projected `JOB_FIELDS`, an FTS5 table over title/team/location,
+    and the (mtime, size) signature of the ranked files it was built from. Pages are keyset
+    ordered by (provider, profile, rank), rank being the position in the ranked artifact.
+    """
+
+    _build_lock = threading.Lock()
+    # run dir -> (run dir mtime, index.json mtime, index.json size) last seen with a current index.
+    _verified: Dict[str, Tuple[int, int, int]] = {}
+
+    def __init__(self, run_dir: Path) -> None:
+        self.run_dir = run_dir
+        self.db_path = run_dir / RUN_JOB_INDEX_FILENAME
+
+    def _load_run_index(self) -> Dict[str, Any]:
+        try:
+            payload = json.loads((self.run_dir / "index.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def build(self, index: Optional[Dict[str, Any]] = None) -> int:
+        """(Re)build the index from the run's ranked artifacts; returns jobs indexed."""
+        sources = ranked_job_sources(self.run_dir, index if index is not None else self._load_run_index())
+        signature = _source_signature(sources)
+        tmp_path = self.db_path.with_name(f".{self.db_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        indexed = 0
+        conn = sqlite3.connect(tmp_path)
+        try:
+            with conn:
+                conn.executescript(
+                    """
+                    CREATE TABLE meta (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL
+                    );
+                    CREATE TABLE jobs (
+                        provider TEXT NOT NULL,
+                        profile TEXT NOT NULL,
+                        rank INTEGER NOT NULL,
+                        job_id TEXT,
+                        title TEXT,
+                        team TEXT,
+                        location TEXT,
+                        score REAL,
+                        role_band TEXT,
+                        apply_url TEXT,
+                        PRIMARY KEY (provider, profile, rank)
+                    );
+                    CREATE INDEX idx_jobs_role_band ON jobs(role_band, provider, profile, rank);
+                    CREATE VIRTUAL TABLE jobs_fts USING fts5(
+                        title, team, location, content='jobs', content_rowid='rowid'
+                    );
+                    """
+                )
+                for (provider, profile), path in sorted(sources.items()):
+                    try:
+                        payload = json.loads(path.read_text(encoding="utf-8"))
+                    except (OSError, json.JSONDecodeError):
+                        continue
+                    if not isinstance(payload, list):
+                        continue
+                    rows = [
+                        (
+                            provider,
+                            profile,
+                            rank,
+                            _text(job.get("job_id")),
+                            _text(job.get("title")),
+                            _text(job.get("team")),
+                            _text(job.get("location")),
+                            _score(job.get("score")),
+                            _text(job.get("role_band")),
+                            _text(job.get("apply_url")),
+                        )
+                        for rank, job in enumerate(item for item in payload if isinstance(item, dict))
+                    ]
+                    conn.executemany(
+                        f"INSERT INTO jobs({', '.join(JOB_FIELDS)}) VALUES ({', '.join('?' * len(JOB_FIELDS))})", rows
+                    )
+                    indexed += len(rows)
+                conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+                conn.executemany(
+                    "INSERT INTO meta(key, value) VALUES (?, ?)",
+                    [("schema_version", str(RUN_JOB_INDEX_SCHEMA_VERSION)), ("sources", signature)],
+                )
+        finally:
+            conn.close()
+        os.replace(tmp_path, self.db_path)
+        return indexed
+
+    def _stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            run_dir_stat = self.run_dir.stat()
+            index_stat = (self.run_dir / "index.json").stat()
+        except OSError:
+            return None
+        return (run_dir_stat.st_mtime_ns, index_stat.st_mtime_ns, index_stat.st_size)
+
+    def ensure_current(self) -> None:
+        """
+        Build the index when it is missing, from another schema version, or older than its ranked files.
+        The check is skipped while the run dir and its index.json keep the mtimes of the last check.
+        """
+        key = str(self.run_dir)
+        with self._build_lock:
+            stamp = self._stamp()
+            if stamp is not None and self._verified.get(key) == stamp:
+                return
+            if not self._is_current():
+                self.build()
+                stamp = self._stamp()
+            if stamp is None:
+                self._verified.pop(key, None)
+            else:
+                self._verified[key] = stamp
+
+    def _is_current(self) -> bool:
+        if not self.db_path.exists():
+            return False
+        try:
+            conn = self._connect()
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+        if meta.get("schema_version") != str(RUN_JOB_INDEX_SCHEMA_VERSION):
+            return False
+        return meta.get("sources") == _source_signature(ranked_job_sources(self.run_dir, self._load_run_index()))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+
+    def query_jobs(
+        self,
+        *,
+        provider: Optional[str] = None,
+        profile: Optional[str] = None,
+        min_score: Optional[float] = None,
+        role_band: Optional[str] = None,
+        q: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        One page of projected jobs in (provider, profile, rank) order, plus `next_cursor` (None on
+        the last page). `q` matches word prefixes in title/team/location; a `q` without any word
+        matches nothing. Raises ValueError on a bad cursor.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (("provider", provider), ("profile", profile), ("role_band", role_band)):
+            if value is not None:
+                clauses.append(f"j.{column} = ?")
+                params.append(value)
+        if min_score is not None:
+            clauses.append("j.score >= ?")
+            params.append(min_score)
+        match = _fts_query(q) if q else None
+        if q and match is None:
+            return {"jobs": [], "next_cursor": None}
+        if match is not None:
+            clauses.append("j.rowid IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.append(match)
+        if cursor is not None:
+            clauses.append("(j.provider, j.profile, j.rank) > (?, ?, ?)")
+            params.extend(_decode_cursor(cursor))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        bounded = max(1, limit)
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT {', '.join(f'j.{field}' for field in JOB_FIELDS)} FROM jobs AS j {where} "
+                "ORDER BY j.provider, j.profile, j.rank LIMIT ?",
+                (*params, bounded + 1),
+            ).fetchall()
+        finally:
+            conn.close()
+        jobs = [dict(zip(JOB_FIELDS, row, strict=True)) for row in rows[:bounded]]
+        next_cursor = None
+        if len(rows) > bounded:
+            last = jobs[-1]
+            next_cursor = _encode_cursor(last["provider"], last["profile"], last["rank"])
+        return {"jobs": jobs, "next_cursor": next_cursor}
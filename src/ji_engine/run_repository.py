@@ -7,11 +7,15 @@ See LICENSE for permitted use.
 
 from __future__ import annotations
 
+import base64
 import json
 import logging
 import os
+import re
 import sqlite3
+import threading
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol
 
@@ -27,6 +31,10 @@ from ji_engine.config import (
 
 logger = logging.getLogger(__name__)
 
+# Bumped whenever run_index columns change; older files are rebuilt on first read.
+RUN_INDEX_SCHEMA_VERSION = 3
+_GIT_SHA_PREFIX_RE = re.compile(r"[0-9A-Za-z]{1,64}")
+
 
 class RunRepository(Protocol):
     def list_run_dirs(self, *, candidate_id: str = DEFAULT_CANDIDATE_ID) -> List[Path]: ...
@@ -63,7 +71,41 @@ class RunRepository(Protocol):
 
     def latest_run(self, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Optional[Dict[str, Any]]: ...
 
-    def rebuild_index(self, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Dict[str, Any]: ...
+    def rebuild_index(
+        self, candidate_id: str = DEFAULT_CANDIDATE_ID, *, since: Optional[str] = None
+    ) -> Dict[str, Any]: ...
+
+    def upsert_run(
+        self,
+        run_id: str,
+        *,
+        candidate_id: str = DEFAULT_CANDIDATE_ID,
+        run_report_path: Optional[Path] = None,
+    ) -> bool: ...
+
+    def delta_counts_window(
+        self,
+        provider: str,
+        profile: str,
+        *,
+        window: int = 7,
+        candidate_id: str = DEFAULT_CANDIDATE_ID,
+    ) -> Dict[str, Any]: ...
+
+    def query_runs(
+        self,
+        candidate_id: str = DEFAULT_CANDIDATE_ID,
+        *,
+        status: Optional[str] = None,
+        provider: Optional[str] = None,
+        profile: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        git_sha: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_payload: bool = False,
+    ) -> Dict[str, Any]: ...
 
 
 @dataclass(frozen=True)
@@ -79,10 +121,155 @@ def _sanitize_run_id(run_id: str) -> str:
     return run_id.replace(":", "").replace("-", "").replace(".", "")
 
 
+_DELTA_COUNT_FIELDS = (("new", "new_job_count"), ("changed", "changed_job_count"), ("removed", "removed_job_count"))
+
+
+def _parse_iso(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _str_list(value: Any) -> List[str]:
+    return sorted({item for item in value if isinstance(item, str) and item}) if isinstance(value, list) else []
+
+
+def _load_run_report(entry: _RunIndexEntry, run_report_path: Optional[Path] = None) -> Dict[str, Any]:
+    # The sibling `<runs>/<run>.json` is the live report (publish updates land there); the run
+    # dir copy is a snapshot taken when the registry was written.
+    candidates = [run_report_path] if run_report_path is not None else []
+    candidates.append(entry.run_dir.parent / f"{entry.run_dir.name}.json")
+    rel = entry.payload.get("run_report_path")
+    if isinstance(rel, str) and rel.strip():
+        candidates.append(entry.run_dir / rel)
+    candidates.append(entry.run_dir / "run_report.json")
+    for path in candidates:
+        try:
+            report = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if isinstance(report, dict):
+            return report
+    return {}
+
+
+def _run_summary(entry: _RunIndexEntry, run_report_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Queryable run_index columns for one run, from its index.json and (when present) its run report."""
+    report = _load_run_report(entry, run_report_path)
+    timestamps = report.get("timestamps") if isinstance(report.get("timestamps"), dict) else {}
+    started_at = timestamps.get("started_at") if isinstance(timestamps.get("started_at"), str) else None
+    ended_at = timestamps.get("ended_at") if isinstance(timestamps.get("ended_at"), str) else None
+    started, ended = _parse_iso(started_at), _parse_iso(ended_at or entry.timestamp)
+    duration = round((ended - started).total_seconds(), 3) if started and ended else None
+
+    index_providers = entry.payload.get("providers") if isinstance(entry.payload.get("providers"), dict) else {}
+    providers = _str_list(report.get("providers")) or sorted(p for p in index_providers if isinstance(p, str))
+    profiles = set(_str_list(report.get("profiles")))
+    counts = {"new": 0, "changed": 0, "removed": 0}
+    for provider_payload in index_providers.values():
+        profile_map = provider_payload.get("profiles") if isinstance(provider_payload, dict) else None
+        for profile, profile_payload in (profile_map or {}).items() if isinstance(profile_map, dict) else []:
+            profiles.add(profile)
+            diff_counts = profile_payload.get("diff_counts") if isinstance(profile_payload, dict) else None
+            for name in counts:
+                value = (diff_counts or {}).get(name) if isinstance(diff_counts, dict) else None
+                if isinstance(value, int) and not isinstance(value, bool):
+                    counts[name] += value
+
+    git_sha = report.get("git_sha")
+    if not isinstance(git_sha, str) or not git_sha.strip() or git_sha == "unknown":
+        build = (report.get("provenance") or {}).get("build") if isinstance(report.get("provenance"), dict) else None
+        git_sha = build.get("git_sha") if isinstance(build, dict) else None
+    if not isinstance(git_sha, str) or not git_sha.strip() or git_sha == "unknown":
+        git_sha = None
+
+    cost = None
+    accounting = report.get("ai_accounting")
+    totals = accounting.get("totals") if isinstance(accounting, dict) else None
+    if isinstance(totals, dict):
+        try:
+            cost = float(totals.get("estimated_cost_usd"))
+        except (TypeError, ValueError):
+            cost = None
+
+    status = report.get("status")
+    return {
+        "run_id": entry.run_id,
+        "timestamp": entry.timestamp,
+        "status": status if isinstance(status, str) and status else None,
+        "started_at": started_at,
+        "ended_at": ended_at,
+        "duration_seconds": duration,
+        "git_sha": git_sha,
+        "providers": providers,
+        "profiles": sorted(profiles),
+        "diff_counts": counts,
+        "estimated_cost_usd": cost,
+    }
+
+
+def _encode_cursor(timestamp: str, run_id: str) -> str:
+    raw = json.dumps([timestamp, run_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, run_id = json.loads(raw.decode("utf-8"))
+    except (ValueError, TypeError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid run cursor") from exc
+    if not isinstance(timestamp, str) or not isinstance(run_id, str):
+        raise ValueError("Invalid run cursor")
+    return timestamp, run_id
+
+
+def _summary_matches(summary: Dict[str, Any], filters: Dict[str, Optional[str]]) -> bool:
+    if filters["status"] is not None and summary["status"] != filters["status"]:
+        return False
+    if filters["provider"] is not None and filters["provider"] not in summary["providers"]:
+        return False
+    if filters["profile"] is not None and filters["profile"] not in summary["profiles"]:
+        return False
+    if filters["since"] is not None and summary["timestamp"] < filters["since"]:
+        return False
+    if filters["until"] is not None and summary["timestamp"] >= filters["until"]:
+        return False
+    if filters["git_sha"] is not None and not (summary["git_sha"] or "").startswith(filters["git_sha"]):
+        return False
+    return True
+
+
+def _report_delta_rows(report: Dict[str, Any]) -> List[tuple]:
+    """(provider, profile, new, changed, removed, valid) for each delta_summary entry of a run report."""
+    delta_summary = report.get("delta_summary")
+    provider_profile = delta_summary.get("provider_profile") if isinstance(delta_summary, dict) else None
+    rows: List[tuple] = []
+    for provider, profiles in sorted((provider_profile or {}).items() if isinstance(provider_profile, dict) else []):
+        if not isinstance(profiles, dict):
+            continue
+        for profile, entry in sorted(profiles.items()):
+            if not isinstance(entry, dict):
+                continue
+            try:
+                counts = tuple(int(entry.get(key, 0) or 0) for _, key in _DELTA_COUNT_FIELDS)
+            except Exception:
+                rows.append((provider, profile, None, None, None, 0))
+                continue
+            rows.append((provider, profile, *counts, 1))
+    return rows
+
+
 class FileSystemRunRepository(RunRepository):
     def __init__(self, legacy_runs_dir: Path = RUN_METADATA_DIR) -> None:
         self._legacy_runs_dir = legacy_runs_dir
         self._fallback_logged: set[str] = set()
+        # One read-only connection per index file, reopened when a rebuild swaps the file.
+        self._readers: Dict[str, tuple[tuple[int, int], sqlite3.Connection]] = {}
+        self._readers_lock = threading.Lock()
 
     def _db_path(self, candidate_id: str) -> Path:
         namespaced = candidate_run_index_path(candidate_id)
@@ -183,6 +370,8 @@ class FileSystemRunRepository(RunRepository):
         out_path = self.resolve_run_artifact_path(run_id, relative_path, candidate_id=candidate_id)
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=sort_keys), encoding="utf-8")
+        if relative_path in ("index.json", "run_report.json"):
+            self.upsert_run(run_id, candidate_id=candidate_id)
         return out_path
 
     def _read_index_json(self, path: Path) -> Optional[Dict[str, Any]]:
@@ -196,34 +385,52 @@ class FileSystemRunRepository(RunRepository):
             return None
         return payload
 
+    def _entry_for_dir(self, run_dir: Path) -> Optional[_RunIndexEntry]:
+        index_path = run_dir / "index.json"
+        payload = self._read_index_json(index_path)
+        if payload is None:
+            return None
+        run_id = payload.get("run_id")
+        if not isinstance(run_id, str) or not run_id.strip():
+            return None
+        timestamp = payload.get("timestamp")
+        if not isinstance(timestamp, str) or not timestamp.strip():
+            timestamp = run_id
+        return _RunIndexEntry(
+            run_id=run_id,
+            timestamp=timestamp,
+            run_dir=run_dir,
+            index_path=index_path,
+            payload=payload,
+        )
+
+    @staticmethod
+    def _list_root_dirs(root: Path) -> List[Path]:
+        if not root.exists():
+            return []
+        return sorted((p for p in root.iterdir() if p.is_dir()), key=lambda p: p.name)
+
     def _scan_runs_from_filesystem(self, candidate_id: str) -> List[_RunIndexEntry]:
         entries: Dict[str, _RunIndexEntry] = {}
         for root in self._candidate_run_roots(candidate_id):
-            if not root.exists():
-                continue
-            for run_dir in sorted((p for p in root.iterdir() if p.is_dir()), key=lambda p: p.name):
-                index_path = run_dir / "index.json"
-                payload = self._read_index_json(index_path)
-                if payload is None:
-                    continue
-                run_id = payload.get("run_id")
-                if not isinstance(run_id, str) or not run_id.strip():
+            for run_dir in self._list_root_dirs(root):
+                entry = self._entry_for_dir(run_dir)
+                if entry is None or entry.run_id in entries:
                     continue
-                if run_id in entries:
-                    continue
-                timestamp = payload.get("timestamp")
-                if not isinstance(timestamp, str) or not timestamp.strip():
-                    timestamp = run_id
-                entries[run_id] = _RunIndexEntry(
-                    run_id=run_id,
-                    timestamp=timestamp,
-                    run_dir=run_dir,
-                    index_path=index_path,
-                    payload=payload,
-                )
+                entries[entry.run_id] = entry
         ordered = sorted(entries.values(), key=lambda e: (e.timestamp, e.run_id), reverse=True)
         return ordered
 
+    def _root_watermarks(self, candidate_id: str) -> Dict[str, str]:
+        """Directory mtime per run root; a new or removed run dir moves its root's watermark."""
+        marks: Dict[str, str] = {}
+        for root in self._candidate_run_roots(candidate_id):
+            try:
+                marks[str(root)] = str(root.stat().st_mtime_ns)
+            except OSError:
+                marks[str(root)] = "missing"
+        return marks
+
     def _ensure_schema(self, conn: sqlite3.Connection) -> None:
         conn.executescript(
             """
@@ -235,94 +442,406 @@ class FileSystemRunRepository(RunRepository):
                 run_dir TEXT NOT NULL,
                 index_path TEXT NOT NULL,
                 payload_json TEXT NOT NULL,
+                status TEXT,
+                started_at TEXT,
+                ended_at TEXT,
+                duration_seconds REAL,
+                git_sha TEXT,
+                new_count INTEGER NOT NULL DEFAULT 0,
+                changed_count INTEGER NOT NULL DEFAULT 0,
+                removed_count INTEGER NOT NULL DEFAULT 0,
+                estimated_cost_usd REAL,
                 PRIMARY KEY (candidate_id, run_id)
             );
             CREATE INDEX IF NOT EXISTS idx_run_index_latest
                 ON run_index(candidate_id, timestamp DESC, run_id DESC);
+            CREATE INDEX IF NOT EXISTS idx_run_index_run_dir
+                ON run_index(candidate_id, run_dir);
+            CREATE TABLE IF NOT EXISTS run_index_watermarks (
+                candidate_id TEXT NOT NULL,
+                root TEXT NOT NULL,
+                mtime_ns TEXT NOT NULL,
+                PRIMARY KEY (candidate_id, root)
+            );
+            CREATE TABLE IF NOT EXISTS run_report_watermarks (
+                candidate_id TEXT NOT NULL,
+                root TEXT NOT NULL,
+                mtime_ns TEXT NOT NULL,
+                PRIMARY KEY (candidate_id, root)
+            );
+            CREATE INDEX IF NOT EXISTS idx_run_index_status
+                ON run_index(candidate_id, status, timestamp DESC, run_id DESC);
+            CREATE INDEX IF NOT EXISTS idx_run_index_git_sha
+                ON run_index(candidate_id, git_sha);
+            CREATE TABLE IF NOT EXISTS run_index_providers (
+                candidate_id TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                PRIMARY KEY (candidate_id, provider, run_id)
+            );
+            CREATE TABLE IF NOT EXISTS run_index_profiles (
+                candidate_id TEXT NOT NULL,
+                profile TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                PRIMARY KEY (candidate_id, profile, run_id)
+            );
+            CREATE TABLE IF NOT EXISTS run_report_files (
+                candidate_id TEXT NOT NULL,
+                report_path TEXT NOT NULL,
+                report_name TEXT NOT NULL,
+                run_id TEXT,
+                mtime_ns INTEGER NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                readable INTEGER NOT NULL,
+                PRIMARY KEY (candidate_id, report_path)
+            );
+            CREATE INDEX IF NOT EXISTS idx_run_report_files_name
+                ON run_report_files(candidate_id, report_name DESC);
+            CREATE TABLE IF NOT EXISTS run_delta_counts (
+                candidate_id TEXT NOT NULL,
+                report_path TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                profile TEXT NOT NULL,
+                new_count INTEGER,
+                changed_count INTEGER,
+                removed_count INTEGER,
+                valid INTEGER NOT NULL,
+                PRIMARY KEY (candidate_id, report_path, provider, profile)
+            );
+            CREATE INDEX IF NOT EXISTS idx_run_delta_counts_provider_profile
+                ON run_delta_counts(candidate_id, provider, profile);
             """
         )
 
-    def rebuild_index(self, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Dict[str, Any]:
+    def rebuild_index(self, candidate_id: str = DEFAULT_CANDIDATE_ID, *, since: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Rebuild the run index from run directories. With `since`, only run dirs whose name sorts
+        at or after the sanitized `since` run id are re-read into the existing index; a missing
+        or outdated index still gets a full rebuild.
+        """
         safe_candidate = sanitize_candidate_id(candidate_id)
         db_path = self._db_path(safe_candidate)
+        if since is not None and db_path.exists():
+            try:
+                return self._reindex_since(safe_candidate, since)
+            except (OSError, sqlite3.DatabaseError):
+                logger.warning(
+                    "run_index incremental rebuild failed; rebuilding fully: candidate_id=%s", safe_candidate
+                )
         db_path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = db_path.with_suffix(".tmp")
         if tmp_path.exists():
             tmp_path.unlink()
 
+        watermarks = self._root_watermarks(safe_candidate)
         entries = self._scan_runs_from_filesystem(safe_candidate)
         conn = sqlite3.connect(tmp_path)
         try:
             self._ensure_schema(conn)
             conn.execute("DELETE FROM run_index WHERE candidate_id = ?", (safe_candidate,))
             for entry in sorted(entries, key=lambda e: e.run_id):
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO run_index(
-                        candidate_id, run_id, timestamp, run_dir, index_path, payload_json
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        safe_candidate,
-                        entry.run_id,
-                        entry.timestamp,
-                        str(entry.run_dir),
-                        str(entry.index_path),
-                        json.dumps(entry.payload, sort_keys=True, separators=(",", ":")),
-                    ),
-                )
+                self._insert_entry(conn, safe_candidate, entry)
+            self._write_watermarks(conn, safe_candidate, watermarks)
+            conn.execute(f"PRAGMA user_version = {RUN_INDEX_SCHEMA_VERSION}")
             conn.commit()
+            self._sync_delta_counts(conn, safe_candidate)
         finally:
             conn.close()
+        with self._readers_lock:
+            self._drop_reader(db_path)
         os.replace(tmp_path, db_path)
         return {
             "candidate_id": safe_candidate,
             "db_path": str(db_path),
             "runs_indexed": len(entries),
+            "since": None,
         }
 
-    def _read_rows(self, candidate_id: str, limit: int) -> List[Dict[str, Any]]:
-        safe_candidate = sanitize_candidate_id(candidate_id)
-        db_path = self._db_path(safe_candidate)
+    def _insert_entry(
+        self,
+        conn: sqlite3.Connection,
+        candidate_id: str,
+        entry: _RunIndexEntry,
+        run_report_path: Optional[Path] = None,
+    ) -> None:
+        summary = _run_summary(entry, run_report_path)
+        counts = summary["diff_counts"]
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO run_index(
+                candidate_id, run_id, timestamp, run_dir, index_path, payload_json,
+                status, started_at, ended_at, duration_seconds, git_sha,
+                new_count, changed_count, removed_count, estimated_cost_usd
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                candidate_id,
+                entry.run_id,
+                entry.timestamp,
+                str(entry.run_dir),
+                str(entry.index_path),
+                json.dumps(entry.payload, sort_keys=True, separators=(",", ":")),
+                summary["status"],
+                summary["started_at"],
+                summary["ended_at"],
+                summary["duration_seconds"],
+                summary["git_sha"],
+                counts["new"],
+                counts["changed"],
+                counts["removed"],
+                summary["estimated_cost_usd"],
+            ),
+        )
+        for table, column, values in (
+            ("run_index_providers", "provider", summary["providers"]),
+            ("run_index_profiles", "profile", summary["profiles"]),
+        ):
+            conn.execute(f"DELETE FROM {table} WHERE candidate_id = ? AND run_id = ?", (candidate_id, entry.run_id))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table}(candidate_id, {column}, run_id) VALUES (?, ?, ?)",
+                [(candidate_id, value, entry.run_id) for value in values],
+            )
+
+    @staticmethod
+    def _write_watermarks(
+        conn: sqlite3.Connection,
+        candidate_id: str,
+        watermarks: Dict[str, str],
+        table: str = "run_index_watermarks",
+    ) -> None:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {table}(candidate_id, root, mtime_ns) VALUES (?, ?, ?)",
+            [(candidate_id, root, mtime) for root, mtime in sorted(watermarks.items())],
+        )
+
+    @staticmethod
+    def _delete_run(conn: sqlite3.Connection, candidate_id: str, run_id: str) -> None:
+        for table in ("run_index", "run_index_providers", "run_index_profiles"):
+            conn.execute(f"DELETE FROM {table} WHERE candidate_id = ? AND run_id = ?", (candidate_id, run_id))
+
+    def _root_rank(self, candidate_id: str, run_dir: Path) -> tuple[int, str]:
+        roots = [str(root) for root in self._candidate_run_roots(candidate_id)]
+        parent = str(run_dir.parent)
+        return (roots.index(parent) if parent in roots else len(roots), run_dir.name)
+
+    def _upsert_entry(
+        self,
+        conn: sqlite3.Connection,
+        candidate_id: str,
+        entry: _RunIndexEntry,
+        run_report_path: Optional[Path] = None,
+    ) -> bool:
+        """Index one run dir unless the same run_id is already indexed from a dir a full scan would prefer."""
+        existing = conn.execute(
+            "SELECT run_dir FROM run_index WHERE candidate_id = ? AND run_id = ?", (candidate_id, entry.run_id)
+        ).fetchone()
+        if existing is not None and existing[0] != str(entry.run_dir):
+            existing_dir = Path(existing[0])
+            if existing_dir.is_dir() and self._root_rank(candidate_id, existing_dir) < self._root_rank(
+                candidate_id, entry.run_dir
+            ):
+                return False
+        self._insert_entry(conn, candidate_id, entry, run_report_path)
+        return True
+
+    def _open_writer(self, candidate_id: str) -> sqlite3.Connection:
+        db_path = self._db_path(candidate_id)
         if not db_path.exists():
-            self.rebuild_index(safe_candidate)
+            self.rebuild_index(candidate_id)
         conn = sqlite3.connect(db_path)
         try:
-            rows = conn.execute(
-                """
-                SELECT payload_json
-                FROM run_index
-                WHERE candidate_id = ?
-                ORDER BY timestamp DESC, run_id DESC
-                LIMIT ?
-                """,
-                (safe_candidate, limit),
-            ).fetchall()
-            return [json.loads(row[0]) for row in rows]
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != RUN_INDEX_SCHEMA_VERSION:
+                raise sqlite3.DatabaseError(f"run_index schema version {version} != {RUN_INDEX_SCHEMA_VERSION}")
+            self._ensure_schema(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _sync_roots(self, candidate_id: str, stale: Dict[str, str]) -> None:
+        """Index run dirs that appeared under the stale roots and drop rows for dirs that vanished."""
+        conn = self._open_writer(candidate_id)
+        try:
+            with conn:
+                known = {
+                    row[0]: row[1]
+                    for row in conn.execute(
+                        "SELECT run_dir, run_id FROM run_index WHERE candidate_id = ?", (candidate_id,)
+                    )
+                }
+                complete: Dict[str, str] = {}
+                for root in self._candidate_run_roots(candidate_id):
+                    if str(root) not in stale:
+                        continue
+                    listed = self._list_root_dirs(root)
+                    listed_names = {str(run_dir) for run_dir in listed}
+                    for run_dir, run_id in known.items():
+                        if str(Path(run_dir).parent) == str(root) and run_dir not in listed_names:
+                            self._delete_run(conn, candidate_id, run_id)
+                    settled = True
+                    for run_dir in listed:
+                        if str(run_dir) in known:
+                            continue
+                        entry = self._entry_for_dir(run_dir)
+                        if entry is None:
+                            # Dir without a readable index.json yet; look again on the next read.
+                            settled = False
+                            continue
+                        self._upsert_entry(conn, candidate_id, entry)
+                    if settled:
+                        complete[str(root)] = stale[str(root)]
+                self._write_watermarks(conn, candidate_id, complete)
         finally:
             conn.close()
 
-    def _read_one(self, candidate_id: str, run_id: str) -> Optional[Dict[str, Any]]:
+    def _reindex_since(self, candidate_id: str, since: str) -> Dict[str, Any]:
+        threshold = _sanitize_run_id(since)
+        watermarks = self._root_watermarks(candidate_id)
+        conn = self._open_writer(candidate_id)
+        indexed = 0
+        try:
+            with conn:
+                known = {
+                    row[0]: row[1]
+                    for row in conn.execute(
+                        "SELECT run_dir, run_id FROM run_index WHERE candidate_id = ?", (candidate_id,)
+                    )
+                }
+                for root in self._candidate_run_roots(candidate_id):
+                    listed = [run_dir for run_dir in self._list_root_dirs(root) if run_dir.name >= threshold]
+                    listed_names = {str(run_dir) for run_dir in listed}
+                    for run_dir, run_id in known.items():
+                        path = Path(run_dir)
+                        if str(path.parent) == str(root) and path.name >= threshold and run_dir not in listed_names:
+                            self._delete_run(conn, candidate_id, run_id)
+                    for run_dir in listed:
+                        entry = self._entry_for_dir(run_dir)
+                        if entry is not None and self._upsert_entry(conn, candidate_id, entry):
+                            indexed += 1
+                self._write_watermarks(conn, candidate_id, watermarks)
+            self._sync_delta_counts(conn, candidate_id)
+        finally:
+            conn.close()
+        return {
+            "candidate_id": candidate_id,
+            "db_path": str(self._db_path(candidate_id)),
+            "runs_indexed": indexed,
+            "since": since,
+        }
+
+    def upsert_run(
+        self,
+        run_id: str,
+        *,
+        candidate_id: str = DEFAULT_CANDIDATE_ID,
+        run_report_path: Optional[Path] = None,
+    ) -> bool:
+        """
+        Index (or re-index) a single run from its run dir in one transaction. `run_report_path`
+        points at the live run report when it is not next to the run dir. Delta counts are synced
+        with the run reports here as well, so in-place report rewrites reach the index. Returns
+        False when the run dir has no readable index.json yet.
+        """
         safe_candidate = sanitize_candidate_id(candidate_id)
-        db_path = self._db_path(safe_candidate)
-        if not db_path.exists():
+        entry = self._entry_for_dir(self.resolve_run_dir(run_id, candidate_id=safe_candidate))
+        if entry is None:
+            return False
+        try:
+            conn = self._open_writer(safe_candidate)
+            try:
+                with conn:
+                    self._upsert_entry(conn, safe_candidate, entry, run_report_path)
+                self._sync_delta_counts(conn, safe_candidate)
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError:
             self.rebuild_index(safe_candidate)
-        conn = sqlite3.connect(db_path)
+        return True
+
+    def _drop_reader(self, db_path: Path) -> None:
+        cached = self._readers.pop(str(db_path), None)
+        if cached is not None:
+            cached[1].close()
+
+    def _reader(self, db_path: Path) -> sqlite3.Connection:
+        """Pooled read-only connection for `db_path`; callers must hold `_readers_lock`."""
+        stat = db_path.stat()
+        identity = (stat.st_dev, stat.st_ino)
+        cached = self._readers.get(str(db_path))
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+        self._drop_reader(db_path)
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
         try:
-            row = conn.execute(
-                """
-                SELECT payload_json
-                FROM run_index
-                WHERE candidate_id = ? AND run_id = ?
-                LIMIT 1
-                """,
-                (safe_candidate, run_id),
-            ).fetchone()
-            if not row:
-                return None
-            return json.loads(row[0])
-        finally:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.Error:
             conn.close()
+            raise
+        if version != RUN_INDEX_SCHEMA_VERSION:
+            conn.close()
+            raise sqlite3.DatabaseError(f"run_index schema version {version} != {RUN_INDEX_SCHEMA_VERSION}")
+        self._readers[str(db_path)] = (identity, conn)
+        return conn
+
+    def _read(self, candidate_id: str, sql: str, params: tuple) -> List[tuple]:
+        db_path = self._db_path(candidate_id)
+        if not db_path.exists():
+            self.rebuild_index(candidate_id)
+        stale = self._stale_roots(candidate_id, db_path)
+        if stale:
+            self._sync_roots(candidate_id, stale)
+        with self._readers_lock:
+            try:
+                return self._reader(db_path).execute(sql, params).fetchall()
+            except sqlite3.Error:
+                self._drop_reader(db_path)
+                raise
+
+    def _stale_roots(self, candidate_id: str, db_path: Path, table: str = "run_index_watermarks") -> Dict[str, str]:
+        """Run roots whose directory mtime moved since the index last caught up with them."""
+        with self._readers_lock:
+            try:
+                stored = dict(
+                    self._reader(db_path)
+                    .execute(f"SELECT root, mtime_ns FROM {table} WHERE candidate_id = ?", (candidate_id,))
+                    .fetchall()
+                )
+            except sqlite3.Error:
+                self._drop_reader(db_path)
+                raise
+        return {root: mark for root, mark in self._root_watermarks(candidate_id).items() if stored.get(root) != mark}
+
+    def _read_rows(self, candidate_id: str, limit: int) -> List[Dict[str, Any]]:
+        safe_candidate = sanitize_candidate_id(candidate_id)
+        rows = self._read(
+            safe_candidate,
+            """
+            SELECT payload_json
+            FROM run_index
+            WHERE candidate_id = ?
+            ORDER BY timestamp DESC, run_id DESC
+            LIMIT ?
+            """,
+            (safe_candidate, limit),
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def _read_one(self, candidate_id: str, run_id: str) -> Optional[Dict[str, Any]]:
+        safe_candidate = sanitize_candidate_id(candidate_id)
+        rows = self._read(
+            safe_candidate,
+            """
+            SELECT payload_json
+            FROM run_index
+            WHERE candidate_id = ? AND run_id = ?
+            LIMIT 1
+            """,
+            (safe_candidate, run_id),
+        )
+        if not rows:
+            return None
+        return json.loads(rows[0][0])
 
     def _fallback(self, candidate_id: str, reason: str) -> List[Dict[str, Any]]:
         safe_candidate = sanitize_candidate_id(candidate_id)
@@ -351,6 +870,284 @@ class FileSystemRunRepository(RunRepository):
             except (json.JSONDecodeError, OSError, sqlite3.DatabaseError, sqlite3.OperationalError):
                 return self._fallback(safe_candidate, "index_read_failed")
 
+    def _sync_delta_counts(self, conn: sqlite3.Connection, candidate_id: str) -> None:
+        """
+        Bring the per-report delta count rows in line with the run reports on disk. Only reports
+        that are new or whose mtime/size changed are parsed; rows for vanished reports are dropped.
+        Records the run root mtimes it caught up with in run_report_watermarks.
+        """
+        watermarks = self._root_watermarks(candidate_id)
+        known = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute(
+                "SELECT report_path, mtime_ns, size_bytes FROM run_report_files WHERE candidate_id = ?",
+                (candidate_id,),
+            )
+        }
+        current: Dict[str, Path] = {}
+        with conn:
+            for path in self.list_run_metadata_paths(candidate_id=candidate_id):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                key = str(path)
+                current[key] = path
+                if known.get(key) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                try:
+                    report = json.loads(path.read_text(encoding="utf-8"))
+                except Exception:
+                    report = None
+                readable = isinstance(report, dict)
+                conn.execute(
+                    "DELETE FROM run_delta_counts WHERE candidate_id = ? AND report_path = ?", (candidate_id, key)
+                )
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO run_report_files(
+                        candidate_id, report_path, report_name, run_id, mtime_ns, size_bytes, readable
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        candidate_id,
+                        key,
+                        path.name,
+                        str(report.get("run_id") or path.stem) if readable else None,
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        int(readable),
+                    ),
+                )
+                if readable:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO run_delta_counts(
+                            candidate_id, report_path, provider, profile,
+                            new_count, changed_count, removed_count, valid
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [(candidate_id, key, *row) for row in _report_delta_rows(report)],
+                    )
+            for key in set(known) - set(current):
+                for table in ("run_report_files", "run_delta_counts"):
+                    conn.execute(f"DELETE FROM {table} WHERE candidate_id = ? AND report_path = ?", (candidate_id, key))
+            self._write_watermarks(conn, candidate_id, watermarks, table="run_report_watermarks")
+
+    def _query_delta_counts(self, candidate_id: str, provider: str, profile: str, window: int) -> List[Dict[str, Any]]:
+        """
+        Read delta counts through the read-only index connection. Reports are synced at index time;
+        a read only re-syncs when a run root's mtime shows reports were added, replaced, or removed.
+        """
+        db_path = self._db_path(candidate_id)
+        if not db_path.exists():
+            self.rebuild_index(candidate_id)
+        if self._stale_roots(candidate_id, db_path, table="run_report_watermarks"):
+            conn = self._open_writer(candidate_id)
+            try:
+                self._sync_delta_counts(conn, candidate_id)
+            finally:
+                conn.close()
+        rows = self._read(
+            candidate_id,
+            """
+            SELECT f.run_id, d.new_count, d.changed_count, d.removed_count
+            FROM run_report_files AS f
+            LEFT JOIN run_delta_counts AS d
+                ON d.candidate_id = f.candidate_id AND d.report_path = f.report_path
+                AND d.provider = ? AND d.profile = ?
+            WHERE f.candidate_id = ? AND f.readable = 1 AND (d.valid IS NULL OR d.valid = 1)
+            ORDER BY f.report_name DESC
+            LIMIT ?
+            """,
+            (provider, profile, candidate_id, window),
+        )
+        return [
+            {"run_id": run_id, "new": new or 0, "changed": changed or 0, "removed": removed or 0}
+            for run_id, new, changed, removed in rows
+        ]
+
+    def _scan_delta_counts(self, candidate_id: str, provider: str, profile: str, window: int) -> List[Dict[str, Any]]:
+        series: List[Dict[str, Any]] = []
+        for path in reversed(self.list_run_metadata_paths(candidate_id=candidate_id)):
+            try:
+                report = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+            if not isinstance(report, dict):
+                continue
+            rows = {(row[0], row[1]): row for row in _report_delta_rows(report)}
+            row = rows.get((provider, profile))
+            if row is not None and not row[5]:
+                continue
+            counts = row[2:5] if row is not None else (0, 0, 0)
+            entry: Dict[str, Any] = {"run_id": str(report.get("run_id") or path.stem)}
+            entry.update({name: count for (name, _), count in zip(_DELTA_COUNT_FIELDS, counts, strict=True)})
+            series.append(entry)
+            if len(series) >= window:
+                break
+        return series
+
+    def delta_counts_window(
+        self,
+        provider: str,
+        profile: str,
+        *,
+        window: int = 7,
+        candidate_id: str = DEFAULT_CANDIDATE_ID,
+    ) -> Dict[str, Any]:
+        """
+        new/changed/removed counts for provider/profile over the latest `window` run reports
+        (by report file name), oldest first, with window totals. Counts come from indexed
+        columns in the run index; the report files are only scanned if the index is unusable.
+        """
+        safe_candidate = sanitize_candidate_id(candidate_id)
+        bounded_window = max(1, min(window, 1000))
+        try:
+            series = self._query_delta_counts(safe_candidate, provider, profile, bounded_window)
+        except (OSError, sqlite3.DatabaseError):
+            try:
+                self.rebuild_index(safe_candidate)
+                series = self._query_delta_counts(safe_candidate, provider, profile, bounded_window)
+            except (OSError, sqlite3.DatabaseError):
+                logger.warning(
+                    "run_index delta counts unavailable; scanning run reports: candidate_id=%s", safe_candidate
+                )
+                series = self._scan_delta_counts(safe_candidate, provider, profile, bounded_window)
+        series.reverse()
+        totals = {name: sum(item[name] for item in series) for name, _ in _DELTA_COUNT_FIELDS}
+        return {"window_size": window, "runs_considered": len(series), "totals": totals, "series": series}
+
+    def _query_runs_sql(
+        self, candidate_id: str, filters: Dict[str, Optional[str]], after: Optional[tuple[str, str]], limit: int
+    ) -> List[Dict[str, Any]]:
+        clauses = ["r.candidate_id = ?"]
+        params: List[Any] = [candidate_id]
+        if filters["status"] is not None:
+            clauses.append("r.status = ?")
+            params.append(filters["status"])
+        for table, column in (("run_index_providers", "provider"), ("run_index_profiles", "profile")):
+            if filters[column] is not None:
+                clauses.append(
+                    f"EXISTS (SELECT 1 FROM {table} AS t WHERE t.candidate_id = r.candidate_id "
+                    f"AND t.{column} = ? AND t.run_id = r.run_id)"
+                )
+                params.append(filters[column])
+        if filters["since"] is not None:
+            clauses.append("r.timestamp >= ?")
+            params.append(filters["since"])
+        if filters["until"] is not None:
+            clauses.append("r.timestamp < ?")
+            params.append(filters["until"])
+        if filters["git_sha"] is not None:
+            clauses.append("r.git_sha GLOB ?")
+            params.append(f"{filters['git_sha']}*")
+        if after is not None:
+            clauses.append("(r.timestamp < ? OR (r.timestamp = ? AND r.run_id < ?))")
+            params.extend([after[0], after[0], after[1]])
+        rows = self._read(
+            candidate_id,
+            f"""
+            SELECT r.run_id, r.timestamp, r.status, r.started_at, r.ended_at, r.duration_seconds, r.git_sha,
+                   r.new_count, r.changed_count, r.removed_count, r.estimated_cost_usd, r.payload_json,
+                   (SELECT group_concat(provider, char(31)) FROM (
+                        SELECT provider FROM run_index_providers AS p
+                        WHERE p.candidate_id = r.candidate_id AND p.run_id = r.run_id ORDER BY provider)),
+                   (SELECT group_concat(profile, char(31)) FROM (
+                        SELECT profile FROM run_index_profiles AS p
+                        WHERE p.candidate_id = r.candidate_id AND p.run_id = r.run_id ORDER BY profile))
+            FROM run_index AS r
+            WHERE {" AND ".join(clauses)}
+            ORDER BY r.timestamp DESC, r.run_id DESC
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+        results: List[Dict[str, Any]] = []
+        for row in rows:
+            results.append(
+                {
+                    "run_id": row[0],
+                    "timestamp": row[1],
+                    "status": row[2],
+                    "started_at": row[3],
+                    "ended_at": row[4],
+                    "duration_seconds": row[5],
+                    "git_sha": row[6],
+                    "diff_counts": {"new": row[7], "changed": row[8], "removed": row[9]},
+                    "estimated_cost_usd": row[10],
+                    "providers": row[12].split("\x1f") if row[12] else [],
+                    "profiles": row[13].split("\x1f") if row[13] else [],
+                    "_payload_json": row[11],
+                }
+            )
+        return results
+
+    def _query_runs_scan(
+        self, candidate_id: str, filters: Dict[str, Optional[str]], after: Optional[tuple[str, str]], limit: int
+    ) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        for entry in self._scan_runs_from_filesystem(candidate_id):
+            if after is not None and (entry.timestamp, entry.run_id) >= after:
+                continue
+            summary = _run_summary(entry)
+            if not _summary_matches(summary, filters):
+                continue
+            summary["_payload_json"] = json.dumps(entry.payload, sort_keys=True, separators=(",", ":"))
+            results.append(summary)
+            if len(results) >= limit:
+                break
+        return results
+
+    def query_runs(
+        self,
+        candidate_id: str = DEFAULT_CANDIDATE_ID,
+        *,
+        status: Optional[str] = None,
+        provider: Optional[str] = None,
+        profile: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        git_sha: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_payload: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Filtered page of run summaries, newest first. `since` is inclusive and `until` exclusive
+        (both compared against the run timestamp); `git_sha` matches by prefix. Pass the returned
+        `next_cursor` back as `cursor` for the following page. Raises ValueError on a bad cursor.
+        """
+        safe_candidate = sanitize_candidate_id(candidate_id)
+        bounded_limit = max(1, min(limit, 1000))
+        after = _decode_cursor(cursor) if cursor else None
+        if git_sha is not None and not _GIT_SHA_PREFIX_RE.fullmatch(git_sha):
+            raise ValueError("Invalid git_sha filter")
+        filters = {
+            "status": status,
+            "provider": provider,
+            "profile": profile,
+            "since": since,
+            "until": until,
+            "git_sha": git_sha,
+        }
+        try:
+            rows = self._query_runs_sql(safe_candidate, filters, after, bounded_limit + 1)
+        except (OSError, sqlite3.DatabaseError):
+            try:
+                self.rebuild_index(safe_candidate)
+                rows = self._query_runs_sql(safe_candidate, filters, after, bounded_limit + 1)
+            except (OSError, sqlite3.DatabaseError):
+                logger.warning("run_index query fell back to filesystem scan: candidate_id=%s", safe_candidate)
+                rows = self._query_runs_scan(safe_candidate, filters, after, bounded_limit + 1)
+        page = rows[:bounded_limit]
+        for item in page:
+            payload_json = item.pop("_payload_json")
+            if include_payload:
+                item["payload"] = json.loads(payload_json)
+        next_cursor = _encode_cursor(page[-1]["timestamp"], page[-1]["run_id"]) if len(rows) > bounded_limit else None
+        return {"runs": page, "next_cursor": next_cursor}
+
     def latest_run(self, candidate_id: str = DEFAULT_CANDIDATE_ID) -> Optional[Dict[str, Any]]:
         rows = self.list_runs(candidate_id=candidate_id, limit=1)
         return rows[0] if rows else None
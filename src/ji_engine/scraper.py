@@ -7,15 +7,13 @@ See LICENSE for permitted use.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import List, Optional
 
 from ji_engine.config import RAW_JOBS_JSON
 from ji_engine.models import RawJobPosting
 from ji_engine.providers.openai_provider import OpenAICareersProvider
-
-_CANONICAL_JSON_KWARGS = {"ensure_ascii": False, "sort_keys": True, "separators": (",", ":")}
+from ji_engine.utils.canonical_json import canonical_text
 
 
 class ScraperManager:
@@ -46,7 +44,7 @@ class ScraperManager:
         out_path.parent.mkdir(parents=True, exist_ok=True)
 
         with out_path.open("w", encoding="utf-8") as f:
-            f.write(json.dumps(payload, **_CANONICAL_JSON_KWARGS) + "\n")
+            f.write(canonical_text(payload))
 
         print(f"Scraped {len(all_jobs)} jobs.")
         print(f"Wrote JSON to {out_path.resolve()}")
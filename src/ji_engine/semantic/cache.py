@@ -14,6 +14,8 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ji_engine.utils.canonical_json import canonical_text
+
 from .core import SEMANTIC_NORM_VERSION
 
 
@@ -103,5 +105,5 @@ def load_cache_entry(path: Path) -> Optional[Dict[str, Any]]:
 def save_cache_entry(path: Path, payload: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.write_text(canonical_text(payload, pretty=True), encoding="utf-8")
     os.replace(tmp, path)
@@ -12,6 +12,8 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ji_engine.utils.compression import read_artifact_text
+
 from .cache import (
     build_cache_entry,
     build_embedding_cache_key,
@@ -41,7 +43,7 @@ def _canonical_profile_text(profile_data: Any) -> str:
 
 
 def _load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(read_artifact_text(path))
 
 
 def _load_ranked_jobs(path: Path) -> List[Dict[str, Any]]:
@@ -0,0 +1,173 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from ji_engine.utils.atomic_write import atomic_write_text
+
+try:  # optional C-accelerated backend: pip install '.[fast]'
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised where orjson is absent
+    _orjson = None
+
+JSON_BACKEND_ENV = "JOBINTEL_JSON_BACKEND"
+JSON_BACKENDS = ("auto", "orjson", "stdlib")
+
+# The two canonical artifact layouts. Both are byte-for-byte what `json.dumps` writes with these
+# settings; the orjson fast path is only taken when it provably produces the same bytes.
+COMPACT_JSON_SETTINGS: Dict[str, Any] = {"ensure_ascii": False, "sort_keys": True, "separators": (",", ":")}
+PRETTY_JSON_SETTINGS: Dict[str, Any] = {"ensure_ascii": False, "sort_keys": True, "indent": 2}
+
+# orjson writes floats in [1e-9, 1e-4) differently from `repr(float)` ("0.00001" / "1e-7" vs
+# "1e-05" / "1e-07"); output that may hold one is re-encoded with the stdlib (see _may_diverge).
+_NEG_EXPONENT = re.compile(rb"e-[0-9]")
+_DIGITS = b"0123456789"
+_TOKEN_BOUNDARY = b":,[ \n"
+
+
+def _fast_unsupported(obj: Any) -> Any:
+    # Anything outside plain JSON types (and str/int/dict/list subclasses, via passthrough) goes
+    # back to the stdlib encoder, so `default=` callables and TypeErrors behave exactly as before.
+    raise TypeError(f"Object of type {type(obj).__name__} is not handled by the fast JSON path")
+
+
+def _may_diverge(data: bytes) -> bool:
+    """
+    Whether orjson output may hold a float the stdlib writes differently. Two plain scans rather
+    than one regex alternation, which is several times slower on large artifacts; a lookalike
+    inside a string only costs the fallback, and ids such as "a26e-4a09" are not number tokens.
+    """
+    if b"0.0000" in data:
+        return True
+    for match in _NEG_EXPONENT.finditer(data):
+        end = match.end()
+        if end < len(data) and data[end] in _DIGITS:
+            continue
+        pos = match.start() - 1
+        if pos < 0 or data[pos] not in _DIGITS:
+            continue
+        while pos >= 0 and data[pos] in b"0123456789.":
+            pos -= 1
+        if pos >= 0 and data[pos] == ord("-"):
+            pos -= 1
+        if pos < 0 or data[pos] in _TOKEN_BOUNDARY:
+            return True
+    return False
+
+
+def _resolve_backend() -> Optional[Any]:
+    choice = os.environ.get(JSON_BACKEND_ENV, "auto").strip().lower() or "auto"
+    if choice not in JSON_BACKENDS:
+        raise ValueError(f"{JSON_BACKEND_ENV} must be one of {JSON_BACKENDS}, got {choice!r}")
+    if choice == "stdlib":
+        return None
+    if _orjson is None and choice == "orjson":
+        raise RuntimeError(f"{JSON_BACKEND_ENV}=orjson but orjson is not installed (pip install '.[fast]')")
+    return _orjson
+
+
+_FAST = _resolve_backend()
+_ORJSON_OPTIONS = (
+    _orjson.OPT_SORT_KEYS
+    | _orjson.OPT_PASSTHROUGH_SUBCLASS
+    | _orjson.OPT_PASSTHROUGH_DATETIME
+    | _orjson.OPT_PASSTHROUGH_DATACLASS
+    if _orjson is not None
+    else 0
+)
+
+
+def json_backend() -> str:
+    """Backend used for canonical serialization in this process: "orjson" or "stdlib"."""
+    return "orjson" if _FAST is not None else "stdlib"
+
+
+def _fast_dumps(obj: Any, pretty: bool) -> Optional[bytes]:
+    if _FAST is None:
+        return None
+    try:
+        data = _FAST.dumps(
+            obj, default=_fast_unsupported, option=_ORJSON_OPTIONS | (_FAST.OPT_INDENT_2 if pretty else 0)
+        )
+    except (TypeError, ValueError):
+        # Non-str keys, ints beyond 64 bits, non-JSON types: the stdlib decides what happens.
+        return None
+    if _may_diverge(data):
+        return None
+    return data
+
+
+def canonical_dumps(obj: Any, *, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Canonical JSON text for `obj` (no trailing newline): sorted keys, UTF-8 characters kept as is,
+    compact separators, or two-space indentation when `pretty`. Identical to
+    `json.dumps(obj, **COMPACT_JSON_SETTINGS)` / `PRETTY_JSON_SETTINGS` (plus `default`).
+    Non-finite floats are not JSON and are not part of the contract: the stdlib writes `NaN`,
+    the orjson backend `null`.
+    """
+    data = _fast_dumps(obj, pretty)
+    if data is not None:
+        return data.decode("utf-8")
+    return json.dumps(obj, **(PRETTY_JSON_SETTINGS if pretty else COMPACT_JSON_SETTINGS), default=default)
+
+
+def canonical_dumps_bytes(obj: Any, *, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """UTF-8 bytes of `canonical_dumps`, without the decode/encode round trip on the fast path."""
+    data = _fast_dumps(obj, pretty)
+    if data is not None:
+        return data
+    return canonical_dumps(obj, pretty=pretty, default=default).encode("utf-8")
+
+
+def canonical_text(obj: Any, *, pretty: bool = False) -> str:
+    """Artifact file content: `canonical_dumps` plus a trailing newline."""
+    return canonical_dumps(obj, pretty=pretty) + "\n"
+
+
+def write_canonical_json(path: Path, obj: Any, *, pretty: bool = False) -> None:
+    """Atomically write `canonical_text(obj)` to `path`."""
+    atomic_write_text(Path(path), canonical_text(obj, pretty=pretty))
+
+
+def iter_canonical_array(records: Iterable[Any], *, pretty: bool = False) -> Iterator[str]:
+    """
+    Streaming encoder: text chunks that join to `canonical_dumps(list(records), pretty=pretty)`,
+    serializing one element at a time so a large list (or a generator) is never encoded whole.
+    """
+    pad = "  " if pretty else ""
+    opener, separator, closer = ("[\n  ", ",\n  ", "\n]") if pretty else ("[", ",", "]")
+    first = True
+    for record in records:
+        text = canonical_dumps(record, pretty=pretty)
+        if pad:
+            # Nested lines gain one level; encoded strings never hold a raw newline, so this is exact.
+            text = text.replace("\n", "\n" + pad)
+        yield opener if first else separator
+        yield text
+        first = False
+    yield "[]" if first else closer
+
+
+def canonical_jsonl_line(record: Any) -> str:
+    """One JSON Lines record: compact canonical JSON plus a newline."""
+    return canonical_dumps(record) + "\n"
+
+
+def stable_hash_bytes(obj: Any, *, ensure_ascii: bool = False) -> bytes:
+    """
+    Hash input for identities and fingerprints: `json.dumps(obj, sort_keys=True, default=str)` with
+    the default ", " / ": " separators, as every stored fingerprint and job identity was computed.
+    orjson cannot produce that layout, so this always uses the stdlib encoder; the payloads hashed
+    here are small, fixed-shape dicts.
+    """
+    return json.dumps(obj, ensure_ascii=ensure_ascii, sort_keys=True, default=str).encode("utf-8")
@@ -0,0 +1,218 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Tuple
+
+try:  # optional zstd codec: pip install '.[zstd]'
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - exercised where zstandard is absent
+    _zstd = None
+
+COMPRESSION_ENV = "JOBINTEL_ARTIFACT_COMPRESSION"
+COMPRESSION_CHOICES = ("none", "gzip", "zstd")
+# Stored suffix per codec, appended to the logical name: ranked.json -> ranked.json.gz.
+CODEC_SUFFIXES: Dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+_MAGIC = ((b"\x1f\x8b", "gzip"), (b"\x28\xb5\x2f\xfd", "zstd"))
+_CHUNK_BYTES = 1024 * 1024
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 10
+
+
+def artifact_compression() -> Optional[str]:
+    """Codec configured for archived artifacts ("gzip"/"zstd"), or None when they are stored as is."""
+    choice = os.environ.get(COMPRESSION_ENV, "none").strip().lower() or "none"
+    if choice not in COMPRESSION_CHOICES:
+        raise ValueError(f"{COMPRESSION_ENV} must be one of {COMPRESSION_CHOICES}, got {choice!r}")
+    if choice == "none":
+        return None
+    if choice == "zstd" and _zstd is None:
+        raise RuntimeError(f"{COMPRESSION_ENV}=zstd but zstandard is not installed (pip install '.[zstd]')")
+    return choice
+
+
+def codec_for_suffix(path: Path) -> Optional[str]:
+    suffix = Path(path).suffix.lower()
+    for codec, codec_suffix in CODEC_SUFFIXES.items():
+        if suffix == codec_suffix:
+            return codec
+    return None
+
+
+def logical_path(path: Path) -> Path:
+    """`path` without its compression suffix: what the artifact is, independent of how it is stored."""
+    path = Path(path)
+    return path.with_suffix("") if codec_for_suffix(path) else path
+
+
+def compressed_path(path: Path, codec: str) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + CODEC_SUFFIXES[codec])
+
+
+def resolve_artifact_path(path: Path) -> Path:
+    """
+    `path` when it exists, else the first existing compressed form (`<path>.gz`, `<path>.zst`).
+    Falls back to `path` itself so callers still get their usual missing-file behaviour.
+    """
+    path = Path(path)
+    if path.exists():
+        return path
+    for codec in CODEC_SUFFIXES:
+        candidate = compressed_path(path, codec)
+        if candidate.exists():
+            return candidate
+    return path
+
+
+def detect_codec(path: Path) -> Optional[str]:
+    """Codec of the stored bytes, sniffed from the magic number (JSON, CSV and Markdown never match)."""
+    with Path(path).open("rb") as fh:
+        head = fh.read(4)
+    for magic, codec in _MAGIC:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def _decompressing_reader(raw: IO[bytes], codec: str) -> IO[bytes]:
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if _zstd is None:
+        raise RuntimeError(f"{raw.name} is zstd-compressed but zstandard is not installed (pip install '.[zstd]')")
+    return _zstd.ZstdDecompressor().stream_reader(raw, closefd=False)
+
+
+class _ClosingReader(io.BufferedReader):
+    """Buffered decompressed stream that also closes the underlying file."""
+
+    def __init__(self, stream: IO[bytes], raw: IO[bytes]) -> None:
+        super().__init__(stream, buffer_size=_CHUNK_BYTES)  # type: ignore[arg-type]
+        self._raw_file = raw
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._raw_file.close()
+
+
+def open_artifact(path: Path, mode: str = "rb") -> IO[Any]:
+    """
+    Open an artifact for reading, plain or compressed: `path` is resolved with
+    `resolve_artifact_path` and compressed bytes are decompressed on the fly. `mode` is "rb"
+    or "r" (UTF-8 text).
+    """
+    if mode not in {"rb", "r"}:
+        raise ValueError(f"open_artifact mode must be 'rb' or 'r', got {mode!r}")
+    resolved = resolve_artifact_path(path)
+    codec = detect_codec(resolved)
+    raw = resolved.open("rb")
+    if codec is None:
+        stream: IO[bytes] = raw
+    else:
+        try:
+            stream = _ClosingReader(_decompressing_reader(raw, codec), raw)
+        except Exception:
+            raw.close()
+            raise
+    if mode == "rb":
+        return stream
+    return io.TextIOWrapper(stream, encoding="utf-8")
+
+
+def read_artifact_bytes(path: Path) -> bytes:
+    with open_artifact(path, "rb") as fh:
+        return fh.read()
+
+
+def read_artifact_text(path: Path) -> str:
+    """UTF-8 text of a plain or compressed artifact."""
+    return read_artifact_bytes(path).decode("utf-8")
+
+
+def artifact_digest(path: Path) -> Tuple[str, int]:
+    """(sha256, size) of the artifact's uncompressed bytes, however it is stored."""
+    hasher = hashlib.sha256()
+    size = 0
+    with open_artifact(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK_BYTES), b""):
+            hasher.update(chunk)
+            size += len(chunk)
+    return hasher.hexdigest(), size
+
+
+class _HashingWriter(io.RawIOBase):
+    """Write-through file wrapper that hashes and counts the (compressed) bytes it stores."""
+
+    def __init__(self, fh: IO[bytes]) -> None:
+        self._fh = fh
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        view = memoryview(data)
+        self._fh.write(view)
+        self.hasher.update(view)
+        self.size += len(view)
+        return len(view)
+
+
+def compress_file(src: Path, dest: Path, codec: str) -> Dict[str, Any]:
+    """
+    Atomically write `src` to `dest` compressed with `codec` and return its digests:
+    `sha256`/`bytes` describe the uncompressed content (identical to hashing `src`), while
+    `compressed_sha256`/`compressed_bytes` describe the stored file. Output is deterministic
+    (gzip carries no name or mtime), so equal inputs give equal compressed digests.
+    """
+    if codec not in CODEC_SUFFIXES:
+        raise ValueError(f"Unknown compression codec {codec!r}; expected one of {tuple(CODEC_SUFFIXES)}")
+    if codec == "zstd" and _zstd is None:
+        raise RuntimeError("zstd compression requested but zstandard is not installed (pip install '.[zstd]')")
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    content_hasher = hashlib.sha256()
+    content_size = 0
+    with tempfile.NamedTemporaryFile("wb", dir=dest.parent, prefix=f".{dest.name}.", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        with tmp_path.open("wb") as out, Path(src).open("rb") as fh:
+            sink = _HashingWriter(out)
+            if codec == "gzip":
+                compressor: Any = gzip.GzipFile(
+                    filename="", mode="wb", fileobj=sink, compresslevel=_GZIP_LEVEL, mtime=0
+                )
+            else:
+                compressor = _zstd.ZstdCompressor(level=_ZSTD_LEVEL, write_checksum=True).stream_writer(
+                    sink, closefd=False
+                )
+            with compressor:
+                for chunk in iter(lambda: fh.read(_CHUNK_BYTES), b""):
+                    content_hasher.update(chunk)
+                    content_size += len(chunk)
+                    compressor.write(chunk)
+        os.replace(tmp_path, dest)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return {
+        "sha256": content_hasher.hexdigest(),
+        "bytes": content_size,
+        "compression": codec,
+        "compressed_sha256": sink.hasher.hexdigest(),
+        "compressed_bytes": sink.size,
+    }
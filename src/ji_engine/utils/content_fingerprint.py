@@ -8,9 +8,10 @@ See LICENSE for permitted use.
 from __future__ import annotations
 
 import hashlib
-import json
 from typing import Any, Dict
 
+from ji_engine.utils.canonical_json import stable_hash_bytes
+
 
 def content_fingerprint(job: Dict[str, Any]) -> str:
     """
@@ -34,5 +35,5 @@ def content_fingerprint(job: Dict[str, Any]) -> str:
         "team": job.get("team"),
         "description_text_hash": desc_hash,
     }
-    raw = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    raw = stable_hash_bytes(payload, ensure_ascii=True)
     return hashlib.sha256(raw).hexdigest()
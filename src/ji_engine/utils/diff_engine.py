@@ -0,0 +1,96 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Tuple, TypeVar
+
+KeyFn = Callable[[Dict[str, Any]], str]
+FingerprintFn = Callable[[Dict[str, Any]], Hashable]
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class KeyedDiff:
+    """
+    Prior/current comparison under one identity + fingerprint scheme.
+
+    `prev`/`curr` map key -> job with dict-comprehension semantics (a repeated key keeps its
+    first position and its last record). `added`/`changed`/`unchanged` follow `curr` order,
+    `removed` follows `prev` order. `fingerprints` holds the (prev, curr) fingerprint of every
+    shared key so renderers can reuse them instead of recomputing field values.
+    """
+
+    prev: Dict[str, Dict[str, Any]]
+    curr: Dict[str, Dict[str, Any]]
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+    unchanged: List[str]
+    fingerprints: Dict[str, Tuple[Hashable, Hashable]]
+
+
+class JobDiff:
+    """
+    One provider/profile diff: both ranked lists are loaded once and shared by every renderer.
+
+    Renderers (shortlist changes section, diff report, delta summary) keep their own identity and
+    field semantics, so each asks for a named view via `keyed()`. A view is computed once per
+    `JobDiff` and reused; fingerprints are only computed for keys present on both sides. Alerts
+    diff the current side against last_seen.json instead of `prev_jobs`, so they share the
+    current-side identities and index through `current()`.
+    """
+
+    def __init__(self, prev_jobs: List[Dict[str, Any]], curr_jobs: List[Dict[str, Any]]) -> None:
+        self.prev_jobs = list(prev_jobs)
+        self.curr_jobs = list(curr_jobs)
+        self._views: Dict[str, KeyedDiff] = {}
+        self._current: Dict[str, Any] = {}
+
+    def keyed(self, name: str, key_fn: KeyFn, fingerprint_fn: FingerprintFn) -> KeyedDiff:
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = _keyed_diff(self.prev_jobs, self.curr_jobs, key_fn, fingerprint_fn)
+        return view
+
+    def current(self, name: str, build: Callable[[List[Dict[str, Any]]], T]) -> T:
+        """Named value derived from `curr_jobs` only, built once per `JobDiff`."""
+        if name not in self._current:
+            self._current[name] = build(self.curr_jobs)
+        return self._current[name]
+
+
+def _keyed_diff(
+    prev_jobs: List[Dict[str, Any]],
+    curr_jobs: List[Dict[str, Any]],
+    key_fn: KeyFn,
+    fingerprint_fn: FingerprintFn,
+) -> KeyedDiff:
+    prev = {key_fn(job): job for job in prev_jobs}
+    curr = {key_fn(job): job for job in curr_jobs}
+
+    added: List[str] = []
+    changed: List[str] = []
+    unchanged: List[str] = []
+    fingerprints: Dict[str, Tuple[Hashable, Hashable]] = {}
+    for key, curr_job in curr.items():
+        if key not in prev:
+            added.append(key)
+            continue
+        pair = fingerprints[key] = (fingerprint_fn(prev[key]), fingerprint_fn(curr_job))
+        (changed if pair[0] != pair[1] else unchanged).append(key)
+    removed = [key for key in prev if key not in curr]
+    return KeyedDiff(
+        prev=prev,
+        curr=curr,
+        added=added,
+        removed=removed,
+        changed=changed,
+        unchanged=unchanged,
+        fingerprints=fingerprints,
+    )
@@ -11,7 +11,8 @@ import hashlib
 import json
 from typing import Any, Dict, Iterable, List, Tuple
 
-from .job_identity import job_identity, normalize_job_text
+from .diff_engine import JobDiff, KeyedDiff
+from .job_identity import normalize_job_text, stored_job_identity
 
 _DIFF_FIELDS: Tuple[str, ...] = ("title", "location", "team", "level", "score", "jd_hash")
 
@@ -65,27 +66,30 @@ def _identity_key(job: Dict[str, Any]) -> str:
     jid = normalize_job_text(str(job.get("job_id") or ""), casefold=False)
     if jid:
         return jid
-    return job_identity(job, mode="provider")
+    return stored_job_identity(job)
 
 
-def _changed_fields(prev_job: Dict[str, Any], curr_job: Dict[str, Any]) -> List[str]:
-    changed: List[str] = []
-    for field in _DIFF_FIELDS:
-        if _field_value(prev_job, field) != _field_value(curr_job, field):
-            changed.append(field)
-    return changed
+def _diff_values(job: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Comparable `_DIFF_FIELDS` values for one job.
 
-
-def _stable_fingerprint(job: Dict[str, Any]) -> str:
-    payload = {field: _field_value(job, field) for field in _DIFF_FIELDS}
-    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    `jd_hash` carries the normalized description itself: equal text <=> equal digest, so the
+    tuple compares exactly like the hashed fields without paying for sha256 on every record.
+    """
+    return tuple(
+        _normalize(_job_description_text(job)) if field == "jd_hash" else _field_value(job, field)
+        for field in _DIFF_FIELDS
+    )
 
 
 def _sorted_items(items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return sorted(items, key=lambda x: x.get("id") or "")
 
 
+def diff_report_view(diff: JobDiff) -> KeyedDiff:
+    return diff.keyed("diff_report", _identity_key, _diff_values)
+
+
 def build_diff_report(
     prev_jobs: List[Dict[str, Any]],
     curr_jobs: List[Dict[str, Any]],
@@ -94,34 +98,26 @@ def build_diff_report(
     profile: str,
     baseline_exists: bool,
     ignored_ids: set[str] | None = None,
+    diff: JobDiff | None = None,
 ) -> Dict[str, Any]:
-    prev_map = {_identity_key(job): (job, _stable_fingerprint(job)) for job in prev_jobs}
-    curr_map = {_identity_key(job): (job, _stable_fingerprint(job)) for job in curr_jobs}
-
-    prev_ids = set(prev_map)
-    curr_ids = set(curr_map)
+    """Render the per provider/profile diff report; pass `diff` to reuse an already indexed `JobDiff`."""
+    view = diff_report_view(diff if diff is not None else JobDiff(prev_jobs, curr_jobs))
 
     blocked = set(ignored_ids or set())
-    added_ids = {identity for identity in (curr_ids - prev_ids) if identity not in blocked}
-    removed_ids = {identity for identity in (prev_ids - curr_ids) if identity not in blocked}
-    shared_ids = prev_ids & curr_ids
-
-    changed_ids: List[str] = []
+    added_items = [_project(view.curr[i], i) for i in view.added if i not in blocked]
+    removed_items = [_project(view.prev[i], i) for i in view.removed if i not in blocked]
     changed_items: List[Dict[str, Any]] = []
-
-    for identity in sorted(shared_ids):
+    for identity in view.changed:
         if identity in blocked:
             continue
-        prev_job, prev_hash = prev_map[identity]
-        curr_job, curr_hash = curr_map[identity]
-        if prev_hash != curr_hash:
-            changed_ids.append(identity)
-            item = _project(curr_job, identity)
-            item["changed_fields"] = _changed_fields(prev_job, curr_job)
-            changed_items.append(item)
-
-    added_items = [_project(curr_map[i][0], i) for i in added_ids]
-    removed_items = [_project(prev_map[i][0], i) for i in removed_ids]
+        prev_values, curr_values = view.fingerprints[identity]
+        item = _project(view.curr[identity], identity)
+        item["changed_fields"] = [
+            field
+            for field, before, after in zip(_DIFF_FIELDS, prev_values, curr_values, strict=True)
+            if before != after
+        ]
+        changed_items.append(item)
 
     report = {
         "provider": provider,
@@ -136,7 +132,7 @@ def build_diff_report(
         "changed": _sorted_items(changed_items),
         "removed": _sorted_items(removed_items),
         "suppressed": {
-            "ignored": len(blocked & (prev_ids | curr_ids)),
+            "ignored": len(blocked & (view.prev.keys() | view.curr.keys())),
         },
     }
     report["summary_hash"] = diff_report_digest(report)
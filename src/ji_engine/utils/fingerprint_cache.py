@@ -0,0 +1,163 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ji_engine.utils.atomic_write import atomic_write_text
+from ji_engine.utils.canonical_json import canonical_text
+
+FINGERPRINT_CACHE_SCHEMA_VERSION = 1
+HASH_BUFFER_BYTES = 1024 * 1024
+MAX_STORED_FINGERPRINTS = 20000
+# A file modified this close to the moment it was hashed may be rewritten again within the same
+# mtime tick (1-2s on some filesystems) without changing size or mtime; such entries are re-hashed
+# instead of trusted until they age past the window (same idea as git's "racily clean" entries).
+RACY_WINDOW_NS = 2_000_000_000
+
+_LOCK = threading.Lock()
+_ENTRIES: Dict[str, Dict[str, Any]] = {}
+_STORE_PATH: Optional[Path] = None
+_STORE_LOADED = False
+_DIRTY = False
+_ENABLED = True
+
+
+def hash_cache_enabled() -> bool:
+    """False when disabled for this process (`--no-hash-cache`) or via JOBINTEL_NO_HASH_CACHE=1."""
+    if os.environ.get("JOBINTEL_NO_HASH_CACHE", "").strip().lower() in {"1", "true", "yes"}:
+        return False
+    return _ENABLED
+
+
+def configure_fingerprint_cache(store_path: Optional[Path], *, enabled: bool = True) -> None:
+    """
+    Point the cache at an on-disk store (None keeps it process-local) and enable/disable it.
+    Disabling makes every lookup stream the file again and leaves the store untouched.
+    """
+    global _STORE_PATH, _STORE_LOADED, _ENABLED
+    with _LOCK:
+        if store_path != _STORE_PATH:
+            _STORE_PATH = store_path
+            _STORE_LOADED = False
+        _ENABLED = enabled
+
+
+def clear_fingerprint_cache() -> None:
+    global _STORE_LOADED, _DIRTY
+    with _LOCK:
+        _ENTRIES.clear()
+        _STORE_LOADED = False
+        _DIRTY = False
+
+
+def hash_file_streaming(path: Path) -> Tuple[str, int]:
+    """(sha256 hex, byte count) of `path`, read through one reusable large buffer."""
+    digest = hashlib.sha256()
+    size = 0
+    buffer = bytearray(HASH_BUFFER_BYTES)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as handle:
+        while True:
+            read = handle.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+            size += read
+    return digest.hexdigest(), size
+
+
+def _read_store(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema_version") != FINGERPRINT_CACHE_SCHEMA_VERSION:
+        return {}
+    entries = payload.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {key: entry for key, entry in entries.items() if isinstance(entry, dict)}
+
+
+def _load_store_locked() -> None:
+    global _STORE_LOADED
+    if _STORE_LOADED or _STORE_PATH is None:
+        return
+    for key, entry in _read_store(_STORE_PATH).items():
+        _ENTRIES.setdefault(key, entry)
+    _STORE_LOADED = True
+
+
+def _stat_key(stat: os.stat_result) -> Dict[str, int]:
+    return {"ino": stat.st_ino, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def file_fingerprint(path: Path) -> Tuple[str, int]:
+    """
+    (sha256 hex, byte count) of `path`, reused from the cache while the file's
+    (path, inode, size, mtime_ns) is unchanged and streamed from disk otherwise.
+    """
+    if not hash_cache_enabled():
+        return hash_file_streaming(path)
+    global _DIRTY
+    key = str(path.resolve())
+    stat_key = _stat_key(path.stat())
+    with _LOCK:
+        _load_store_locked()
+        entry = _ENTRIES.get(key)
+    if (
+        entry is not None
+        and all(entry.get(field) == value for field, value in stat_key.items())
+        and isinstance(entry.get("sha256"), str)
+        and isinstance(entry.get("hashed_at_ns"), int)
+        and entry["hashed_at_ns"] - stat_key["mtime_ns"] > RACY_WINDOW_NS
+    ):
+        return entry["sha256"], stat_key["size"]
+    hashed_at_ns = time.time_ns()
+    sha256, size = hash_file_streaming(path)
+    current = _stat_key(path.stat())
+    if current == stat_key and size == stat_key["size"]:
+        with _LOCK:
+            _ENTRIES[key] = {**stat_key, "sha256": sha256, "hashed_at_ns": hashed_at_ns}
+            _DIRTY = True
+    return sha256, size
+
+
+def flush_fingerprint_cache() -> Optional[Path]:
+    """
+    Merge this process's fingerprints into the on-disk store (newest hash per path wins,
+    capped at MAX_STORED_FINGERPRINTS) and atomically replace it. Best-effort; returns
+    the store path when written.
+    """
+    global _DIRTY
+    with _LOCK:
+        if _STORE_PATH is None or not _DIRTY or not hash_cache_enabled():
+            return None
+        store_path = _STORE_PATH
+        merged = _read_store(store_path)
+        for key, entry in _ENTRIES.items():
+            stored = merged.get(key)
+            if stored is None or int(stored.get("hashed_at_ns") or 0) <= int(entry.get("hashed_at_ns") or 0):
+                merged[key] = entry
+        if len(merged) > MAX_STORED_FINGERPRINTS:
+            newest = sorted(merged.items(), key=lambda item: int(item[1].get("hashed_at_ns") or 0), reverse=True)
+            merged = dict(newest[:MAX_STORED_FINGERPRINTS])
+        payload = {"schema_version": FINGERPRINT_CACHE_SCHEMA_VERSION, "entries": dict(sorted(merged.items()))}
+        try:
+            atomic_write_text(store_path, canonical_text(payload))
+        except OSError:
+            return None
+        _DIRTY = False
+    return store_path
@@ -8,11 +8,14 @@ See LICENSE for permitted use.
 from __future__ import annotations
 
 import hashlib
-import json
 import re
-from typing import Any, Dict, Literal
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Literal, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+from ji_engine.utils.canonical_json import stable_hash_bytes
+
 _DROP_QUERY_PREFIXES = ("utm_", "gh_", "lever_")
 _DROP_QUERY_KEYS = {
     "gh_jid",
@@ -140,11 +143,11 @@ def _legacy_identity(job: Dict[str, object]) -> str:
     location = _norm(job.get("location") or job.get("locationName"))
     team = _norm(job.get("team") or job.get("department") or job.get("departmentName"))
     payload = {"strategy": "legacy_fallback", "title": title, "location": location, "team": team}
-    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    raw = stable_hash_bytes(payload)
     return hashlib.sha256(raw).hexdigest()
 
 
-def job_identity(job: Dict[str, object], *, mode: Literal["legacy", "provider"] = "legacy") -> str:
+def _compute_job_identity(job: Dict[str, object], *, mode: Literal["legacy", "provider"]) -> str:
     """
     Deterministic identifier for job postings.
 
@@ -200,5 +203,112 @@ def job_identity(job: Dict[str, object], *, mode: Literal["legacy", "provider"]
             "jd_hash": _description_hash(job),
         }
 
-    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+    raw = stable_hash_bytes(payload)
     return hashlib.sha256(raw).hexdigest()
+
+
+# ------------------------------------------------------------
+# Memoized identities
+# ------------------------------------------------------------
+
+# Record field where scoring stores the provider-mode identity (see `stored_job_identity`).
+JOB_IDENTITY_FIELD = "job_identity"
+IDENTITY_MEMO_SIZE = 16384
+
+# Every field `_compute_job_identity` may read, in either mode.
+_IDENTITY_FIELDS: Tuple[str, ...] = tuple(
+    dict.fromkeys(
+        (
+            "provider",
+            "source",
+            "job_id",
+            "apply_url",
+            "detail_url",
+            "url",
+            "title",
+            "location",
+            "locationName",
+            "team",
+            "department",
+            "departmentName",
+            "description_text",
+            "jd_text",
+            "description",
+            "descriptionHtml",
+        )
+        + _REQUISITION_KEYS
+    )
+)
+
+_memo: "OrderedDict[Hashable, str]" = OrderedDict()
+_memo_lock = threading.Lock()
+_memo_stats = {"hits": 0, "misses": 0}
+
+
+def _memo_key(job: Dict[str, object], mode: str) -> Optional[Hashable]:
+    values = tuple(map(job.get, _IDENTITY_FIELDS))
+    # Include the types so 1 / 1.0 / True (equal hashes, different str()) stay distinct.
+    key = (mode, values, tuple(map(type, values)))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def job_identity(job: Dict[str, object], *, mode: Literal["legacy", "provider"] = "legacy") -> str:
+    """
+    Deterministic identifier for job postings (memoized).
+
+    Results are cached in-process keyed by the identity-relevant fields of `job`,
+    so hashing the same posting again from another stage is a dict lookup.
+    See `_compute_job_identity` for the strategy.
+    """
+    if mode == "legacy":
+        job_id = job.get("job_id")
+        if job_id is not None:
+            normalized = normalize_job_text(str(job_id), casefold=False)
+            if normalized:
+                # Same short-circuit as `_legacy_identity`; nothing is hashed, so skip the memo.
+                return normalized
+    key = _memo_key(job, mode)
+    if key is None:
+        return _compute_job_identity(job, mode=mode)
+    with _memo_lock:
+        cached = _memo.get(key)
+        if cached is not None:
+            _memo.move_to_end(key)
+            _memo_stats["hits"] += 1
+            return cached
+    identity = _compute_job_identity(job, mode=mode)
+    with _memo_lock:
+        _memo_stats["misses"] += 1
+        _memo[key] = identity
+        while len(_memo) > IDENTITY_MEMO_SIZE:
+            _memo.popitem(last=False)
+    return identity
+
+
+def identities_for(jobs: Iterable[Dict[str, object]], *, mode: Literal["legacy", "provider"] = "provider") -> List[str]:
+    """Batch API: one identity per job, in input order (memoized)."""
+    return [job_identity(job, mode=mode) for job in jobs]
+
+
+def stored_job_identity(job: Dict[str, object]) -> str:
+    """Provider-mode identity, preferring the value stored on the record at scoring time."""
+    stored = job.get(JOB_IDENTITY_FIELD)
+    if isinstance(stored, str) and stored:
+        return stored
+    return job_identity(job, mode="provider")
+
+
+def identity_memo_stats() -> Dict[str, int]:
+    with _memo_lock:
+        return {"hits": _memo_stats["hits"], "misses": _memo_stats["misses"], "size": len(_memo)}
+
+
+def clear_identity_memo() -> None:
+    with _memo_lock:
+        _memo.clear()
+        _memo_stats["hits"] = 0
+        _memo_stats["misses"] = 0
@@ -0,0 +1,151 @@
+"""
+SignalCraft
+Copyright (c) 2026 Chris Menendez.
+All Rights Reserved.
+See LICENSE for permitted use.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, TextIO
+
+from ji_engine.utils.atomic_write import atomic_write_with
+from ji_engine.utils.canonical_json import canonical_jsonl_line, iter_canonical_array
+from ji_engine.utils.compression import logical_path, open_artifact
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+_READ_CHUNK_CHARS = 1 << 20
+_WHITESPACE = " \t\n\r"
+
+
+def is_jsonl_path(path: Path) -> bool:
+    return logical_path(Path(path)).suffix.lower() in JSONL_SUFFIXES
+
+
+def _skip_ws(buf: str, pos: int) -> int:
+    while pos < len(buf) and buf[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _iter_json_array(fh: TextIO, chunk_chars: int, source: str) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time. Only the current element (plus
+    one read chunk) is held in memory, instead of the whole file text and the whole list.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def _fill(minimum: int) -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        buf = buf[pos:]
+        pos = 0
+        chunk = fh.read(max(chunk_chars, minimum))
+        if not chunk:
+            eof = True
+            return False
+        buf += chunk
+        return True
+
+    while True:
+        pos = _skip_ws(buf, pos)
+        if pos < len(buf) or not _fill(0):
+            break
+    if pos >= len(buf) or buf[pos] != "[":
+        raise ValueError(f"{source}: expected a JSON array of records")
+    pos += 1
+    expect_value = True
+    first = True
+    while True:
+        pos = _skip_ws(buf, pos)
+        if pos >= len(buf):
+            if _fill(0):
+                continue
+            raise ValueError(f"{source}: unterminated JSON array")
+        char = buf[pos]
+        if char == "]" and (first or not expect_value):
+            return
+        if not expect_value:
+            if char != ",":
+                raise ValueError(f"{source}: expected ',' or ']' at offset {pos}")
+            pos += 1
+            expect_value = True
+            continue
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # Incomplete element at the end of the buffer: read more (growing, so a huge element
+            # is re-decoded a logarithmic number of times) and retry.
+            if _fill(len(buf)):
+                continue
+            raise
+        if end >= len(buf) and _fill(0):
+            # A number may continue past the chunk boundary; decode it again with more input.
+            continue
+        yield value
+        pos = end
+        expect_value = False
+        first = False
+
+
+def iter_json_records(path: Path, *, chunk_chars: int = _READ_CHUNK_CHARS) -> Iterator[Any]:
+    """
+    Stream the records of a job artifact: one per line for JSON Lines (`.jsonl`/`.ndjson`,
+    blank lines skipped), otherwise the elements of a top-level JSON array. Gzip/zstd-compressed
+    artifacts (`.json.gz`, `.jsonl.zst`, ...) are decompressed on the fly.
+    """
+    path = Path(path)
+    with open_artifact(path, "r") as fh:
+        if is_jsonl_path(path):
+            for lineno, line in enumerate(fh, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"{path}:{lineno}: invalid JSON Lines record: {exc}") from exc
+        else:
+            yield from _iter_json_array(fh, chunk_chars, str(path))
+
+
+def read_json_records(path: Path) -> List[Any]:
+    """All records of a `.json` array or `.jsonl` artifact as a list."""
+    return list(iter_json_records(path))
+
+
+def write_json_records(
+    path: Path, records: Iterable[Any], *, pretty: bool = False, jsonl: Optional[bool] = None
+) -> int:
+    """
+    Atomically write `records` (any iterable, consumed once) and return how many were written.
+    JSON Lines when `jsonl` is set or the path ends in `.jsonl`/`.ndjson`, one canonical compact
+    record per line; otherwise a canonical JSON array plus trailing newline, byte-identical to
+    `canonical_text(list(records), pretty=pretty)`. Records are serialized one at a time, so a
+    generator never has to be materialized.
+    """
+    path = Path(path)
+    use_jsonl = is_jsonl_path(path) if jsonl is None else jsonl
+    count = 0
+
+    def _counted() -> Iterator[Any]:
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    def _write(tmp_path: Path) -> None:
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            if use_jsonl:
+                fh.writelines(canonical_jsonl_line(record) for record in _counted())
+            else:
+                fh.writelines(iter_canonical_array(_counted(), pretty=pretty))
+                fh.write("\n")
+
+    atomic_write_with(path, _write)
+    return count
@@ -8,7 +8,9 @@ See LICENSE for permitted use.
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 STATE_ABBREVS = (
     "AL",
@@ -144,3 +146,119 @@ def normalize_location_guess(title: Optional[str], location: Optional[str]) -> D
         "is_us_or_remote_us_guess": False,
         "us_guess_reason": "none",
     }
+
+
+# ------------------------------------------------------------
+# Memoized normalization
+# ------------------------------------------------------------
+
+DEFAULT_LOCATION_CACHE_SIZE = 4096
+# Stand-in for a run of title words that cannot influence the guess. It is a single
+# non-word token, so it keeps kept words from becoming adjacent ("united ~ states").
+_TITLE_GAP = "~"
+_TITLE_SIGNAL_NEEDLES = ("remote", "united", "states", "u.s.", "usa")
+
+
+def _title_word_has_signal(word: str) -> bool:
+    if "US" in word:
+        return True
+    lowered = word.lower()
+    return any(needle in lowered for needle in _TITLE_SIGNAL_NEEDLES)
+
+
+def title_location_signal(title: Optional[str]) -> str:
+    """
+    Reduce a title to the words that can affect `normalize_location_guess`.
+
+    Words without remote/US markers collapse into a gap token, so
+    `normalize_location_guess(title_location_signal(t), loc) == normalize_location_guess(t, loc)`
+    while most titles share the same (tiny) signal and therefore the same cache entry.
+    """
+    words = _normalize_text(title).split(" ") if title else []
+    out: List[str] = []
+    for word in words:
+        if not word:
+            continue
+        if _title_word_has_signal(word):
+            out.append(word)
+        elif not out or out[-1] != _TITLE_GAP:
+            out.append(_TITLE_GAP)
+    return " ".join(out)
+
+
+def _job_title_location(job: Mapping[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    return job.get("title"), job.get("location") or job.get("locationName")
+
+
+class LocationNormalizer:
+    """
+    Bounded LRU in front of `normalize_location_guess`, keyed by (title signal, location).
+
+    Location strings repeat heavily across a board, so the classifier, scoring and
+    history stages share one instance (see `shared_location_normalizer`).
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_LOCATION_CACHE_SIZE) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, bool, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def normalize(self, title: Optional[str], location: Optional[str]) -> Dict[str, Any]:
+        signal = title_location_signal(title)
+        key = (signal, location or "")
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if cached is None:
+            result = normalize_location_guess(signal, location)
+            cached = (result["location_norm"], result["is_us_or_remote_us_guess"], result["us_guess_reason"])
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = cached
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        location_norm, is_us, reason = cached
+        return {
+            "location_norm": location_norm,
+            "is_us_or_remote_us_guess": is_us,
+            "us_guess_reason": reason,
+        }
+
+    def normalize_job(self, job: Mapping[str, Any]) -> Dict[str, Any]:
+        title, location = _job_title_location(job)
+        return self.normalize(title, location)
+
+    def normalize_jobs(self, jobs: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """Batch API: one normalization result per job, in input order."""
+        return [self.normalize_job(job) for job in jobs]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses, size = self.hits, self.misses, len(self._entries)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": size,
+            "maxsize": self.maxsize,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_SHARED_NORMALIZER = LocationNormalizer()
+
+
+def shared_location_normalizer() -> LocationNormalizer:
+    """Process-wide normalizer shared by classify, scoring and history."""
+    return _SHARED_NORMALIZER
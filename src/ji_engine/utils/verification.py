@@ -11,17 +11,15 @@ import hashlib
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from ji_engine.utils.fingerprint_cache import file_fingerprint
+
 
 def compute_sha256_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
 def compute_sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    return file_fingerprint(path)[0]
 
 
 def _rel_path_for_logical_key(base_dir: Path, logical_key: str, path: Path) -> str:
@@ -39,10 +37,11 @@ def build_verifiable_artifacts(base_dir: Path, artifacts: Dict[str, Path]) -> Di
         if not path.exists():
             continue
         rel_path = _rel_path_for_logical_key(base_dir, logical_key, path)
+        sha256, size = file_fingerprint(path)
         payload[logical_key] = {
             "path": rel_path,
-            "sha256": compute_sha256_file(path),
-            "bytes": path.stat().st_size,
+            "sha256": sha256,
+            "bytes": size,
             "hash_algo": "sha256",
         }
     return payload
@@ -13,6 +13,8 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 from ji_engine.ai.accounting import estimate_cost_usd, estimate_tokens, resolve_model_rates
+from ji_engine.ai.cache_store import open_ai_cache_store
+from ji_engine.ai.chat_client import ChatCompletionsClient
 from ji_engine.ai.insights_input import build_weekly_insights_input
 from ji_engine.config import DEFAULT_CANDIDATE_ID, REPO_ROOT, RUN_METADATA_DIR
 from ji_engine.run_repository import FileSystemRunRepository, RunRepository
@@ -164,12 +166,36 @@ def _should_use_cache(existing: Dict[str, Any], metadata: Dict[str, Any]) -> boo
     existing_meta = existing.get("metadata")
     if not isinstance(existing_meta, dict):
         return False
+    if existing_meta.get("model_call_failed"):
+        # Local fallback content from a failed call: ask the model again.
+        return False
     for key in ("cache_key", "structured_input_hash", "prompt_sha256", "prompt_version", "model", "provider"):
         if existing_meta.get(key) != metadata.get(key):
             return False
     return True
 
 
+def _model_insight_fields(
+    client: ChatCompletionsClient, prompt_text: str, insights_input: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Insight lists from the chat endpoint; only non-empty lists of strings replace the local ones.
+    None when the call failed.
+    """
+    try:
+        content = client.complete_json(
+            prompt_text, json.dumps(insights_input, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        )
+    except Exception as exc:
+        logger.warning("AI insights call failed; keeping the local insights: %r", exc)
+        return None
+    return {
+        name: value
+        for name in ("themes", "recommended_actions", "risks")
+        if isinstance(value := content.get(name), list) and value and all(isinstance(item, str) for item in value)
+    }
+
+
 def generate_insights(
     *,
     provider: str,
@@ -182,6 +208,7 @@ def generate_insights(
     ai_reason: str,
     model_name: str,
     candidate_id: str = DEFAULT_CANDIDATE_ID,
+    chat_client: Optional[ChatCompletionsClient] = None,
 ) -> Tuple[Path, Path, Dict[str, Any]]:
     prompt_text, prompt_sha = _load_prompt(prompt_path)
     prompt_text = prompt_text.strip()
@@ -248,6 +275,32 @@ def generate_insights(
             logger.info("AI insights cache hit (%s/%s).", provider, profile)
             return md_path, json_path, existing
 
+    # Across runs, identical inputs (same cache_key) reuse the stored insights instead of a new call.
+    store = open_ai_cache_store()
+    stored = store.get("insights", f"{provider}:{profile}", cache_key) if ai_enabled else None
+    if isinstance(stored, dict) and _should_use_cache(stored, metadata):
+        logger.info("AI insights cache store hit (%s/%s).", provider, profile)
+        # No model call happens for this run, so its accounting books zero tokens.
+        stored_accounting = (stored.get("metadata") or {}).get("ai_accounting") or {}
+        payload = {
+            **stored,
+            "metadata": {
+                **stored["metadata"],
+                "timestamp": metadata["timestamp"],
+                "ai_accounting": {
+                    **stored_accounting,
+                    "tokens_in": 0,
+                    "tokens_out": 0,
+                    "tokens_total": 0,
+                    "estimated_cost_usd": "0.000000",
+                },
+            },
+        }
+        json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        md_path.write_text(_render_markdown(payload), encoding="utf-8")
+        store.flush()
+        return md_path, json_path, payload
+
     if not ai_enabled:
         ai_accounting = {
             "model": model_name,
@@ -275,6 +328,10 @@ def generate_insights(
             reason="",
             metadata=metadata,
         )
+        model_fields: Optional[Dict[str, Any]] = {}
+        if chat_client is not None:
+            model_fields = _model_insight_fields(chat_client, prompt_text, insights_input_payload)
+            payload.update(model_fields or {})
         tokens_in = estimate_tokens(
             json.dumps(insights_input_payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
         )
@@ -306,6 +363,12 @@ def generate_insights(
             ),
         }
         payload["metadata"] = {**metadata, "ai_accounting": ai_accounting}
+        if model_fields is None:
+            # Fallback content is marked and kept out of the store so a later run retries the call.
+            payload["metadata"]["model_call_failed"] = True
+        else:
+            store.put("insights", f"{provider}:{profile}", cache_key, payload)
+        store.flush()
 
     json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     md_path.write_text(_render_markdown(payload), encoding="utf-8")
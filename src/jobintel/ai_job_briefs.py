@@ -10,12 +10,17 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ji_engine.ai.accounting import estimate_cost_usd, estimate_tokens, resolve_model_rates
+from ji_engine.ai.cache_store import AICacheStore, ai_cache_db_path, open_ai_cache_store
+from ji_engine.ai.chat_client import ChatCompletionsClient
+from ji_engine.ai.executor import AIBudget, AIExecutor
 from ji_engine.config import DEFAULT_CANDIDATE_ID, REPO_ROOT, RUN_METADATA_DIR, STATE_DIR
 from ji_engine.run_repository import FileSystemRunRepository, RunRepository
+from ji_engine.utils.compression import read_artifact_text
 from ji_engine.utils.content_fingerprint import content_fingerprint
 from ji_engine.utils.job_identity import job_identity
 from ji_engine.utils.time import utc_now_z
@@ -24,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 PROMPT_VERSION = "job_briefs_v1"
 PROMPT_PATH = REPO_ROOT / "docs" / "prompts" / "job_briefs_v1.md"
+BRIEF_LIST_FIELDS = ("why_fit", "gaps", "interview_focus", "resume_tweaks")
 
 
 def _utcnow_iso() -> str:
@@ -57,7 +63,7 @@ def _load_prompt(path: Path) -> Tuple[str, str]:
 
 def _load_ranked(path: Path) -> List[Dict[str, Any]]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(read_artifact_text(path))
     except FileNotFoundError:
         return []
     if isinstance(data, list):
@@ -86,10 +92,6 @@ def _token_estimate(text: str) -> int:
     return estimate_tokens(text)
 
 
-def _brief_cache_dir(profile: str) -> Path:
-    return STATE_DIR / "ai_job_briefs_cache" / profile
-
-
 def _cache_key(job: Dict[str, Any], profile_hash: str, model: str) -> str:
     parts = [
         _job_id(job),
@@ -101,21 +103,13 @@ def _cache_key(job: Dict[str, Any], profile_hash: str, model: str) -> str:
     return _sha256_bytes("|".join(parts).encode("utf-8"))
 
 
-def _load_cache(profile: str, key: str) -> Optional[Dict[str, Any]]:
-    path = _brief_cache_dir(profile) / f"{key}.json"
-    if not path.exists():
-        return None
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return None
-    return payload if isinstance(payload, dict) else None
+def _cache_store() -> AICacheStore:
+    return open_ai_cache_store(ai_cache_db_path(STATE_DIR), state_dir=STATE_DIR)
 
 
-def _save_cache(profile: str, key: str, payload: Dict[str, Any]) -> None:
-    path = _brief_cache_dir(profile) / f"{key}.json"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+def _cache_entry(job: Dict[str, Any], profile: str, key: str) -> Tuple[str, str]:
+    """Briefs live in the "briefs" namespace as (job_id, "<profile>.<cache key>")."""
+    return _job_id(job), f"{profile}.{key}"
 
 
 def _fit_bullets(job: Dict[str, Any]) -> List[str]:
@@ -168,6 +162,52 @@ def _brief_payload(job: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _model_brief_fields(
+    job: Dict[str, Any], client: ChatCompletionsClient, prompt_text: str, max_tokens: int
+) -> Optional[Dict[str, List[str]]]:
+    """Bullet lists from the chat endpoint; only non-empty lists of strings are taken. None when the call failed."""
+    fields = {name: job.get(name) for name in ("title", "apply_url", "score", "role_band", "fit_signals", "jd_text")}
+    try:
+        content = client.complete_json(
+            prompt_text, json.dumps(fields, sort_keys=True, ensure_ascii=False), max_tokens=max_tokens
+        )
+    except Exception as exc:
+        logger.warning("AI job brief call failed for %s; keeping the local brief: %r", _job_id(job), exc)
+        return None
+    return {
+        name: value
+        for name in BRIEF_LIST_FIELDS
+        if isinstance(value := content.get(name), list) and value and all(isinstance(item, str) for item in value)
+    }
+
+
+def _generate_brief(
+    job: Dict[str, Any],
+    profile: str,
+    key: str,
+    ai_enabled: bool,
+    chat_client: Optional[ChatCompletionsClient] = None,
+    prompt_text: str = "",
+    max_tokens: int = 0,
+) -> Dict[str, Any]:
+    """
+    One brief (the model call when live) plus its cache write; runs on an AIExecutor worker.
+    A brief that fell back to local content because the call failed is not cached, so the next
+    run asks the model again.
+    """
+    brief = _brief_payload(job)
+    if not ai_enabled:
+        for name in BRIEF_LIST_FIELDS:
+            brief[name] = []
+    elif chat_client is not None:
+        fields = _model_brief_fields(job, chat_client, prompt_text, max_tokens)
+        if fields is None:
+            return brief
+        brief.update(fields)
+    _cache_store().put("briefs", *_cache_entry(job, profile, key), brief)
+    return brief
+
+
 def generate_job_briefs(
     *,
     provider: str,
@@ -183,6 +223,9 @@ def generate_job_briefs(
     prompt_path: Path = PROMPT_PATH,
     profile_path: Path = Path("data/candidate_profile.json"),
     candidate_id: str = DEFAULT_CANDIDATE_ID,
+    max_workers: Optional[int] = None,
+    max_cost_usd: Optional[str] = None,
+    chat_client: Optional[ChatCompletionsClient] = None,
 ) -> Tuple[Path, Path, Dict[str, Any]]:
     prompt_text, prompt_sha = _load_prompt(prompt_path)
     prompt_text = prompt_text.strip()
@@ -210,39 +253,55 @@ def generate_job_briefs(
     json_path = run_dir / f"ai_job_briefs.{profile}.json"
     md_path = run_dir / f"ai_job_briefs.{profile}.md"
 
-    briefs: List[Dict[str, Any]] = []
+    # Budget and cache decisions are made here, in ranked order, exactly as a serial loop would make
+    # them; only the generation calls fan out. A job whose key is already being generated in this run
+    # shares that call (and counts as a cache hit, as it would once the first copy had been saved).
+    budget = AIBudget(
+        max_tokens=total_budget,
+        max_cost_usd=max_cost_usd,
+        input_per_1k=rates["input_per_1k"],
+        output_per_1k=rates["output_per_1k"],
+    )
+    slots: List[Union[Dict[str, Any], Future]] = []
     cache_hits = 0
-    used_tokens = 0
     skipped_budget = 0
-
-    for job in top_jobs:
-        jd_text = job.get("jd_text") or ""
-        estimated_tokens = _token_estimate(jd_text if isinstance(jd_text, str) else "")
-        if estimated_tokens > max_tokens_per_job:
-            estimated_tokens = max_tokens_per_job
-        if used_tokens + estimated_tokens > total_budget:
-            skipped_budget += 1
-            continue
-
-        key = _cache_key(job, profile_hash, model_name)
-        cached = _load_cache(profile, key)
-        if cached:
-            cache_hits += 1
-            briefs.append(cached)
-            continue
-
-        if ai_enabled:
-            brief = _brief_payload(job)
-        else:
-            brief = _brief_payload(job)
-            brief["why_fit"] = []
-            brief["gaps"] = []
-            brief["interview_focus"] = []
-            brief["resume_tweaks"] = []
-
-        _save_cache(profile, key, brief)
-        briefs.append(brief)
-        used_tokens += estimated_tokens
+    store = _cache_store()
+    keys = [_cache_key(job, profile_hash, model_name) for job in top_jobs]
+    cached_briefs = store.get_many(
+        "briefs", (_cache_entry(job, profile, key) for job, key in zip(top_jobs, keys, strict=True))
+    )
+
+    # Keys generated in this run, finished or not; the executor only coalesces calls still in flight.
+    submitted: Dict[str, Future] = {}
+    with AIExecutor(max_workers) as executor:
+        for job, key in zip(top_jobs, keys, strict=True):
+            jd_text = job.get("jd_text") or ""
+            estimated_tokens = _token_estimate(jd_text if isinstance(jd_text, str) else "")
+            if estimated_tokens > max_tokens_per_job:
+                estimated_tokens = max_tokens_per_job
+            if not budget.fits(estimated_tokens):
+                skipped_budget += 1
+                continue
+
+            if key in submitted:
+                cache_hits += 1
+                slots.append(submitted[key])
+                continue
+            cached = cached_briefs.get(_cache_entry(job, profile, key))
+            if isinstance(cached, dict) and cached:
+                cache_hits += 1
+                slots.append(cached)
+                continue
+
+            budget.try_reserve(estimated_tokens)
+            submitted[key] = executor.submit(
+                key, _generate_brief, job, profile, key, ai_enabled, chat_client, prompt_text, max_tokens_per_job
+            )
+            slots.append(submitted[key])
+        briefs = [slot.result() if isinstance(slot, Future) else slot for slot in slots]
+    store.flush()
+    logger.info("AI job briefs (%s/%s): %s", provider, profile, executor.stats())
+    used_tokens = budget.tokens_in
 
     status = "ok" if ai_enabled else "disabled"
     tokens_in = used_tokens if ai_enabled else 0
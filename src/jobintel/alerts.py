@@ -13,7 +13,8 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
-from ji_engine.utils.job_identity import job_identity
+from ji_engine.utils.diff_engine import JobDiff
+from ji_engine.utils.job_identity import identities_for
 
 
 def _normalize(value: Any) -> str:
@@ -39,10 +40,14 @@ def _job_url(job: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def build_last_seen(jobs: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+def build_last_seen(
+    jobs: Iterable[Dict[str, Any]], identities: Optional[List[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    jobs = list(jobs)
+    if identities is None:
+        identities = identities_for(jobs, mode="legacy")
     index: Dict[str, Dict[str, Any]] = {}
-    for job in jobs:
-        jid = job_identity(job)
+    for job, jid in zip(jobs, identities, strict=True):
         index[jid] = {
             "score": job.get("score"),
             "title_hash": stable_title_location_hash(job),
@@ -51,6 +56,16 @@ def build_last_seen(jobs: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]
     return index
 
 
+def _legacy_identities(jobs: List[Dict[str, Any]]) -> List[str]:
+    return identities_for(jobs, mode="legacy")
+
+
+def current_last_seen(diff: JobDiff) -> Dict[str, Dict[str, Any]]:
+    """last_seen index of the diff's current side, shared by alerts and the last_seen.json write."""
+    identities = diff.current("legacy_identities", _legacy_identities)
+    return diff.current("last_seen", lambda jobs: build_last_seen(jobs, identities))
+
+
 def load_last_seen(path: Path) -> Dict[str, Dict[str, Any]]:
     if not path.exists():
         return {}
@@ -83,17 +98,21 @@ def compute_alerts(
     jobs: Iterable[Dict[str, Any]],
     prev_index: Dict[str, Dict[str, Any]],
     score_delta: int = 10,
+    *,
+    diff: Optional[JobDiff] = None,
 ) -> Dict[str, Any]:
-    current_jobs = list(jobs)
-    current_index = build_last_seen(current_jobs)
+    """Alerts for `jobs` against `prev_index`; pass the run's `JobDiff` over `jobs` to share its current side."""
+    shared = diff if diff is not None else JobDiff([], list(jobs))
+    current_jobs = shared.curr_jobs
+    current_ids = shared.current("legacy_identities", _legacy_identities)
+    current_index = current_last_seen(shared)
 
     new_jobs: List[Dict[str, Any]] = []
     removed_jobs: List[str] = []
     score_changes: List[Dict[str, Any]] = []
     title_location_changes: List[Dict[str, Any]] = []
 
-    for job in current_jobs:
-        jid = job_identity(job)
+    for job, jid in zip(current_jobs, current_ids, strict=True):
         prev = prev_index.get(jid)
         if prev is None:
             new_jobs.append(
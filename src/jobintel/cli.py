@@ -19,6 +19,7 @@ from typing import Dict, List, Optional
 from ji_engine.config import DEFAULT_CANDIDATE_ID, RUN_METADATA_DIR, candidate_run_metadata_dir, sanitize_candidate_id
 from ji_engine.providers.openai_provider import CAREERS_SEARCH_URL
 from ji_engine.providers.registry import load_providers_config, resolve_provider_ids
+from ji_engine.run_repository import FileSystemRunRepository
 
 from .safety.diff import build_safety_diff_report, load_jobs_from_path, render_summary, write_report
 from .snapshots.refresh import refresh_snapshot
@@ -278,6 +279,37 @@ def _add_run_daily_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _runs_list(args: argparse.Namespace) -> int:
+    try:
+        candidate_id = sanitize_candidate_id(args.candidate_id)
+        page = FileSystemRunRepository().query_runs(
+            candidate_id,
+            status=args.status,
+            provider=args.provider,
+            profile=args.profile,
+            since=args.since,
+            until=args.until,
+            git_sha=args.git_sha,
+            limit=args.limit,
+            cursor=args.cursor,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    if args.json:
+        print(json.dumps(page, sort_keys=True))
+        return 0
+    for run in page["runs"]:
+        counts = run["diff_counts"]
+        print(
+            f"{run['run_id']} status={run['status'] or 'unknown'} providers={','.join(run['providers']) or '-'} "
+            f"profiles={','.join(run['profiles']) or '-'} new={counts['new']} changed={counts['changed']} "
+            f"removed={counts['removed']} git_sha={run['git_sha'] or '-'}"
+        )
+    if page["next_cursor"]:
+        print(f"next_cursor={page['next_cursor']}")
+    return 0
+
+
 def _safety_diff(args: argparse.Namespace) -> int:
     baseline_path = Path(args.baseline)
     candidate_path = Path(args.candidate)
@@ -349,6 +381,21 @@ def build_parser() -> argparse.ArgumentParser:
     _add_run_daily_args(run_daily_cmd)
     run_daily_cmd.set_defaults(func=_run_daily)
 
+    runs_cmd = subparsers.add_parser("runs", help="Query the run index")
+    runs_sub = runs_cmd.add_subparsers(dest="runs_command", required=True)
+    runs_list = runs_sub.add_parser("list", help="List runs newest first, with optional filters")
+    runs_list.add_argument("--candidate-id", default=DEFAULT_CANDIDATE_ID)
+    runs_list.add_argument("--status", help="Run status, e.g. success or failed.")
+    runs_list.add_argument("--provider", help="Only runs that included this provider.")
+    runs_list.add_argument("--profile", help="Only runs that included this profile.")
+    runs_list.add_argument("--since", help="Inclusive lower bound on run timestamp (ISO-8601).")
+    runs_list.add_argument("--until", help="Exclusive upper bound on run timestamp (ISO-8601).")
+    runs_list.add_argument("--git-sha", help="Git sha or sha prefix.")
+    runs_list.add_argument("--limit", type=int, default=50)
+    runs_list.add_argument("--cursor", help="next_cursor from a previous page.")
+    runs_list.add_argument("--json", action="store_true", help="Emit JSON output")
+    runs_list.set_defaults(func=_runs_list)
+
     safety_cmd = subparsers.add_parser("safety", help="Semantic safety net tooling")
     safety_sub = safety_cmd.add_subparsers(dest="safety_command", required=True)
 
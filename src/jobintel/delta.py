@@ -10,7 +10,9 @@ from __future__ import annotations
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ji_engine.utils.diff_engine import JobDiff, KeyedDiff
 
 FIELDS = ("title", "location", "team", "url")
 MAX_ID_LIST = 20
@@ -76,27 +78,33 @@ def _cap_list(values: Iterable[str], limit: int = MAX_ID_LIST) -> List[str]:
     return sorted_vals[:limit]
 
 
-def compute_delta(
-    current_labeled_path: Optional[Path],
-    current_ranked_path: Optional[Path],
-    baseline_labeled_path: Optional[Path],
-    baseline_ranked_path: Optional[Path],
+def _fields_fingerprint(job: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+    fields = extract_fields(job)
+    return tuple(fields[field] for field in FIELDS)
+
+
+def delta_view(diff: JobDiff, provider: str) -> KeyedDiff:
+    return diff.keyed(f"delta:{provider}", lambda job: extract_job_id(job, provider), _fields_fingerprint)
+
+
+def _empty_change_fields() -> Dict[str, int]:
+    return dict.fromkeys(FIELDS, 0)
+
+
+def render_delta(
+    diff: JobDiff,
+    *,
     provider: str,
     profile: str,
+    labeled_total: int,
 ) -> Dict[str, Any]:
-    current_labeled = _load_list(current_labeled_path)
-    current_ranked = _load_list(current_ranked_path)
-    baseline_ranked = _load_list(baseline_ranked_path)
-
-    labeled_total = len(current_labeled)
-    ranked_total = len(current_ranked)
-
-    if not baseline_ranked:
+    """Delta summary for one provider/profile from a `JobDiff` (baseline = prev, current ranked = curr)."""
+    if not diff.prev_jobs:
         return {
             "provider": provider,
             "profile": profile,
             "labeled_total": labeled_total,
-            "ranked_total": ranked_total,
+            "ranked_total": len(diff.curr_jobs),
             "new_job_count": 0,
             "removed_job_count": 0,
             "changed_job_count": 0,
@@ -104,47 +112,53 @@ def compute_delta(
             "new_job_ids": [],
             "removed_job_ids": [],
             "changed_job_ids": [],
-            "change_fields": {"title": 0, "location": 0, "team": 0, "url": 0},
+            "change_fields": _empty_change_fields(),
         }
 
-    current_map = {extract_job_id(job, provider): job for job in current_ranked}
-    baseline_map = {extract_job_id(job, provider): job for job in baseline_ranked}
-
-    current_ids = set(current_map)
-    baseline_ids = set(baseline_map)
-
-    new_ids = current_ids - baseline_ids
-    removed_ids = baseline_ids - current_ids
-    intersect_ids = current_ids & baseline_ids
-
-    change_fields = {"title": 0, "location": 0, "team": 0, "url": 0}
-    changed_ids: List[str] = []
-    unchanged_ids: List[str] = []
-
-    for job_id in sorted(intersect_ids):
-        current_fields = extract_fields(current_map[job_id])
-        baseline_fields = extract_fields(baseline_map[job_id])
-        changed = False
-        for field in FIELDS:
-            if current_fields.get(field) != baseline_fields.get(field):
+    view = delta_view(diff, provider)
+    change_fields = _empty_change_fields()
+    for job_id in view.changed:
+        baseline_fields, current_fields = view.fingerprints[job_id]
+        for field, before, after in zip(FIELDS, baseline_fields, current_fields, strict=True):
+            if before != after:
                 change_fields[field] += 1
-                changed = True
-        if changed:
-            changed_ids.append(job_id)
-        else:
-            unchanged_ids.append(job_id)
 
     return {
         "provider": provider,
         "profile": profile,
         "labeled_total": labeled_total,
-        "ranked_total": ranked_total,
-        "new_job_count": len(new_ids),
-        "removed_job_count": len(removed_ids),
-        "changed_job_count": len(changed_ids),
-        "unchanged_job_count": len(unchanged_ids),
-        "new_job_ids": _cap_list(new_ids),
-        "removed_job_ids": _cap_list(removed_ids),
-        "changed_job_ids": _cap_list(changed_ids),
+        "ranked_total": len(diff.curr_jobs),
+        "new_job_count": len(view.added),
+        "removed_job_count": len(view.removed),
+        "changed_job_count": len(view.changed),
+        "unchanged_job_count": len(view.unchanged),
+        "new_job_ids": _cap_list(view.added),
+        "removed_job_ids": _cap_list(view.removed),
+        "changed_job_ids": _cap_list(view.changed),
         "change_fields": change_fields,
     }
+
+
+def compute_delta(
+    current_labeled_path: Optional[Path],
+    current_ranked_path: Optional[Path],
+    baseline_labeled_path: Optional[Path],
+    baseline_ranked_path: Optional[Path],
+    provider: str,
+    profile: str,
+    *,
+    diff: Optional[JobDiff] = None,
+) -> Dict[str, Any]:
+    """
+    Delta summary for the ranked files. `diff` (the run's `JobDiff` for this provider/profile) is
+    rendered as-is when its prior side is the baseline ranked list; otherwise the files are diffed here.
+    """
+    baseline = _load_list(baseline_ranked_path)
+    if diff is None or diff.prev_jobs != baseline:
+        diff = JobDiff(baseline, _load_list(current_ranked_path))
+    return render_delta(
+        diff,
+        provider=provider,
+        profile=profile,
+        labeled_total=len(_load_list(current_labeled_path)),
+    )
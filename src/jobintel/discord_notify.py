@@ -15,6 +15,7 @@ import urllib.request
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
+from ji_engine.utils.compression import read_artifact_text
 from ji_engine.utils.time import utc_now_z
 
 logger = logging.getLogger(__name__)
@@ -38,7 +39,7 @@ def _utcnow_iso() -> str:
 
 def _load_ranked(path: Path) -> list[dict]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(read_artifact_text(path))
     except FileNotFoundError:
         return []
     if isinstance(data, list):
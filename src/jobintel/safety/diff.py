@@ -14,7 +14,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from ji_engine.utils.job_identity import job_identity, normalize_job_text, normalize_job_url
+from ji_engine.utils.compression import read_artifact_text, resolve_artifact_path
+from ji_engine.utils.job_identity import normalize_job_text, normalize_job_url, stored_job_identity
 
 COMPLETENESS_FIELDS = (
     "job_id",
@@ -44,7 +45,7 @@ class NormalizedJob:
 
 
 def _read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(read_artifact_text(path))
 
 
 def _stringify(value: Any) -> str:
@@ -77,7 +78,7 @@ def _effective_job_id(job: Dict[str, Any]) -> str:
     raw = job.get("job_id")
     if isinstance(raw, str) and raw.strip():
         return raw.strip()
-    return job_identity(job, mode="provider")
+    return stored_job_identity(job)
 
 
 def _fingerprint_fields(job: Dict[str, Any]) -> Dict[str, str]:
@@ -199,7 +200,7 @@ def load_jobs_from_path(
                 raise ValueError(f"run report at {report_path} is not an object")
             return _load_jobs_from_run_report(report_path, report, provider=provider, profile=profile)
         raise ValueError(f"directory {path} does not contain run_report.json")
-    if not path.exists():
+    if not resolve_artifact_path(path).exists():
         raise ValueError(f"file not found: {path}")
     payload = _read_json(path)
     if isinstance(payload, list):
@@ -3,8 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from ji_engine.ai.augment import compute_content_hash
-from ji_engine.ai.cache import FileSystemAICache
+from ji_engine.ai.augment import compute_content_hash, default_augment_cache
 from ji_engine.ai.extract_rules import RULES_VERSION
 from ji_engine.ai.provider import AIProvider, StubProvider
 from ji_engine.utils.atomic_write import atomic_write_text
@@ -18,14 +17,7 @@ class MinimalProvider(AIProvider):
 
 
 def _patch_cache(monkeypatch, tmp_path: Path):
-    from ji_engine.ai import cache as cache_mod
-
-    class _TmpCache(cache_mod.FileSystemAICache):
-        def __init__(self, root: Path | None = None):
-            super().__init__(root=tmp_path / "ai_cache")
-
-    monkeypatch.setattr("ji_engine.ai.cache.FileSystemAICache", _TmpCache)
-    monkeypatch.setattr("ji_engine.ai.augment.FileSystemAICache", _TmpCache)
+    monkeypatch.setenv("JOBINTEL_AI_CACHE_DB", str(tmp_path / "ai_cache.sqlite3"))
 
 
 def test_run_ai_augment_backfills_skills_from_rules(monkeypatch, tmp_path: Path) -> None:
@@ -78,7 +70,7 @@ def test_cached_ai_payload_upgraded_to_new_rules(monkeypatch, tmp_path: Path) ->
     }
     chash = compute_content_hash(job)
     job_id = job["apply_url"]
-    cache = FileSystemAICache(root=tmp_path / "ai_cache")
+    cache = default_augment_cache()
     cache.put(
         job_id,
         chash,
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+from pathlib import Path
+
+from ji_engine.ai.cache_store import (
+    AICacheStore,
+    LegacyAICacheTier,
+    S3CacheTier,
+    ai_cache_counter_delta,
+    read_ai_cache_counters,
+)
+
+
+class _FakeS3:
+    def __init__(self) -> None:
+        self.objects: dict = {}
+        self.gets = 0
+        self.lock = threading.Lock()
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        with self.lock:
+            self.gets += 1
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes) -> None:
+        with self.lock:
+            self.objects[(Bucket, Key)] = Body
+
+
+def test_store_batches_by_namespace_and_persists_counters(tmp_path: Path) -> None:
+    db = tmp_path / "ai_cache.sqlite3"
+    store = AICacheStore(db)
+    store.put_many("augment", [("job/1", "h1", {"summary": "a"}), ("job/2", "h2", {"summary": "b"})])
+    store.put("briefs", "job/1", "cs.h1", {"job_id": "job/1"})
+
+    found = store.get_many("augment", [("job/1", "h1"), ("job/2", "h2"), ("job/3", "h3"), ("job/1", "h1")])
+    assert found == {("job/1", "h1"): {"summary": "a"}, ("job/2", "h2"): {"summary": "b"}}
+    assert store.get("briefs", "job/1", "h1") is None
+    assert store.namespace("briefs").get("job/1", "cs.h1") == {"job_id": "job/1"}
+    assert store.entry_counts() == {"augment": 2, "briefs": 1}
+
+    before = read_ai_cache_counters(db)
+    store.flush()
+    after = read_ai_cache_counters(db)
+    delta = ai_cache_counter_delta(before, after)
+    assert (delta["augment"]["hits"], delta["augment"]["misses"], delta["augment"]["puts"]) == (2, 1, 2)
+    assert (delta["briefs"]["hits"], delta["briefs"]["misses"], delta["briefs"]["puts"]) == (1, 1, 1)
+    store.close()
+    # Counters survive the process: a fresh store adds to them rather than starting over.
+    AICacheStore(db).close()
+    assert read_ai_cache_counters(db) == after
+
+
+def test_store_evicts_expired_then_least_recently_used(tmp_path: Path) -> None:
+    store = AICacheStore(tmp_path / "ai_cache.sqlite3", max_entries=2, ttl_days=1)
+    store.put_many("augment", [(f"job{idx}", "h", {"n": idx}) for idx in range(4)])
+    conn = store._connect()
+    with conn:
+        conn.execute("UPDATE ai_cache SET accessed_at = accessed_at - 2 * 86400 WHERE job_id = 'job0'")
+        conn.execute("UPDATE ai_cache SET accessed_at = accessed_at - 60 WHERE job_id = 'job1'")
+    # An expired entry reads as a miss even before eviction runs.
+    assert store.get("augment", "job0", "h") is None
+    store.get("augment", "job2", "h")
+
+    assert store.evict() == 2
+    assert sorted(job_id for job_id, _ in store.get_many("augment", [(f"job{i}", "h") for i in range(4)])) == [
+        "job2",
+        "job3",
+    ]
+    stats = store.stats()["augment"]
+    assert (stats["expired"], stats["evicted"]) == (1, 2)
+    store.close()
+
+
+def test_store_reads_through_and_writes_behind_to_s3(tmp_path: Path) -> None:
+    s3 = _FakeS3()
+    tier = S3CacheTier("bucket", prefix="jobintel", client=s3)
+    writer = AICacheStore(tmp_path / "a.sqlite3", remote=tier)
+    writer.put_many("insights", [("openai:cs", f"k{idx}", {"n": idx}) for idx in range(5)])
+    writer.flush()
+    assert sorted(key for _, key in s3.objects) == [
+        f"jobintel/ai_cache/insights/openai_cs.k{idx}.json" for idx in range(5)
+    ]
+    assert writer.stats()["insights"]["remote_puts"] == 5
+    writer.close()
+
+    reader = AICacheStore(tmp_path / "b.sqlite3", remote=tier)
+    keys = [("openai:cs", f"k{idx}") for idx in range(6)]
+    assert len(reader.get_many("insights", keys)) == 5
+    gets = s3.gets
+    # Remote hits were copied into the local tier; only the true miss goes back to S3.
+    assert len(reader.get_many("insights", keys)) == 5
+    assert s3.gets == gets + 1
+    stats = reader.stats()["insights"]
+    assert (stats["remote_hits"], stats["hits"], stats["misses"]) == (5, 5, 2)
+    reader.close()
+
+
+def test_store_reads_pre_store_layouts_and_backfills(tmp_path: Path) -> None:
+    file_root = tmp_path / "data" / "ai_cache"
+    file_root.mkdir(parents=True)
+    (file_root / "https___a.h1.json").write_text(json.dumps({"summary": "augment"}), encoding="utf-8")
+    (file_root / "https___b.h2.json").write_text(json.dumps({"application_kit": {"x": 1}}), encoding="utf-8")
+    briefs_root = tmp_path / "state" / "ai_job_briefs_cache"
+    (briefs_root / "cs").mkdir(parents=True)
+    (briefs_root / "cs" / "k1.json").write_text(json.dumps({"job_id": "job/1"}), encoding="utf-8")
+    s3 = _FakeS3()
+    s3.objects[("bucket", "jobintel/ai_cache/job_3.h3.json")] = json.dumps({"application_kit": {"y": 2}}).encode()
+    tier = S3CacheTier("bucket", prefix="jobintel", client=s3)
+    legacy = LegacyAICacheTier(file_root=file_root, briefs_root=briefs_root, s3=tier)
+    store = AICacheStore(tmp_path / "ai_cache.sqlite3", remote=tier, legacy=legacy)
+
+    assert store.get("augment", "https___a", "h1") == {"summary": "augment"}
+    assert store.get("application_kit", "https___b", "h2") == {"application_kit": {"x": 1}}
+    assert store.get("application_kit", "job:3", "h3") == {"application_kit": {"y": 2}}
+    assert store.get("briefs", "job/1", "cs.k1") == {"job_id": "job/1"}
+    # Augment and application kits shared one flat layout; each namespace only takes its own shape.
+    assert store.get("augment", "https___b", "h2") is None
+    assert store.get("application_kit", "https___a", "h1") is None
+    assert store.stats()["augment"]["legacy_hits"] == 1
+    assert store.stats()["application_kit"]["legacy_hits"] == 2
+
+    # Hits were backfilled into SQLite: they survive the old files going away.
+    for path in (file_root / "https___a.h1.json", briefs_root / "cs" / "k1.json"):
+        path.unlink()
+    s3.objects.clear()
+    assert store.get("augment", "https___a", "h1") == {"summary": "augment"}
+    assert store.get("application_kit", "job:3", "h3") == {"application_kit": {"y": 2}}
+    assert store.get("briefs", "job/1", "cs.k1") == {"job_id": "job/1"}
+    assert store.stats()["briefs"]["hits"] == 1
+    store.close()
+
+
+def test_ttl_counts_from_last_read(tmp_path: Path) -> None:
+    store = AICacheStore(tmp_path / "ai_cache.sqlite3", ttl_days=1)
+    store.put_many("augment", [("old-but-used", "h", {"n": 1}), ("unused", "h", {"n": 2})])
+    conn = store._connect()
+    with conn:
+        conn.execute("UPDATE ai_cache SET created_at = created_at - 90 * 86400")
+        conn.execute("UPDATE ai_cache SET accessed_at = accessed_at - 2 * 86400 WHERE job_id = 'unused'")
+    assert store.get("augment", "old-but-used", "h") == {"n": 1}
+    assert store.get("augment", "unused", "h") is None
+    assert store.evict() == 1
+    assert store.entry_counts() == {"augment": 1}
+    store.close()
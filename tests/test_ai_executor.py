@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from ji_engine.ai.cache import FileSystemAICache
+from ji_engine.ai.executor import AIBudget, AIExecutor
+from ji_engine.ai.provider import LatencyStubProvider
+from jobintel import ai_job_briefs
+
+
+def test_budget_reservations_never_overshoot_across_threads() -> None:
+    budget = AIBudget(max_tokens=1000, max_cost_usd="0.050000", input_per_1k="0.1", output_per_1k="0")
+    granted: list = []
+
+    def _worker() -> None:
+        for _ in range(50):
+            if budget.try_reserve(7):
+                granted.append(7)
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 0.05 USD at 0.1 USD/1k tokens caps the run at 500 tokens, below the 1000-token ceiling.
+    assert sum(granted) == budget.tokens_used == 497
+    assert budget.rejected == 400 - len(granted)
+    assert not budget.fits(7)
+    budget.release(7)
+    assert budget.fits(7)
+
+
+def test_executor_bounds_concurrency_and_coalesces_identical_keys() -> None:
+    active = [0]
+    peak = [0]
+    calls: list = []
+    lock = threading.Lock()
+
+    def _call(key: str) -> str:
+        with lock:
+            calls.append(key)
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return key.upper()
+
+    keys = ["a", "b", "a", "c", "d", "b", "e", "f"]
+    with AIExecutor(max_workers=3) as executor:
+        futures = [executor.submit(key, _call, key) for key in keys]
+        results = [future.result() for future in futures]
+    assert results == [key.upper() for key in keys]
+    assert sorted(calls) == ["a", "b", "c", "d", "e", "f"]
+    assert peak[0] <= 3
+    assert executor.stats() == {"max_workers": 3, "calls": 6, "coalesced": 2}
+
+
+def test_executor_drops_finished_futures() -> None:
+    release = threading.Event()
+    with AIExecutor(max_workers=2) as executor:
+        first = executor.submit("a", release.wait, 5)
+        assert executor.inflight("a")
+        assert executor.submit("a", release.wait, 5) is first
+        release.set()
+        first.result()
+        # Done-callbacks run just after result() wakes up; give the worker a moment to drop it.
+        for _ in range(200):
+            if not executor.inflight("a"):
+                break
+            time.sleep(0.005)
+        # Only in-flight keys coalesce; a finished call is neither held nor reused.
+        assert executor._futures == {}
+        assert executor.submit("a", lambda: "again").result() == "again"
+    assert executor.stats() == {"max_workers": 2, "calls": 2, "coalesced": 1}
+    assert executor._futures == {}
+
+
+def test_streamed_augment_leaves_no_results_on_the_executor(tmp_path: Path, monkeypatch) -> None:
+    import scripts.run_ai_augment as augment
+
+    executors: list = []
+
+    class _RecordingExecutor(AIExecutor):
+        def __init__(self, max_workers=None) -> None:
+            super().__init__(max_workers)
+            executors.append(self)
+
+    monkeypatch.setattr(augment, "AIExecutor", _RecordingExecutor)
+    monkeypatch.setattr(augment, "_STREAM_CHUNK", 4)
+    jobs = [{"title": f"Role {idx}", "jd_text": "Python", "apply_url": f"u{idx}"} for idx in range(10)]
+    input_path = tmp_path / "in.jsonl"
+    input_path.write_text("".join(json.dumps(job) + "\n" for job in jobs), encoding="utf-8")
+    argv = ["--in_path", str(input_path), "--out_path", str(tmp_path / "out.jsonl"), "--max_workers", "3"]
+    cache = FileSystemAICache(root=tmp_path / "cache")
+    assert augment.main(argv, provider=LatencyStubProvider(latency_ms=1), cache=cache) == 0
+    (executor,) = executors
+    assert executor.stats()["calls"] == 10
+    assert executor._futures == {}
+
+
+def test_concurrent_augment_matches_serial_output(tmp_path: Path, monkeypatch) -> None:
+    from scripts.run_ai_augment import main
+
+    jobs = [
+        {
+            "title": f"Role {idx}",
+            "jd_text": f"Requirements: Python. Team {idx}.",
+            "location": "SF",
+            "apply_url": f"u{idx}",
+        }
+        for idx in range(6)
+    ]
+    jobs.append(dict(jobs[2]))
+    input_path = tmp_path / "openai_enriched_jobs.json"
+    input_path.write_text(json.dumps(jobs), encoding="utf-8")
+
+    outputs = {}
+    for workers in (1, 4):
+        out_path = tmp_path / f"out.{workers}.json"
+        cache = FileSystemAICache(root=tmp_path / f"cache.{workers}")
+        argv = ["--in_path", str(input_path), "--out_path", str(out_path), "--max_workers", str(workers)]
+        assert main(argv, provider=LatencyStubProvider(latency_ms=20), cache=cache) == 0
+        outputs[workers] = out_path.read_bytes()
+    assert outputs[1] == outputs[4]
+    assert [job["apply_url"] for job in json.loads(outputs[4])] == [job["apply_url"] for job in jobs]
+
+
+def test_concurrent_job_briefs_keep_serial_budget_and_cache_semantics(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ai_job_briefs, "RUN_METADATA_DIR", tmp_path / "state" / "runs")
+    ranked = [{"job_id": str(idx), "title": f"Role {idx}", "score": 90 - idx, "jd_text": "x" * 400} for idx in range(8)]
+    ranked.insert(3, dict(ranked[1]))
+    ranked_path = tmp_path / "ranked.json"
+    ranked_path.write_text(json.dumps(ranked), encoding="utf-8")
+    prompt = tmp_path / "prompt.md"
+    prompt.write_text("prompt", encoding="utf-8")
+
+    payloads = {}
+    for workers in (1, 4):
+        monkeypatch.setattr(ai_job_briefs, "STATE_DIR", tmp_path / f"state.{workers}")
+        _, _, payload = ai_job_briefs.generate_job_briefs(
+            provider="openai",
+            profile="cs",
+            ranked_path=ranked_path,
+            run_id=f"2026-01-22T00:00:0{workers}Z",
+            max_jobs=9,
+            max_tokens_per_job=100,
+            total_budget=500,
+            ai_enabled=True,
+            ai_reason="",
+            model_name="stub",
+            prompt_path=prompt,
+            max_workers=workers,
+        )
+        payload["metadata"].pop("timestamp")
+        payloads[workers] = payload
+    assert payloads[1] == payloads[4]
+    meta = payloads[4]["metadata"]
+    # Five fresh briefs fit the 500-token budget; the duplicate of job 1 is served from the in-flight call.
+    assert [brief["job_id"] for brief in payloads[4]["briefs"]] == ["0", "1", "2", "1", "3", "4"]
+    assert (meta["cache_hits"], meta["estimated_tokens_used"], meta["skipped_due_to_budget"]) == (1, 500, 3)
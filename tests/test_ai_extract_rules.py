@@ -155,3 +155,47 @@ def test_boilerplate_skills_do_not_leak_into_extraction() -> None:
     assert "Kubernetes" not in out["skills_required"]
     assert "Security" not in out["skills_required"]
     assert "Security clearance required" not in out["red_flags"]
+
+
+def _raw_pattern_skills(text: str) -> list[str]:
+    """Reference: evaluate the raw pattern tables one `re.search` at a time."""
+    import re
+
+    def _any(pats: list[str]) -> bool:
+        return any(re.search(p, text, flags=re.IGNORECASE) for p in pats)
+
+    hw = _any(rules_mod._HW_TRIGGER_PATTERNS)
+    cs = _any(rules_mod._CS_TRIGGER_PATTERNS)
+    out = []
+    for skill, pats in rules_mod._SKILL_PATTERNS:
+        if skill in rules_mod._GATED_HW_SKILLS and not hw:
+            continue
+        if skill in rules_mod._GATED_CS_SKILLS and not cs:
+            continue
+        if _any(pats):
+            out.append(skill)
+    return out
+
+
+def test_compiled_skill_tables_match_raw_patterns_per_section() -> None:
+    import json
+    from pathlib import Path
+
+    fixture = Path(__file__).parent / "fixtures" / "openai_enriched_jobs.sample.json"
+    jobs = json.loads(fixture.read_text(encoding="utf-8"))
+    assert jobs
+    for job in jobs:
+        text = rules_mod._job_text(job)
+        req, pref, _other = rules_mod._section_slices(text)
+        by_section = rules_mod._skills_by_section({"required": req, "preferred": pref, "full": text})
+        assert by_section["required"] == _raw_pattern_skills(req)
+        assert by_section["preferred"] == _raw_pattern_skills(pref)
+        assert by_section["full"] == _raw_pattern_skills(text)
+
+
+def test_literal_prefilter_respects_case_folding() -> None:
+    # "ſ" (long s) folds onto "s" under IGNORECASE; the prefilter must not hide that match.
+    assert rules_mod._skills_from_text("ſql and python") == ["Python", "SQL"]
+    assert rules_mod._skills_from_text("SQL") == _raw_pattern_skills("SQL") == ["SQL"]
+    assert rules_mod._required_literal(r"\brobotics?\b") == "robotic"
+    assert rules_mod._required_literal(r"\bcustomer success\b|\bcs\b") == ""
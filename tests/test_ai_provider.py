@@ -19,14 +19,7 @@ class FakeProvider(AIProvider):
 
 
 def _patch_cache(monkeypatch, tmp_path: Path):
-    from ji_engine.ai import cache as cache_mod
-
-    class _TmpCache(cache_mod.FileSystemAICache):
-        def __init__(self, root: Path | None = None):
-            super().__init__(root=tmp_path / "ai_cache")
-
-    monkeypatch.setattr("ji_engine.ai.cache.FileSystemAICache", _TmpCache)
-    monkeypatch.setattr("ji_engine.ai.augment.FileSystemAICache", _TmpCache)
+    monkeypatch.setenv("JOBINTEL_AI_CACHE_DB", str(tmp_path / "ai_cache.sqlite3"))
 
 
 def test_cache_miss_calls_provider_once(monkeypatch, tmp_path: Path):
@@ -92,3 +85,92 @@ def test_invalid_provider_output_is_normalized(monkeypatch, tmp_path: Path):
     assert isinstance(ai["skills_required"], list)
     assert isinstance(ai["match_score"], int)
     assert 0 <= ai["match_score"] <= 100
+
+
+class _Killed(BaseException):
+    """Stands in for SIGTERM/KeyboardInterrupt: not swallowed by the provider error handling."""
+
+
+class DyingProvider(FakeProvider):
+    def __init__(self, payload: Dict[str, Any], die_after: int):
+        super().__init__(payload)
+        self.die_after = die_after
+
+    def extract(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        if self.calls >= self.die_after:
+            raise _Killed()
+        return super().extract(job)
+
+
+def test_interrupted_run_keeps_completed_results(monkeypatch, tmp_path: Path):
+    _patch_cache(monkeypatch, tmp_path)
+    input_path = tmp_path / "openai_enriched_jobs.json"
+    output_path = tmp_path / "openai_enriched_jobs_ai.json"
+    jobs = [{"id": f"job-{idx}", "title": f"Job{idx}", "jd_text": "Desc", "location": "SF"} for idx in range(40)]
+    atomic_write_text(input_path, json.dumps(jobs))
+
+    monkeypatch.setattr("scripts.run_ai_augment.ENRICHED_JOBS_JSON", input_path)
+    monkeypatch.setattr("scripts.run_ai_augment.OUTPUT_PATH", output_path)
+
+    from scripts.run_ai_augment import _CACHE_WRITE_BATCH, main  # noqa: WPS433
+
+    payload = {"summary": "fake", "confidence": 1.0, "skills_required": ["python"]}
+    dying = DyingProvider(payload, die_after=36)
+    try:
+        main(argv=["--max_workers", "1"], provider=dying)
+    except _Killed:
+        pass
+    else:  # pragma: no cover - the provider always dies
+        raise AssertionError("expected the run to be interrupted")
+    assert dying.calls == 36
+
+    # Completed results were stored in batches as they arrived, so the rerun only pays for the rest.
+    provider = FakeProvider(payload)
+    main(argv=["--max_workers", "1"], provider=provider)
+    assert provider.calls == 40 - _CACHE_WRITE_BATCH
+    assert len(json.loads(output_path.read_text())) == 40
+
+
+def test_base_url_requires_ai_live_and_keeps_openai_key_off_other_hosts(monkeypatch):
+    from ji_engine.ai.provider import HTTPChatProvider, StubProvider
+    from scripts.run_ai_augment import _parse_args, _select_provider  # noqa: WPS433
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-openai")
+    monkeypatch.delenv("JOBINTEL_AI_API_KEY", raising=False)
+    monkeypatch.setenv("JOBINTEL_AI_BASE_URL", "http://127.0.0.1:8089/v1")
+
+    # A configured endpoint alone is not an opt-in to live calls.
+    assert isinstance(_select_provider(_parse_args([])), StubProvider)
+
+    provider = _select_provider(_parse_args(["--ai_live"]))
+    assert isinstance(provider, HTTPChatProvider)
+    assert provider.client.api_key == ""
+
+    monkeypatch.setenv("JOBINTEL_AI_API_KEY", "proxy-key")
+    assert _select_provider(_parse_args(["--ai_live"])).client.api_key == "proxy-key"
+
+    provider = _select_provider(_parse_args(["--ai_live", "--ai_base_url", "https://api.openai.com/v1"]))
+    assert provider.client.api_key == "sk-openai"
+
+
+def test_streamed_chunks_match_a_single_pass(monkeypatch, tmp_path: Path):
+    import scripts.run_ai_augment as augment
+
+    input_path = tmp_path / "openai_enriched_jobs.jsonl"
+    # Repeats of a key land in later chunks than its first occurrence.
+    jobs = [
+        {"id": f"job-{idx % 7}", "title": f"Job{idx % 7}", "jd_text": "Python", "location": "SF"} for idx in range(20)
+    ]
+    input_path.write_text("".join(json.dumps(job) + "\n" for job in jobs), encoding="utf-8")
+
+    outputs = []
+    for run, chunk in enumerate((3, 1000)):
+        monkeypatch.setenv("JOBINTEL_AI_CACHE_DB", str(tmp_path / f"ai_cache.{run}.sqlite3"))
+        monkeypatch.setattr(augment, "_STREAM_CHUNK", chunk)
+        provider = FakeProvider({"summary": "fake", "confidence": 1.0, "skills_required": ["python"]})
+        out_path = tmp_path / f"out.{run}.jsonl"
+        augment.main(argv=["--in_path", str(input_path), "--out_path", str(out_path)], provider=provider)
+        assert provider.calls == 7
+        outputs.append(out_path.read_bytes())
+    assert outputs[0] == outputs[1]
+    assert len(outputs[0].splitlines()) == 20
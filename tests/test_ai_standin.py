@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import urllib.error
+from pathlib import Path
+
+import pytest
+
+from ji_engine.ai.cache_store import open_ai_cache_store
+from ji_engine.ai.chat_client import ChatCompletionsClient
+from ji_engine.ai.provider import HTTPChatProvider
+from ji_engine.ai.standin_server import StandInConfig, StandInServer, count_tokens
+from ji_engine.embeddings.provider import OpenAIEmbeddingProvider
+from ji_engine.embeddings.simple import hash_embed
+from jobintel import ai_job_briefs
+
+
+def test_standin_is_deterministic_and_retries_through_injected_errors() -> None:
+    config = StandInConfig(latency_ms=0, error_rate=0.5, seed="t")
+    job = {"title": "Solutions Engineer", "jd_text": "Python, Kubernetes.", "location": "SF"}
+    results = []
+    for _ in range(2):
+        with StandInServer(config) as server:
+            client = ChatCompletionsClient(server.base_url, model="standin", backoff_s=0)
+            results.append(
+                (
+                    [HTTPChatProvider(client).extract(dict(job, title=f"Role {idx}")) for idx in range(6)],
+                    client.stats(),
+                    server.stats(),
+                )
+            )
+    (payloads, client_stats, server_stats), (payloads2, client_stats2, server_stats2) = results
+    assert payloads == payloads2
+    assert payloads[0]["summary"].startswith("Stand-in response ")
+    # Same request sequence, same injected failures: the client retried exactly as often both times.
+    assert client_stats["retries"] == client_stats2["retries"] == server_stats["errors"] > 0
+    assert client_stats["failed"] == 0
+    assert client_stats["prompt_tokens"] == server_stats["prompt_tokens"] == server_stats2["prompt_tokens"]
+
+    with StandInServer(StandInConfig(latency_ms=0)) as server:
+        embedder = OpenAIEmbeddingProvider(api_key="", base_url=server.base_url, min_interval=0)
+        assert embedder.embed("kubernetes operator") == hash_embed("kubernetes operator", dim=256)
+        assert server.stats()["prompt_tokens"] == count_tokens("kubernetes operator") == 2
+
+
+def test_standin_rate_limit_answers_429_with_retry_after() -> None:
+    with StandInServer(StandInConfig(latency_ms=0, rate_limit_rps=0.5, rate_limit_burst=1)) as server:
+        client = ChatCompletionsClient(server.base_url, max_retries=1)
+        client.complete_json("system", "first")
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            client.complete_json("system", "second")
+        assert excinfo.value.code == 429
+        assert float(excinfo.value.headers["Retry-After"]) > 0
+        assert client.stats()["rate_limited"] == 1
+        assert server.stats()["rate_limited"] == 1
+
+
+def test_job_briefs_through_standin_keep_local_content(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ai_job_briefs, "RUN_METADATA_DIR", tmp_path / "state" / "runs")
+    ranked = [{"job_id": str(idx), "title": f"Role {idx}", "score": 90 - idx, "jd_text": "y" * 80} for idx in range(5)]
+    ranked_path = tmp_path / "ranked.json"
+    ranked_path.write_text(json.dumps(ranked), encoding="utf-8")
+    prompt = tmp_path / "prompt.md"
+    prompt.write_text("Write a brief.", encoding="utf-8")
+
+    payloads = []
+    with StandInServer(StandInConfig(latency_ms=5, jitter_ms=5)) as server:
+        client = ChatCompletionsClient(server.base_url, model="stub")
+        for idx, chat_client in enumerate((None, client)):
+            monkeypatch.setattr(ai_job_briefs, "STATE_DIR", tmp_path / f"state.{idx}")
+            _, _, payload = ai_job_briefs.generate_job_briefs(
+                provider="openai",
+                profile="cs",
+                ranked_path=ranked_path,
+                run_id=f"2026-01-22T00:00:0{idx}Z",
+                max_jobs=5,
+                max_tokens_per_job=100,
+                total_budget=10_000,
+                ai_enabled=True,
+                ai_reason="",
+                model_name="stub",
+                prompt_path=prompt,
+                max_workers=3,
+                chat_client=chat_client,
+            )
+            payload["metadata"].pop("timestamp")
+            payloads.append(payload)
+        served = server.stats()
+    # The stand-in returns no brief fields, so the briefs are the local ones; the calls were real.
+    assert payloads[0] == payloads[1]
+    assert served["ok"] == client.stats()["calls"] == 5
+    assert served["prompt_tokens"] == client.stats()["prompt_tokens"] > 0
+
+
+def test_load_test_harness_reports_every_stage(capsys) -> None:
+    from scripts.load_test_ai import main
+
+    argv = ["--jobs", "4", "--workers", "2", "--latency-ms", "1", "--jitter-ms", "1", "--tail-rate", "0"]
+    assert main([*argv, "--error-rate", "0.05"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert [stage["stage"] for stage in report["stages"]] == ["augment", "briefs", "insights"]
+    for stage in report["stages"]:
+        assert stage["client"]["failed"] == 0
+        assert stage["server"]["ok"] == stage["client"]["calls"] == stage["items"]
+        assert stage["accounting"]["served_tokens"] > 0
+        assert stage["client"]["latency_ms"]["p99"] is not None
+
+
+def test_failed_calls_are_not_cached_and_retry_next_run(tmp_path: Path, monkeypatch) -> None:
+    from jobintel import ai_insights
+
+    monkeypatch.setenv("JOBINTEL_AI_CACHE_DB", str(tmp_path / "ai_cache.sqlite3"))
+    monkeypatch.setattr(ai_job_briefs, "RUN_METADATA_DIR", tmp_path / "state" / "runs")
+    monkeypatch.setattr(ai_job_briefs, "STATE_DIR", tmp_path / "state")
+    monkeypatch.setattr(ai_insights, "RUN_METADATA_DIR", tmp_path / "state" / "runs")
+    ranked = [{"job_id": str(idx), "title": f"Role {idx}", "score": 90 - idx, "jd_text": "y" * 80} for idx in range(3)]
+    ranked_path = tmp_path / "ranked.json"
+    ranked_path.write_text(json.dumps(ranked), encoding="utf-8")
+    prompt = tmp_path / "prompt.md"
+    prompt.write_text("Write a brief.", encoding="utf-8")
+
+    def _run(client: ChatCompletionsClient, run_id: str) -> dict:
+        _, _, briefs = ai_job_briefs.generate_job_briefs(
+            provider="openai",
+            profile="cs",
+            ranked_path=ranked_path,
+            run_id=run_id,
+            max_jobs=3,
+            max_tokens_per_job=100,
+            total_budget=10_000,
+            ai_enabled=True,
+            ai_reason="",
+            model_name="stub",
+            prompt_path=prompt,
+            chat_client=client,
+        )
+        _, _, insights = ai_insights.generate_insights(
+            provider="openai",
+            profile="cs",
+            ranked_path=ranked_path,
+            prev_path=None,
+            run_id=run_id,
+            prompt_path=prompt,
+            ai_enabled=True,
+            ai_reason="",
+            model_name="stub",
+            chat_client=client,
+        )
+        return {"briefs": briefs, "insights": insights}
+
+    with StandInServer(StandInConfig(latency_ms=0, error_rate=1.0)) as server:
+        failing = ChatCompletionsClient(server.base_url, model="stub", max_retries=0)
+        first = _run(failing, "2026-01-22T00:00:00Z")
+        assert failing.stats()["failed"] == 4
+        assert first["briefs"]["briefs"][0]["why_fit"]  # local fallback content
+        assert first["insights"]["metadata"]["model_call_failed"] is True
+        # Same run again: neither the fallback briefs nor the fallback insights file are reused.
+        _run(failing, "2026-01-22T00:00:00Z")
+        assert failing.stats()["calls"] == 8
+        assert failing.stats()["failed"] == 8
+
+    with StandInServer(StandInConfig(latency_ms=0)) as server:
+        healthy = ChatCompletionsClient(server.base_url, model="stub")
+        second = _run(healthy, "2026-01-22T00:00:01Z")
+        assert healthy.stats()["calls"] == 4
+        assert second["briefs"]["metadata"]["cache_hits"] == 0
+        assert "model_call_failed" not in second["insights"]["metadata"]
+        # Real replies are cached: the briefs are served from the store on the next run.
+        third = _run(healthy, "2026-01-22T00:00:02Z")
+        assert third["briefs"]["metadata"]["cache_hits"] == 3
+    stored = open_ai_cache_store().get("insights", "openai:cs", second["insights"]["metadata"]["cache_key"])
+    assert stored and "model_call_failed" not in stored["metadata"]
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import List
 
 import scripts.score_jobs as score_mod
+from ji_engine.ai.cache import FileSystemAICache
 from ji_engine.ai.provider import AIProvider
 
 
@@ -40,11 +41,11 @@ def test_application_kit_uses_cache(tmp_path: Path, monkeypatch) -> None:
 
     provider = FakeProvider()
     shortlist = [jobs[0]]
-    cache = score_mod.FileSystemAICache(root=cache_dir)
+    cache = FileSystemAICache(root=cache_dir)
     score_mod.write_application_kit_md(shortlist, out_md, provider, cache)
     assert provider.calls == ["u1"]
     # second run uses cache
-    cache2 = score_mod.FileSystemAICache(root=cache_dir)
+    cache2 = FileSystemAICache(root=cache_dir)
     score_mod.write_application_kit_md(shortlist, out_md, provider, cache2)
     assert provider.calls == ["u1"]
     content = out_md.read_text(encoding="utf-8")
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+from pathlib import Path
+
+import pytest
+
+import scripts.replay_run as replay_run
+import scripts.run_daily as run_daily
+from ji_engine.utils.compression import (
+    artifact_compression,
+    artifact_digest,
+    compress_file,
+    logical_path,
+    read_artifact_text,
+    resolve_artifact_path,
+)
+from ji_engine.utils.jsonl import read_json_records, write_json_records
+from jobintel.discord_notify import _load_ranked
+from jobintel.safety.diff import load_jobs_from_path
+
+_JOBS = [{"job_id": f"job-{idx}", "title": "Solutions Engineer — Zürich", "score": idx} for idx in range(300)]
+
+
+@pytest.fixture(params=["gzip", "zstd"])
+def codec(request) -> str:
+    if request.param == "zstd":
+        pytest.importorskip("zstandard")
+    return request.param
+
+
+def test_compress_file_records_uncompressed_and_compressed_digests(tmp_path: Path, codec: str) -> None:
+    src = tmp_path / "ranked.json"
+    write_json_records(src, _JOBS, pretty=True)
+    raw = src.read_bytes()
+    dest = tmp_path / "archive" / f"ranked.json{'.gz' if codec == 'gzip' else '.zst'}"
+
+    digests = compress_file(src, dest, codec)
+    stored = dest.read_bytes()
+    assert digests["compression"] == codec
+    assert (digests["sha256"], digests["bytes"]) == (hashlib.sha256(raw).hexdigest(), len(raw))
+    assert (digests["compressed_sha256"], digests["compressed_bytes"]) == (
+        hashlib.sha256(stored).hexdigest(),
+        len(stored),
+    )
+    assert len(stored) < len(raw)
+    # Deterministic: recompressing the same input yields the same stored bytes.
+    assert compress_file(src, tmp_path / "again" / dest.name, codec) == digests
+    assert sorted(p.name for p in dest.parent.iterdir()) == [dest.name]
+
+    assert artifact_digest(dest) == (digests["sha256"], digests["bytes"])
+    assert read_artifact_text(dest) == raw.decode("utf-8")
+    # The logical name finds the compressed copy.
+    logical = dest.parent / "ranked.json"
+    assert logical_path(dest) == logical
+    assert resolve_artifact_path(logical) == dest
+    assert read_json_records(logical) == _JOBS
+
+
+def test_readers_accept_plain_or_gzip(tmp_path: Path) -> None:
+    plain = tmp_path / "plain" / "openai_ranked_jobs.cs.json"
+    write_json_records(plain, _JOBS)
+    packed = compress_file(plain, tmp_path / "packed" / "openai_ranked_jobs.cs.json.gz", "gzip")
+    assert packed["sha256"] == hashlib.sha256(plain.read_bytes()).hexdigest()
+    for directory in ("plain", "packed"):
+        logical = tmp_path / directory / "openai_ranked_jobs.cs.json"
+        assert load_jobs_from_path(logical) == _JOBS
+        assert _load_ranked(logical) == _JOBS
+        assert run_daily._read_json(logical) == _JOBS
+    assert load_jobs_from_path(tmp_path / "packed" / "openai_ranked_jobs.cs.json.gz") == _JOBS
+    assert _load_ranked(tmp_path / "missing.json") == []
+
+    jsonl = tmp_path / "ranked.jsonl"
+    write_json_records(jsonl, _JOBS)
+    jsonl_gz = tmp_path / "ranked.jsonl.gz"
+    jsonl_gz.write_bytes(gzip.compress(jsonl.read_bytes()))
+    assert read_json_records(jsonl_gz) == _JOBS
+
+
+def test_archive_input_compresses_when_configured(tmp_path: Path, monkeypatch) -> None:
+    state_dir = tmp_path / "state"
+    run_dir = state_dir / "runs" / "20260101T000000Z"
+    src = tmp_path / "openai_enriched_jobs.json"
+    write_json_records(src, _JOBS, pretty=True)
+    expected_sha = hashlib.sha256(src.read_bytes()).hexdigest()
+    dest_rel = Path("inputs") / "openai" / "cs" / "selected_scoring_input.json"
+
+    monkeypatch.delenv("JOBINTEL_ARTIFACT_COMPRESSION", raising=False)
+    plain = run_daily._archive_input(run_dir, src, dest_rel, state_dir=state_dir, compress=True)
+    assert plain["archived_path"].endswith("selected_scoring_input.json")
+    assert plain["sha256"] == expected_sha and "compression" not in plain
+
+    monkeypatch.setenv("JOBINTEL_ARTIFACT_COMPRESSION", "gzip")
+    meta = run_daily._archive_input(run_dir, src, dest_rel, state_dir=state_dir, compress=True)
+    stored = state_dir / meta["archived_path"]
+    assert meta["archived_path"].endswith("selected_scoring_input.json.gz")
+    # sha256/bytes stay over the uncompressed input; the stored file's digest is separate.
+    assert (meta["sha256"], meta["bytes"]) == (expected_sha, src.stat().st_size)
+    assert meta["compression"] == "gzip"
+    assert meta["compressed_sha256"] == hashlib.sha256(stored.read_bytes()).hexdigest() != expected_sha
+    assert meta["compressed_bytes"] == stored.stat().st_size
+    assert replay_run._content_sha256(stored) == expected_sha
+    # Inputs archived without `compress` (the configs) are always plain copies.
+    config_meta = run_daily._archive_input(run_dir, src, Path("inputs") / "profiles.json", state_dir=state_dir)
+    assert config_meta["archived_path"] == "runs/20260101T000000Z/inputs/profiles.json"
+
+
+def test_compression_setting_is_validated(monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_ARTIFACT_COMPRESSION", " GZIP ")
+    assert artifact_compression() == "gzip"
+    monkeypatch.setenv("JOBINTEL_ARTIFACT_COMPRESSION", "none")
+    assert artifact_compression() is None
+    monkeypatch.setenv("JOBINTEL_ARTIFACT_COMPRESSION", "lz4")
+    with pytest.raises(ValueError, match="JOBINTEL_ARTIFACT_COMPRESSION"):
+        artifact_compression()
@@ -15,6 +15,7 @@ except Exception:  # pragma: no cover
 
 import scripts.publish_s3 as publish_s3
 import scripts.run_daily as run_daily_module
+from ji_engine.utils.diff_engine import JobDiff
 from ji_engine.utils.verification import compute_sha256_file
 
 pytestmark = pytest.mark.skipif(boto3 is None or mock_s3 is None, reason="boto3/moto not installed")
@@ -101,7 +102,7 @@ def test_contract_first_run_writes_pointer_and_new_equals_total(tmp_path, monkey
             / "cs"
             / "openai_ranked_jobs.cs.json"
         )
-        new, changed, removed, _ = run_daily._diff([], curr)
+        new, changed, removed, _ = run_daily._diff(JobDiff([], curr))
         assert len(new) == len(curr)
         assert len(changed) == 0
         assert len(removed) == 0
@@ -147,7 +148,7 @@ def test_contract_second_run_reuses_pointer_and_new_zero(tmp_path, monkeypatch):
             / "cs"
             / "openai_ranked_jobs.cs.json"
         )
-        new, changed, removed, _ = run_daily._diff(prev, curr)
+        new, changed, removed, _ = run_daily._diff(JobDiff(prev, curr))
         assert len(new) == 0
         assert len(changed) == 0
         assert len(removed) == 0
@@ -219,7 +220,7 @@ def test_contract_deleted_pointer_returns_first_run_behavior(tmp_path, monkeypat
             / "cs"
             / "openai_ranked_jobs.cs.json"
         )
-        new, changed, removed, _ = run_daily._diff([], curr)
+        new, changed, removed, _ = run_daily._diff(JobDiff([], curr))
         assert len(new) == len(curr)
         assert len(changed) == 0
         assert len(removed) == 0
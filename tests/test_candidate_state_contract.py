@@ -22,6 +22,8 @@ def test_candidate_state_contract_layout(tmp_path, monkeypatch):
     assert paths.last_run_pointer_path == paths.system_state / "last_run.json"
     assert paths.last_success_pointer_path == paths.system_state / "last_success.json"
     assert paths.run_index_path == paths.system_state / "run_index.sqlite"
+    assert paths.job_history_path == paths.system_state / "job_history.sqlite"
+    assert paths.latest_view_path == paths.system_state / "latest_view.json"
 
 
 def test_candidate_pointer_read_paths_local_include_legacy(tmp_path, monkeypatch):
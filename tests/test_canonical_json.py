@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from ji_engine.utils import canonical_json
+from ji_engine.utils.canonical_json import (
+    COMPACT_JSON_SETTINGS,
+    PRETTY_JSON_SETTINGS,
+    canonical_dumps,
+    canonical_dumps_bytes,
+    canonical_text,
+    iter_canonical_array,
+    stable_hash_bytes,
+)
+from ji_engine.utils.content_fingerprint import content_fingerprint
+from ji_engine.utils.job_identity import job_identity
+
+FIXTURES = Path(__file__).parent / "fixtures"
+GOLDEN = FIXTURES / "canonical_json"
+
+# Everything the artifacts carry, plus the values where a fast encoder is most likely to drift:
+# float formatting on both sides of the exponent cut-offs, escapes, non-ASCII, big ints, key order.
+CORPUS = [
+    {
+        "title": "Solutions Engineer — Zürich",
+        "jd_text": 'Line one\nTab\there "quoted" \\ back/slash   \x7f \x00 \x1f ☃ 😀',
+        "score": 87,
+        "apply_url": None,
+        "flags": [True, False, None],
+        "Zeta": 1,
+        "alpha": {"b": [], "a": {}, "é": "ü", "A": [{"y": 2, "x": 1}]},
+    },
+    [0.1, 1.0, -0.0, 0.5, 2.5e-4, 1e-4, 9.99e-5, 1e-5, 8.138092491779292e-05, 1e-7, 5.9e-7, 1e-9, 1e-10, 5e-324],
+    [1e15, 1e16, 1.5e16, 1e22, 123456789.123, 1.7976931348623157e308, -2.5e-06],
+    [0, -1, 2**53 + 1, 2**63 - 1, -(2**63), 2**64, -(2**64) - 1, 10**40],
+    {"similarity": 0.00001234, "boost": 0.0, "text": "not a float: 0.00001 and 1e-5", "id": "a26e-4a09-94dd"},
+    [],
+    {},
+    "",
+]
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request, monkeypatch) -> str:
+    if request.param == "orjson":
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(canonical_json, "_FAST", orjson)
+    else:
+        monkeypatch.setattr(canonical_json, "_FAST", None)
+    assert canonical_json.json_backend() == request.param
+    return request.param
+
+
+def _fixture_values():
+    for path in sorted(FIXTURES.rglob("*.json")):
+        if GOLDEN in path.parents:
+            continue
+        yield path.relative_to(FIXTURES).as_posix(), json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_golden_bytes_match_on_every_backend(backend: str) -> None:
+    for name, pretty in (("corpus.compact.json", False), ("corpus.pretty.json", True)):
+        golden = (GOLDEN / name).read_bytes()
+        assert canonical_text(CORPUS, pretty=pretty).encode("utf-8") == golden
+        assert canonical_dumps_bytes(CORPUS, pretty=pretty) + b"\n" == golden
+        assert "".join(iter_canonical_array(CORPUS, pretty=pretty)).encode("utf-8") + b"\n" == golden
+
+
+def test_goldens_are_the_stdlib_layouts() -> None:
+    # The checked-in goldens are exactly what the pre-existing json.dumps calls wrote.
+    assert (GOLDEN / "corpus.compact.json").read_text(encoding="utf-8") == json.dumps(
+        CORPUS, **COMPACT_JSON_SETTINGS
+    ) + "\n"
+    assert (GOLDEN / "corpus.pretty.json").read_text(encoding="utf-8") == json.dumps(
+        CORPUS, **PRETTY_JSON_SETTINGS
+    ) + "\n"
+
+
+def test_repo_fixtures_round_trip_byte_exact(backend: str) -> None:
+    for name, value in _fixture_values():
+        for pretty, settings in ((False, COMPACT_JSON_SETTINGS), (True, PRETTY_JSON_SETTINGS)):
+            assert canonical_dumps(value, pretty=pretty) == json.dumps(value, **settings), name
+        if isinstance(value, list):
+            assert "".join(iter_canonical_array(iter(value))) == json.dumps(value, **COMPACT_JSON_SETTINGS), name
+    if backend == "orjson":
+        # Real job records (UUID-laden URLs included) stay on the fast path rather than falling back.
+        jobs = json.loads((FIXTURES / "openai_enriched_jobs.sample.json").read_text(encoding="utf-8"))
+        assert canonical_json._fast_dumps(jobs, pretty=False) is not None
+
+
+def test_non_json_values_follow_the_stdlib(backend: str) -> None:
+    class Tag(str):
+        pass
+
+    value = {"when": datetime(2026, 1, 2, 3, 4, 5), "tag": Tag("x"), "ids": {10: "b", 3: "a"}}
+    assert canonical_dumps(value, default=str) == json.dumps(value, default=str, **COMPACT_JSON_SETTINGS)
+    with pytest.raises(TypeError):
+        canonical_dumps({"when": datetime(2026, 1, 2)})
+
+
+def test_hash_inputs_keep_the_historical_layout(backend: str) -> None:
+    payload = {"title": "Señor TAM", "team": None, "location": "Remote"}
+    assert stable_hash_bytes(payload) == json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode()
+    assert stable_hash_bytes(payload, ensure_ascii=True) == json.dumps(payload, sort_keys=True, default=str).encode()
+    job = {"title": "Señor Solutions Engineer", "location": "Zürich", "team": "GTM", "jd_text": "Build things."}
+    # Pinned before the serializer moved: stored fingerprints and identities must not change.
+    assert content_fingerprint(job) == "3e221fb62a901dc2a075fd0baa03bcaeade630d09e16f4c7bbc7d2878d76eb80"
+    assert job_identity(job, mode="legacy") == "c0e130b3eb16ca63b30ca81c29cd5b46222eafbee8e3b638b753be35ce179616"
+    assert (
+        job_identity(dict(job, provider="openai"), mode="provider")
+        == "65aafade3f9a637dd5fb6ee958d85ee1496307106b620801a4c91d04ec90a12f"
+    )
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from ji_engine.models import JobSource, RawJobPosting
+from ji_engine.pipeline import classifier
+from ji_engine.pipeline.classifier import TitleRelevanceClassifier, label_jobs, score_title_relevance
+from ji_engine.profile_loader import load_candidate_profile
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _job(title: str, location: str | None = None, idx: int = 0) -> RawJobPosting:
+    return RawJobPosting(
+        source=JobSource.OPENAI,
+        title=title,
+        location=location,
+        team=None,
+        apply_url=f"https://jobs.ashbyhq.com/openai/{idx}",
+        detail_url=None,
+        raw_text="",
+        scraped_at=datetime(2026, 1, 1),
+    )
+
+
+def _substring_reference(title: str, location: str | None, anti_patterns: list[str]) -> str:
+    """Plain ``any(term in text ...)`` evaluation of the same rule tables."""
+    t = title.lower()
+    loc = f"{title} {location or ''}".lower()
+    if any(m in loc for m in classifier.FOREIGN_MARKERS):
+        return "IRRELEVANT"
+    if any(k in t for k in classifier.KILL_WORDS):
+        return "IRRELEVANT"
+    for ap in anti_patterns:
+        if any(w in t for w in ap.lower().split() if len(w) > 3):
+            return "IRRELEVANT"
+    has_cs = any(x in t for x in classifier.CS_TERMS)
+    has_sa = any(x in t for x in classifier.SA_TERMS)
+    score = (15 if has_cs else 0) + (10 if has_sa else 0)
+    score += 5 if any(x in t for x in classifier.TPM_TERMS) else 0
+    score += 3 if any(x in t for x in classifier.SENIORITY_TERMS) else 0
+    if any(x in t for x in classifier.SWE_TERMS) and not has_sa and not has_cs:
+        score -= 6
+    if any(x in t for x in classifier.DS_TERMS):
+        score -= 6
+    score += 6 if "remote" in loc else 0
+    score += 5 if "new york" in loc else 0
+    score += 2 if any(x in loc for x in classifier.US_NUDGE_MARKERS) else 0
+    if has_sa and score >= 12:
+        return "RELEVANT"
+    if score >= 18:
+        return "RELEVANT"
+    return "MAYBE" if score >= 10 else "IRRELEVANT"
+
+
+def _fixture_pairs() -> list[tuple[str, str | None]]:
+    pairs = set()
+    for rel in ("tests/fixtures/openai_enriched_jobs.sample.json", "data/openai_labeled_jobs.json"):
+        for item in json.loads((REPO_ROOT / rel).read_text(encoding="utf-8")):
+            if isinstance(item.get("title"), str):
+                pairs.add((item["title"], item.get("location")))
+    return sorted(pairs, key=lambda p: (p[0], p[1] or ""))
+
+
+def test_compiled_rules_match_substring_reference_on_fixtures() -> None:
+    profile = load_candidate_profile(str(REPO_ROOT / "data" / "candidate_profile.json"))
+    anti = list(profile.preferences.anti_patterns)
+    pairs = _fixture_pairs()
+    assert pairs
+    for idx, (title, location) in enumerate(pairs):
+        expected = _substring_reference(title, location, anti)
+        assert score_title_relevance(_job(title, location, idx), profile) == expected, (title, location)
+
+
+def test_score_title_relevance_tiers() -> None:
+    rules = TitleRelevanceClassifier()
+    assert rules.score("Customer Success Manager", "New York, NY") == "RELEVANT"
+    assert rules.score("Solutions Architect", "Remote") == "RELEVANT"
+    assert rules.score("Technical Program Manager", "Remote") == "MAYBE"
+    assert rules.score("Customer Success Manager", "London, UK") == "IRRELEVANT"
+    assert rules.score("Recruiter", "Remote") == "IRRELEVANT"
+    assert rules.score("Research Scientist", "San Francisco") == "IRRELEVANT"
+
+
+def test_anti_patterns_compiled_per_classifier() -> None:
+    assert TitleRelevanceClassifier().score("Sales Solutions Architect", "Remote") == "RELEVANT"
+    rules = TitleRelevanceClassifier(["Pure quota-carrying sales roles"])
+    assert rules.score("Sales Solutions Architect", "Remote") == "IRRELEVANT"
+
+
+def test_label_jobs_batch_matches_single_calls() -> None:
+    profile = load_candidate_profile(str(REPO_ROOT / "data" / "candidate_profile.json"))
+    jobs = [_job(title, location, idx) for idx, (title, location) in enumerate(_fixture_pairs())]
+    labeled = label_jobs(jobs, profile)
+    assert [row["relevance"] for row in labeled] == [score_title_relevance(job, profile) for job in jobs]
+    assert TitleRelevanceClassifier.for_profile(profile) is TitleRelevanceClassifier.for_profile(profile)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from pathlib import Path
@@ -334,7 +335,7 @@ def test_dashboard_latest_s3(monkeypatch) -> None:
     monkeypatch.setattr(
         dashboard.aws_runs,
         "read_last_success_state",
-        lambda bucket, prefix, candidate_id="local": (
+        lambda bucket, prefix, candidate_id="local", client=None: (
             {"run_id": "2026-01-01T00:00:00Z"},
             "ok",
             "state/last_success.json",
@@ -469,3 +470,361 @@ def test_dashboard_semantic_summary_invalid_json_returns_500(tmp_path: Path, mon
     resp = client.get(f"/runs/{run_id}/semantic_summary/cs")
     assert resp.status_code == 500
     assert resp.json()["detail"] == "Semantic summary invalid JSON"
+
+
+def test_dashboard_delta_trends_endpoint(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.dashboard.app as dashboard
+
+    importlib.reload(config)
+    dashboard = importlib.reload(dashboard)
+
+    config.RUN_METADATA_DIR.mkdir(parents=True, exist_ok=True)
+    for day, new_count in ((1, 2), (2, 5)):
+        run_id = f"2026-01-0{day}T00:00:00Z"
+        report = {
+            "run_id": run_id,
+            "delta_summary": {"provider_profile": {"openai": {"cs": {"new_job_count": new_count}}}},
+        }
+        (config.RUN_METADATA_DIR / f"{_sanitize(run_id)}.json").write_text(json.dumps(report), encoding="utf-8")
+
+    client = TestClient(dashboard.app)
+    resp = client.get("/v1/trends/openai/cs", params={"window": 30})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["window_size"] == 30
+    assert body["totals"] == {"new": 7, "changed": 0, "removed": 0}
+    assert [item["new"] for item in body["series"]] == [2, 5]
+    assert client.get("/v1/trends/openai/cs", params={"window": 0}).status_code == 400
+
+
+def test_dashboard_runs_filters_and_cursor(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.dashboard.app as dashboard
+
+    importlib.reload(config)
+    dashboard = importlib.reload(dashboard)
+
+    for day, status in ((1, "success"), (2, "failed"), (3, "success")):
+        run_id = f"2026-01-0{day}T00:00:00Z"
+        run_dir = config.RUN_METADATA_DIR / _sanitize(run_id)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        (run_dir / "index.json").write_text(json.dumps({"run_id": run_id, "timestamp": run_id}), encoding="utf-8")
+        (run_dir / "run_report.json").write_text(json.dumps({"status": status}), encoding="utf-8")
+
+    client = TestClient(dashboard.app)
+    resp = client.get("/runs", params={"status": "success", "limit": 1})
+    assert resp.status_code == 200
+    assert [item["run_id"] for item in resp.json()] == ["2026-01-03T00:00:00Z"]
+    assert resp.json()[0]["summary"]["status"] == "success"
+    cursor = resp.headers["X-Next-Cursor"]
+
+    resp = client.get("/runs", params={"status": "success", "limit": 1, "cursor": cursor})
+    assert [item["run_id"] for item in resp.json()] == ["2026-01-01T00:00:00Z"]
+    assert "X-Next-Cursor" not in resp.headers
+    assert client.get("/runs", params={"cursor": "!!"}).status_code == 400
+
+
+def test_dashboard_run_detail_and_artifact_conditional_requests(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.dashboard.app as dashboard
+
+    importlib.reload(config)
+    dashboard = importlib.reload(dashboard)
+
+    run_id = "2026-01-22T00:00:00Z"
+    run_dir = config.RUN_METADATA_DIR / _sanitize(run_id)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    artifact_path = run_dir / "openai" / "cs" / "openai_ranked_jobs.cs.json"
+    artifact_path.parent.mkdir(parents=True)
+    artifact_path.write_text("[]", encoding="utf-8")
+    # Same basename and size under another profile: it must not borrow the cs digest.
+    other_path = run_dir / "openai" / "tam" / "openai_shortlist.md"
+    other_path.parent.mkdir(parents=True)
+    other_path.write_text("{}", encoding="utf-8")
+    (run_dir / "index.json").write_text(
+        json.dumps(
+            {
+                "run_id": run_id,
+                "timestamp": run_id,
+                "artifacts": {
+                    artifact_path.name: "openai/cs/openai_ranked_jobs.cs.json",
+                    other_path.name: "openai/tam/openai_shortlist.md",
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    report = {
+        "semantic_enabled": False,
+        "timestamps": {"started_at": run_id, "ended_at": None},
+        "verifiable_artifacts": {
+            "openai:cs:ranked_json": {"path": "ashby_cache/openai_ranked_jobs.cs.json", "sha256": "feed", "bytes": 2},
+            "openai:cs:shortlist_md": {"path": "ashby_cache/openai_shortlist.md", "sha256": "beef", "bytes": 2},
+        },
+    }
+    (run_dir / "run_report.json").write_text(json.dumps(report), encoding="utf-8")
+
+    client = TestClient(dashboard.app)
+    validations = []
+    original_validate = dashboard._validate_schema
+    monkeypatch.setattr(
+        dashboard,
+        "_validate_schema",
+        lambda payload, schema: validations.append(schema) or original_validate(payload, schema),
+    )
+
+    detail = client.get(f"/runs/{run_id}")
+    assert detail.status_code == 200
+    assert detail.headers["cache-control"] == "no-cache"
+    etag = detail.headers["etag"]
+    parsed = len(validations)
+    again = client.get(f"/runs/{run_id}", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert len(validations) == parsed
+
+    artifact = client.get(f"/runs/{run_id}/artifact/{artifact_path.name}")
+    assert artifact.status_code == 200
+    assert artifact.headers["etag"] == '"feed"'
+    assert (
+        client.get(
+            f"/runs/{run_id}/artifact/{artifact_path.name}", headers={"If-None-Match": 'W/"other", "feed"'}
+        ).status_code
+        == 304
+    )
+    other = client.get(f"/runs/{run_id}/artifact/{other_path.name}")
+    assert other.headers["etag"] == f'"{hashlib.sha256(b"{}").hexdigest()}"'
+
+    # Finishing the run rewrites run_report.json: artifacts become immutable, the run detail does not
+    # (its diff counts, costs and prompt version can still change).
+    report["timestamps"]["ended_at"] = "2026-01-22T00:05:00Z"
+    report["semantic_enabled"] = True
+    (run_dir / "run_report.json").write_text(json.dumps(report), encoding="utf-8")
+    finished = client.get(f"/runs/{run_id}", headers={"If-None-Match": etag})
+    assert finished.status_code == 200
+    assert finished.json()["semantic_enabled"] is True
+    assert finished.headers["etag"] != etag
+    assert finished.headers["cache-control"] == "no-cache"
+    artifact = client.get(f"/runs/{run_id}/artifact/{artifact_path.name}")
+    assert "immutable" in artifact.headers["cache-control"]
+
+    # An artifact without a recorded digest falls back to hashing the file.
+    artifact_path.write_text("[1]", encoding="utf-8")
+    resp = client.get(f"/runs/{run_id}/artifact/{artifact_path.name}")
+    assert resp.content == b"[1]"
+    assert resp.headers["etag"] == f'"{hashlib.sha256(b"[1]").hexdigest()}"'
+
+
+def test_dashboard_artifact_streams_ranges_and_compression(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import gzip
+    import importlib
+    import os
+
+    import ji_engine.config as config
+    import ji_engine.dashboard.app as dashboard
+
+    importlib.reload(config)
+    dashboard = importlib.reload(dashboard)
+
+    run_id = "2026-01-22T00:00:00Z"
+    run_dir = config.RUN_METADATA_DIR / _sanitize(run_id)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    body = json.dumps([{"job_id": str(idx), "title": "Customer Success"} for idx in range(5000)]).encode("utf-8")
+    artifact_path = run_dir / "openai_ranked_jobs.cs.json"
+    artifact_path.write_bytes(body)
+    csv_path = run_dir / "openai_ranked_jobs.cs.csv"
+    csv_path.write_bytes(b"job_id,title\n" * 200)
+    (run_dir / "index.json").write_text(
+        json.dumps(
+            {
+                "run_id": run_id,
+                "timestamp": run_id,
+                "artifacts": {artifact_path.name: artifact_path.name, csv_path.name: csv_path.name},
+            }
+        ),
+        encoding="utf-8",
+    )
+    # A body larger than the JSON reader cap is still served: artifacts are never parsed.
+    monkeypatch.setenv("JOBINTEL_DASHBOARD_MAX_JSON_BYTES", "1024")
+    client = TestClient(dashboard.app)
+    url = f"/runs/{run_id}/artifact/{artifact_path.name}"
+
+    ranged = client.get(url, headers={"Range": "bytes=0-9", "Accept-Encoding": "gzip"})
+    assert ranged.status_code == 206
+    assert ranged.content == body[:10]
+    assert ranged.headers["content-range"] == f"bytes 0-9/{len(body)}"
+    assert "content-encoding" not in ranged.headers
+
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert plain.content == body
+    assert plain.headers["accept-ranges"] == "bytes"
+    assert "content-encoding" not in plain.headers
+
+    compressed = client.get(url, headers={"Accept-Encoding": "br;q=0, gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.content == body
+    assert compressed.headers["etag"] != plain.headers["etag"]
+    assert (
+        client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]}).status_code
+        == 304
+    )
+
+    # A pre-compressed sibling at least as new as the artifact is served as is.
+    sibling = csv_path.with_name(csv_path.name + ".gz")
+    sibling.write_bytes(gzip.compress(b"from-sibling\n"))
+    stat = csv_path.stat()
+    os.utime(sibling, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    resp = client.get(f"/runs/{run_id}/artifact/{csv_path.name}", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.content == b"from-sibling\n"
+    os.utime(sibling, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+    resp = client.get(f"/runs/{run_id}/artifact/{csv_path.name}", headers={"Accept-Encoding": "gzip"})
+    assert resp.content == b"job_id,title\n" * 200
+
+
+def test_dashboard_serves_artifacts_archived_compressed(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.dashboard.app as dashboard
+    from ji_engine.utils.compression import compress_file
+
+    importlib.reload(config)
+    dashboard = importlib.reload(dashboard)
+
+    run_id = "2026-01-23T00:00:00Z"
+    run_dir = config.RUN_METADATA_DIR / _sanitize(run_id)
+    (run_dir / "openai").mkdir(parents=True, exist_ok=True)
+    body = json.dumps([{"job_id": str(idx), "title": "Solutions Engineer"} for idx in range(2000)]).encode("utf-8")
+    source = tmp_path / "openai_enriched_jobs.json"
+    source.write_bytes(body)
+    digests = compress_file(source, run_dir / "openai" / "openai_enriched_jobs.json.gz", "gzip")
+    (run_dir / "index.json").write_text(
+        json.dumps(
+            {
+                "run_id": run_id,
+                "timestamp": run_id,
+                "artifacts": {"openai_enriched_jobs.json": "openai/openai_enriched_jobs.json.gz"},
+            }
+        ),
+        encoding="utf-8",
+    )
+    client = TestClient(dashboard.app)
+    url = f"/runs/{run_id}/artifact/openai_enriched_jobs.json"
+
+    # Clients that take gzip get the stored bytes untouched; the ETag names the uncompressed content.
+    stored = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert stored.status_code == 200
+    assert stored.headers["content-encoding"] == "gzip"
+    assert stored.headers["content-type"].startswith("application/json")
+    assert stored.headers["etag"] == f'"{digests["sha256"]}-gzip"'
+    assert stored.content == body
+
+    # Everyone else gets the artifact decoded.
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] == f'"{digests["sha256"]}"'
+    assert plain.content == body
+
+
+def test_dashboard_run_jobs_endpoint_filters_and_paginates(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.dashboard.app as dashboard
+
+    importlib.reload(config)
+    dashboard = importlib.reload(dashboard)
+
+    run_id = "2026-01-22T00:00:00Z"
+    run_dir = config.RUN_METADATA_DIR / _sanitize(run_id)
+    profiles = {}
+    for provider in ("anthropic", "openai"):
+        jobs = [
+            {
+                "job_id": f"{provider}-{idx}",
+                "title": "Customer Success Manager" if idx % 2 else "Solutions Engineer",
+                "team": "Go To Market",
+                "location": "Remote - US" if idx % 3 else "San Francisco, CA",
+                "score": 100 - idx * 10,
+                "role_band": "CS_CORE" if idx % 2 else "ADJACENT",
+                "apply_url": f"https://example.com/{provider}/{idx}",
+                "jd_text": "not projected",
+            }
+            for idx in range(6)
+        ]
+        rel = f"{provider}/cs/{provider}_ranked_jobs.cs.json"
+        (run_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+        (run_dir / rel).write_text(json.dumps(jobs), encoding="utf-8")
+        profiles[provider] = {"profiles": {"cs": {"artifacts": {f"{provider}_ranked_jobs.cs.json": rel}}}}
+    (run_dir / "index.json").write_text(
+        json.dumps({"run_id": run_id, "timestamp": run_id, "providers": profiles, "artifacts": {}}),
+        encoding="utf-8",
+    )
+
+    client = TestClient(dashboard.app)
+    url = f"/runs/{run_id}/jobs"
+    first = client.get(url, params={"limit": 4})
+    assert first.status_code == 200
+    assert (run_dir / "jobs_index.sqlite").exists()
+    page = first.json()
+    assert [job["job_id"] for job in page["jobs"]] == ["anthropic-0", "anthropic-1", "anthropic-2", "anthropic-3"]
+    assert "jd_text" not in page["jobs"][0]
+    assert first.headers["x-next-cursor"] == page["next_cursor"]
+    rest = client.get(url, params={"limit": 100, "cursor": page["next_cursor"]}).json()
+    assert len(rest["jobs"]) == 8 and rest["next_cursor"] is None
+
+    def _ids(**params) -> list:
+        resp = client.get(url, params=params)
+        assert resp.status_code == 200
+        return [job["job_id"] for job in resp.json()["jobs"]]
+
+    assert _ids(provider="openai", min_score=75) == ["openai-0", "openai-1", "openai-2"]
+    assert _ids(provider="openai", role_band="CS_CORE") == ["openai-1", "openai-3", "openai-5"]
+    assert _ids(provider="openai", q="custom remote") == ["openai-1", "openai-5"]
+    assert _ids(q='success"* (') == [
+        "anthropic-1",
+        "anthropic-3",
+        "anthropic-5",
+        "openai-1",
+        "openai-3",
+        "openai-5",
+    ]
+    assert _ids(profile="tam") == []
+    assert _ids(q="!!! ...") == []
+
+    # While the run dir is unchanged the freshness check is not repeated.
+    with monkeypatch.context() as patched:
+        patched.setattr(dashboard.RunJobIndex, "_is_current", lambda *_a, **_k: (_ for _ in ()).throw(AssertionError))
+        assert _ids(provider="openai", limit=1) == ["openai-0"]
+
+    # Rewriting a ranked artifact (and the run's index.json with it) invalidates the per-run index.
+    rel = run_dir / "openai/cs/openai_ranked_jobs.cs.json"
+    rel.write_text(json.dumps([{"job_id": "openai-new", "title": "Support Lead", "score": 1}]), encoding="utf-8")
+    index_path = run_dir / "index.json"
+    index_path.write_text(index_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert _ids(provider="openai") == ["openai-new"]
+
+    assert client.get(url, params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get(url, params={"limit": 0}).status_code == 400
+    assert client.get("/runs/2026-02-01T00:00:00Z/jobs").status_code == 404
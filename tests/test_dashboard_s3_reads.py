@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+from botocore.exceptions import ClientError  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from ji_engine.dashboard.s3_reads import DashboardS3Reader  # noqa: E402
+
+try:
+    import boto3
+    from moto import mock_aws
+except ImportError:  # pragma: no cover - optional dependency
+    boto3 = None
+    mock_aws = None
+
+
+class _StandInS3:
+    """In-memory stand-in for the two S3 calls the dashboard makes, counting each call."""
+
+    def __init__(self, objects: dict) -> None:
+        self.objects = objects
+        self.calls: list = []
+        self.gate: threading.Event | None = None
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        self.calls.append(("get_object", Key))
+        if self.gate is not None:
+            self.gate.wait(5)
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        raw = json.dumps(self.objects[Key]).encode("utf-8")
+        return {"Body": io.BytesIO(raw), "ContentLength": len(raw)}
+
+    def list_objects_v2(self, Bucket: str, Prefix: str, ContinuationToken: str | None = None) -> dict:
+        self.calls.append(("list_objects_v2", Prefix))
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start : start + 2]
+        truncated = start + 2 < len(keys)
+        return {
+            "Contents": [{"Key": key} for key in page],
+            "IsTruncated": truncated,
+            "NextContinuationToken": str(start + 2) if truncated else None,
+        }
+
+
+def test_reader_caches_for_ttl_and_skips_transient_errors() -> None:
+    now = [0.0]
+    s3 = _StandInS3({"p/a.json": {"n": 1}, "p/b.json": {"n": 2}, "p/c.json": {"n": 3}})
+    reader = DashboardS3Reader(ttl_seconds=10, client_factory=lambda: s3, clock=lambda: now[0])
+
+    assert reader.list_keys("bucket", "p/") == ["p/a.json", "p/b.json", "p/c.json"]
+    assert reader.list_keys("bucket", "p/") == ["p/a.json", "p/b.json", "p/c.json"]
+    assert [call[0] for call in s3.calls] == ["list_objects_v2", "list_objects_v2"]  # two pages, one listing
+
+    assert reader.get_json("bucket", "p/a.json", max_bytes=1024) == ({"n": 1}, "ok")
+    assert reader.get_json("bucket", "p/missing.json", max_bytes=1024) == (None, "not_found")
+    s3.objects["p/a.json"] = {"n": 10}
+    assert reader.get_json("bucket", "p/a.json", max_bytes=1024) == ({"n": 1}, "ok")
+    assert reader.get_json("bucket", "p/missing.json", max_bytes=1024) == (None, "not_found")
+    assert len(s3.calls) == 4
+
+    now[0] = 11.0
+    assert reader.get_json("bucket", "p/a.json", max_bytes=1024) == ({"n": 10}, "ok")
+    assert reader.get_json("bucket", "p/a.json", max_bytes=4) == (None, "too_large")
+    assert reader.get_json("bucket", "p/a.json", max_bytes=4) == (None, "too_large")
+    assert s3.calls[4:] == [("get_object", "p/a.json")] * 3
+
+
+def test_reader_coalesces_concurrent_identical_requests() -> None:
+    s3 = _StandInS3({"p/state.json": {"run_id": "r1"}})
+    s3.gate = threading.Event()
+    reader = DashboardS3Reader(ttl_seconds=0, client_factory=lambda: s3)
+    results: list = []
+
+    def _read() -> None:
+        results.append(reader.get_json("bucket", "p/state.json", max_bytes=1024))
+
+    leader = threading.Thread(target=_read)
+    leader.start()
+    while not s3.calls:
+        time.sleep(0.001)
+    # The leader is now blocked inside get_object; followers find its in-flight load and wait on it.
+    followers = [threading.Thread(target=_read) for _ in range(7)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.2)
+    s3.gate.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+    assert results == [({"run_id": "r1"}, "ok")] * 8
+    assert s3.calls == [("get_object", "p/state.json")]
+    assert reader.misses == 1
+
+
+def test_dashboard_s3_routes_share_cached_reads(monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_S3_BUCKET", "proof-bucket")
+    monkeypatch.setenv("JOBINTEL_S3_PREFIX", "jobintel")
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.dashboard.app as dashboard
+
+    importlib.reload(config)
+    dashboard = importlib.reload(dashboard)
+
+    run_id = "2026-01-01T00:00:00Z"
+    s3 = _StandInS3(
+        {
+            "jobintel/state/candidates/local/last_success.json": {"run_id": run_id},
+            f"jobintel/state/candidates/local/proofs/{run_id}.json": {"run_id": run_id},
+            "jobintel/latest/openai/cs/openai_ranked_jobs.cs.json": {},
+        }
+    )
+    monkeypatch.setattr(dashboard, "S3_READER", DashboardS3Reader(ttl_seconds=60, client_factory=lambda: s3))
+
+    client = TestClient(dashboard.app)
+    for _ in range(3):
+        assert client.get("/v1/latest").json()["payload"] == {"run_id": run_id}
+        assert client.get("/v1/artifacts/latest/openai/cs").json()["keys"] == [
+            "jobintel/latest/openai/cs/openai_ranked_jobs.cs.json"
+        ]
+        assert client.get(f"/v1/runs/{run_id}").json()["payload"] == {"run_id": run_id}
+    assert sorted(call[0] for call in s3.calls) == ["get_object", "get_object", "list_objects_v2"]
+
+
+@pytest.mark.skipif(mock_aws is None, reason="moto not installed")
+def test_reader_against_moto() -> None:
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="bucket")
+        for idx in range(3):
+            client.put_object(Bucket="bucket", Key=f"p/{idx}.json", Body=json.dumps({"idx": idx}).encode("utf-8"))
+        reader = DashboardS3Reader(client_factory=lambda: client)
+        assert reader.list_keys("bucket", "p/") == ["p/0.json", "p/1.json", "p/2.json"]
+        assert reader.get_json("bucket", "p/1.json", max_bytes=1024) == ({"idx": 1}, "ok")
+        assert reader.get_json("bucket", "p/9.json", max_bytes=1024) == (None, "not_found")
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import scripts.run_daily as run_daily
+from ji_engine.utils.diff_engine import JobDiff
+from ji_engine.utils.diff_report import build_diff_report
+from jobintel.alerts import build_last_seen, compute_alerts, current_last_seen
+from jobintel.delta import compute_delta, render_delta
+
+
+def _jobs() -> tuple[list[dict], list[dict]]:
+    prev = [
+        {"provider": "openai", "job_id": "1", "title": "A", "apply_url": "https://a.example", "score": 80},
+        {"provider": "openai", "job_id": "2", "title": "B", "apply_url": "https://b.example", "score": 70},
+        {"provider": "openai", "job_id": "3", "title": "C", "apply_url": "https://c.example", "score": 60},
+    ]
+    curr = [
+        {"provider": "openai", "job_id": "2", "title": "B", "apply_url": "https://b.example", "score": 70},
+        {"provider": "openai", "job_id": "3", "title": "C2", "apply_url": "https://c.example", "score": 65},
+        {"provider": "openai", "job_id": "4", "title": "D", "apply_url": "https://d.example", "score": 90},
+    ]
+    return prev, curr
+
+
+def test_keyed_view_is_computed_once_and_only_fingerprints_shared_keys() -> None:
+    prev, curr = _jobs()
+    diff = JobDiff(prev, curr)
+    fingerprinted: list[str] = []
+
+    def _fingerprint(job: dict) -> str:
+        fingerprinted.append(job["job_id"])
+        return job["title"]
+
+    view = diff.keyed("test", lambda job: job["job_id"], _fingerprint)
+    assert diff.keyed("test", lambda job: job["job_id"], _fingerprint) is view
+    assert (view.added, view.removed, view.changed, view.unchanged) == (["4"], ["1"], ["3"], ["2"])
+    assert sorted(fingerprinted) == ["2", "2", "3", "3"]
+
+
+def test_renderers_from_shared_diff_match_standalone(tmp_path: Path) -> None:
+    prev, curr = _jobs()
+    shared = JobDiff(prev, curr)
+
+    assert run_daily._diff(shared) == run_daily._diff(JobDiff(prev, curr))
+    standalone_report = build_diff_report(prev, curr, provider="openai", profile="cs", baseline_exists=True)
+    shared_report = build_diff_report(prev, curr, provider="openai", profile="cs", baseline_exists=True, diff=shared)
+    assert shared_report == standalone_report
+    assert shared_report["counts"] == {"added": 1, "changed": 1, "removed": 1}
+
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(prev), encoding="utf-8")
+    current.write_text(json.dumps(curr), encoding="utf-8")
+    delta = compute_delta(None, current, None, baseline, "openai", "cs")
+    assert render_delta(shared, provider="openai", profile="cs", labeled_total=0) == delta
+    assert delta["changed_job_ids"] == ["openai:3"]
+    assert delta["change_fields"]["title"] == 1
+
+
+def test_changes_section_uses_shared_prev_map(tmp_path: Path) -> None:
+    prev, curr = _jobs()
+    shared = JobDiff(prev, curr)
+    new_jobs, changed_jobs, removed_jobs, changed_fields = run_daily._diff(shared)
+    outputs = []
+    for kwargs in ({"prev_jobs": prev}, {"diff": shared}):
+        shortlist = tmp_path / f"shortlist_{len(outputs)}.md"
+        shortlist.write_text("# Shortlist\n", encoding="utf-8")
+        run_daily._append_shortlist_changes_section(
+            shortlist, "cs", new_jobs, changed_jobs, removed_jobs, True, changed_fields, **kwargs
+        )
+        outputs.append(shortlist.read_text(encoding="utf-8"))
+    assert outputs[0] == outputs[1]
+    assert "title: C → C2" in outputs[0]
+
+
+def test_alerts_and_delta_route_through_the_shared_diff(tmp_path: Path) -> None:
+    prev, curr = _jobs()
+    shared = JobDiff(prev, curr)
+    prev_index = build_last_seen(prev)
+
+    assert compute_alerts(curr, prev_index, diff=shared) == compute_alerts(curr, prev_index)
+    # The last_seen index alerts built is the one written back to last_seen.json.
+    assert current_last_seen(shared) is current_last_seen(shared)
+    assert current_last_seen(shared) == build_last_seen(curr)
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(prev), encoding="utf-8")
+    missing_current = tmp_path / "missing.json"
+    # Same baseline list: the shared diff is rendered without reading the current ranked file.
+    delta = compute_delta(None, missing_current, None, baseline, "openai", "cs", diff=shared)
+    assert delta == render_delta(shared, provider="openai", profile="cs", labeled_total=0)
+    assert delta["ranked_total"] == 3
+    # Another baseline: the ranked files are diffed instead.
+    baseline.write_text(json.dumps(prev[:1]), encoding="utf-8")
+    assert compute_delta(None, missing_current, None, baseline, "openai", "cs", diff=shared)["ranked_total"] == 0
@@ -67,3 +67,47 @@ def test_enrich_jobs_preserves_order_with_threads(tmp_path: Path, monkeypatch: p
     titles = [item["title"] for item in data]
 
     assert titles == ["title-1", "title-2", "title-3"]
+
+
+def test_enrich_jobs_bounds_work_behind_a_slow_fetch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    jobs = [
+        {
+            "title": f"Job {idx}",
+            "apply_url": f"https://jobs.ashbyhq.com/openai/{idx:08d}-1111-1111-1111-111111111111/application",
+            "relevance": "RELEVANT",
+        }
+        for idx in range(20)
+    ]
+    labeled_path = tmp_path / "labeled.json"
+    enriched_path = tmp_path / "enriched.json"
+    labeled_path.write_text(json.dumps(jobs), encoding="utf-8")
+    snapshot_dir = tmp_path / "openai_snapshots" / "jobs"
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    (snapshot_dir / "stub.html").write_text("<html>stub</html>", encoding="utf-8")
+    monkeypatch.setattr("scripts.enrich_jobs.SNAPSHOT_DIR", tmp_path / "openai_snapshots")
+    monkeypatch.setattr("scripts.enrich_jobs.LABELED_JOBS_JSON", labeled_path)
+    monkeypatch.setattr("scripts.enrich_jobs.ENRICHED_JOBS_JSON", enriched_path)
+
+    started: list[str] = []
+    started_while_blocked: list[int] = []
+
+    def _fake_fetch(org: str, job_id: str, cache_dir: Path) -> Dict[str, Any]:
+        started.append(job_id)
+        if job_id.startswith("00000000"):
+            # Head-of-line fetch: everything behind it can finish but not be written.
+            time.sleep(0.3)
+            started_while_blocked.append(len(started))
+        return {"data": {"jobPosting": {"title": job_id, "descriptionHtml": "<div>desc</div>"}}}
+
+    monkeypatch.setattr("scripts.enrich_jobs.fetch_job_posting", _fake_fetch)
+
+    import scripts.enrich_jobs as mod
+
+    monkeypatch.setattr(sys, "argv", ["enrich_jobs.py", "--max_workers", "2"])
+    mod.main()
+
+    # 2 * max_workers submitted up front; nothing more until the head result is written.
+    assert started_while_blocked == [4]
+    assert [item["title"] for item in json.loads(enriched_path.read_text(encoding="utf-8"))] == [
+        f"{idx:08d}-1111-1111-1111-111111111111" for idx in range(20)
+    ]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import ji_engine.utils.fingerprint_cache as fingerprint_cache
+from ji_engine.utils.fingerprint_cache import (
+    FINGERPRINT_CACHE_SCHEMA_VERSION,
+    clear_fingerprint_cache,
+    configure_fingerprint_cache,
+    file_fingerprint,
+    flush_fingerprint_cache,
+)
+from ji_engine.utils.verification import build_verifiable_artifacts, verify_verifiable_artifacts
+
+_OLD_MTIME_NS = 1_700_000_000 * 1_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch):
+    monkeypatch.delenv("JOBINTEL_NO_HASH_CACHE", raising=False)
+    configure_fingerprint_cache(None)
+    clear_fingerprint_cache()
+    yield
+    configure_fingerprint_cache(None)
+    clear_fingerprint_cache()
+
+
+@pytest.fixture
+def hash_calls(monkeypatch) -> list:
+    calls: list = []
+    original = fingerprint_cache.hash_file_streaming
+
+    def _counting(path: Path):
+        calls.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(fingerprint_cache, "hash_file_streaming", _counting)
+    return calls
+
+
+def _write_aged(path: Path, content: bytes) -> None:
+    path.write_bytes(content)
+    os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+
+
+def test_fingerprint_is_reused_until_stat_changes(tmp_path: Path, hash_calls: list) -> None:
+    path = tmp_path / "ranked.json"
+    _write_aged(path, b"[1, 2, 3]")
+    expected = (hashlib.sha256(b"[1, 2, 3]").hexdigest(), 9)
+
+    assert file_fingerprint(path) == expected
+    assert file_fingerprint(path) == expected
+    assert build_verifiable_artifacts(tmp_path, {"ranked": path})["ranked"]["bytes"] == 9
+    assert verify_verifiable_artifacts(tmp_path, {"ranked": {"path": "ranked.json", "sha256": expected[0]}})[0]
+    assert hash_calls == ["ranked.json"]
+
+    _write_aged(path, b"[1, 2, 3, 4]")
+    assert file_fingerprint(path) == (hashlib.sha256(b"[1, 2, 3, 4]").hexdigest(), 12)
+    assert hash_calls == ["ranked.json", "ranked.json"]
+
+
+def test_recently_modified_files_are_rehashed(tmp_path: Path, hash_calls: list) -> None:
+    path = tmp_path / "ranked.json"
+    path.write_bytes(b"[1]")
+    assert file_fingerprint(path)[0] == hashlib.sha256(b"[1]").hexdigest()
+    # Same inode, same size, possibly the same mtime tick: must not be served from the cache.
+    path.write_bytes(b"[2]")
+    assert file_fingerprint(path)[0] == hashlib.sha256(b"[2]").hexdigest()
+    assert hash_calls == ["ranked.json", "ranked.json"]
+
+
+def test_on_disk_store_survives_processes_and_can_be_bypassed(tmp_path: Path, hash_calls: list, monkeypatch) -> None:
+    store = tmp_path / "state" / "hash_cache.json"
+    path = tmp_path / "ranked.json"
+    _write_aged(path, b"[1]")
+    configure_fingerprint_cache(store)
+    original = file_fingerprint(path)
+    assert flush_fingerprint_cache() == store
+    payload = json.loads(store.read_text(encoding="utf-8"))
+    assert payload["schema_version"] == FINGERPRINT_CACHE_SCHEMA_VERSION
+    assert payload["entries"][str(path.resolve())]["sha256"] == original[0]
+
+    # A fresh process: in-memory entries gone, the store answers without hashing.
+    clear_fingerprint_cache()
+    assert file_fingerprint(path) == original
+    assert hash_calls == ["ranked.json"]
+
+    # Tampering that preserves inode, size and mtime is invisible to the cache; audits opt out of it.
+    with path.open("r+b") as handle:
+        handle.write(b"[9]")
+    os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+    assert file_fingerprint(path) == original
+    monkeypatch.setenv("JOBINTEL_NO_HASH_CACHE", "1")
+    assert file_fingerprint(path)[0] == hashlib.sha256(b"[9]").hexdigest()
+    monkeypatch.delenv("JOBINTEL_NO_HASH_CACHE")
+    configure_fingerprint_cache(store, enabled=False)
+    assert file_fingerprint(path)[0] == hashlib.sha256(b"[9]").hexdigest()
+    assert flush_fingerprint_cache() is None
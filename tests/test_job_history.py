@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+from ji_engine.history_retention import write_history_run_artifacts
+from ji_engine.job_history import JobHistoryStore
+
+
+def _job(job_id: str, fingerprint: str, score: int = 50) -> dict:
+    return {
+        "job_id": job_id,
+        "title": f"Role {job_id}",
+        "score": score,
+        "content_fingerprint": fingerprint,
+        "role_band": "CS_CORE",
+    }
+
+
+RUNS = [
+    ("2026-02-01T00:00:00Z", {"openai": [_job("a", "fa"), _job("b", "fb")]}),
+    ("2026-02-02T00:00:00Z", {"openai": [_job("a", "fa2", 60), _job("c", "fc")]}),
+    ("2026-02-03T00:00:00Z", {"openai": [_job("a", "fa2", 60), _job("b", "fb")], "anthropic": [_job("a", "x")]}),
+]
+
+
+def _record_all(store: JobHistoryStore) -> None:
+    for run_id, jobs_by_provider in RUNS:
+        store.record_run(profile="cs", run_id=run_id, run_timestamp=run_id, jobs_by_provider=jobs_by_provider)
+
+
+def test_record_run_assigns_lifecycle_status_and_timeline(tmp_path: Path) -> None:
+    store = JobHistoryStore(tmp_path / "job_history.sqlite")
+    _record_all(store)
+
+    timeline = store.job_timeline("a", profile="cs", provider="openai")
+    assert [row["status"] for row in timeline] == ["new", "changed", "unchanged"]
+    assert [row["score"] for row in timeline] == [50, 60, 60]
+    assert [row["status"] for row in store.job_timeline("b", profile="cs")] == ["new", "reopened"]
+
+    # Re-recording a run replaces its rows rather than duplicating them.
+    run_id, jobs_by_provider = RUNS[-1]
+    assert store.record_run(profile="cs", run_id=run_id, run_timestamp=run_id, jobs_by_provider=jobs_by_provider) == 3
+    assert len(store.job_timeline("a", profile="cs")) == 4
+
+
+def test_open_duration_and_churn_by_provider(tmp_path: Path) -> None:
+    store = JobHistoryStore(tmp_path / "job_history.sqlite")
+    assert store.open_duration("a", profile="cs") is None
+    assert store.churn_by_provider(profile="cs") == {}
+    _record_all(store)
+
+    duration = store.open_duration("a", profile="cs", provider="openai")
+    assert duration["first_seen_run_id"] == "2026-02-01T00:00:00Z"
+    assert duration["runs_seen"] == 3
+    assert duration["open"] is True
+    assert duration["open_days"] == 2.0
+    assert store.open_duration("c", profile="cs")["open"] is False
+
+    churn = store.churn_by_provider(profile="cs")
+    assert churn["openai"] == {"new": 0, "reopened": 1, "changed": 0, "unchanged": 1, "removed": 1}
+    assert churn["anthropic"]["new"] == 1
+    assert store.churn_by_provider(profile="cs", run_id="2026-02-02T00:00:00Z")["openai"]["removed"] == 1
+
+
+def test_rebuild_from_run_dirs_matches_incremental(tmp_path: Path) -> None:
+    run_dirs = []
+    for run_id, jobs_by_provider in RUNS:
+        run_dir = tmp_path / "runs" / run_id.replace(":", "")
+        providers_payload = {}
+        for provider, jobs in jobs_by_provider.items():
+            name = f"{provider}_ranked_jobs.cs.json"
+            (run_dir / provider / "cs").mkdir(parents=True)
+            (run_dir / provider / "cs" / name).write_text(json.dumps(jobs), encoding="utf-8")
+            providers_payload[provider] = {"profiles": {"cs": {"artifacts": {name: f"{provider}/cs/{name}"}}}}
+        (run_dir / "index.json").write_text(
+            json.dumps({"run_id": run_id, "timestamp": run_id, "providers": providers_payload}), encoding="utf-8"
+        )
+        run_dirs.append(run_dir)
+
+    incremental = JobHistoryStore(tmp_path / "incremental.sqlite")
+    _record_all(incremental)
+    rebuilt = JobHistoryStore(tmp_path / "rebuilt.sqlite")
+    result = rebuilt.rebuild_from_run_dirs(reversed(run_dirs))
+    assert (result.runs_indexed, result.rows_indexed) == (3, 7)
+
+    def _rows(path: Path) -> list:
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT * FROM job_history ORDER BY profile, job_id, provider, run_id").fetchall()
+
+    assert _rows(rebuilt.db_path) == _rows(incremental.db_path)
+
+
+def test_write_history_run_artifacts_records_job_history(tmp_path: Path) -> None:
+    ranked_path = tmp_path / "data" / "openai_ranked_jobs.cs.json"
+    ranked_path.parent.mkdir(parents=True)
+    ranked_path.write_text(json.dumps([_job("job-1", "f1"), _job("job-2", "f2")]), encoding="utf-8")
+    report_path = tmp_path / "run_report.json"
+    report_path.write_text(
+        json.dumps(
+            {
+                "run_id": "2026-02-07T12:34:56Z",
+                "providers": ["openai"],
+                "outputs_by_provider": {"openai": {"cs": {"ranked_json": {"path": str(ranked_path)}}}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    db_path = tmp_path / "system_state" / "job_history.sqlite"
+    result = write_history_run_artifacts(
+        history_dir=tmp_path / "history",
+        run_id="2026-02-07T12:34:56Z",
+        profile="cs",
+        run_report_path=report_path,
+        written_at="2026-02-07T12:35:00Z",
+        job_history_db=db_path,
+    )
+    assert result.job_history_rows == 2
+    timeline = JobHistoryStore(db_path).job_timeline("job-2", profile="cs")
+    assert timeline[0]["run_timestamp"] == "2026-02-07T12:35:00Z"
+    assert timeline[0]["status"] == "new"
@@ -1,7 +1,15 @@
 import hashlib
 import json
 
-from ji_engine.utils.job_identity import job_identity
+from ji_engine.utils import job_identity as job_identity_module
+from ji_engine.utils.job_identity import (
+    JOB_IDENTITY_FIELD,
+    clear_identity_memo,
+    identities_for,
+    identity_memo_stats,
+    job_identity,
+    stored_job_identity,
+)
 
 
 def _hash_payload(payload: dict) -> str:
@@ -140,3 +148,42 @@ def test_job_identity_changes_when_key_fields_change_without_req_id():
     }
     variant = {**base, "location": "San Francisco"}
     assert job_identity(base, mode="provider") != job_identity(variant, mode="provider")
+
+
+def test_identity_memo_matches_uncached_and_counts_hits():
+    clear_identity_memo()
+    jobs = [
+        {"provider": "openai", "job_id": "R-1", "title": "A"},
+        {"provider": "openai", "apply_url": "https://example.com/jobs/2?utm_source=x", "title": "B"},
+        {"provider": "openai", "title": "C", "location": "Remote", "description_text": "hello"},
+        {"title": "D", "location": "NYC", "raw": {"nested": ["unhashable"]}},
+        {"title": "E", "location": ["list", "value"]},
+    ]
+    for mode in ("legacy", "provider"):
+        expected = [job_identity_module._compute_job_identity(job, mode=mode) for job in jobs]
+        assert identities_for(jobs, mode=mode) == expected
+        assert identities_for(jobs, mode=mode) == expected
+    stats = identity_memo_stats()
+    # Legacy identities with a job_id and the unhashable list-valued location bypass the memo.
+    assert stats["misses"] == 7
+    assert stats["hits"] == 7
+    assert stats["size"] == 7
+
+
+def test_identity_memo_keys_on_identity_fields_only():
+    clear_identity_memo()
+    base = {"provider": "openai", "title": "A", "location": "Remote"}
+    first = job_identity(base, mode="provider")
+    assert job_identity({**base, "score": 99, "explanation": {"x": 1}}, mode="provider") == first
+    assert identity_memo_stats()["hits"] == 1
+    changed = job_identity({**base, "location": "NYC"}, mode="provider")
+    assert changed != first
+    # 1 and True hash equal but render differently; the memo must not conflate them.
+    assert job_identity({"title": 1}) == job_identity_module._compute_job_identity({"title": 1}, mode="legacy")
+    assert job_identity({"title": True}) == job_identity_module._compute_job_identity({"title": True}, mode="legacy")
+
+
+def test_stored_job_identity_prefers_record_value():
+    job = {"provider": "openai", "title": "A", "location": "Remote"}
+    assert stored_job_identity(job) == job_identity(job, mode="provider")
+    assert stored_job_identity({**job, JOB_IDENTITY_FIELD: "precomputed"}) == "precomputed"
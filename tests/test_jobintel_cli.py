@@ -120,3 +120,30 @@ def test_cli_run_daily_prints_run_summary_path_when_present(tmp_path, monkeypatc
     assert rc == 0
     out = capsys.readouterr().out
     assert f"RUN_SUMMARY_PATH={run_summary_path}" in out
+
+
+def test_cli_runs_list_filters(tmp_path, monkeypatch, capsys):
+    import importlib
+    import json
+
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+    import ji_engine.config as config
+    import ji_engine.run_repository as run_repository
+
+    importlib.reload(config)
+    importlib.reload(run_repository)
+    reloaded = importlib.reload(cli)
+
+    for run_id, status in (("2026-01-02T00:00:00Z", "success"), ("2026-01-03T00:00:00Z", "failed")):
+        run_dir = config.RUN_METADATA_DIR / run_id.replace(":", "").replace("-", "")
+        run_dir.mkdir(parents=True)
+        (run_dir / "index.json").write_text(json.dumps({"run_id": run_id, "timestamp": run_id}), encoding="utf-8")
+        (run_dir / "run_report.json").write_text(json.dumps({"status": status}), encoding="utf-8")
+
+    assert reloaded.main(["runs", "list", "--status", "success", "--json"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert [run["run_id"] for run in payload["runs"]] == ["2026-01-02T00:00:00Z"]
+    assert payload["next_cursor"] is None
+
+    with pytest.raises(SystemExit):
+        reloaded.main(["runs", "list", "--cursor", "not-a-cursor"])
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+import ji_engine.config as config
+import scripts.run_classify as run_classify
+import scripts.run_enrich as run_enrich
+import scripts.score_jobs as score_jobs
+from ji_engine.utils.atomic_write import atomic_write_with
+from ji_engine.utils.canonical_json import COMPACT_JSON_SETTINGS, PRETTY_JSON_SETTINGS
+from ji_engine.utils.jsonl import _iter_json_array, iter_json_records, read_json_records, write_json_records
+
+_RECORDS = [
+    {"title": "Solutions Engineer", "jd_text": 'line one\nline "two" — café', "tags": [1, 2.5, None, {"k": True}]},
+    {"title": "TAM", "score": 1234567890123, "nested": {"b": [], "a": {}}},
+    [],
+    "plain string",
+    -0.5,
+]
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_json_array_writer_is_byte_identical_and_reader_streams_across_chunks(tmp_path: Path, pretty: bool) -> None:
+    settings = PRETTY_JSON_SETTINGS if pretty else COMPACT_JSON_SETTINGS
+    out = tmp_path / "records.json"
+    assert write_json_records(out, iter(_RECORDS), pretty=pretty) == len(_RECORDS)
+    assert out.read_text(encoding="utf-8") == json.dumps(_RECORDS, **settings) + "\n"
+    for chunk_chars in (1, 3, 64):
+        assert list(_iter_json_array(io.StringIO(out.read_text(encoding="utf-8")), chunk_chars, "t")) == _RECORDS
+    assert read_json_records(out) == _RECORDS
+
+    empty = tmp_path / "empty.json"
+    write_json_records(empty, [], pretty=pretty)
+    assert empty.read_text(encoding="utf-8") == json.dumps([], **settings) + "\n"
+    assert read_json_records(empty) == []
+
+
+def test_jsonl_round_trip_and_malformed_inputs(tmp_path: Path) -> None:
+    out = tmp_path / "records.jsonl"
+    assert write_json_records(out, (record for record in _RECORDS)) == len(_RECORDS)
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(_RECORDS) and all("\n" not in line for line in lines)
+    assert list(iter_json_records(out)) == _RECORDS
+
+    bad_line = tmp_path / "bad.jsonl"
+    bad_line.write_text('{"a": 1}\n\n{"a": \n', encoding="utf-8")
+    with pytest.raises(ValueError, match="bad.jsonl:3"):
+        read_json_records(bad_line)
+    for text in ('{"a": 1}', "[1, 2", "[1 2]", "[1,]"):
+        bad = tmp_path / "bad.json"
+        bad.write_text(text, encoding="utf-8")
+        with pytest.raises(ValueError):
+            read_json_records(bad)
+    # A failed write leaves neither a partial artifact nor a temp file behind.
+    with pytest.raises(TypeError):
+        write_json_records(tmp_path / "partial.json", [{"ok": 1}, {"bad": object()}])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bad.json", "bad.jsonl", "records.jsonl"]
+
+
+def test_writer_goes_through_the_shared_atomic_write(tmp_path: Path, monkeypatch) -> None:
+    import ji_engine.utils.jsonl as jsonl
+
+    targets: list = []
+
+    def _recording(path: Path, writer) -> None:
+        targets.append(path)
+        atomic_write_with(path, writer)
+
+    monkeypatch.setattr(jsonl, "atomic_write_with", _recording)
+    out = tmp_path / "records.jsonl"
+    assert write_json_records(out, _RECORDS) == len(_RECORDS)
+    assert targets == [out]
+    assert read_json_records(out) == _RECORDS
+
+
+def test_jsonl_artifacts_through_classify_and_score(tmp_path: Path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv("JOBINTEL_DATA_DIR", str(data_dir))
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+    importlib.reload(config)
+    importlib.reload(run_classify)
+    importlib.reload(score_jobs)
+
+    raw = [
+        {
+            "source": "openai",
+            "title": title,
+            "location": "Remote - US",
+            "team": "CS",
+            "apply_url": f"https://jobs.ashbyhq.com/openai/{idx}/application",
+            "detail_url": None,
+            "raw_text": "Customer success for enterprise API deployments.",
+            "scraped_at": "2024-01-01T00:00:00",
+        }
+        for idx, title in enumerate(("Customer Success Manager", "Solutions Engineer", "Office Manager"))
+    ]
+    raw_json = data_dir / "raw.json"
+    write_json_records(raw_json, raw, pretty=True)
+    raw_jsonl = data_dir / "raw.jsonl"
+    write_json_records(raw_jsonl, raw)
+
+    labeled_json = data_dir / "labeled.json"
+    labeled_jsonl = data_dir / "labeled.jsonl"
+    assert run_classify.main(["--in_path", str(raw_json), "--out_path", str(labeled_json)]) == 0
+    assert run_classify.main(["--in_path", str(raw_jsonl), "--out_path", str(labeled_jsonl)]) == 0
+    assert read_json_records(labeled_jsonl) == json.loads(labeled_json.read_text(encoding="utf-8"))
+
+    outputs = {}
+    for name, in_path in (("json", labeled_json), ("jsonl", labeled_jsonl)):
+        out_dir = tmp_path / name
+        argv = ["score_jobs.py", "--profile", "cs", "--in_path", str(in_path), "--min_score", "0"]
+        for flag, filename in (
+            ("--out_json", "ranked.json"),
+            ("--out_jsonl", "ranked.jsonl"),
+            ("--out_csv", "ranked.csv"),
+            ("--out_families", "families.json"),
+            ("--out_md", "shortlist.md"),
+        ):
+            argv += [flag, str(out_dir / filename)]
+        monkeypatch.setattr(sys, "argv", argv)
+        assert score_jobs.main() == 0
+        outputs[name] = out_dir
+
+    ranked_bytes = (outputs["json"] / "ranked.json").read_bytes()
+    # The canonical ranked JSON does not depend on the input format, and the JSONL carries the same records.
+    assert (outputs["jsonl"] / "ranked.json").read_bytes() == ranked_bytes
+    assert read_json_records(outputs["jsonl"] / "ranked.jsonl") == json.loads(ranked_bytes)
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [('{"jobs": []}', "expected a JSON array of records"), ("[1 2]", "expected ',' or ']'")],
+)
+def test_run_enrich_reports_the_reader_error(tmp_path: Path, monkeypatch, capsys, text: str, message: str) -> None:
+    labeled = tmp_path / "labeled.json"
+    labeled.write_text(text, encoding="utf-8")
+    monkeypatch.setattr(
+        sys, "argv", ["run_enrich.py", "--in_path", str(labeled), "--out_path", str(tmp_path / "out.json")]
+    )
+    with pytest.raises(SystemExit):
+        run_enrich.main()
+    out = capsys.readouterr().out
+    assert message in out and str(labeled) in out
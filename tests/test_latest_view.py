@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+import ji_engine.config as config
+import scripts.run_daily as run_daily
+from ji_engine.latest_view import (
+    LATEST_VIEW_SCHEMA_VERSION,
+    build_latest_records,
+    latest_record,
+    read_latest_view,
+    update_latest_view,
+)
+
+
+def _report(run_id: str, profiles: list) -> dict:
+    return {
+        "run_id": run_id,
+        "timestamps": {"ended_at": run_id},
+        "outputs_by_provider": {
+            "openai": {
+                profile: {
+                    "ranked_json": {"path": f"/data/openai_ranked_jobs.{profile}.json", "sha256": f"sha-{profile}"},
+                    "shortlist_md": {"path": f"/data/openai_shortlist.{profile}.md", "sha256": None},
+                }
+                for profile in profiles
+            }
+        },
+    }
+
+
+def _index(profiles: list) -> dict:
+    return {
+        "providers": {
+            "openai": {
+                "profiles": {
+                    profile: {
+                        "diff_counts": {"new": 1, "changed": 0, "removed": 2},
+                        "artifacts": {
+                            f"openai_ranked_jobs.{profile}.json": f"openai/{profile}/openai_ranked_jobs.{profile}.json"
+                        },
+                    }
+                    for profile in profiles
+                }
+            }
+        }
+    }
+
+
+def test_latest_view_merges_records_per_provider_profile(tmp_path: Path) -> None:
+    view_path = tmp_path / "system_state" / "latest_view.json"
+    assert read_latest_view(view_path) == {}
+
+    run_a = tmp_path / "runs" / "a"
+    update_latest_view(view_path, build_latest_records(_report("a", ["cs", "tam"]), run_a, _index(["cs", "tam"])))
+    # Run b only ranked cs; tam keeps pointing at run a.
+    run_b = tmp_path / "runs" / "b"
+    records = build_latest_records(_report("b", ["cs", "tam"]), run_b, _index(["cs"]))
+    assert sorted(records) == ["openai/cs"]
+    update_latest_view(view_path, records)
+
+    view = read_latest_view(view_path)
+    assert view["schema_version"] == LATEST_VIEW_SCHEMA_VERSION
+    cs = latest_record(view, "openai", "cs")
+    assert cs["run_id"] == "b"
+    assert cs["ranked_json"] == str(run_b / "openai" / "cs" / "openai_ranked_jobs.cs.json")
+    assert cs["outputs"]["ranked_json"] == {"path": "/data/openai_ranked_jobs.cs.json", "sha256": "sha-cs"}
+    assert cs["counts"] == {"new": 1, "changed": 0, "removed": 2}
+    assert latest_record(view, "openai", "tam")["run_id"] == "a"
+    assert latest_record(view, "anthropic", "cs") is None
+
+    view_path.write_text(json.dumps({"schema_version": 0, "records": {}}), encoding="utf-8")
+    assert read_latest_view(view_path) == {}
+
+
+def test_run_daily_updates_latest_view_and_uses_it_as_baseline(tmp_path: Path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    state_dir = tmp_path / "state"
+    snapshot = data_dir / "openai_snapshots" / "index.html"
+    snapshot.parent.mkdir(parents=True, exist_ok=True)
+    snapshot.write_text("snapshot", encoding="utf-8")
+
+    monkeypatch.setenv("JOBINTEL_DATA_DIR", str(data_dir))
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(state_dir))
+    importlib.reload(config)
+    module = importlib.reload(run_daily)
+
+    output_dir = data_dir / "ashby_cache"
+
+    def fake_run(cmd, *, stage):
+        if stage in {"scrape", "classify", "enrich"}:
+            name = {"scrape": "raw", "classify": "labeled", "enrich": "enriched"}[stage]
+            path = output_dir / f"openai_{name}_jobs.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("[]", encoding="utf-8")
+        elif stage.startswith("score:"):
+            profile = stage.split(":", 1)[1]
+            for path in (
+                module._provider_ranked_jobs_json("openai", profile),
+                module._provider_ranked_jobs_csv("openai", profile),
+                module._provider_ranked_families_json("openai", profile),
+                module._provider_shortlist_md("openai", profile),
+            ):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("[]", encoding="utf-8")
+
+    monkeypatch.setattr(module, "_run", fake_run)
+    monkeypatch.setattr(sys, "argv", ["run_daily.py", "--no_subprocess", "--profiles", "cs", "--us_only", "--no_post"])
+    assert module.main() == 0
+
+    run_report = json.loads(sorted(module.RUN_METADATA_DIR.glob("*.json"))[-1].read_text(encoding="utf-8"))
+    run_id = run_report["run_id"]
+    record = latest_record(read_latest_view(config.candidate_latest_view_path("local")), "openai", "cs")
+    assert record is not None
+    assert record["run_id"] == run_id
+    assert (
+        record["outputs"]["ranked_json"]["sha256"]
+        == run_report["outputs_by_provider"]["openai"]["cs"]["ranked_json"]["sha256"]
+    )
+    ranked_copy = module._run_registry_dir(run_id) / "openai" / "cs" / "openai_ranked_jobs.cs.json"
+    assert Path(record["ranked_json"]) == ranked_copy
+
+    assert module._resolve_latest_view_ranked("openai", "cs", "2099-01-01T00:00:00Z") == ranked_copy
+    assert module._resolve_latest_view_ranked("openai", "cs", run_id) is None
+    ranked_copy.unlink()
+    assert module._resolve_latest_view_ranked("openai", "cs", "2099-01-01T00:00:00Z") is None
+
+
+def test_dashboard_latest_artifacts_reads_latest_view(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+    import ji_engine.dashboard.app as dashboard
+
+    importlib.reload(config)
+    dashboard = importlib.reload(dashboard)
+
+    run_dir = config.candidate_run_metadata_dir("local") / "a"
+    update_latest_view(
+        config.candidate_latest_view_path("local"), build_latest_records(_report("a", ["cs"]), run_dir, _index(["cs"]))
+    )
+
+    client = TestClient(dashboard.app)
+    resp = client.get("/v1/artifacts/latest/openai/cs")
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "source": "local",
+        "run_id": "a",
+        "paths": ["/data/openai_ranked_jobs.cs.json", "/data/openai_shortlist.cs.md"],
+    }
+    # No record and no last_success pointer for this pair -> the pointer path still answers 404.
+    assert client.get("/v1/artifacts/latest/openai/tam").status_code == 404
@@ -29,3 +29,50 @@ def test_normalize_empty() -> None:
     result = normalize_location_guess(None, None)
     assert result["is_us_or_remote_us_guess"] is False
     assert result["us_guess_reason"] == "none"
+
+
+def test_location_normalizer_matches_uncached_and_counts_hits() -> None:
+    from ji_engine.utils.location_normalize import LocationNormalizer
+
+    normalizer = LocationNormalizer(maxsize=8)
+    cases = [
+        ("Customer Success Manager", "Remote - US"),
+        ("Solutions Engineer", "Remote - US"),
+        ("Engineer (Remote)", "United States"),
+        ("Engineer, United", "States"),
+        ("Engineer, United Kingdom", "States"),
+        ("Engineer US", None),
+        ("Engineer", "London, UK"),
+        (None, None),
+    ]
+    for title, location in cases:
+        assert normalizer.normalize(title, location) == normalize_location_guess(title, location)
+    stats = normalizer.stats()
+    # Titles without location markers share a cache entry per location.
+    assert stats["hits"] == 1
+    assert stats["misses"] == len(cases) - 1
+
+
+def test_location_normalizer_batch_and_bound() -> None:
+    from ji_engine.utils.location_normalize import LocationNormalizer
+
+    normalizer = LocationNormalizer(maxsize=2)
+    jobs = [
+        {"title": "A", "location": "New York, NY"},
+        {"title": "B", "locationName": "Remote - US"},
+        {"title": "C", "location": "Austin, TX"},
+        {"title": "D", "location": "New York, NY"},
+    ]
+    results = normalizer.normalize_jobs(jobs)
+    assert [r["us_guess_reason"] for r in results] == ["city_state", "remote_us", "city_state", "city_state"]
+    stats = normalizer.stats()
+    assert stats["size"] == 2
+    assert stats["misses"] == 4
+
+
+def test_title_location_signal_keeps_marker_words_apart() -> None:
+    from ji_engine.utils.location_normalize import title_location_signal
+
+    assert title_location_signal("Senior Customer Success Manager") == "~"
+    assert title_location_signal("Engineer - Remote US") == "~ Remote US"
+    assert title_location_signal("United Robotics States") == "United ~ States"
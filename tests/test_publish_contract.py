@@ -54,3 +54,22 @@ def test_publish_state_required_with_bucket() -> None:
     assert enabled is True
     assert required is True
     assert reason is None
+
+
+def test_publish_section_carries_transfer_summary() -> None:
+    transfers = {
+        "uploaded": 1,
+        "copied": 1,
+        "skipped": 0,
+        "bytes_uploaded": 2,
+        "workers": 8,
+        "seconds": 0.1,
+        "files": [],
+    }
+    section = run_daily._build_publish_section(
+        s3_meta={"status": "ok", "transfers": transfers}, enabled=True, required=False, bucket="b", prefix="p"
+    )
+    assert section["transfers"] == transfers
+    assert "transfers" not in run_daily._build_publish_section(
+        s3_meta={"status": "skipped"}, enabled=False, required=False, bucket=None, prefix=None
+    )
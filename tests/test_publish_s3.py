@@ -47,9 +47,15 @@ class DummyClient:
     def __init__(self):
         self.calls = []
 
-    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None):
+    def head_object(self, Bucket, Key):
+        raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None, Config=None):
         self.calls.append(("upload", Key, ExtraArgs or {}))
 
+    def copy_object(self, Bucket, Key, CopySource):
+        self.calls.append(("copy", Key, CopySource["Key"]))
+
     def put_object(self, Bucket, Key, Body):
         self.calls.append(("put", Key))
 
@@ -142,10 +148,19 @@ def test_publish_s3_uploads_runs_and_latest(tmp_path, monkeypatch):
         [
             f"jobintel/runs/{run_id}/openai/cs/openai_ranked_jobs.cs.json",
             f"jobintel/runs/{run_id}/openai/cs/openai_shortlist.cs.md",
-            "jobintel/latest/openai/cs/openai_ranked_jobs.cs.json",
-            "jobintel/latest/openai/cs/openai_shortlist.cs.md",
         ]
     )
+    copies = sorted(call[1:] for call in client.calls if call[0] == "copy")
+    assert copies == [
+        (
+            "jobintel/latest/openai/cs/openai_ranked_jobs.cs.json",
+            f"jobintel/runs/{run_id}/openai/cs/openai_ranked_jobs.cs.json",
+        ),
+        (
+            "jobintel/latest/openai/cs/openai_shortlist.cs.md",
+            f"jobintel/runs/{run_id}/openai/cs/openai_shortlist.cs.md",
+        ),
+    ]
     content_types = [call[2].get("ContentType") for call in client.calls if call[0] == "upload"]
     assert any(ct == "application/json" for ct in content_types)
     assert any(ct == "text/markdown; charset=utf-8" for ct in content_types)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import scripts.publish_s3 as publish_s3
+from ji_engine.utils.verification import compute_sha256_file
+
+try:
+    import boto3
+    from moto import mock_aws
+except ImportError:  # pragma: no cover - optional dependency
+    boto3 = None
+    mock_aws = None
+
+pytestmark = pytest.mark.skipif(mock_aws is None, reason="moto not installed")
+
+BUCKET = "bucket"
+RUN_ID = "2026-01-02T00:00:00Z"
+
+
+def _write_report(run_dir: Path, artifacts: dict) -> None:
+    verifiable = {
+        logical_key: {
+            "path": path.name,
+            "sha256": compute_sha256_file(path),
+            "bytes": path.stat().st_size,
+            "hash_algo": "sha256",
+        }
+        for logical_key, path in artifacts.items()
+    }
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "run_report.json").write_text(
+        json.dumps(
+            {
+                "run_id": RUN_ID,
+                "run_report_schema_version": 1,
+                "providers": ["openai"],
+                "profiles": ["cs"],
+                "timestamps": {"ended_at": RUN_ID},
+                "verifiable_artifacts": verifiable,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def _publish(run_dir: Path) -> dict:
+    return publish_s3.publish_run(
+        run_id=RUN_ID,
+        bucket=BUCKET,
+        prefix="jobintel",
+        run_dir=run_dir,
+        dry_run=False,
+        require_s3=True,
+        workers=4,
+    )
+
+
+def _actions(result: dict) -> dict:
+    return {record["s3_key"]: record["action"] for record in result["transfers"]["files"]}
+
+
+def test_publish_copies_latest_and_skips_unchanged_objects(tmp_path: Path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    monkeypatch.setattr(publish_s3, "DATA_DIR", data_dir)
+    ranked = data_dir / "openai_ranked_jobs.cs.json"
+    ranked.write_text('[{"job_id": "1"}]', encoding="utf-8")
+    shortlist = data_dir / "openai_shortlist.cs.md"
+    shortlist.write_text("# shortlist", encoding="utf-8")
+    run_dir = tmp_path / "run"
+    _write_report(run_dir, {"openai:cs:ranked_json": ranked, "openai:cs:shortlist_md": shortlist})
+
+    runs_ranked = f"jobintel/runs/{RUN_ID}/openai/cs/openai_ranked_jobs.cs.json"
+    runs_shortlist = f"jobintel/runs/{RUN_ID}/openai/cs/openai_shortlist.cs.md"
+    latest_ranked = "jobintel/latest/openai/cs/openai_ranked_jobs.cs.json"
+    latest_shortlist = "jobintel/latest/openai/cs/openai_shortlist.cs.md"
+
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        # Same bytes already present without sha256 metadata (older publisher): matched by ETag.
+        client.put_object(Bucket=BUCKET, Key=runs_shortlist, Body=shortlist.read_bytes())
+
+        first = _publish(run_dir)
+        assert first["status"] == "ok"
+        assert first["uploaded_files_count"] == 4
+        assert _actions(first) == {
+            runs_ranked: "uploaded",
+            runs_shortlist: "skipped",
+            latest_ranked: "copied",
+            latest_shortlist: "copied",
+        }
+        assert first["transfers"]["bytes_uploaded"] == ranked.stat().st_size
+        assert first["transfers"]["workers"] == 4
+        assert all(record["seconds"] >= 0 for record in first["transfers"]["files"])
+
+        head = client.head_object(Bucket=BUCKET, Key=latest_ranked)
+        assert head["ContentType"] == "application/json"
+        assert head["Metadata"] == {"sha256": compute_sha256_file(ranked)}
+        body = client.get_object(Bucket=BUCKET, Key=latest_ranked)["Body"].read()
+        assert body == ranked.read_bytes()
+
+        second = _publish(run_dir)
+        assert set(_actions(second).values()) == {"skipped"}
+        assert second["transfers"]["bytes_uploaded"] == 0
+        assert second["uploaded_files_count"] == 4
+
+        ranked.write_text('[{"job_id": "2"}]', encoding="utf-8")
+        _write_report(run_dir, {"openai:cs:ranked_json": ranked, "openai:cs:shortlist_md": shortlist})
+        third = _publish(run_dir)
+        assert _actions(third) == {
+            runs_ranked: "uploaded",
+            runs_shortlist: "skipped",
+            latest_ranked: "copied",
+            latest_shortlist: "skipped",
+        }
+        assert client.get_object(Bucket=BUCKET, Key=latest_ranked)["Body"].read() == ranked.read_bytes()
+
+
+def test_publish_multipart_upload_is_skipped_by_sha_metadata(tmp_path: Path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    monkeypatch.setattr(publish_s3, "DATA_DIR", data_dir)
+    monkeypatch.setattr(publish_s3, "MULTIPART_THRESHOLD_BYTES", 5 * 1024 * 1024)
+    monkeypatch.setattr(publish_s3, "MULTIPART_CHUNKSIZE_BYTES", 5 * 1024 * 1024)
+    ranked = data_dir / "openai_ranked_jobs.cs.json"
+    ranked.write_bytes(b"[" + b" " * (6 * 1024 * 1024) + b"]")
+    run_dir = tmp_path / "run"
+    _write_report(run_dir, {"openai:cs:ranked_json": ranked})
+
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+
+        first = _publish(run_dir)
+        runs_key = f"jobintel/runs/{RUN_ID}/openai/cs/openai_ranked_jobs.cs.json"
+        assert _actions(first)[runs_key] == "uploaded"
+        # Multipart ETag is not an MD5 of the content; the sha256 metadata is what makes it skippable.
+        assert "-" in client.head_object(Bucket=BUCKET, Key=runs_key)["ETag"]
+
+        second = _publish(run_dir)
+        assert set(_actions(second).values()) == {"skipped"}
+
+
+def test_streaming_publisher_uploads_in_background_and_rolls_back(tmp_path: Path) -> None:
+    ranked = tmp_path / "openai_ranked_jobs.cs.json"
+    ranked.write_text("[]", encoding="utf-8")
+    shortlist = tmp_path / "openai_shortlist.cs.md"
+    shortlist.write_text("# shortlist", encoding="utf-8")
+    runs_prefix = f"jobintel/runs/{RUN_ID}/openai/cs"
+
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        client.put_object(Bucket=BUCKET, Key=f"{runs_prefix}/openai_shortlist.cs.md", Body=shortlist.read_bytes())
+
+        streamer = publish_s3.StreamingPublisher(
+            run_id=RUN_ID, bucket=BUCKET, prefix="jobintel", workers=2, client_factory=lambda: client
+        )
+        streamer.submit("openai", "cs", [ranked, shortlist, tmp_path / "missing.csv"])
+        streamer.submit("openai", "cs", [ranked])
+        summary = streamer.rollback()
+
+        assert {record["s3_key"]: record["action"] for record in summary["files"]} == {
+            f"{runs_prefix}/openai_ranked_jobs.cs.json": "uploaded",
+            f"{runs_prefix}/openai_shortlist.cs.md": "skipped",
+        }
+        assert summary["rolled_back"] == 1
+        assert summary["errors"] == []
+        remaining = [obj["Key"] for obj in client.list_objects_v2(Bucket=BUCKET).get("Contents", [])]
+        # Objects that were already there before the run are not this run's to delete.
+        assert remaining == [f"{runs_prefix}/openai_shortlist.cs.md"]
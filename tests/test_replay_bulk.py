@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import scripts.replay_run as replay_run
+
+
+def _write_run(runs_dir: Path, data_dir: Path, run_id: str, content: bytes) -> Path:
+    ranked = data_dir / f"openai_ranked_jobs.{run_id}.json"
+    ranked.parent.mkdir(parents=True, exist_ok=True)
+    ranked.write_bytes(content)
+    run_dir = runs_dir / replay_run._sanitize_run_id(run_id)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    report = {
+        "run_id": run_id,
+        "verifiable_artifacts": {
+            "openai:cs:ranked_json": {
+                "path": ranked.name,
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "bytes": len(content),
+                "hash_algo": "sha256",
+            }
+        },
+    }
+    (run_dir / "run_report.json").write_text(json.dumps(report), encoding="utf-8")
+    return ranked
+
+
+def _history(tmp_path: Path, monkeypatch) -> tuple:
+    data_dir = tmp_path / "data"
+    runs_dir = tmp_path / "state" / "runs"
+    monkeypatch.setattr(replay_run, "DATA_DIR", data_dir)
+    run_ids = ["2026-01-01T00:00:00Z", "2026-01-02T00:00:00Z", "2026-01-03T00:00:00Z"]
+    ranked = [_write_run(runs_dir, data_dir, run_id, f"[{idx}]".encode()) for idx, run_id in enumerate(run_ids)]
+    return runs_dir, run_ids, ranked
+
+
+def test_bulk_replay_writes_matrix_and_fails_on_any_mismatch(tmp_path: Path, monkeypatch, capsys) -> None:
+    runs_dir, run_ids, ranked = _history(tmp_path, monkeypatch)
+    (runs_dir / "not-a-run").mkdir()
+    matrix_path = tmp_path / "matrix.json"
+
+    args = ["--all", "--runs-dir", str(runs_dir), "--workers", "2", "--matrix-out", str(matrix_path), "--quiet"]
+    assert replay_run.main(args) == 0
+    matrix = json.loads(matrix_path.read_text(encoding="utf-8"))
+    assert matrix["schema_version"] == replay_run.BULK_REPLAY_MATRIX_SCHEMA_VERSION
+    assert [row["run_id"] for row in matrix["runs"]] == run_ids
+    assert matrix["summary"] == {
+        "runs": 3,
+        "passed": 3,
+        "failed": 0,
+        "failed_run_ids": [],
+        "mismatched": 0,
+        "missing": 0,
+    }
+
+    ranked[1].write_bytes(b"[9]")
+    ranked[2].unlink()
+    assert replay_run.main([*args[:-1], "--json"]) == 2
+    matrix = json.loads(capsys.readouterr().out)
+    assert [row["artifacts"] for row in matrix["runs"]] == [
+        {"openai:cs:ranked_json": "match"},
+        {"openai:cs:ranked_json": "mismatch"},
+        {"openai:cs:ranked_json": "missing"},
+    ]
+    assert matrix["summary"]["failed_run_ids"] == run_ids[1:]
+    assert json.loads(matrix_path.read_text(encoding="utf-8")) == matrix
+
+
+def test_bulk_replay_since_filters_runs(tmp_path: Path, monkeypatch, capsys) -> None:
+    runs_dir, run_ids, _ = _history(tmp_path, monkeypatch)
+    assert replay_run.main(["--since", run_ids[1], "--runs-dir", str(runs_dir), "--workers", "1"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out == [
+        f"{run_ids[1]}: PASS checked=1 matched=1 mismatched=0 missing=0",
+        f"{run_ids[2]}: PASS checked=1 matched=1 mismatched=0 missing=0",
+        "SUMMARY: runs=2 passed=2 failed=0",
+    ]
+    assert replay_run.main(["--since", "2027-01-01T00:00:00Z", "--runs-dir", str(runs_dir), "--quiet"]) == 2
+    assert replay_run.main(["--all", "--candidate", "Bad Id!", "--quiet"]) == 2
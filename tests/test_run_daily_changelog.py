@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from ji_engine.utils.diff_engine import JobDiff
 from scripts import run_daily
 
 
@@ -34,7 +35,7 @@ def test_changelog_counts(tmp_path: Path) -> None:
     prev_loaded = run_daily._read_json(prev_path)
     curr_loaded = run_daily._read_json(curr_path)
 
-    new_jobs, changed_jobs, removed_jobs, _changed_fields = run_daily._diff(prev_loaded, curr_loaded)
+    new_jobs, changed_jobs, removed_jobs, _changed_fields = run_daily._diff(JobDiff(prev_loaded, curr_loaded))
 
     assert len(new_jobs) == 1
     assert len(changed_jobs) == 1
@@ -59,7 +60,7 @@ def test_changelog_uses_job_id_identity(tmp_path: Path) -> None:
     prev_loaded = run_daily._read_json(prev_path)
     curr_loaded = run_daily._read_json(curr_path)
 
-    new_jobs, changed_jobs, removed_jobs, _changed_fields = run_daily._diff(prev_loaded, curr_loaded)
+    new_jobs, changed_jobs, removed_jobs, _changed_fields = run_daily._diff(JobDiff(prev_loaded, curr_loaded))
 
     assert len(new_jobs) == 1
     assert len(changed_jobs) == 0
@@ -84,7 +85,7 @@ def test_changelog_prefers_job_id_over_url_changes(tmp_path: Path) -> None:
     prev_loaded = run_daily._read_json(prev_path)
     curr_loaded = run_daily._read_json(curr_path)
 
-    new_jobs, changed_jobs, removed_jobs, _changed_fields = run_daily._diff(prev_loaded, curr_loaded)
+    new_jobs, changed_jobs, removed_jobs, _changed_fields = run_daily._diff(JobDiff(prev_loaded, curr_loaded))
 
     assert len(new_jobs) == 0
     assert len(changed_jobs) == 0
@@ -177,6 +177,7 @@ def test_run_daily_writes_cost_artifact(tmp_path: Path, monkeypatch) -> None:
         "ai_estimated_cost_usd",
         "total_estimated_tokens",
         "ai_accounting",
+        "ai_cache",
     }
     assert costs["ai_calls"] >= 1
     assert costs["total_estimated_tokens"] == costs["embeddings_estimated_tokens"] + costs["ai_estimated_tokens"]
@@ -3,6 +3,8 @@ import json
 import sys
 from pathlib import Path
 
+import pytest
+
 
 def test_run_daily_error_skips_publish(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setenv("JOBINTEL_DATA_DIR", str(tmp_path / "data"))
@@ -52,3 +54,147 @@ def test_run_daily_error_skips_publish(monkeypatch, tmp_path: Path) -> None:
     publish_section = data.get("publish") or {}
     assert publish_section.get("enabled") is False
     assert publish_section.get("skip_reason") == "skipped_status_error"
+
+
+def _stream_env(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("JOBINTEL_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setenv("PUBLISH_S3", "1")
+    monkeypatch.setenv("PUBLISH_S3_STREAM", "1")
+    monkeypatch.setenv("JOBINTEL_S3_BUCKET", "bucket")
+    monkeypatch.setenv("JOBINTEL_S3_PREFIX", "jobintel")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+    import ji_engine.config as config
+    import scripts.publish_s3 as publish_s3
+    import scripts.run_daily as run_daily
+
+    importlib.reload(config)
+    importlib.reload(publish_s3)
+    run_daily = importlib.reload(run_daily)
+    monkeypatch.setattr(run_daily.publish_s3, "_run_preflight", lambda **_kwargs: {"ok": True})
+    snapshot = tmp_path / "data" / "openai_snapshots" / "index.html"
+    snapshot.parent.mkdir(parents=True, exist_ok=True)
+    snapshot.write_text("snapshot", encoding="utf-8")
+    return run_daily
+
+
+def _fake_stages(run_daily, tmp_path: Path, on_score):
+    def fake_run(cmd, *, stage):
+        if stage in {"scrape", "classify", "enrich"}:
+            name = {"scrape": "raw", "classify": "labeled", "enrich": "enriched"}[stage]
+            path = tmp_path / "data" / "ashby_cache" / f"openai_{name}_jobs.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("[]", encoding="utf-8")
+        elif stage.startswith("score:"):
+            profile = stage.split(":", 1)[1]
+            on_score(profile)
+            for path in (
+                run_daily._provider_ranked_jobs_json("openai", profile),
+                run_daily._provider_ranked_jobs_csv("openai", profile),
+                run_daily._provider_ranked_families_json("openai", profile),
+                run_daily._provider_shortlist_md("openai", profile),
+            ):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("[]", encoding="utf-8")
+
+    return fake_run
+
+
+def _wait_for_key(client, suffix: str) -> bool:
+    import time
+
+    for _ in range(500):
+        contents = client.list_objects_v2(Bucket="bucket", Prefix="jobintel/runs/").get("Contents") or []
+        if any(obj["Key"].endswith(suffix) for obj in contents):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_run_daily_streams_runs_artifacts_before_run_end(monkeypatch, tmp_path: Path) -> None:
+    pytest.importorskip("moto")
+    import boto3
+    from moto import mock_aws
+
+    run_daily = _stream_env(monkeypatch, tmp_path)
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="bucket")
+        seen_while_running: dict = {}
+
+        def on_score(profile: str) -> None:
+            if profile == "tam":
+                # cs finished before tam started scoring: its runs/ objects are already on their way.
+                seen_while_running["cs"] = _wait_for_key(client, "/openai/cs/openai_ranked_jobs.cs.json")
+                seen_while_running["latest"] = bool(
+                    client.list_objects_v2(Bucket="bucket", Prefix="jobintel/latest/").get("KeyCount")
+                )
+
+        monkeypatch.setattr(run_daily, "_run", _fake_stages(run_daily, tmp_path, on_score))
+        monkeypatch.setattr(
+            sys, "argv", ["run_daily.py", "--no_subprocess", "--profiles", "cs,tam", "--us_only", "--no_post"]
+        )
+        assert run_daily.main() == 0
+
+        assert seen_while_running == {"cs": True, "latest": False}
+        report = json.loads(sorted(run_daily.RUN_METADATA_DIR.glob("*.json"))[-1].read_text(encoding="utf-8"))
+        publish = report["publish"]
+        assert publish["streamed"]["uploaded"] == 8
+        assert publish["streamed"]["errors"] == []
+        runs_actions = {f["action"] for f in publish["transfers"]["files"] if f["kind"] == "runs"}
+        assert runs_actions == {"skipped"}
+        assert publish["transfers"]["copied"] == 8
+        assert publish["pointer_write"]["global"] == "ok"
+
+
+def test_run_daily_failed_run_rolls_back_streamed_objects(monkeypatch, tmp_path: Path) -> None:
+    pytest.importorskip("moto")
+    import boto3
+    from moto import mock_aws
+
+    run_daily = _stream_env(monkeypatch, tmp_path)
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="bucket")
+
+        def on_score(profile: str) -> None:
+            if profile == "tam":
+                assert _wait_for_key(client, "/openai/cs/openai_ranked_jobs.cs.json")
+                raise SystemExit(2)
+
+        monkeypatch.setattr(run_daily, "_run", _fake_stages(run_daily, tmp_path, on_score))
+        monkeypatch.setattr(
+            sys, "argv", ["run_daily.py", "--no_subprocess", "--profiles", "cs,tam", "--us_only", "--no_post"]
+        )
+        assert run_daily.main() == 2
+
+        assert client.list_objects_v2(Bucket="bucket").get("KeyCount") == 0
+        report = json.loads(sorted(run_daily.RUN_METADATA_DIR.glob("*.json"))[-1].read_text(encoding="utf-8"))
+        assert report["publish"]["skip_reason"] == "skipped_status_error"
+        assert report["publish"]["streamed"]["rolled_back"] == 4
+
+
+def test_run_daily_metadata_failure_rolls_back_streamed_objects(monkeypatch, tmp_path: Path) -> None:
+    pytest.importorskip("moto")
+    import boto3
+    from moto import mock_aws
+
+    run_daily = _stream_env(monkeypatch, tmp_path)
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="bucket")
+
+        def fail_metadata(**_kwargs):
+            assert _wait_for_key(client, "/openai/cs/openai_ranked_jobs.cs.json")
+            raise run_daily.ScoringConfigError("scoring config unreadable")
+
+        monkeypatch.setattr(run_daily, "build_scoring_model_metadata", fail_metadata)
+        monkeypatch.setattr(run_daily, "_run", _fake_stages(run_daily, tmp_path, lambda _profile: None))
+        monkeypatch.setattr(sys, "argv", ["run_daily.py", "--no_subprocess", "--profiles", "cs", "--no_post"])
+        run_daily.main()
+
+        # _finalize returned before the publish step; the streamed objects are still removed.
+        assert client.list_objects_v2(Bucket="bucket").get("KeyCount") == 0
+        last_run = json.loads(run_daily.LAST_RUN_JSON.read_text(encoding="utf-8"))
+        assert last_run["failed_stage"] == "scoring_model_metadata"
@@ -140,3 +140,254 @@ def test_rebuild_run_index_cli(tmp_path: Path, monkeypatch, capsys) -> None:
     assert rc == 0
     assert payload["results"][0]["candidate_id"] == "local"
     assert payload["results"][0]["runs_indexed"] == 1
+
+
+def test_delta_counts_window_reads_indexed_counts(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.run_repository as run_repository
+
+    importlib.reload(config)
+    run_repository = importlib.reload(run_repository)
+
+    def _write_report(run_id: str, counts: dict) -> Path:
+        path = config.RUN_METADATA_DIR / f"{_sanitize(run_id)}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        delta = {"provider_profile": {"openai": {"cs": counts}}}
+        path.write_text(json.dumps({"run_id": run_id, "delta_summary": delta}), encoding="utf-8")
+        return path
+
+    _write_report("2026-01-01T00:00:00Z", {"new_job_count": 1, "changed_job_count": 2, "removed_job_count": 3})
+    _write_report("2026-01-02T00:00:00Z", {"new_job_count": "bad"})
+    latest = _write_report("2026-01-03T00:00:00Z", {"new_job_count": 4})
+    (config.RUN_METADATA_DIR / "20260104T000000Z.json").write_text("{not json", encoding="utf-8")
+
+    repo = run_repository.FileSystemRunRepository()
+    window = repo.delta_counts_window("openai", "cs", window=7)
+    assert window["runs_considered"] == 2
+    assert window["totals"] == {"new": 5, "changed": 2, "removed": 3}
+    assert [item["run_id"] for item in window["series"]] == ["2026-01-01T00:00:00Z", "2026-01-03T00:00:00Z"]
+    assert repo.delta_counts_window("openai", "cs", window=1)["totals"]["new"] == 4
+    assert repo.delta_counts_window("anthropic", "cs")["totals"] == {"new": 0, "changed": 0, "removed": 0}
+
+    # Unchanged reports are read straight from the index: no parsing and no writer connection.
+    with monkeypatch.context() as patched:
+        patched.setattr(run_repository.json, "loads", lambda *_a, **_k: (_ for _ in ()).throw(AssertionError))
+        patched.setattr(repo, "_open_writer", lambda *_a, **_k: (_ for _ in ()).throw(AssertionError))
+        assert repo.delta_counts_window("openai", "cs", window=7) == window
+
+    # A new report moves its root's mtime, so the next read picks it up.
+    _write_report("2026-01-05T00:00:00Z", {"new_job_count": 10})
+    assert repo.delta_counts_window("openai", "cs", window=7)["totals"]["new"] == 15
+
+    # In-place rewrites are synced at index time.
+    latest.write_text(json.dumps({"run_id": "2026-01-03T00:00:00Z"}), encoding="utf-8")
+    repo.rebuild_index(since="2026-01-03T00:00:00Z")
+    assert repo.delta_counts_window("openai", "cs", window=7)["totals"]["new"] == 11
+
+
+def _write_run(runs_root: Path, run_id: str, *, status: str, providers: dict, git_sha: str) -> None:
+    run_dir = runs_root / _sanitize(run_id)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    index = {
+        "run_id": run_id,
+        "timestamp": run_id,
+        "providers": {
+            provider: {
+                "profiles": {profile: {"diff_counts": {"new": 1, "changed": 2, "removed": 0}} for profile in profs}
+            }
+            for provider, profs in providers.items()
+        },
+        "artifacts": {"run_report.json": "run_report.json"},
+        "run_report_path": "run_report.json",
+    }
+    report = {
+        "run_id": run_id,
+        "status": status,
+        "providers": sorted(providers),
+        "timestamps": {"started_at": "2026-01-01T23:59:00Z", "ended_at": run_id},
+        "git_sha": git_sha,
+        "ai_accounting": {"totals": {"estimated_cost_usd": "0.125000"}},
+    }
+    (run_dir / "index.json").write_text(json.dumps(index), encoding="utf-8")
+    (run_dir / "run_report.json").write_text(json.dumps(report), encoding="utf-8")
+
+
+def test_query_runs_filters_and_paginates(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.run_repository as run_repository
+
+    importlib.reload(config)
+    run_repository = importlib.reload(run_repository)
+
+    _write_run(
+        config.RUN_METADATA_DIR,
+        "2026-01-02T00:00:00Z",
+        status="success",
+        providers={"openai": ["cs"]},
+        git_sha="abc123",
+    )
+    _write_run(
+        config.RUN_METADATA_DIR,
+        "2026-01-03T00:00:00Z",
+        status="failed",
+        providers={"openai": ["cs"], "anthropic": ["tam"]},
+        git_sha="def456",
+    )
+    _write_run(
+        config.RUN_METADATA_DIR,
+        "2026-01-04T00:00:00Z",
+        status="success",
+        providers={"anthropic": ["cs"]},
+        git_sha="abc999",
+    )
+
+    repo = run_repository.FileSystemRunRepository()
+    first = repo.query_runs("local", limit=2)
+    assert [run["run_id"] for run in first["runs"]] == ["2026-01-04T00:00:00Z", "2026-01-03T00:00:00Z"]
+    second = repo.query_runs("local", limit=2, cursor=first["next_cursor"])
+    assert [run["run_id"] for run in second["runs"]] == ["2026-01-02T00:00:00Z"]
+    assert second["next_cursor"] is None
+
+    summary = second["runs"][0]
+    assert summary["status"] == "success"
+    assert summary["duration_seconds"] == 60.0
+    assert summary["providers"] == ["openai"]
+    assert summary["profiles"] == ["cs"]
+    assert summary["diff_counts"] == {"new": 1, "changed": 2, "removed": 0}
+    assert summary["estimated_cost_usd"] == 0.125
+    assert "payload" not in summary
+
+    def _ids(**filters) -> list:
+        return [run["run_id"] for run in repo.query_runs("local", **filters)["runs"]]
+
+    assert _ids(status="success") == ["2026-01-04T00:00:00Z", "2026-01-02T00:00:00Z"]
+    assert _ids(provider="openai") == ["2026-01-03T00:00:00Z", "2026-01-02T00:00:00Z"]
+    assert _ids(profile="tam") == ["2026-01-03T00:00:00Z"]
+    assert _ids(since="2026-01-03T00:00:00Z", until="2026-01-04T00:00:00Z") == ["2026-01-03T00:00:00Z"]
+    assert _ids(git_sha="abc", status="success", provider="anthropic") == ["2026-01-04T00:00:00Z"]
+    payload = repo.query_runs("local", limit=1, include_payload=True)["runs"][0]["payload"]
+    assert payload["run_id"] == "2026-01-04T00:00:00Z"
+
+    # The scan fallback returns the same pages as the indexed query.
+    monkeypatch.setattr(
+        repo, "_query_runs_sql", lambda *_a, **_k: (_ for _ in ()).throw(run_repository.sqlite3.DatabaseError())
+    )
+    monkeypatch.setattr(repo, "rebuild_index", lambda *_a, **_k: None)
+    assert repo.query_runs("local", limit=2) == first
+    assert _ids(git_sha="abc", status="success") == ["2026-01-04T00:00:00Z", "2026-01-02T00:00:00Z"]
+
+
+def test_pooled_reader_reopens_after_rebuild_and_upgrades_old_schema(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+    import sqlite3
+
+    import ji_engine.config as config
+    import ji_engine.run_repository as run_repository
+
+    importlib.reload(config)
+    run_repository = importlib.reload(run_repository)
+
+    run_a = "2026-01-02T00:00:00Z"
+    _write_index(config.RUN_METADATA_DIR / _sanitize(run_a), run_a, run_a)
+    db_path = config.candidate_run_index_path("local")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE run_index (candidate_id TEXT, run_id TEXT, timestamp TEXT, run_dir TEXT, "
+            "index_path TEXT, payload_json TEXT, PRIMARY KEY (candidate_id, run_id))"
+        )
+
+    repo = run_repository.FileSystemRunRepository()
+    assert [run["run_id"] for run in repo.list_runs("local")] == [run_a]
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == run_repository.RUN_INDEX_SCHEMA_VERSION
+    reader = repo._readers[str(db_path)][1]
+    assert repo.query_runs("local")["runs"][0]["run_id"] == run_a
+    assert repo._readers[str(db_path)][1] is reader
+
+    run_b = "2026-01-03T00:00:00Z"
+    _write_index(config.RUN_METADATA_DIR / _sanitize(run_b), run_b, run_b)
+    repo.rebuild_index("local")
+    assert repo.latest_run("local")["run_id"] == run_b
+    assert repo._readers[str(db_path)][1] is not reader
+
+
+def test_new_and_removed_run_dirs_are_indexed_incrementally(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+    import shutil
+
+    import ji_engine.config as config
+    import ji_engine.run_repository as run_repository
+
+    importlib.reload(config)
+    run_repository = importlib.reload(run_repository)
+
+    run_a = "2026-01-02T00:00:00Z"
+    run_b = "2026-01-03T00:00:00Z"
+    _write_run(config.RUN_METADATA_DIR, run_a, status="success", providers={"openai": ["cs"]}, git_sha="abc123")
+    repo = run_repository.FileSystemRunRepository()
+    repo.rebuild_index("local")
+
+    monkeypatch.setattr(
+        repo,
+        "_scan_runs_from_filesystem",
+        lambda *_args, **_kwargs: (_ for _ in ()).throw(AssertionError("filesystem scan called")),
+    )
+    _write_run(config.RUN_METADATA_DIR, run_b, status="running", providers={"openai": ["cs"]}, git_sha="def456")
+    assert repo.latest_run("local")["run_id"] == run_b
+    assert [run["run_id"] for run in repo.query_runs("local", status="running")["runs"]] == [run_b]
+
+    # Publish rewrites the live report next to the run dir; the upsert picks it up in place.
+    live_report = config.RUN_METADATA_DIR / f"{_sanitize(run_b)}.json"
+    live_report.write_text(json.dumps({"run_id": run_b, "status": "failed"}), encoding="utf-8")
+    assert repo.upsert_run(run_b, candidate_id="local", run_report_path=live_report) is True
+    assert [run["run_id"] for run in repo.query_runs("local", status="failed")["runs"]] == [run_b]
+    assert repo.upsert_run("2026-02-01T00:00:00Z", candidate_id="local") is False
+
+    shutil.rmtree(config.RUN_METADATA_DIR / _sanitize(run_a))
+    assert [run["run_id"] for run in repo.list_runs("local")] == [run_b]
+    assert repo.query_runs("local", provider="openai")["runs"][0]["run_id"] == run_b
+
+
+def test_rebuild_index_since_reindexes_only_newer_runs(tmp_path: Path, monkeypatch, capsys) -> None:
+    monkeypatch.setenv("JOBINTEL_STATE_DIR", str(tmp_path / "state"))
+
+    import importlib
+
+    import ji_engine.config as config
+    import ji_engine.run_repository as run_repository
+    from scripts import rebuild_run_index
+
+    importlib.reload(config)
+    run_repository = importlib.reload(run_repository)
+    rebuild_run_index = importlib.reload(rebuild_run_index)
+
+    run_ids = ["2026-01-02T00:00:00Z", "2026-01-03T00:00:00Z", "2026-01-04T00:00:00Z"]
+    for run_id in run_ids:
+        _write_run(config.RUN_METADATA_DIR, run_id, status="success", providers={"openai": ["cs"]}, git_sha="abc")
+    repo = run_repository.FileSystemRunRepository()
+    assert repo.rebuild_index("local")["runs_indexed"] == 3
+
+    _write_run(config.RUN_METADATA_DIR, run_ids[2], status="failed", providers={"openai": ["cs"]}, git_sha="abc")
+    result = repo.rebuild_index("local", since=run_ids[1])
+    assert result["runs_indexed"] == 2
+    assert result["since"] == run_ids[1]
+    assert [run["run_id"] for run in repo.query_runs("local", status="failed")["runs"]] == [run_ids[2]]
+
+    rc = rebuild_run_index.main(["--json", "--since", run_ids[2]])
+    payload = json.loads(capsys.readouterr().out)
+    assert rc == 0
+    assert payload["results"][0]["runs_indexed"] == 1
+    assert payload["results"][0]["since"] == run_ids[2]
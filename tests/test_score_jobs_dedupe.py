@@ -1,3 +1,6 @@
+import json
+
+import scripts.score_jobs as score_jobs
 from scripts.score_jobs import _dedupe_jobs_for_scoring
 
 
@@ -26,3 +29,36 @@ def test_dedupe_jobs_deterministic_across_input_order() -> None:
     out1 = _dedupe_jobs_for_scoring([poor, rich])
     out2 = _dedupe_jobs_for_scoring([rich, poor])
     assert out1 == out2
+
+
+def test_dedupe_jobs_full_tie_falls_back_to_stable_repr() -> None:
+    a = {"job_id": "same", "apply_url": "https://example.com/a", "jd_text": "abc", "scraped_at": "2026-01-01"}
+    b = {"job_id": "same", "apply_url": "https://example.com/b", "jd_text": "abd", "scraped_at": "2026-01-02"}
+    expected = max((dict(a), dict(b)), key=lambda j: json.dumps(j, ensure_ascii=False, sort_keys=True))
+    for order in ([dict(a), dict(b)], [dict(b), dict(a)]):
+        out = _dedupe_jobs_for_scoring(order)
+        assert len(out) == 1
+        assert out[0]["apply_url"] == expected["apply_url"]
+
+
+def test_dedupe_jobs_keeps_first_appearance_order_and_hashes_only_when_needed(monkeypatch) -> None:
+    calls = []
+    real_identity = score_jobs.job_identity
+
+    def _counting_identity(job, *, mode="legacy"):
+        calls.append(job.get("title"))
+        return real_identity(job, mode=mode)
+
+    monkeypatch.setattr(score_jobs, "job_identity", _counting_identity)
+    jobs = [
+        {"job_id": "b", "title": "B"},
+        {"apply_url": "https://example.com/u", "title": "U"},
+        {"job_id": "a", "title": "A"},
+        {"title": "No id or url"},
+        {"job_id": "b", "title": "B", "jd_text": "longer"},
+    ]
+    out = _dedupe_jobs_for_scoring(jobs)
+    assert [job["title"] for job in out] == ["B", "U", "A", "No id or url"]
+    assert out[0]["jd_text"] == "longer"
+    assert out[1]["job_id"] == "https://example.com/u"
+    assert calls == ["No id or url"]
@@ -79,4 +79,7 @@ def test_us_only_filter_keeps_us_without_fallback(tmp_path, monkeypatch) -> None
     assert "Sales Engineer" not in titles
 
     meta_path = out_json.with_suffix(".score_meta.json")
-    assert not meta_path.exists()
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    assert "us_only_fallback" not in meta
+    # Classifier and scoring share one location cache; its counters land in the score meta.
+    assert meta["location_cache"]["hits"] + meta["location_cache"]["misses"] >= 2